@@ -24,3 +24,25 @@ def pytest_runtest_setup(item: pytest.Item) -> None:
 def _normalize_request_node_path(request: pytest.FixtureRequest) -> None:
     _normalize_item_path(request.node)
     os.environ["UDOS_ROOT"] = str(_REPO_ROOT)
+
+
+@pytest.fixture(autouse=True)
+def _isolate_runtime_stores(
+    request: pytest.FixtureRequest,
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path_factory: pytest.TempPathFactory,
+) -> None:
+    """Keep SQLite stores opened at their default paths out of memory/."""
+    node_path = Path(str(request.node.path)).resolve()
+    if not node_path.is_relative_to(_REPO_ROOT) or node_path.relative_to(
+        _REPO_ROOT
+    ).parts[0] not in {"core", "wizard"}:
+        return
+    store_dir = tmp_path_factory.mktemp("stores")
+    monkeypatch.setattr(
+        "core.services.spatial_filesystem.DEFAULT_INDEX_PATH",
+        str(store_dir / "spatial_index.db"),
+    )
+    monkeypatch.setattr(
+        "wizard.services.quota_tracker.QuotaTracker.DATA_DIR", store_dir / "quotas"
+    )
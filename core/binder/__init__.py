@@ -32,8 +32,11 @@ from .validator import BinderValidator, ValidationReport, SeverityLevel
 from .database import BinderDatabase, AccessMode, open_binder_db, DatabaseInfo
 from .feed import (
     BinderFeed,
+    FeedCache,
     FeedFormat,
     FeedItem,
+    FeedRender,
+    FeedValidators,
     FrontmatterData,
     FrontmatterExtractor,
     ContentPreview,
@@ -58,6 +61,9 @@ __all__ = [
     "DatabaseInfo",
     # Feed
     "BinderFeed",
+    "FeedCache",
+    "FeedRender",
+    "FeedValidators",
     "FeedFormat",
     "FeedItem",
     "FrontmatterData",
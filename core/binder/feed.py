@@ -10,13 +10,22 @@ Version: 1.0.0 (v1.0.6.0)
 
 from dataclasses import dataclass, asdict, field
 from datetime import datetime
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
+import hashlib
+import heapq
+import os
 import re
 import json
 from xml.etree.ElementTree import Element, SubElement, tostring
 
+# Derived cache of extracted feed items, kept outside the binder (and vault)
+# in one file per binder keyed by a hash of its resolved path.
+FEED_CACHE_DIR = "memory/bank/binder/feed-cache"
+FEED_CACHE_VERSION = 1
+
 
 class FeedFormat(Enum):
     """Feed format options."""
@@ -56,9 +65,10 @@ class FeedItem:
     guid: Optional[str] = None
 
     def __post_init__(self):
-        """Generate GUID from URL if not provided."""
+        """Generate GUID from URL if not provided (stable across processes)."""
         if not self.guid:
-            self.guid = f"binder-{hash(self.url) % (2**31)}"
+            digest = hashlib.sha256(self.url.encode("utf-8")).hexdigest()
+            self.guid = f"binder-{int(digest[:8], 16) % (2**31)}"
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -67,6 +77,118 @@ class FeedItem:
             data["date"] = self.date.isoformat()
         return data
 
+    @classmethod
+    def from_dict(cls, data: dict) -> "FeedItem":
+        """Rebuild a FeedItem from ``to_dict`` output."""
+        return cls(
+            title=data["title"],
+            url=data["url"],
+            content_preview=data.get("content_preview", ""),
+            date=datetime.fromisoformat(data["date"]),
+            author=data.get("author"),
+            tags=list(data.get("tags") or []),
+            guid=data.get("guid"),
+        )
+
+
+@dataclass
+class FeedValidators:
+    """HTTP cache validators for a generated feed."""
+
+    etag: str
+    last_modified: str
+
+    def matches(
+        self, if_none_match: Optional[str] = None, if_modified_since: Optional[str] = None
+    ) -> bool:
+        """True when a conditional request can be answered with 304."""
+        if if_none_match:
+            tags = [tag.strip() for tag in if_none_match.split(",")]
+            return "*" in tags or self.etag in tags or f"W/{self.etag}" in tags
+        if if_modified_since:
+            try:
+                since = parsedate_to_datetime(if_modified_since)
+                current = parsedate_to_datetime(self.last_modified)
+            except (TypeError, ValueError):
+                return False
+            return current <= since
+        return False
+
+
+@dataclass
+class FeedRender:
+    """Result of a conditional feed render."""
+
+    status: int
+    body: str
+    media_type: str
+    validators: FeedValidators
+
+
+def feed_cache_path(binder_path: Path, cache_dir: Optional[Path] = None) -> Optional[Path]:
+    """Return the cache file for a binder (None if no repo root to hold it)."""
+    if cache_dir is None:
+        from core.services.logging_api import get_repo_root
+
+        try:
+            cache_dir = get_repo_root() / FEED_CACHE_DIR
+        except RuntimeError:
+            return None
+    key = hashlib.sha256(str(Path(binder_path).resolve()).encode("utf-8")).hexdigest()[:16]
+    return Path(cache_dir) / f"{key}.json"
+
+
+class FeedCache:
+    """Per-binder cache of FeedItems keyed on relative path + mtime + size."""
+
+    def __init__(self, cache_path: Path):
+        self.cache_path = cache_path
+        self._entries: Optional[Dict[str, dict]] = None
+        self._dirty = False
+
+    def _load(self) -> Dict[str, dict]:
+        if self._entries is None:
+            self._entries = {}
+            try:
+                payload = json.loads(self.cache_path.read_text(encoding="utf-8"))
+                if payload.get("version") == FEED_CACHE_VERSION:
+                    self._entries = dict(payload.get("entries") or {})
+            except (OSError, ValueError, AttributeError):
+                pass
+        return self._entries
+
+    def get(self, rel_path: str, mtime_ns: int, size: int) -> Optional[dict]:
+        entry = self._load().get(rel_path)
+        if entry and entry.get("mtime_ns") == mtime_ns and entry.get("size") == size:
+            return entry["item"]
+        return None
+
+    def put(self, rel_path: str, mtime_ns: int, size: int, item: dict) -> None:
+        self._load()[rel_path] = {"mtime_ns": mtime_ns, "size": size, "item": item}
+        self._dirty = True
+
+    def prune(self, live: set) -> None:
+        entries = self._load()
+        stale = [key for key in entries if key not in live]
+        for key in stale:
+            del entries[key]
+        if stale:
+            self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty or self._entries is None:
+            return
+        payload = {"version": FEED_CACHE_VERSION, "entries": self._entries}
+        tmp_path = self.cache_path.with_name(self.cache_path.name + ".tmp")
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+            os.replace(tmp_path, self.cache_path)
+            self._dirty = False
+        except OSError:
+            # Unwritable cache dir: keep the in-memory cache for this instance.
+            pass
+
 
 class FrontmatterExtractor:
     """Extract frontmatter metadata from markdown files."""
@@ -261,13 +383,21 @@ class ContentPreview:
 class BinderFeed:
     """Generate RSS feeds from binder markdown files."""
 
-    def __init__(self, binder_path: Path, base_url: str = ""):
+    def __init__(
+        self,
+        binder_path: Path,
+        base_url: str = "",
+        use_cache: bool = True,
+        cache_dir: Optional[Path] = None,
+    ):
         """
         Initialize feed generator.
 
         Args:
             binder_path: Path to binder folder
             base_url: Base URL for feed items (optional, for absolute URLs)
+            use_cache: Reuse extracted items for unchanged files (default True)
+            cache_dir: Directory for the item cache (default: memory/bank/binder/feed-cache)
         """
         self.binder_path = Path(binder_path)
         self.base_url = base_url
@@ -275,58 +405,180 @@ class BinderFeed:
         if not self.binder_path.is_dir():
             raise ValueError(f"Binder path not found: {binder_path}")
 
-    def scan_files(self, pattern: str = "*.md") -> List[FeedItem]:
-        """
-        Scan binder for markdown files and extract feed items.
-
-        Args:
-            pattern: Glob pattern for files (default "*.md")
+        cache_path = feed_cache_path(self.binder_path, cache_dir) if use_cache else None
+        self.cache = FeedCache(cache_path) if cache_path else None
 
-        Returns:
-            List of FeedItem objects, sorted by date (newest first)
-        """
-        items = []
-
-        # Search in all subdirectories
+    def _collect(self, pattern: str) -> List[Tuple[Path, str, os.stat_result]]:
+        """Return (path, relative posix path, stat) for feed source files."""
+        found = []
         for md_file in self.binder_path.rglob(pattern):
             # Skip hidden files and system files
             if md_file.name.startswith("."):
                 continue
+            try:
+                st = md_file.stat()
+            except OSError:
+                continue
+            found.append((md_file, md_file.relative_to(self.binder_path).as_posix(), st))
+        return found
 
+    def _tree_mtime(self) -> float:
+        """Latest mtime of the binder directory and its subdirectories.
+
+        Adding, removing or renaming a file bumps its directory's mtime, so
+        this moves Last-Modified forward even when the newest file is deleted.
+        """
+        latest = 0.0
+        pending = [self.binder_path]
+        while pending:
+            directory = pending.pop()
             try:
-                frontmatter, content = FrontmatterExtractor.extract(md_file)
-
-                # Generate preview
-                preview = ContentPreview.generate(content)
-
-                # Calculate relative URL
-                rel_path = md_file.relative_to(self.binder_path)
-                if self.base_url:
-                    url = f"{self.base_url}/{rel_path.as_posix()}"
-                else:
-                    url = rel_path.as_posix()
-
-                # Create feed item
-                item = FeedItem(
-                    title=frontmatter.title,
-                    url=url,
-                    content_preview=preview,
-                    date=frontmatter.date or datetime.now(),
-                    author=frontmatter.author,
-                    tags=frontmatter.tags,
-                )
+                latest = max(latest, directory.stat().st_mtime)
+                with os.scandir(directory) as entries:
+                    pending.extend(
+                        Path(entry.path) for entry in entries if entry.is_dir(follow_symlinks=False)
+                    )
+            except OSError:
+                continue
+        return latest
+
+    def _item_url(self, rel_path: str) -> str:
+        if self.base_url:
+            return f"{self.base_url}/{rel_path}"
+        return rel_path
+
+    def _build_item(self, md_file: Path, rel_path: str) -> FeedItem:
+        frontmatter, content = FrontmatterExtractor.extract(md_file)
+
+        # Generate preview
+        preview = ContentPreview.generate(content)
+
+        return FeedItem(
+            title=frontmatter.title,
+            url=self._item_url(rel_path),
+            content_preview=preview,
+            date=frontmatter.date or datetime.now(),
+            author=frontmatter.author,
+            tags=frontmatter.tags,
+        )
 
+    def _load_items(self, files: List[Tuple[Path, str, os.stat_result]]) -> List[FeedItem]:
+        """Extract items, reusing cached ones for unchanged files."""
+        items = []
+        for md_file, rel_path, st in files:
+            cached = self.cache.get(rel_path, st.st_mtime_ns, st.st_size) if self.cache else None
+            if cached is not None:
+                url = self._item_url(rel_path)
+                item = FeedItem.from_dict({**cached, "url": url, "guid": None})
                 items.append(item)
-
-            except Exception as e:
+                continue
+            try:
+                item = self._build_item(md_file, rel_path)
+            except Exception:
                 # Skip files with errors
                 continue
+            if self.cache is not None:
+                stored = item.to_dict()
+                stored["url"] = rel_path
+                self.cache.put(rel_path, st.st_mtime_ns, st.st_size, stored)
+            items.append(item)
+        if self.cache is not None:
+            self.cache.prune({rel_path for _, rel_path, _ in files})
+            self.cache.save()
+        return items
+
+    def scan_files(self, pattern: str = "*.md", limit: Optional[int] = None) -> List[FeedItem]:
+        """
+        Scan binder for markdown files and extract feed items.
+
+        Unchanged files (same mtime and size) are served from the feed cache.
+
+        Args:
+            pattern: Glob pattern for files (default "*.md")
+            limit: Keep only the newest N items (heap select, no full sort)
+
+        Returns:
+            List of FeedItem objects, sorted by date (newest first)
+        """
+        items = self._load_items(self._collect(pattern))
+
+        if limit is not None:
+            return heapq.nlargest(limit, items, key=lambda x: x.date)
 
         # Sort by date, newest first
         items.sort(key=lambda x: x.date, reverse=True)
 
         return items
 
+    def validators(
+        self,
+        pattern: str = "*.md",
+        format: FeedFormat = FeedFormat.RSS_2_0,
+        limit: Optional[int] = None,
+        files: Optional[List[Tuple[Path, str, os.stat_result]]] = None,
+    ) -> FeedValidators:
+        """
+        Compute ETag/Last-Modified from file signatures only (no parsing).
+
+        Last-Modified is the newest of the source files and the binder's
+        directories, so deletions advance it too.
+
+        Args:
+            pattern: Glob pattern for files (default "*.md")
+            format: Feed format the validators describe
+            limit: Item limit the feed is rendered with
+            files: Pre-collected files (internal)
+
+        Returns:
+            FeedValidators for the current binder state
+        """
+        if files is None:
+            files = self._collect(pattern)
+        digest = hashlib.sha256()
+        digest.update(f"{FEED_CACHE_VERSION}|{format.value}|{limit}|{self.base_url}\n".encode("utf-8"))
+        latest = self._tree_mtime()
+        for _, rel_path, st in sorted(files, key=lambda f: f[1]):
+            digest.update(f"{rel_path}|{st.st_mtime_ns}|{st.st_size}\n".encode("utf-8"))
+            latest = max(latest, st.st_mtime)
+        return FeedValidators(
+            etag=f'"{digest.hexdigest()[:32]}"',
+            last_modified=formatdate(int(latest), usegmt=True),
+        )
+
+    def render(
+        self,
+        format: FeedFormat = FeedFormat.RSS_2_0,
+        limit: Optional[int] = None,
+        if_none_match: Optional[str] = None,
+        if_modified_since: Optional[str] = None,
+        pattern: str = "*.md",
+    ) -> FeedRender:
+        """
+        Conditionally render a feed for HTTP handlers.
+
+        Returns status 304 with an empty body when the client's validators
+        still match, without extracting any file.
+        """
+        files = self._collect(pattern)
+        validators = self.validators(pattern, format=format, limit=limit, files=files)
+        media_type = (
+            "application/rss+xml" if format == FeedFormat.RSS_2_0 else "application/feed+json"
+        )
+        if validators.matches(if_none_match, if_modified_since):
+            return FeedRender(status=304, body="", media_type=media_type, validators=validators)
+
+        items = self._load_items(files)
+        if limit is not None:
+            items = heapq.nlargest(limit, items, key=lambda x: x.date)
+        else:
+            items.sort(key=lambda x: x.date, reverse=True)
+
+        if format == FeedFormat.RSS_2_0:
+            body = self.generate_rss(items)
+        else:
+            body = json.dumps(self.generate_json(items), indent=2, ensure_ascii=False)
+        return FeedRender(status=200, body=body, media_type=media_type, validators=validators)
+
     def generate_rss(self, items: Optional[List[FeedItem]] = None) -> str:
         """
         Generate RSS 2.0 XML feed.
@@ -364,16 +364,7 @@ LOG FILES:
         limit: int = 50,
     ) -> List[Dict]:
         manager = get_log_manager()
-        entries = list(manager.ring())
-        if component:
-            entries = [entry for entry in entries if entry.get("component") == component]
-        if category:
-            entries = [entry for entry in entries if entry.get("category") == category]
-        if level:
-            entries = [entry for entry in entries if entry.get("level") == level]
-        if limit:
-            entries = entries[-limit:]
-        return entries
+        return manager.query(level=level, category=category, component=component, limit=limit)
 
     def _clear_ring(self) -> int:
         manager = get_log_manager()
@@ -18,6 +18,12 @@ from core.services.map_renderer import MapRenderer
 class MapHandler(BaseCommandHandler, HandlerLoggingMixin):
     """Display location tile grid with automatic logging."""
 
+    def __init__(self):
+        super().__init__()
+        # Reused for every MAP call on this handler so parsed tile layouts
+        # stay cached; the dispatcher keeps one handler instance.
+        self._renderer: Optional[MapRenderer] = None
+
     def handle(self, command: str, params: List[str], grid, parser) -> Dict:
         """
         Handle MAP command.
@@ -99,7 +105,7 @@ class MapHandler(BaseCommandHandler, HandlerLoggingMixin):
             # Import OutputToolkit only when needed (avoid circular import)
             from core.tui.output import OutputToolkit
 
-            renderer = MapRenderer()
+            renderer = self._get_renderer()
             cols = renderer.cols
             rows = renderer.rows
             output = "\n".join(
@@ -132,6 +138,10 @@ class MapHandler(BaseCommandHandler, HandlerLoggingMixin):
                 "height": rows,
             }
 
+    def _get_renderer(self) -> MapRenderer:
+        if self._renderer is None:
+            self._renderer = MapRenderer()
+        return self._renderer
+
     def _render_grid(self, location: Location) -> str:
-        renderer = MapRenderer()
-        return renderer.render(location)
+        return self._get_renderer().render(location)
@@ -12,6 +12,7 @@ Commands:
 
     TAG list @binders                    # List tags in workspace
     TAG find forest adventure            # Find files with tags
+    TAG find --all forest adventure      # Find files with every tag
 
     BINDER open @binders/my-project/sandbox      # Open binder
     BINDER list @binders/my-project/sandbox      # List chapters
@@ -182,12 +183,13 @@ class SpatialFilesystemHandler:
         except Exception as e:
             return f'❌ Error: {e}'
 
-    def tag_find(self, *tags: str) -> str:
-        """Find files with any of the given tags."""
+    def tag_find(self, *tags: str, match: str = 'any') -> str:
+        """Find files with any (or all) of the given tags."""
         try:
-            files = self.fs.find_by_tags(list(tags))
+            files = self.fs.find_by_tags(list(tags), match=match)
 
-            lines = [f'🔍 Files tagged with: {", ".join(tags)}']
+            joiner = ' + ' if match == 'all' else ', '
+            lines = [f'🔍 Files tagged with: {joiner.join(tags)}']
             lines.append('')
 
             for file in files:
@@ -282,7 +284,8 @@ class SpatialFilesystemHandler:
 
 🏷️  TAG Discovery:
   TAG list @workspace                    - List tags in workspace
-  TAG find forest adventure              - Find files with tags
+  TAG find forest adventure              - Find files with any tag
+  TAG find --all forest adventure        - Find files with every tag
 
 📚 BINDER Management:
   BINDER open @ws/project                - Open binder
@@ -355,9 +358,13 @@ def dispatch_spatial_command(handler: SpatialFilesystemHandler, args: List[str])
             if subcommand == 'LIST':
                 return handler.tag_list(args[2]) if len(args) > 2 else '❌ Usage: TAG list @workspace'
             elif subcommand == 'FIND':
-                if len(args) > 2:
-                    return handler.tag_find(*args[2:])
-                return '❌ Usage: TAG find tag1 tag2 ...'
+                tags = args[2:]
+                match = 'any'
+                if tags and tags[0].lower() == '--all':
+                    tags, match = tags[1:], 'all'
+                if tags:
+                    return handler.tag_find(*tags, match=match)
+                return '❌ Usage: TAG find [--all] tag1 tag2 ...'
 
         # Binder commands
         elif command == 'BINDER':
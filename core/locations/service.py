@@ -26,6 +26,7 @@ from typing import Optional, Dict, List, Any
 from pathlib import Path
 from collections import deque
 
+from core.services.grid_spatial_index import GridSpatialIndex
 from core.services.logging_api import get_logger
 
 logger = get_logger("location_service")
@@ -73,12 +74,14 @@ class LocationService:
         self._locations_data = None
         self._locations_by_id = None
         self._db_connection = None
+        self._spatial_index = None
         
         logger.info(f"[LOCAL] LocationService initialized (backend={'SQLite' if self.use_sqlite else 'JSON'})")
         self._load_locations()
 
     def _load_locations(self):
         """Load locations from appropriate backend (JSON or SQLite)."""
+        self._spatial_index = None
         if self.use_sqlite:
             self._load_from_sqlite()
         else:
@@ -381,6 +384,34 @@ class LocationService:
 
         return location.get("tiles", {})
 
+    def get_spatial_index(self) -> GridSpatialIndex:
+        """Get a spatial index over location grid codes (built on first use)."""
+        if self._spatial_index is None:
+            self._spatial_index = GridSpatialIndex.from_locations(self.get_all_locations())
+        return self._spatial_index
+
+    def get_nearest_locations(self, location_id: str, k: int = 5) -> List[Dict]:
+        """Get the k locations closest to a location, excluding itself.
+
+        Each result is the location dict plus a ``distance_km`` key.
+        """
+        if location_id not in self._locations_by_id:
+            return []
+        try:
+            nearest = self.get_spatial_index().nearest_to(location_id, k=k + 1)
+        except ValueError:
+            return []  # Not a grid-coded location
+        return [
+            {**self._locations_by_id[other_id], "distance_km": round(distance, 1)}
+            for other_id, distance in nearest
+            if other_id != location_id
+        ][:k]
+
+    def get_locations_within(self, grid_code: str) -> List[Dict]:
+        """Get locations at or inside a grid cell (e.g. 'L300-BV34')."""
+        index = self.get_spatial_index()
+        return [self._locations_by_id[loc_id] for loc_id in index.contained_in(grid_code)]
+
     def count_locations(self) -> int:
         """Count total locations."""
         return len(self.get_all_locations())
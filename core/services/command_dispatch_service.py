@@ -16,6 +16,7 @@ from core.services.command_catalog import (
     CANONICAL_UCODE_COMMANDS,
     SUBCOMMAND_ALIASES as SHARED_SUBCOMMAND_ALIASES,
 )
+from core.services.command_fuzzy_matcher import get_command_matcher
 from core.services.logging_manager import get_logger
 
 logger = get_logger(__name__)
@@ -33,6 +34,9 @@ UCODE_COMMANDS = CANONICAL_UCODE_COMMANDS
 # Subcommands that expand a parent command (for fuzzy matching)
 SUBCOMMAND_ALIASES = SHARED_SUBCOMMAND_ALIASES
 
+# Stage-1 fuzzy matcher over the (immutable) command catalog, built once at import
+_UCODE_MATCHER = get_command_matcher(UCODE_COMMANDS)
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Configuration
@@ -134,16 +138,9 @@ def match_ucode_command(user_input: str) -> Tuple[Optional[str], float]:
     if len(first_token) < 4 or not first_token.isalpha():
         return None, 0.0
 
-    # Fuzzy match (Levenshtein distance ≤ 2)
-    candidates: list[Tuple[str, int]] = []
-    for cmd in UCODE_COMMANDS:
-        dist = _levenshtein_distance(first_token, cmd)
-        if dist <= 2:
-            candidates.append((cmd, dist))
-
-    if candidates:
-        # Pick closest candidate; break ties alphabetically
-        best = min(candidates, key=lambda x: (x[1], x[0]))
+    # Fuzzy match (Levenshtein distance ≤ 2) via the precompiled matcher
+    best = _UCODE_MATCHER.closest(first_token)
+    if best:
         # Confidence: inversely proportional to distance
         confidence = max(0.80, 1.0 - (best[1] * 0.1))
         return best[0], confidence
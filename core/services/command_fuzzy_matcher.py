@@ -0,0 +1,103 @@
+"""Precompiled fuzzy matcher for uCODE command tokens.
+
+Stage 1 dispatch used to run a full Levenshtein against every command for
+each non-exact token. This module builds a deletion-neighbourhood index
+(SymSpell style) once per command set: every string reachable by deleting up
+to ``max_distance`` characters maps back to the commands that produce it.
+A query only generates its own deletions, looks them up, and verifies the
+few candidates with a bounded Levenshtein that exits as soon as the
+distance budget is exceeded.
+"""
+
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+
+def _deletes(word: str, max_distance: int) -> Set[str]:
+    """All strings reachable from ``word`` by deleting up to ``max_distance`` chars."""
+    results = {word}
+    frontier = {word}
+    for _ in range(max_distance):
+        next_frontier: Set[str] = set()
+        for item in frontier:
+            for idx in range(len(item)):
+                next_frontier.add(item[:idx] + item[idx + 1 :])
+        next_frontier -= results
+        results |= next_frontier
+        frontier = next_frontier
+    return results
+
+
+def bounded_levenshtein(a: str, b: str, max_distance: int) -> Optional[int]:
+    """Levenshtein distance, or None once it must exceed ``max_distance``."""
+    if abs(len(a) - len(b)) > max_distance:
+        return None
+    if len(a) < len(b):
+        a, b = b, a
+    if not b:
+        return len(a) if len(a) <= max_distance else None
+
+    previous = list(range(len(b) + 1))
+    for i, c1 in enumerate(a):
+        current = [i + 1]
+        row_min = current[0]
+        for j, c2 in enumerate(b):
+            value = min(
+                previous[j + 1] + 1,
+                current[j] + 1,
+                previous[j] + (c1 != c2),
+            )
+            current.append(value)
+            if value < row_min:
+                row_min = value
+        if row_min > max_distance:
+            return None
+        previous = current
+
+    distance = previous[-1]
+    return distance if distance <= max_distance else None
+
+
+class FuzzyCommandMatcher:
+    """Deletion-neighbourhood index over a fixed command set."""
+
+    def __init__(self, commands: Iterable[str], max_distance: int = 2):
+        self.commands: FrozenSet[str] = frozenset(commands)
+        self.max_distance = max_distance
+        self._index: Dict[str, Tuple[str, ...]] = {}
+        buckets: Dict[str, Set[str]] = {}
+        for command in self.commands:
+            for variant in _deletes(command, max_distance):
+                buckets.setdefault(variant, set()).add(command)
+        for variant, members in buckets.items():
+            self._index[variant] = tuple(sorted(members))
+
+    def closest(self, token: str) -> Optional[Tuple[str, int]]:
+        """Return ``(command, distance)`` for the nearest command, ties alphabetical."""
+        if token in self.commands:
+            return token, 0
+        candidates: Set[str] = set()
+        for variant in _deletes(token, self.max_distance):
+            members = self._index.get(variant)
+            if members:
+                candidates.update(members)
+        best: Optional[Tuple[str, int]] = None
+        for command in candidates:
+            limit = self.max_distance if best is None else best[1]
+            distance = bounded_levenshtein(token, command, limit)
+            if distance is None:
+                continue
+            if best is None or (distance, command) < (best[1], best[0]):
+                best = (command, distance)
+        return best
+
+
+@lru_cache(maxsize=8)
+def get_command_matcher(commands: FrozenSet[str], max_distance: int = 2) -> FuzzyCommandMatcher:
+    """Matcher for a command-set version (built once, then cached)."""
+    return FuzzyCommandMatcher(commands, max_distance=max_distance)
+
+
+__all__ = ["FuzzyCommandMatcher", "bounded_levenshtein", "get_command_matcher"]
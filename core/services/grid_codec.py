@@ -10,7 +10,17 @@ on demand.
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import List, Optional, Tuple
+from functools import lru_cache
+import string
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
 
 
 @dataclass
@@ -144,3 +154,136 @@ def encode_from_latlon(layer: int, lat: float, lon: float) -> str:
     col = round(((lon + 180.0) / 360.0) * col_max)
     cell = f"{_index_to_col(col)}{str(row).zfill(2)}"
     return f"L{str(layer).zfill(3)}-{cell}"
+
+
+GRID_ROW_COUNT = GRID_ROW_MAX - GRID_ROW_MIN + 1
+GRID_COL_COUNT = _max_col_index() + 1
+
+
+@lru_cache(maxsize=1)
+def _cell_tables() -> Tuple[Dict[str, int], Dict[str, int]]:
+    """Lookup tables from the two-letter column and two-digit row of a cell."""
+    cols: Dict[str, int] = {}
+    for first in string.ascii_letters:
+        for second in string.ascii_letters:
+            index = _col_to_index(first + second)
+            if index is not None:
+                cols[first + second] = index
+    rows = {str(row): row - GRID_ROW_MIN for row in range(GRID_ROW_MIN, GRID_ROW_MAX + 1)}
+    return cols, rows
+
+
+def cell_steps(depth: int) -> Tuple[float, float]:
+    """Latitude and longitude size of a cell ``depth`` levels down."""
+    return 180.0 / GRID_ROW_COUNT**depth, 360.0 / GRID_COL_COUNT**depth
+
+
+@lru_cache(maxsize=1)
+def _encode_tables() -> Tuple[Tuple[str, ...], Tuple[str, ...]]:
+    cols = tuple(_index_to_col(index) for index in range(GRID_COL_COUNT))
+    rows = tuple(str(row).zfill(2) for row in range(GRID_ROW_MIN, GRID_ROW_MAX + 1))
+    return cols, rows
+
+
+def decode_many(
+    codes: Iterable[str],
+    *,
+    centers: bool = False,
+    as_array: bool = False,
+) -> Any:
+    """
+    Decode many grid codes at once.
+
+    Returns one entry per code, in order: bounds as in
+    decode_to_latlon_bounds, or centers as in decode_to_latlon when
+    ``centers`` is set, with None for invalid codes. ``as_array`` returns a
+    float64 NumPy array of shape (n, 4) or (n, 2) with NaN rows for invalid
+    codes instead (requires numpy). ``codes`` may be any iterable of strings,
+    including a NumPy string array.
+
+    A code's column and row indices are packed into one base-80 and one
+    base-30 integer, so its bounds come from a single multiply by the cell
+    size of its depth rather than one subdivision per level. Results agree
+    with the scalar path to within float rounding (well under 1e-9 degrees).
+    """
+    cols, rows = _cell_tables()
+    col_of, row_of = cols.get, rows.get
+    steps = [cell_steps(depth) for depth in range(8)]
+    valid_layers: set[str] = set()
+    results: List[Optional[Tuple[float, ...]]] = []
+    append = results.append
+
+    for code in codes:
+        try:
+            parts = code.split("-")
+            if code[:1] != "L" or len(parts) < 2:
+                append(None)
+                continue
+            if parts[0] not in valid_layers:
+                int(parts[0][1:])
+                valid_layers.add(parts[0])
+        except Exception:
+            append(None)
+            continue
+
+        col_path = row_path = 0
+        for cell_part in parts[1:]:
+            col = col_of(cell_part[:2])
+            row = row_of(cell_part[2:])
+            if col is None or row is None:
+                # Invalid, or a spelling the tables do not cover.
+                append(_scalar_decode(code, centers))
+                break
+            col_path = col_path * GRID_COL_COUNT + col
+            row_path = row_path * GRID_ROW_COUNT + row
+        else:
+            depth = len(parts) - 1
+            lat_step, lon_step = steps[depth] if depth < len(steps) else cell_steps(depth)
+            lat_max = 90.0 - row_path * lat_step
+            lon_min = -180.0 + col_path * lon_step
+            if centers:
+                append((lat_max - lat_step / 2.0, lon_min + lon_step / 2.0))
+            else:
+                append((lat_max - lat_step, lat_max, lon_min, lon_min + lon_step))
+
+    if not as_array:
+        return results
+    if not NUMPY_AVAILABLE:
+        raise RuntimeError("decode_many(as_array=True) requires numpy")
+    missing = (float("nan"),) * (2 if centers else 4)
+    return np.array([missing if item is None else item for item in results], dtype=np.float64).reshape(
+        len(results), len(missing)
+    )
+
+
+def _scalar_decode(code: str, centers: bool) -> Optional[Tuple[float, ...]]:
+    return decode_to_latlon(code) if centers else decode_to_latlon_bounds(code)
+
+
+def encode_many(layer: int, lats: Sequence[float], lons: Sequence[float]) -> List[str]:
+    """
+    Encode many lat/long pairs onto one layer, as encode_from_latlon does.
+
+    ``lats`` and ``lons`` are parallel sequences (lists, tuples or NumPy
+    arrays) of equal length.
+    """
+    if len(lats) != len(lons):
+        raise ValueError(f"lats and lons differ in length ({len(lats)} != {len(lons)})")
+    col_names, row_names = _encode_tables()
+    prefix = f"L{str(layer).zfill(3)}-"
+    row_span = GRID_ROW_MAX - GRID_ROW_MIN
+    col_max = _max_col_index()
+    if NUMPY_AVAILABLE and isinstance(lats, np.ndarray):
+        lats = lats.tolist()
+    if NUMPY_AVAILABLE and isinstance(lons, np.ndarray):
+        lons = lons.tolist()
+
+    codes: List[str] = []
+    append = codes.append
+    for lat, lon in zip(lats, lons, strict=True):
+        lat = max(-90.0, min(90.0, lat))
+        lon = max(-180.0, min(180.0, lon))
+        row = round(((lat + 90.0) / 180.0) * row_span + GRID_ROW_MIN)
+        col = round(((lon + 180.0) / 360.0) * col_max)
+        append(f"{prefix}{col_names[col]}{row_names[row - GRID_ROW_MIN]}")
+    return codes
@@ -0,0 +1,371 @@
+"""
+Grid Spatial Index (Core)
+=========================
+
+Hierarchical index over uDOS grid codes (L###-AA##[-AA##]...). Every cell of a
+code subdivides its parent 80x30, so a code is a path through a tree of cells;
+items are stored at the node for their code and queries prune whole subtrees
+by cell bounds instead of decoding every code.
+
+Supported queries:
+- containment: codes at or under a cell (prefix), or cells containing a code
+- range: codes whose cell centre falls in a lat/long box or within N cells
+- nearest: k codes closest (great-circle) to a point or cell
+
+Example:
+    index = GridSpatialIndex.from_location_index(fs.location_index)
+    index.contained_in("L300-BV34")
+    index.within_cells("L300-BV34-AQ35", radius=2)
+    index.nearest_to("L300-BV34-AQ35", k=5)
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator, Mapping
+import heapq
+import math
+import re
+from typing import Any
+
+from core.services.grid_codec import (
+    GRID_COL_COUNT,
+    GRID_ROW_COUNT,
+    GRID_ROW_MIN,
+    cell_steps,
+    parse_grid_code,
+)
+
+EARTH_RADIUS_KM = 6371.0088
+
+GridKey = tuple[int, tuple[int, ...]]
+
+_Z_SUFFIX = re.compile(r"-Z-?\d{1,2}$")
+
+
+def grid_key(code: str) -> GridKey | None:
+    """Base layer and packed cell path for ``code``, or None if invalid.
+
+    A trailing z-plane suffix (``L300-AA10-Z2``) is ignored: z-planes share
+    the footprint of their cell.
+    """
+    if not isinstance(code, str):
+        return None
+    coord = parse_grid_code(_Z_SUFFIX.sub("", code))
+    if coord is None:
+        return None
+    path = tuple(col * GRID_ROW_COUNT + row - GRID_ROW_MIN for col, row in coord.cells)
+    return coord.base_layer, path
+
+
+def haversine_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """Great-circle distance between two points in kilometres."""
+    phi1, phi2 = math.radians(lat1), math.radians(lat2)
+    dphi = phi2 - phi1
+    dlam = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlam / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(min(1.0, math.sqrt(a)))
+
+
+def _box_distance_km(lat: float, lon: float, lat_min: float, lat_max: float, lon_min: float, lon_max: float) -> float:
+    """Smallest great-circle distance from a point to a lat/long box."""
+    dlon = 0.0
+    edge = lon
+    if not lon_min <= lon <= lon_max:
+        # Angular gap to the nearer edge meridian, going either way round.
+        to_min = (lon_min - lon) % 360.0
+        to_max = (lon - lon_max) % 360.0
+        dlon, edge = (to_min, lon_min) if to_min <= to_max else (to_max, lon_max)
+        if dlon == 0.0:
+            edge = lon
+    if dlon == 0.0:
+        return haversine_km(lat, lon, min(lat_max, max(lat_min, lat)), lon)
+    # Every point of the box is at least ``dlon`` away in longitude, so the
+    # closest one lies on the edge meridian, at the foot of the perpendicular
+    # from the point (clamped to the box's latitude range).
+    if dlon < 90.0:
+        foot = math.degrees(math.atan(math.tan(math.radians(lat)) / math.cos(math.radians(dlon))))
+    else:
+        foot = 90.0 if lat >= 0 else -90.0
+    return haversine_km(lat, lon, min(lat_max, max(lat_min, foot)), edge)
+
+
+class _Node:
+    __slots__ = ("children", "items")
+
+    def __init__(self) -> None:
+        self.children: dict[int, _Node] = {}
+        self.items: set[str] = set()
+
+
+# Cell frame used while walking: (node, depth, lat_max, lon_min).
+_Frame = tuple[_Node, int, float, float]
+
+
+def _child_frame(node: _Node, depth: int, lat_max: float, lon_min: float, cell: int) -> _Frame:
+    lat_step, lon_step = cell_steps(depth + 1)
+    col, row = divmod(cell, GRID_ROW_COUNT)
+    return node.children[cell], depth + 1, lat_max - row * lat_step, lon_min + col * lon_step
+
+
+def _center(depth: int, lat_max: float, lon_min: float) -> tuple[float, float]:
+    lat_step, lon_step = cell_steps(depth)
+    return lat_max - lat_step / 2.0, lon_min + lon_step / 2.0
+
+
+class GridSpatialIndex:
+    """Spatial index mapping item ids to one or more grid codes.
+
+    Items live in one cell tree per base layer. Geometry follows
+    ``grid_codec``: bounds depend on the cell path only, so range and nearest
+    queries span layers while containment queries stay within a layer.
+    Results are sorted item ids (nearest results are ordered by distance).
+    """
+
+    def __init__(self, entries: Iterable[tuple[str, str]] = ()) -> None:
+        self._layers: dict[int, _Node] = {}
+        self._entries: dict[str, dict[str, GridKey]] = {}
+        for item, code in entries:
+            self.add(item, code)
+
+    # =========================================================================
+    # Feeds
+    # =========================================================================
+
+    @classmethod
+    def from_location_index(cls, location_index: Mapping[str, Iterable[str]]) -> GridSpatialIndex:
+        """Build from a ``code -> item ids`` mapping (``SpatialFilesystem.location_index``)."""
+        return cls((item, code) for code, items in location_index.items() for item in items)
+
+    @classmethod
+    def from_rows(
+        cls,
+        rows: Iterable[Mapping[str, Any]],
+        id_field: str = "place_id",
+        code_field: str = "loc_id",
+    ) -> GridSpatialIndex:
+        """Build from row dicts, e.g. ``places`` rows from the spatial store."""
+        return cls(
+            (str(row[id_field]), row[code_field])
+            for row in rows
+            if row.get(id_field) is not None and row.get(code_field)
+        )
+
+    @classmethod
+    def from_locations(cls, locations: Iterable[Mapping[str, Any]]) -> GridSpatialIndex:
+        """Build from location records whose ``id`` is a grid code (``LocationService``)."""
+        return cls.from_rows(locations, id_field="id", code_field="id")
+
+    # =========================================================================
+    # Mutation
+    # =========================================================================
+
+    def add(self, item: str, code: str) -> bool:
+        """Index ``item`` at ``code``. Returns False for an invalid code."""
+        key = grid_key(code)
+        if key is None:
+            return False
+        codes = self._entries.setdefault(item, {})
+        if code in codes:
+            return True
+        codes[code] = key
+        layer, path = key
+        node = self._layers.setdefault(layer, _Node())
+        for cell in path:
+            node = node.children.setdefault(cell, _Node())
+        node.items.add(item)
+        return True
+
+    def remove(self, item: str, code: str | None = None) -> bool:
+        """Drop ``item`` at ``code`` (or everywhere). Returns False if absent."""
+        codes = self._entries.get(item)
+        if not codes or (code is not None and code not in codes):
+            return False
+        targets = [code] if code is not None else list(codes)
+        for target in targets:
+            key = codes.pop(target)
+            if not any(other == key for other in codes.values()):
+                self._unlink(item, key)
+        if not codes:
+            del self._entries[item]
+        return True
+
+    def clear(self) -> None:
+        self._layers.clear()
+        self._entries.clear()
+
+    def _unlink(self, item: str, key: GridKey) -> None:
+        layer, path = key
+        trail = [self._layers[layer]]
+        for cell in path:
+            trail.append(trail[-1].children[cell])
+        trail[-1].items.discard(item)
+        # Prune nodes left empty, deepest first.
+        for depth in range(len(path), 0, -1):
+            node = trail[depth]
+            if node.items or node.children:
+                break
+            del trail[depth - 1].children[path[depth - 1]]
+        if not trail[0].items and not trail[0].children:
+            del self._layers[layer]
+
+    # =========================================================================
+    # Inspection
+    # =========================================================================
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, item: object) -> bool:
+        return item in self._entries
+
+    def codes(self, item: str) -> list[str]:
+        """Codes ``item`` is indexed at."""
+        return sorted(self._entries.get(item, {}))
+
+    # =========================================================================
+    # Queries
+    # =========================================================================
+
+    def contained_in(self, code: str) -> list[str]:
+        """Items at ``code`` or any cell beneath it on the same layer."""
+        node = self._find(code)
+        if node is None:
+            return []
+        return sorted(set(self._subtree_items(node)))
+
+    def containing(self, code: str) -> list[str]:
+        """Items whose cell is ``code`` or one of its ancestors on the same layer."""
+        key = grid_key(code)
+        if key is None:
+            raise ValueError(f"Invalid grid code: {code}")
+        layer, path = key
+        node = self._layers.get(layer)
+        found: set[str] = set()
+        for cell in path:
+            node = node.children.get(cell) if node else None
+            if node is None:
+                break
+            found.update(node.items)
+        return sorted(found)
+
+    def within_bounds(self, lat_min: float, lat_max: float, lon_min: float, lon_max: float) -> list[str]:
+        """Items whose cell centre lies inside the lat/long box (inclusive)."""
+        found: set[str] = set()
+        stack: list[_Frame] = []
+        for root in self._layers.values():
+            stack.extend(_child_frame(root, 0, 90.0, -180.0, cell) for cell in root.children)
+        while stack:
+            node, depth, cell_lat_max, cell_lon_min = stack.pop()
+            lat_step, lon_step = cell_steps(depth)
+            cell_lat_min = cell_lat_max - lat_step
+            cell_lon_max = cell_lon_min + lon_step
+            if cell_lat_min > lat_max or cell_lat_max < lat_min or cell_lon_min > lon_max or cell_lon_max < lon_min:
+                continue
+            if lat_min <= cell_lat_min and cell_lat_max <= lat_max and lon_min <= cell_lon_min and cell_lon_max <= lon_max:
+                found.update(self._subtree_items(node))
+                continue
+            if node.items:
+                lat, lon = _center(depth, cell_lat_max, cell_lon_min)
+                if lat_min <= lat <= lat_max and lon_min <= lon <= lon_max:
+                    found.update(node.items)
+            stack.extend(_child_frame(node, depth, cell_lat_max, cell_lon_min, cell) for cell in node.children)
+        return sorted(found)
+
+    def within_cells(self, code: str, radius: int = 1) -> list[str]:
+        """Items within ``radius`` cells of ``code``, measured at its depth."""
+        key = grid_key(code)
+        if key is None:
+            raise ValueError(f"Invalid grid code: {code}")
+        if radius < 0:
+            raise ValueError("radius must be >= 0")
+        _, path = key
+        col = row = 0
+        for cell in path:
+            cell_col, cell_row = divmod(cell, GRID_ROW_COUNT)
+            col = col * GRID_COL_COUNT + cell_col
+            row = row * GRID_ROW_COUNT + cell_row
+        depth = len(path)
+        lat_step, lon_step = cell_steps(depth)
+        col_lo, col_hi = max(0, col - radius), min(GRID_COL_COUNT**depth - 1, col + radius)
+        row_lo, row_hi = max(0, row - radius), min(GRID_ROW_COUNT**depth - 1, row + radius)
+        return self.within_bounds(
+            90.0 - (row_hi + 1) * lat_step,
+            90.0 - row_lo * lat_step,
+            -180.0 + col_lo * lon_step,
+            -180.0 + (col_hi + 1) * lon_step,
+        )
+
+    def nearest(self, lat: float, lon: float, k: int = 1, max_km: float | None = None) -> list[tuple[str, float]]:
+        """Up to ``k`` ``(item, km)`` pairs closest to a point, nearest first.
+
+        Distance is measured to each item's cell centre. Subtrees are visited
+        best-first by their minimum possible distance, so search stops as
+        soon as ``k`` items are settled.
+        """
+        if k <= 0:
+            return []
+        limit = math.inf if max_km is None else max_km
+        # Layer roots cover the whole globe; seed the search with them.
+        heap: list[tuple[float, int, Any]] = [
+            (0.0, counter, (root, 0, 90.0, -180.0)) for counter, root in enumerate(self._layers.values())
+        ]
+        counter = len(heap)
+        results: list[tuple[str, float]] = []
+        seen: set[str] = set()
+        while heap and len(results) < k:
+            distance, _, entry = heapq.heappop(heap)
+            if distance > limit:
+                break
+            if isinstance(entry, str):
+                if entry not in seen:
+                    seen.add(entry)
+                    results.append((entry, distance))
+                continue
+            node, depth, cell_lat_max, cell_lon_min = entry
+            if node.items:
+                item_km = haversine_km(lat, lon, *_center(depth, cell_lat_max, cell_lon_min))
+                for item in node.items:
+                    if item not in seen:
+                        heapq.heappush(heap, (item_km, counter, item))
+                        counter += 1
+            lat_step, lon_step = cell_steps(depth + 1)
+            for cell in node.children:
+                child = _child_frame(node, depth, cell_lat_max, cell_lon_min, cell)
+                bound = _box_distance_km(lat, lon, child[2] - lat_step, child[2], child[3], child[3] + lon_step)
+                heapq.heappush(heap, (bound, counter, child))
+                counter += 1
+        return results
+
+    def nearest_to(self, code: str, k: int = 1, max_km: float | None = None) -> list[tuple[str, float]]:
+        """``nearest`` measured from the centre of ``code``'s cell."""
+        key = grid_key(code)
+        if key is None:
+            raise ValueError(f"Invalid grid code: {code}")
+        _, path = key
+        frame: tuple[int, float, float] = (0, 90.0, -180.0)
+        for cell in path:
+            depth, lat_max, lon_min = frame
+            lat_step, lon_step = cell_steps(depth + 1)
+            col, row = divmod(cell, GRID_ROW_COUNT)
+            frame = (depth + 1, lat_max - row * lat_step, lon_min + col * lon_step)
+        return self.nearest(*_center(*frame), k=k, max_km=max_km)
+
+    def _find(self, code: str) -> _Node | None:
+        key = grid_key(code)
+        if key is None:
+            raise ValueError(f"Invalid grid code: {code}")
+        layer, path = key
+        node = self._layers.get(layer)
+        for cell in path:
+            if node is None:
+                return None
+            node = node.children.get(cell)
+        return node
+
+    @staticmethod
+    def _subtree_items(node: _Node) -> Iterator[str]:
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            yield from current.items
+            stack.extend(current.children.values())
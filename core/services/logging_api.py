@@ -6,9 +6,12 @@ Defaults to JSONL file sink with optional pretty console output.
 
 from __future__ import annotations
 
+import atexit
+from collections import deque
+from collections.abc import Iterable
 import contextvars
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import datetime, timezone
 import json
 import os
 from pathlib import Path
@@ -62,6 +65,8 @@ _PAYLOAD_KEYS = {
     "content",
 }
 
+_BACKPRESSURE_POLICIES = {"block", "drop-oldest", "sample"}
+
 
 class LogTags:
     """Standard logging tags for transport identification."""
@@ -113,6 +118,25 @@ def _safe_int(value: str | None, default: int) -> int:
         return default
 
 
+def _ts_bound(value: datetime | str | None) -> str | None:
+    """Normalize a time bound to the UTC ISO form used in event ``ts``."""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def _as_set(value: str | Iterable[str] | None) -> set[str] | None:
+    if not value:
+        return None
+    if isinstance(value, str):
+        return {value}
+    return set(value)
+
+
 def _split_csv(value: str | None) -> set[str] | None:
     if not value:
         return None
@@ -184,6 +208,12 @@ class LogConfig:
     sampling: float = 1.0
     payloads: str = "dev-only"
     ring_size: int = 1000
+    writer: str = "sync"
+    queue_size: int = 10000
+    backpressure: str = "block"
+    flush_bytes: int = 64 * 1024
+    flush_interval: float = 0.25
+    sample_every: int = 10
 
     @classmethod
     def from_env(cls) -> LogConfig:
@@ -199,6 +229,12 @@ class LogConfig:
             sampling=_safe_float(get_config("UDOS_LOG_SAMPLING"), 1.0),
             payloads=get_config("UDOS_LOG_PAYLOADS", "dev-only").lower(),
             ring_size=_safe_int(get_config("UDOS_LOG_RING"), 1000),
+            writer=get_config("UDOS_LOG_WRITER", "sync").lower(),
+            queue_size=_safe_int(get_config("UDOS_LOG_QUEUE"), 10000),
+            backpressure=get_config("UDOS_LOG_BACKPRESSURE", "block").lower(),
+            flush_bytes=_safe_int(get_config("UDOS_LOG_FLUSH_BYTES"), 64 * 1024),
+            flush_interval=_safe_int(get_config("UDOS_LOG_FLUSH_MS"), 250) / 1000.0,
+            sample_every=_safe_int(get_config("UDOS_LOG_SAMPLE_EVERY"), 10),
         )
 
 
@@ -236,6 +272,221 @@ class FileSink:
             self._file.write(line + "\n")
             self._file.flush()
 
+    def write_many(self, lines: list[str]) -> None:
+        """Append a batch of lines with a single write + flush."""
+        if not lines:
+            return
+        with self._lock:
+            self._ensure_open()
+            self._file.write("\n".join(lines) + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        with self._lock:
+            if self._file:
+                try:
+                    self._file.close()
+                except Exception:
+                    pass
+                self._file = None
+
+
+class AsyncLogWriter:
+    """Background writer that batches JSONL lines per sink.
+
+    Events are queued on the caller thread and serialized/written by a single
+    daemon thread. Lines are grouped per ``FileSink`` and flushed when the
+    buffered size reaches ``flush_bytes`` or ``flush_interval`` elapses.
+
+    Back-pressure when the queue is full:
+      - ``block``: caller waits for space
+      - ``drop-oldest``: oldest queued event is evicted
+      - ``sample``: lower levels keep 1 in ``sample_every`` and drop the
+        rest; a kept event evicts the oldest queued event below warn, and
+        warn+ events do too (falling back to the oldest event). A low-level
+        event never evicts a warn+ one: if only those are queued it is dropped
+    """
+
+    def __init__(
+        self,
+        capacity: int = 10000,
+        backpressure: str = "block",
+        flush_bytes: int = 64 * 1024,
+        flush_interval: float = 0.25,
+        sample_every: int = 10,
+    ) -> None:
+        self.capacity = max(1, capacity)
+        self.backpressure = backpressure if backpressure in _BACKPRESSURE_POLICIES else "block"
+        self.flush_bytes = max(1, flush_bytes)
+        self.flush_interval = max(0.001, flush_interval)
+        self.sample_every = max(1, sample_every)
+        self._queue: deque[tuple[FileSink, dict[str, Any]]] = deque()
+        self._cond = threading.Condition()
+        self._flush_requested = 0
+        self._flush_completed = 0
+        self._stopping = False
+        self._sample_counter = 0
+        self._stats = {
+            "enqueued": 0,
+            "written": 0,
+            "batches": 0,
+            "dropped_oldest": 0,
+            "sampled_out": 0,
+            "blocked": 0,
+            "write_errors": 0,
+            "high_water": 0,
+        }
+        self._thread = threading.Thread(target=self._run, name="udos-log-writer", daemon=True)
+        self._thread.start()
+
+    def submit(self, sink: FileSink, event: dict[str, Any]) -> bool:
+        """Queue an event for ``sink``. Returns False if it was dropped."""
+        with self._cond:
+            if self._stopping:
+                return False
+            if len(self._queue) >= self.capacity and not self._make_room(event):
+                return False
+            self._queue.append((sink, event))
+            self._stats["enqueued"] += 1
+            depth = len(self._queue)
+            if depth > self._stats["high_water"]:
+                self._stats["high_water"] = depth
+            self._cond.notify_all()
+            return True
+
+    def _make_room(self, event: dict[str, Any]) -> bool:
+        # Caller holds self._cond.
+        if self.backpressure == "block":
+            self._stats["blocked"] += 1
+            while len(self._queue) >= self.capacity and not self._stopping:
+                self._cond.wait(timeout=self.flush_interval)
+            return not self._stopping
+        if self.backpressure == "sample":
+            low_level = _LEVEL_ORDER.get(event.get("level", ""), 0) < _LEVEL_ORDER["warn"]
+            if low_level:
+                self._sample_counter += 1
+                if self._sample_counter % self.sample_every:
+                    self._stats["sampled_out"] += 1
+                    return False
+            victim = next(
+                (
+                    index
+                    for index, (_, queued) in enumerate(self._queue)
+                    if _LEVEL_ORDER.get(queued.get("level", ""), 0) < _LEVEL_ORDER["warn"]
+                ),
+                None,
+            )
+            if victim is not None:
+                del self._queue[victim]
+                self._stats["dropped_oldest"] += 1
+                return True
+            if low_level:
+                self._stats["sampled_out"] += 1
+                return False
+        self._queue.popleft()
+        self._stats["dropped_oldest"] += 1
+        return True
+
+    def drain(self, timeout: float | None = 5.0) -> bool:
+        """Block until everything queued so far has been written."""
+        if threading.current_thread() is self._thread:
+            return False
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            self._flush_requested += 1
+            target = self._flush_requested
+            self._cond.notify_all()
+            while self._flush_completed < target and self._thread.is_alive():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(timeout=remaining)
+            return self._flush_completed >= target
+
+    def close(self, timeout: float | None = 5.0) -> None:
+        with self._cond:
+            if self._stopping:
+                return
+            self._stopping = True
+            self._cond.notify_all()
+        self._thread.join(timeout=timeout)
+
+    def stats(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "mode": "async",
+                "backpressure": self.backpressure,
+                "queue_depth": len(self._queue),
+                "queue_capacity": self.capacity,
+                "queue_high_water": self._stats["high_water"],
+                "enqueued": self._stats["enqueued"],
+                "written": self._stats["written"],
+                "batches": self._stats["batches"],
+                "dropped": self._stats["dropped_oldest"] + self._stats["sampled_out"],
+                "dropped_oldest": self._stats["dropped_oldest"],
+                "sampled_out": self._stats["sampled_out"],
+                "blocked": self._stats["blocked"],
+                "write_errors": self._stats["write_errors"],
+            }
+
+    def _run(self) -> None:
+        pending: dict[FileSink, list[str]] = {}
+        pending_bytes = 0
+        last_flush = time.monotonic()
+        while True:
+            with self._cond:
+                while not self._queue and not self._stopping and self._flush_requested == self._flush_completed:
+                    remaining = self.flush_interval - (time.monotonic() - last_flush)
+                    if pending and remaining <= 0:
+                        break
+                    self._cond.wait(timeout=remaining if pending else None)
+                batch = list(self._queue)
+                self._queue.clear()
+                flush_target = self._flush_requested
+                stopping = self._stopping
+                self._cond.notify_all()
+
+            for sink, event in batch:
+                try:
+                    line = json.dumps(event, ensure_ascii=False)
+                except Exception:
+                    continue
+                pending.setdefault(sink, []).append(line)
+                pending_bytes += len(line) + 1
+
+            due = time.monotonic() - last_flush >= self.flush_interval
+            forced = stopping or flush_target != self._flush_completed
+            if pending and (forced or due or pending_bytes >= self.flush_bytes):
+                self._write_pending(pending)
+                pending = {}
+                pending_bytes = 0
+                last_flush = time.monotonic()
+            elif not pending:
+                last_flush = time.monotonic()
+
+            if forced:
+                with self._cond:
+                    self._flush_completed = flush_target
+                    self._cond.notify_all()
+            if stopping:
+                with self._cond:
+                    if not self._queue:
+                        return
+
+    def _write_pending(self, pending: dict[FileSink, list[str]]) -> None:
+        written = 0
+        errors = 0
+        for sink, lines in pending.items():
+            try:
+                sink.write_many(lines)
+                written += len(lines)
+            except Exception:
+                errors += 1
+        with self._cond:
+            self._stats["written"] += written
+            self._stats["batches"] += 1
+            self._stats["write_errors"] += errors
+
 
 class LogManager:
     def __init__(self, config: LogConfig | None = None) -> None:
@@ -243,10 +494,20 @@ class LogManager:
         from core.services.unified_config_loader import get_config
 
         self.session_id = get_config("UDOS_SESSION_ID", "") or _short_id("S")
-        self._ring: list[dict[str, Any]] = []
         self._ring_size = max(1, self.config.ring_size)
+        self._ring: deque[dict[str, Any]] = deque(maxlen=self._ring_size)
+        self._ring_lock = threading.Lock()
         self._sinks: dict[tuple[str, str], FileSink] = {}
         self._lock = threading.Lock()
+        self._writer: AsyncLogWriter | None = None
+        if self.config.writer == "async" and self.config.dest in {"file", "both"}:
+            self._writer = AsyncLogWriter(
+                capacity=self.config.queue_size,
+                backpressure=self.config.backpressure,
+                flush_bytes=self.config.flush_bytes,
+                flush_interval=self.config.flush_interval,
+                sample_every=self.config.sample_every,
+            )
 
     def _should_log(self, level: str, category: str) -> bool:
         if level not in _LEVEL_ORDER:
@@ -268,9 +529,8 @@ class LogManager:
             return self._sinks[key]
 
     def _push_ring(self, event: dict[str, Any]) -> None:
-        self._ring.append(event)
-        if len(self._ring) > self._ring_size:
-            self._ring = self._ring[-self._ring_size :]
+        with self._ring_lock:
+            self._ring.append(event)
 
     def dump_ring(self, path: Path | None = None) -> Path:
         if path is None:
@@ -279,15 +539,39 @@ class LogManager:
             filename = f"crash-{utc_filename_timestamp()}-{self.session_id}.jsonl"
             path = crash_dir / filename
         with open(path, "w", encoding="utf-8") as handle:
-            for entry in self._ring:
+            for entry in self.ring():
                 handle.write(json.dumps(entry, ensure_ascii=False) + "\n")
         return path
 
+    def flush(self, timeout: float | None = 5.0) -> bool:
+        """Force queued events to disk (no-op in sync writer mode)."""
+        if self._writer is None:
+            return True
+        return self._writer.drain(timeout=timeout)
+
+    def close(self) -> None:
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.close()
+        with self._lock:
+            for sink in self._sinks.values():
+                sink.close()
+
+    def _write_file(self, event: dict[str, Any], payload: str | None, component: str, name: str) -> None:
+        sink = self._sink(component, name)
+        if self._writer is not None:
+            # Dropped events are counted by the writer's back-pressure stats.
+            self._writer.submit(sink, event)
+            return
+        sink.write(payload if payload is not None else json.dumps(event, ensure_ascii=False))
+
     def emit(self, event: dict[str, Any], component: str, name: str) -> None:
         self._push_ring(event)
-        payload = json.dumps(event, ensure_ascii=False)
+        payload = None
+        if self._writer is None or self.config.dest == "both":
+            payload = json.dumps(event, ensure_ascii=False)
         if self.config.dest in {"file", "both"}:
-            self._sink(component, name).write(payload)
+            self._write_file(event, payload, component, name)
         if self.config.dest in {"stdout", "both"}:
             if self.config.format == "pretty":
                 pretty = f"[{event['ts']}] [{event['level']}] [{event['component']}] {event['msg']}"
@@ -296,6 +580,7 @@ class LogManager:
                 print(payload)
         if event.get("level") == "fatal":
             try:
+                self.flush()
                 crash_path = self.dump_ring()
                 notice = {
                     "ts": _now_iso(),
@@ -312,7 +597,8 @@ class LogManager:
                 }
                 notice_payload = json.dumps(notice, ensure_ascii=False)
                 if self.config.dest in {"file", "both"}:
-                    self._sink(component, name).write(notice_payload)
+                    self._write_file(notice, notice_payload, component, name)
+                    self.flush()
                 if self.config.dest in {"stdout", "both"}:
                     if self.config.format == "pretty":
                         pretty = f"[{notice['ts']}] [fatal] [{component}] Crash ring buffer dumped"
@@ -323,11 +609,62 @@ class LogManager:
                 pass
 
     def ring(self) -> list[dict[str, Any]]:
-        return list(self._ring)
+        with self._ring_lock:
+            return list(self._ring)
+
+    def query(
+        self,
+        level: str | Iterable[str] | None = None,
+        min_level: str | None = None,
+        category: str | Iterable[str] | None = None,
+        component: str | Iterable[str] | None = None,
+        corr_id: str | None = None,
+        since: datetime | str | None = None,
+        until: datetime | str | None = None,
+        limit: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Return matching in-memory events, oldest first.
+
+        Scans newest-to-oldest and stops once ``limit`` matches are found, so
+        "last N errors" queries do not copy the whole ring.
+        """
+        levels = _as_set(level)
+        categories = _as_set(category)
+        components = _as_set(component)
+        floor = _LEVEL_ORDER.get(min_level.lower(), 0) if min_level else 0
+        since_ts = _ts_bound(since)
+        until_ts = _ts_bound(until)
+
+        matches: list[dict[str, Any]] = []
+        with self._ring_lock:
+            for entry in reversed(self._ring):
+                ts = entry.get("ts", "")
+                if since_ts and ts < since_ts:
+                    # Ring is append-ordered, so nothing older can match.
+                    break
+                if until_ts and ts > until_ts:
+                    continue
+                entry_level = entry.get("level")
+                if levels and entry_level not in levels:
+                    continue
+                if floor and _LEVEL_ORDER.get(entry_level, 0) < floor:
+                    continue
+                if categories and entry.get("category") not in categories:
+                    continue
+                if components and entry.get("component") not in components:
+                    continue
+                if corr_id and entry.get("corr_id") != corr_id:
+                    continue
+                matches.append(entry)
+                if limit and len(matches) >= limit:
+                    break
+        matches.reverse()
+        return matches
 
     def clear_ring(self) -> int:
-        count = len(self._ring)
-        self._ring = []
+        with self._ring_lock:
+            count = len(self._ring)
+            self._ring.clear()
         return count
 
     def health(self) -> dict[str, Any]:
@@ -344,6 +681,7 @@ class LogManager:
             "ring_size": self._ring_size,
             "ring_entries": len(self._ring),
             "sinks": len(self._sinks),
+            "writer": self._writer.stats() if self._writer is not None else {"mode": "sync"},
             "timestamp": utc_now_iso_z(),
         }
 
@@ -529,6 +867,12 @@ def get_log_manager() -> LogManager:
     return _LOG_MANAGER
 
 
+@atexit.register
+def _flush_log_manager_at_exit() -> None:
+    if _LOG_MANAGER is not None:
+        _LOG_MANAGER.flush(timeout=2.0)
+
+
 def get_logger(
     component: str,
     category: str = "general",
@@ -1,14 +1,85 @@
 """Map Renderer (Core)
 
 Render location grids in ASCII form based on grid config.
+
+The parsed tile layout (sorted rows/cols and the cell id in each slot) is
+cached per location and reused until the location's set of tile ids changes,
+so repeated frames only re-read tile glyphs. ``diff`` returns the lines and
+cells that changed since the previous frame for animated MAP/TICK views, and
+``render_many`` renders a batch of locations for export.
 """
 from __future__ import annotations
 
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from functools import lru_cache
+
 from core.locations import Location
 from core.services.grid_config import load_grid_config
 from core.services.viewport_service import ViewportService
 from core.tui.output import OutputToolkit
 
+LEGEND = "Legend: S=Structure V=Vehicle W=Waypoint P=POI M=Marker .=Empty"
+EMPTY_CHAR = "."
+
+# Lines above the first map row: border, title, meta, border, column header.
+_HEADER_LINES = 5
+
+
+@dataclass(frozen=True)
+class TileGrid:
+    """Parsed layout of a location's tiles."""
+
+    keys: frozenset[str]
+    rows: tuple[int, ...]
+    cols: tuple[int, ...]
+    cells: tuple[tuple[str | None, ...], ...]  # [row][col] -> tile cell id
+    row_labels: tuple[str, ...]
+    col_header: str
+
+
+@dataclass(frozen=True)
+class FrameDiff:
+    """Changes between the previous and current frame of a location.
+
+    ``lines`` maps line numbers to their new text; ``cells`` lists changed map
+    cells as ``(row, col, char)``. When ``full`` is set the layout changed (or
+    there was no previous frame) and ``lines`` holds the whole frame.
+    """
+
+    location_id: str
+    full: bool
+    line_count: int
+    lines: dict[int, str] = field(default_factory=dict)
+    cells: list[tuple[int, int, str]] = field(default_factory=list)
+
+    @property
+    def changed(self) -> bool:
+        return self.full or bool(self.lines)
+
+
+@dataclass(frozen=True)
+class _Frame:
+    grid: TileGrid | None
+    chars: tuple[tuple[str, ...], ...]
+    lines: tuple[str, ...]
+
+
+@lru_cache(maxsize=256)
+def _frame_chrome(
+    name: str, layer: int, timezone: str, box_width: int, invert: bool
+) -> tuple[tuple[str, ...], tuple[str, ...]]:
+    """Header and footer lines around the map rows."""
+    inner = box_width - 2
+    border = "+" + "-" * (box_width - 2) + "+"
+    header_line = f"{name:<{inner}}"
+    if invert:
+        header_line = OutputToolkit.invert(header_line)
+    meta = f"Layer: L{layer}  Timezone: {timezone}"
+    header = (border, f"| {header_line} |", f"| {meta:<{inner}} |", border)
+    footer = (border, f"| {LEGEND:<{inner}} |", border)
+    return header, footer
+
 
 class MapRenderer:
     """ASCII grid rendering for locations."""
@@ -18,66 +89,131 @@ class MapRenderer:
         standard = grid_cfg.get("viewports", {}).get("standard", {})
         self.cols = int(standard.get("cols", 80))
         self.rows = int(standard.get("rows", 30))
+        self._viewport: ViewportService | None = None
+        self._grids: dict[str, TileGrid] = {}
+        self._frames: dict[str, _Frame] = {}
 
     def render(self, location: Location) -> str:
+        return "\n".join(self._build_frame(location, *self._frame_settings()).lines)
+
+    def render_many(self, locations: Iterable[Location]) -> dict[str, str]:
+        """Render several locations in one pass, keyed by location id."""
+        settings = self._frame_settings()
+        return {
+            location.id: "\n".join(self._build_frame(location, *settings).lines)
+            for location in locations
+        }
+
+    def diff(self, location: Location) -> FrameDiff:
+        """Render ``location`` and report what changed since its last diff."""
+        previous = self._frames.get(location.id)
+        frame = self._build_frame(location, *self._frame_settings(), previous=previous)
+        self._frames[location.id] = frame
+        line_count = len(frame.lines)
+
+        if (
+            previous is None
+            or previous.grid is not frame.grid
+            or len(previous.lines) != line_count
+        ):
+            return FrameDiff(location.id, True, line_count, dict(enumerate(frame.lines)))
+
+        lines = {
+            index: line
+            for index, (old, line) in enumerate(zip(previous.lines, frame.lines, strict=True))
+            if old is not line and old != line
+        }
+        cells = []
+        grid = frame.grid
+        if grid is not None:
+            for r, (old_chars, new_chars) in enumerate(zip(previous.chars, frame.chars, strict=True)):
+                if old_chars == new_chars:
+                    continue
+                for c, (old, new) in enumerate(zip(old_chars, new_chars, strict=True)):
+                    if old != new:
+                        cells.append((grid.rows[r], grid.cols[c], new))
+        return FrameDiff(location.id, False, line_count, lines, cells)
+
+    def forget(self, location_id: str | None = None) -> None:
+        """Drop cached layout and last frame for one location (or all)."""
+        if location_id is None:
+            self._grids.clear()
+            self._frames.clear()
+            return
+        self._grids.pop(location_id, None)
+        self._frames.pop(location_id, None)
+
+    def _frame_settings(self) -> tuple[int, bool]:
+        from core.services.unified_config_loader import get_bool_config
+
+        if self._viewport is None:
+            self._viewport = ViewportService()
+        box_width = min(self._viewport.get_cols(), 80)
+        return box_width, get_bool_config("UDOS_TUI_INVERT_HEADERS", default=True)
+
+    def _build_frame(
+        self,
+        location: Location,
+        box_width: int,
+        invert: bool,
+        previous: _Frame | None = None,
+    ) -> _Frame:
         tiles = location.tiles
-        if not tiles:
-            return self._render_empty_grid()
+        grid = self._tile_grid(location.id, tiles) if tiles else None
+        if grid is None:
+            return _Frame(None, (), tuple(self._render_empty_grid().split("\n")))
 
-        cell_ids = list(tiles.keys())
-        if not cell_ids:
-            return self._render_empty_grid()
+        header, footer = _frame_chrome(
+            location.name, location.layer, location.timezone, box_width, invert
+        )
+        reuse = previous is not None and previous.grid is grid
+        chars: list[tuple[str, ...]] = []
+        row_lines: list[str] = []
+        for r, row_cells in enumerate(grid.cells):
+            row_chars = tuple(
+                self._render_tile(tile) if (tile := tiles.get(cell_id)) else EMPTY_CHAR
+                for cell_id in row_cells
+            )
+            if reuse and previous.chars[r] == row_chars:
+                # Unchanged row: keep the old string (diff compares by identity first).
+                row_chars = previous.chars[r]
+                row_line = previous.lines[_HEADER_LINES + r]
+            else:
+                row_line = grid.row_labels[r] + "".join(f"{char:3} " for char in row_chars)
+            chars.append(row_chars)
+            row_lines.append(row_line)
 
-        rows = set()
-        cols = set()
-        for cell_id in cell_ids:
+        lines = (*header, grid.col_header, *row_lines, *footer)
+        return _Frame(grid, tuple(chars), lines)
+
+    def _tile_grid(self, location_id: str, tiles: dict) -> TileGrid | None:
+        """Parsed layout for ``tiles``, rebuilt only when the tile ids change."""
+        cached = self._grids.get(location_id)
+        if cached is not None and cached.keys == tiles.keys():
+            return cached
+
+        slots: dict[tuple[int, int], str] = {}
+        for cell_id in tiles:
             row = self._parse_row(cell_id)
             col = self._parse_col(cell_id)
             if row is not None and col is not None:
-                rows.add(row)
-                cols.add(col)
-
-        if not rows or not cols:
-            return self._render_empty_grid()
-
-        lines = []
-        cols_width = ViewportService().get_cols()
-        box_width = min(cols_width, 80)
-        inner = box_width - 2
-        header = f"{location.name}"
-        header_line = f"{header:<{inner}}"
-        from core.services.unified_config_loader import get_bool_config
+                slots.setdefault((row, col), cell_id)
+        if not slots:
+            self._grids.pop(location_id, None)
+            return None
 
-        if get_bool_config("UDOS_TUI_INVERT_HEADERS", default=True):
-            header_line = OutputToolkit.invert(header_line)
-        lines.append("+" + "-" * (box_width - 2) + "+")
-        lines.append(f"| {header_line} |")
-        meta = f"Layer: L{location.layer}  Timezone: {location.timezone}"
-        lines.append(f"| {meta:<{inner}} |")
-        lines.append("+" + "-" * (box_width - 2) + "+")
-
-        col_header = "   "
-        for col in sorted(cols):
-            col_header += f"{col:3} "
-        lines.append(col_header)
-
-        for row in sorted(rows):
-            row_str = f"{row:2} "
-            for col in sorted(cols):
-                cell_id = f"{self._row_to_char(row)}{self._col_to_char(col)}"
-                tile = tiles.get(cell_id)
-                if tile:
-                    char = self._render_tile(tile)
-                else:
-                    char = "."
-                row_str += f"{char:3} "
-            lines.append(row_str)
-
-        lines.append("+" + "-" * (box_width - 2) + "+")
-        legend = "Legend: S=Structure V=Vehicle W=Waypoint P=POI M=Marker .=Empty"
-        lines.append(f"| {legend:<{inner}} |")
-        lines.append("+" + "-" * (box_width - 2) + "+")
-        return "\n".join(lines)
+        rows = tuple(sorted({row for row, _ in slots}))
+        cols = tuple(sorted({col for _, col in slots}))
+        grid = TileGrid(
+            keys=frozenset(tiles),
+            rows=rows,
+            cols=cols,
+            cells=tuple(tuple(slots.get((row, col)) for col in cols) for row in rows),
+            row_labels=tuple(f"{row:2} " for row in rows),
+            col_header="   " + "".join(f"{col:3} " for col in cols),
+        )
+        self._grids[location_id] = grid
+        return grid
 
     def _render_empty_grid(self) -> str:
         lines = [
@@ -123,11 +259,3 @@ class MapRenderer:
         except (ValueError, IndexError):
             pass
         return None
-
-    @staticmethod
-    def _row_to_char(row: int) -> str:
-        return str(row).zfill(2)
-
-    @staticmethod
-    def _col_to_char(col: int) -> str:
-        return chr(ord("A") + col).upper()
@@ -45,11 +45,18 @@ from collections import defaultdict
 from dataclasses import asdict, dataclass, field
 from datetime import datetime
 from enum import Enum
+from itertools import islice
+import os
 from pathlib import Path
 import re
-from typing import Any
+import sqlite3
+import time
+from typing import Any, Iterator
 
+from core.services.grid_spatial_index import GridSpatialIndex
+from core.services.hash_utils import sha256_bytes
 from core.services.logging_api import get_logger
+from core.services.spatial_index_store import IndexedFile, SpatialIndexStore
 from core.services.workspace_ref import parse_workspace_name
 
 logger = get_logger("spatial-filesystem")
@@ -138,6 +145,13 @@ WORKSPACE_CONFIG = {
 }
 
 
+# Files whose front-matter is parsed into ContentMetadata
+METADATA_SUFFIXES = (".md", ".yaml", ".yml", ".json")
+
+# Default location of the persistent metadata index (relative to root_dir)
+DEFAULT_INDEX_PATH = "memory/bank/spatial/spatial_index.db"
+
+
 # =============================================================================
 # Data Models
 # =============================================================================
@@ -161,6 +175,11 @@ class ContentMetadata:
     def to_dict(self) -> dict[str, Any]:
         return asdict(self)
 
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> ContentMetadata:
+        known = {name for name in cls.__dataclass_fields__}
+        return cls(**{k: v for k, v in data.items() if k in known})
+
 
 @dataclass
 class FileLocation:
@@ -204,6 +223,37 @@ class GridLocation:
         return None
 
 
+class _WorkspaceTrie:
+    """Path-component trie over workspace roots for longest-prefix lookup."""
+
+    def __init__(self, roots: dict[WorkspaceType, Path]):
+        self._root: dict[str, Any] = {}
+        for ws_type, path in roots.items():
+            parts = str(path).split(os.sep)
+            node = self._root
+            for part in parts:
+                node = node.setdefault(part, {})
+            node[None] = (ws_type, len(parts))
+
+    def resolve(self, file_path: Path | str) -> tuple[WorkspaceType, str] | None:
+        """Return ``(workspace, relative_path)`` for the deepest matching root."""
+        # Splitting the (already normalised) string is far cheaper than
+        # Path.parts on the hot query paths.
+        parts = str(file_path).split(os.sep)
+        node = self._root
+        match: tuple[WorkspaceType, int] | None = None
+        for part in parts:
+            node = node.get(part)
+            if node is None:
+                break
+            if None in node:
+                match = node[None]
+        if match is None:
+            return None
+        ws_type, depth = match
+        return ws_type, os.sep.join(parts[depth:]) or "."
+
+
 # =============================================================================
 # Spatial Filesystem
 # =============================================================================
@@ -213,13 +263,23 @@ class SpatialFilesystem:
     """Integrates filesystem with spatial grid, content-tagging, and role-based access."""
 
     def __init__(
-        self, root_dir: Path | None = None, user_role: UserRole = UserRole.USER
+        self,
+        root_dir: Path | None = None,
+        user_role: UserRole = UserRole.USER,
+        index_path: Path | None = None,
+        index_max_age: float = 30.0,
     ):
         """Initialize spatial filesystem.
 
         Args:
             root_dir: Root directory (typically uDOS root)
             user_role: User's access level
+            index_path: SQLite metadata index (default: memory/bank/spatial/)
+            index_max_age: Seconds a workspace sync is reused before queries
+                walk the disk again. Writes through this class update the
+                index immediately; files changed by other processes show up
+                in list/find results after at most this long, or at once
+                after ``invalidate_index()``. 0 walks on every query.
         """
         if root_dir is None:
             from core.services.logging_api import get_repo_root
@@ -234,11 +294,15 @@ class SpatialFilesystem:
         self.location_index: dict[str, set[str]] = defaultdict(
             set
         )  # L###-Cell → file paths
+        self.grid_index = GridSpatialIndex()  # location_index as a cell tree
         self.tag_index: dict[str, set[str]] = defaultdict(set)  # tag → file paths
         self.binder_index: dict[str, list[str]] = defaultdict(
             list
         )  # binder_id → chapters
         self.metadata_cache: dict[str, ContentMetadata] = {}  # path → metadata
+        self._metadata_sigs: dict[str, tuple[int, int]] = {}  # path → (mtime_ns, size)
+        self._indexed_sigs: dict[str, tuple[int, int]] = {}  # path → last synced signature
+        self._postings_by_path: dict[str, tuple[list[str], list[str], str | None]] = {}
 
         # Ensure memory workspace folders exist (open-box layout)
         for config in WORKSPACE_CONFIG.values():
@@ -246,10 +310,30 @@ class SpatialFilesystem:
             if isinstance(path, str) and path.startswith("memory/"):
                 (self.root_dir / path).mkdir(parents=True, exist_ok=True)
 
+        self._workspace_trie = _WorkspaceTrie(
+            {ws_type: self.get_workspace_path(ws_type) for ws_type in WorkspaceType}
+        )
+
+        # Persistent index (falls back to in-memory only if unavailable)
+        self.index_max_age = index_max_age
+        self._synced_at: dict[WorkspaceType, float] = {}
+        self.index_store = self._open_index_store(
+            Path(index_path) if index_path else self.root_dir / DEFAULT_INDEX_PATH
+        )
+        if self.index_store is not None:
+            self._load_postings()
+
         logger.info(
             f"[LOCAL] Spatial filesystem initialized (role: {self.user_role.value})"
         )
 
+    def _open_index_store(self, index_path: Path) -> SpatialIndexStore | None:
+        try:
+            return SpatialIndexStore(index_path)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"[LOCAL] Spatial index unavailable ({index_path}): {e}")
+            return None
+
     # =========================================================================
     # Access Control
     # =========================================================================
@@ -297,24 +381,319 @@ class SpatialFilesystem:
         self.ensure_access(ws_type)
 
         ws_path = self.get_workspace_path(ws_type)
+        if not ws_path.exists():
+            return []
+
+        if self.index_store is None:
+            return self._scan_workspace(ws_type, ws_path)
+
+        self.sync_workspace(ws_type)
         files = []
+        # Indexed paths are ws_path-prefixed strings; slicing avoids
+        # Path.relative_to, which dominates listing large workspaces.
+        prefix_len = len(str(ws_path)) + 1
+        for indexed in self.index_store.iter_files(ws_path):
+            files.append(
+                FileLocation(
+                    workspace=ws_type,
+                    relative_path=indexed.path[prefix_len:],
+                    absolute_path=Path(indexed.path),
+                    metadata=self._cache_indexed_metadata(indexed),
+                )
+            )
+        return files
 
-        if ws_path.exists():
-            for item in ws_path.rglob("*"):
-                if item.is_file():
-                    relative_path = str(item.relative_to(ws_path))
-                    metadata = self._extract_metadata(item)
-                    files.append(
-                        FileLocation(
-                            workspace=ws_type,
-                            relative_path=relative_path,
-                            absolute_path=item,
-                            metadata=metadata,
-                        )
+    def _scan_workspace(self, ws_type: WorkspaceType, ws_path: Path) -> list[FileLocation]:
+        """Uncached listing used when the persistent index is unavailable."""
+        files = []
+        for item in ws_path.rglob("*"):
+            if item.is_file():
+                files.append(
+                    FileLocation(
+                        workspace=ws_type,
+                        relative_path=str(item.relative_to(ws_path)),
+                        absolute_path=item,
+                        metadata=self._extract_metadata(item),
                     )
-
+                )
         return files
 
+    # =========================================================================
+    # Persistent Index
+    # =========================================================================
+
+    def sync_workspace(self, ws_type: WorkspaceType, force: bool = False) -> dict[str, int]:
+        """Reconcile the persistent index with files on disk.
+
+        Only files whose mtime/size changed are read, and only those whose
+        content hash changed are re-parsed.
+        """
+        stats = {"scanned": 0, "parsed": 0, "touched": 0, "removed": 0}
+        if self.index_store is None:
+            return stats
+        last = self._synced_at.get(ws_type)
+        if not force and last is not None and time.monotonic() - last < self.index_max_age:
+            return stats
+
+        ws_path = self.get_workspace_path(ws_type)
+        known = self.index_store.signatures(ws_path)
+        seen: set[str] = set()
+        upserts: list[tuple[IndexedFile, list[str], list[str]]] = []
+        touched: list[tuple[str, int, int]] = []
+
+        for file_path, st in self._walk_files(ws_path):
+            key = str(file_path)
+            seen.add(key)
+            stats["scanned"] += 1
+            previous = known.get(key)
+            signature = (st.st_mtime_ns, st.st_size)
+            self._indexed_sigs[key] = signature
+            if previous and (previous[0], previous[1]) == signature:
+                continue
+            entry = self._build_index_entry(file_path, st, previous)
+            if entry is None:
+                if key in self._metadata_sigs:  # same content, cache still valid
+                    self._metadata_sigs[key] = signature
+                touched.append((key, st.st_mtime_ns, st.st_size))
+                stats["touched"] += 1
+                continue
+            upserts.append(entry)
+            stats["parsed"] += 1
+
+        removed = [key for key in known if key not in seen]
+        if upserts:
+            self.index_store.upsert_many(upserts)
+            for indexed, tags, locations in upserts:
+                self._set_postings(indexed.path, tags, locations, (indexed.metadata or {}).get("binder_id"))
+        if touched:
+            self.index_store.touch_many(touched)
+        if removed:
+            stats["removed"] = self.index_store.delete_many(removed)
+            for key in removed:
+                self._drop_postings(key)
+                self._indexed_sigs.pop(key, None)
+
+        now = time.monotonic()
+        for other in WorkspaceType:
+            # Nested workspaces (e.g. @binders inside @vault) were covered too.
+            other_path = self.get_workspace_path(other)
+            if other_path == ws_path or ws_path in other_path.parents:
+                self._synced_at[other] = now
+
+        if stats["parsed"] or stats["removed"]:
+            logger.info(
+                f"[LOCAL] Spatial index sync {ws_type.value}: "
+                f"{stats['parsed']} parsed, {stats['removed']} removed, {stats['scanned']} scanned"
+            )
+        return stats
+
+    def sync_index(self, force: bool = False) -> dict[str, int]:
+        """Sync every workspace the current role can access."""
+        totals = {"scanned": 0, "parsed": 0, "touched": 0, "removed": 0}
+        walked: list[Path] = []
+        # Outer workspaces first, so nested ones (e.g. @binders in @vault)
+        # are covered by their parent's walk instead of walked again.
+        for ws_type in sorted(
+            WorkspaceType, key=lambda ws: len(self.get_workspace_path(ws).parts)
+        ):
+            if not self.has_access(ws_type):
+                continue
+            ws_path = self.get_workspace_path(ws_type)
+            if any(ws_path == path or path in ws_path.parents for path in walked):
+                continue
+            if not force and ws_type in self._synced_at and (
+                time.monotonic() - self._synced_at[ws_type] < self.index_max_age
+            ):
+                continue
+            for key, value in self.sync_workspace(ws_type, force=True).items():
+                totals[key] += value
+            walked.append(ws_path)
+        return totals
+
+    def invalidate_index(self, ws_type: WorkspaceType | None = None) -> None:
+        """Make the next query re-walk ``ws_type`` (default: every workspace).
+
+        For callers that changed files behind this class's back and need
+        list/find to see it before ``index_max_age`` runs out.
+        """
+        if ws_type is None:
+            self._synced_at.clear()
+        else:
+            self._synced_at.pop(ws_type, None)
+
+    def _walk_files(self, root: Path):
+        """Yield ``(path, stat)`` for every regular file under ``root``."""
+        if not root.is_dir():
+            return
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            try:
+                entries = list(os.scandir(directory))
+            except OSError:
+                continue
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(Path(entry.path))
+                    elif entry.is_file():
+                        yield Path(entry.path), entry.stat()
+                except OSError:
+                    continue
+
+    def _build_index_entry(
+        self,
+        file_path: Path,
+        st: os.stat_result,
+        previous: tuple[int, int, str] | None = None,
+    ) -> tuple[IndexedFile, list[str], list[str]] | None:
+        """Build an index row for ``file_path``.
+
+        Returns None when the content hash matches ``previous`` (only the
+        stored mtime/size need refreshing).
+        """
+        key = str(file_path)
+        workspace = self._workspace_for_path(file_path)
+        metadata = None
+        content_hash = ""
+        if file_path.suffix in METADATA_SUFFIXES:
+            try:
+                raw = file_path.read_bytes()
+            except OSError:
+                raw = b""
+            content_hash = sha256_bytes(raw)
+            if previous and previous[2] == content_hash:
+                return None
+            metadata = self._parse_metadata(raw.decode("utf-8", errors="replace"), file_path)
+            if metadata is not None:
+                self.metadata_cache[key] = metadata
+                self._metadata_sigs[key] = (st.st_mtime_ns, st.st_size)
+
+        tags = [tag.lower() for tag in metadata.tags] if metadata else []
+        locations = (
+            [str(loc) for loc in metadata.grid_locations if GridLocation.parse(str(loc))]
+            if metadata
+            else []
+        )
+        indexed = IndexedFile(
+            path=key,
+            workspace=workspace.value if workspace else "",
+            mtime_ns=st.st_mtime_ns,
+            size=st.st_size,
+            content_hash=content_hash,
+            metadata=metadata.to_dict() if metadata else None,
+        )
+        return indexed, tags, locations
+
+    def _workspace_for_path(self, file_path: Path) -> WorkspaceType | None:
+        """Return the most specific workspace containing ``file_path``."""
+        resolved = self._workspace_trie.resolve(file_path)
+        return resolved[0] if resolved else None
+
+    def _metadata_for_key(self, file_key: str) -> ContentMetadata | None:
+        """Cached metadata for an indexed path, trusting the last sync.
+
+        The cache is reused while its signature matches the one ``sync_index``
+        last reconciled for the path; otherwise the index row is read (it may
+        have been updated by another process). Neither path stats the file.
+        """
+        if self.index_store is None:
+            return self._extract_metadata(Path(file_key))
+        cached = self.metadata_cache.get(file_key)
+        signature = self._metadata_sigs.get(file_key)
+        if cached is not None and signature is not None and (
+            self._indexed_sigs.get(file_key, signature) == signature
+        ):
+            return cached
+        indexed = self.index_store.get(file_key)
+        if indexed is None:
+            return None
+        return self._cache_indexed_metadata(indexed)
+
+    def _visible_workspace(self, file_path: Path) -> tuple[WorkspaceType, str] | None:
+        """Workspace and relative path for an indexed path the role may see."""
+        resolved = self._workspace_trie.resolve(file_path)
+        if resolved is None or not self.has_access(resolved[0]):
+            return None
+        # With the persistent index, deletions are reconciled by sync_index();
+        # without it, fall back to checking the filesystem.
+        if self.index_store is None and not file_path.exists():
+            return None
+        return resolved
+
+    def _location_for_key(
+        self, file_key: str, grid_locations: list[str] | None = None
+    ) -> FileLocation | None:
+        """Build a FileLocation for an indexed path, or None if not visible."""
+        file_path = Path(file_key)
+        resolved = self._visible_workspace(file_path)
+        if resolved is None:
+            return None
+        ws_type, relative_path = resolved
+        return FileLocation(
+            workspace=ws_type,
+            relative_path=relative_path,
+            absolute_path=file_path,
+            grid_locations=grid_locations or [],
+            metadata=self._metadata_for_key(file_key),
+        )
+
+    def _cache_indexed_metadata(self, indexed: IndexedFile) -> ContentMetadata | None:
+        if indexed.metadata is None:
+            return None
+        cached = self.metadata_cache.get(indexed.path)
+        if cached is not None and self._metadata_sigs.get(indexed.path) == (indexed.mtime_ns, indexed.size):
+            return cached
+        metadata = ContentMetadata.from_dict(indexed.metadata)
+        self.metadata_cache[indexed.path] = metadata
+        self._metadata_sigs[indexed.path] = (indexed.mtime_ns, indexed.size)
+        return metadata
+
+    def _load_postings(self) -> None:
+        postings = self.index_store.postings()
+        per_path: dict[str, tuple[list[str], list[str], str | None]] = {}
+        for tag, paths in postings["tags"].items():
+            self.tag_index[tag].update(paths)
+            for path in paths:
+                per_path.setdefault(path, ([], [], None))[0].append(tag)
+        for location, paths in postings["locations"].items():
+            self.location_index[location].update(paths)
+            for path in paths:
+                self.grid_index.add(path, location)
+                per_path.setdefault(path, ([], [], None))[1].append(location)
+        for binder_id, paths in postings["binders"].items():
+            self.binder_index[binder_id].extend(paths)
+            for path in paths:
+                tags, locations, _ = per_path.get(path, ([], [], None))
+                per_path[path] = (tags, locations, binder_id)
+        self._postings_by_path.update(per_path)
+
+    def _set_postings(
+        self, file_key: str, tags: list[str], locations: list[str], binder_id: str | None
+    ) -> None:
+        self._drop_postings(file_key)
+        for tag in tags:
+            self.tag_index[tag].add(file_key)
+        for location in locations:
+            self.location_index[location].add(file_key)
+            self.grid_index.add(file_key, location)
+        if binder_id:
+            self.binder_index[str(binder_id)].append(file_key)
+        self._postings_by_path[file_key] = (list(tags), list(locations), binder_id)
+
+    def _drop_postings(self, file_key: str) -> None:
+        previous = self._postings_by_path.pop(file_key, None)
+        if previous is None:
+            return
+        tags, locations, binder_id = previous
+        for tag in tags:
+            self.tag_index.get(tag, set()).discard(file_key)
+        for location in locations:
+            self.location_index.get(location, set()).discard(file_key)
+        self.grid_index.remove(file_key)
+        if binder_id and file_key in self.binder_index.get(str(binder_id), []):
+            self.binder_index[str(binder_id)].remove(file_key)
+
     # =========================================================================
     # File Operations
     # =========================================================================
@@ -338,8 +717,8 @@ class SpatialFilesystem:
         from core.services.user_service import is_ghost_mode
 
         if is_ghost_mode():
-            logger = logging.getLogger(__name__)
-            logger.warning(
+            alert_logger = logging.getLogger(__name__)
+            alert_logger.warning(
                 "[TESTING ALERT] Ghost Mode active: write_file in demo mode. "
                 "Enforcement will be added before v1.5 release."
             )
@@ -373,8 +752,8 @@ class SpatialFilesystem:
         from core.services.user_service import is_ghost_mode
 
         if is_ghost_mode():
-            logger = logging.getLogger(__name__)
-            logger.warning(
+            alert_logger = logging.getLogger(__name__)
+            alert_logger.warning(
                 "[TESTING ALERT] Ghost Mode active: delete_file in demo mode. "
                 "Enforcement will be added before v1.5 release."
             )
@@ -387,22 +766,53 @@ class SpatialFilesystem:
             file_path.unlink()
             logger.info(f"[LOCAL] Deleted file: {workspace_ref}")
 
+        file_key = str(file_path)
+        self.metadata_cache.pop(file_key, None)
+        self._metadata_sigs.pop(file_key, None)
+        self._indexed_sigs.pop(file_key, None)
+        self._drop_postings(file_key)
+        if self.index_store is not None:
+            self.index_store.delete_many([file_key])
+
     # =========================================================================
     # Metadata & Front-Matter
     # =========================================================================
 
     def _extract_metadata(self, file_path: Path) -> ContentMetadata | None:
-        """Extract front-matter metadata from markdown file."""
-        if not file_path.suffix in [".md", ".yaml", ".yml", ".json"]:
+        """Extract front-matter metadata from markdown file.
+
+        Cached per path and invalidated when the file's mtime/size change.
+        """
+        if not file_path.suffix in METADATA_SUFFIXES:
             return None
 
         cache_key = str(file_path)
-        if cache_key in self.metadata_cache:
+        try:
+            st = file_path.stat()
+        except OSError:
+            st = None
+        signature = (st.st_mtime_ns, st.st_size) if st else None
+        if cache_key in self.metadata_cache and (
+            signature is None or self._metadata_sigs.get(cache_key) == signature
+        ):
             return self.metadata_cache[cache_key]
 
         try:
             content = file_path.read_text(encoding="utf-8")
+        except Exception as e:
+            logger.warning(f"[LOCAL] Failed to extract metadata from {file_path}: {e}")
+            return None
+
+        metadata = self._parse_metadata(content, file_path)
+        if metadata is not None:
+            self.metadata_cache[cache_key] = metadata
+            if signature:
+                self._metadata_sigs[cache_key] = signature
+        return metadata
 
+    def _parse_metadata(self, content: str, file_path: Path) -> ContentMetadata | None:
+        """Parse front-matter + inline tags from file content."""
+        try:
             frontmatter_str = ""
             body = content
 
@@ -438,7 +848,7 @@ class SpatialFilesystem:
                     seen.add(key)
                     merged_tags.append(tag_clean)
 
-            metadata = ContentMetadata(
+            return ContentMetadata(
                 title=metadata_dict.get("title", ""),
                 description=metadata_dict.get("description", ""),
                 tags=merged_tags,
@@ -467,9 +877,6 @@ class SpatialFilesystem:
                     ]
                 },
             )
-
-            self.metadata_cache[cache_key] = metadata
-            return metadata
         except Exception as e:
             logger.warning(f"[LOCAL] Failed to extract metadata from {file_path}: {e}")
 
@@ -492,27 +899,23 @@ class SpatialFilesystem:
     def _index_file(
         self, file_path: Path, workspace: WorkspaceType, relative_path: str
     ) -> None:
-        """Index file in location/tag indexes."""
-        metadata = self._extract_metadata(file_path)
-        if not metadata:
+        """Index file in location/tag indexes (and the persistent index)."""
+        try:
+            st = file_path.stat()
+        except OSError:
             return
+        entry = self._build_index_entry(file_path, st)
+        if entry is None:
+            return
+        indexed, tags, locations = entry
+        metadata = indexed.metadata or {}
+        self._set_postings(indexed.path, tags, locations, metadata.get("binder_id"))
+        self._indexed_sigs[indexed.path] = (indexed.mtime_ns, indexed.size)
+        if self.index_store is not None:
+            self.index_store.upsert_many([entry])
 
-        file_key = str(file_path)
-
-        # Index by grid locations
-        for location_str in metadata.grid_locations:
-            if GridLocation.parse(location_str):
-                self.location_index[location_str].add(file_key)
-
-        # Index by tags
-        for tag in metadata.tags:
-            self.tag_index[tag.lower()].add(file_key)
-
-        # Index by binder
-        if metadata.binder_id:
-            self.binder_index[metadata.binder_id].append(file_key)
-
-        logger.info(f"[LOCAL] Indexed file: {relative_path} (tags: {metadata.tags})")
+        if indexed.metadata is not None:
+            logger.info(f"[LOCAL] Indexed file: {relative_path} (tags: {metadata.get('tags')})")
 
     # =========================================================================
     # Grid Location Operations
@@ -543,43 +946,62 @@ class SpatialFilesystem:
         content_updated = self._update_frontmatter(content, metadata)
         file_path.write_text(content_updated, encoding="utf-8")
 
-        # Update cache
+        # Update cache + indexes
         self.metadata_cache[str(file_path)] = metadata
-        self.location_index[str(location_str)].add(str(file_path))
+        self._index_file(file_path, ws_type, relative_path)
 
         logger.info(f"[LOCAL] Tagged {workspace_ref} with location: {location_str}")
 
-    def find_by_location(self, location_str: str) -> list[FileLocation]:
+    def find_by_location(
+        self, location_str: str, offset: int = 0, limit: int | None = None
+    ) -> list[FileLocation]:
         """Find files at grid location."""
         location = GridLocation.parse(location_str)
         if not location:
             raise ValueError(f"Invalid grid location format: {location_str}")
 
-        file_keys = self.location_index.get(location_str, set())
-        results = []
-
-        for file_key in file_keys:
-            file_path = Path(file_key)
-            if file_path.exists():
-                # Determine workspace
-                for ws_type in WorkspaceType:
-                    ws_path = self.get_workspace_path(ws_type)
-                    try:
-                        relative_path = str(file_path.relative_to(ws_path))
-                        results.append(
-                            FileLocation(
-                                workspace=ws_type,
-                                relative_path=relative_path,
-                                absolute_path=file_path,
-                                grid_locations=[location_str],
-                                metadata=self._extract_metadata(file_path),
-                            )
-                        )
-                        break
-                    except ValueError:
-                        continue
-
-        return results
+        self.sync_index()
+        file_keys = sorted(self.location_index.get(location_str, set()))
+        results = (self._location_for_key(key, [location_str]) for key in file_keys)
+        visible = (item for item in results if item is not None)
+        return list(islice(visible, offset, None if limit is None else offset + limit))
+
+    def find_near_location(
+        self, location_str: str, radius: int = 1, offset: int = 0, limit: int | None = None
+    ) -> list[FileLocation]:
+        """Find files tagged within ``radius`` cells of a grid location."""
+        location = GridLocation.parse(location_str)
+        if not location:
+            raise ValueError(f"Invalid grid location format: {location_str}")
+
+        self.sync_index()
+        file_keys = self.grid_index.within_cells(location_str, radius)
+        results = (self._location_for_key(key, self.grid_index.codes(key)) for key in file_keys)
+        visible = (item for item in results if item is not None)
+        return list(islice(visible, offset, None if limit is None else offset + limit))
+
+    def find_nearest_location(
+        self, location_str: str, k: int = 5, max_km: float | None = None
+    ) -> list[tuple[FileLocation, float]]:
+        """Find the ``k`` visible files closest to a grid location, with distance in km."""
+        location = GridLocation.parse(location_str)
+        if not location:
+            raise ValueError(f"Invalid grid location format: {location_str}")
+
+        self.sync_index()
+        found: list[tuple[FileLocation, float]] = []
+        # Over-fetch so files hidden by access rules don't shrink the result.
+        fetch = k
+        while True:
+            nearest = self.grid_index.nearest_to(location_str, k=fetch, max_km=max_km)
+            found = []
+            for key, distance in nearest:
+                item = self._location_for_key(key, self.grid_index.codes(key))
+                if item is not None:
+                    found.append((item, distance))
+            if len(found) >= k or len(nearest) < fetch:
+                return found[:k]
+            fetch *= 2
 
     # =========================================================================
     # Content Tagging
@@ -595,35 +1017,64 @@ class SpatialFilesystem:
 
         return metadata.tags if metadata else []
 
-    def find_by_tags(self, tags: list[str]) -> list[FileLocation]:
-        """Find files matching any of the given tags."""
-        tags_lower = [t.lower() for t in tags]
-        file_keys: set[str] = set()
-
-        for tag in tags_lower:
-            file_keys.update(self.tag_index.get(tag, set()))
-
-        results = []
-        for file_key in file_keys:
-            file_path = Path(file_key)
-            if file_path.exists():
-                for ws_type in WorkspaceType:
-                    ws_path = self.get_workspace_path(ws_type)
-                    try:
-                        relative_path = str(file_path.relative_to(ws_path))
-                        results.append(
-                            FileLocation(
-                                workspace=ws_type,
-                                relative_path=relative_path,
-                                absolute_path=file_path,
-                                metadata=self._extract_metadata(file_path),
-                            )
-                        )
-                        break
-                    except ValueError:
-                        continue
-
-        return results
+    def find_by_tags(
+        self,
+        tags: list[str],
+        match: str = "any",
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> list[FileLocation]:
+        """Find files matching any (or, with ``match="all"``, every) tag.
+
+        ``offset``/``limit`` page through results in stable path order.
+        """
+        return list(self.iter_by_tags(tags, match=match, offset=offset, limit=limit))
+
+    def iter_by_tags(
+        self,
+        tags: list[str],
+        match: str = "any",
+        offset: int = 0,
+        limit: int | None = None,
+    ) -> Iterator[FileLocation]:
+        """Lazily yield files for a tag query; FileLocations are built on demand."""
+        self.sync_index()
+        file_keys = self._match_tag_keys(tags, match)
+        results = (self._location_for_key(key) for key in sorted(file_keys))
+        visible = (item for item in results if item is not None)
+        return islice(visible, offset, None if limit is None else offset + limit)
+
+    def count_by_tags(self, tags: list[str], match: str = "any") -> int:
+        """Number of visible files matching a tag query (no results are built)."""
+        self.sync_index()
+        visible = 0
+        allowed_dirs: dict[str, bool] = {}  # a directory's files share a workspace
+        for key in self._match_tag_keys(tags, match):
+            directory = os.path.dirname(key)
+            allowed = allowed_dirs.get(directory)
+            if allowed is None:
+                resolved = self._workspace_trie.resolve(key)
+                allowed = resolved is not None and self.has_access(resolved[0])
+                allowed_dirs[directory] = allowed
+            visible += allowed
+        return visible
+
+    def _match_tag_keys(self, tags: list[str], match: str) -> set[str]:
+        if match not in ("any", "all"):
+            raise ValueError(f"Invalid tag match mode: {match}")
+        postings = [self.tag_index.get(tag.lower(), set()) for tag in tags]
+        if not postings:
+            return set()
+        if match == "any":
+            return set().union(*postings)
+        # Intersect smallest-first so large tags cost a membership test each.
+        postings.sort(key=len)
+        result = set(postings[0])
+        for posting in postings[1:]:
+            if not result:
+                break
+            result.intersection_update(posting)
+        return result
 
     # =========================================================================
     # Binder Operations
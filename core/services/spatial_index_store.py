@@ -0,0 +1,244 @@
+"""
+Spatial Index Store (Core)
+
+SQLite persistence for SpatialFilesystem metadata: one row per file keyed by
+absolute path (mtime/size/content-hash signature + extracted front-matter),
+plus tag, grid-location and binder postings. Lets the filesystem skip
+re-parsing unchanged files across restarts.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from core.services.time_utils import utc_now_iso
+
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS spatial_files (
+    path TEXT PRIMARY KEY,
+    workspace TEXT NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    content_hash TEXT NOT NULL DEFAULT '',
+    metadata_json TEXT,
+    indexed_at TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS spatial_tags (
+    tag TEXT NOT NULL,
+    path TEXT NOT NULL REFERENCES spatial_files(path) ON DELETE CASCADE,
+    PRIMARY KEY (tag, path)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_spatial_tags_path ON spatial_tags(path);
+CREATE TABLE IF NOT EXISTS spatial_locations (
+    location TEXT NOT NULL,
+    path TEXT NOT NULL REFERENCES spatial_files(path) ON DELETE CASCADE,
+    PRIMARY KEY (location, path)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_spatial_locations_path ON spatial_locations(path);
+CREATE TABLE IF NOT EXISTS spatial_binders (
+    binder_id TEXT NOT NULL,
+    path TEXT NOT NULL REFERENCES spatial_files(path) ON DELETE CASCADE,
+    PRIMARY KEY (binder_id, path)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_spatial_binders_path ON spatial_binders(path);
+"""
+
+
+@dataclass
+class IndexedFile:
+    """Stored signature and metadata for one file."""
+
+    path: str
+    workspace: str
+    mtime_ns: int
+    size: int
+    content_hash: str
+    metadata: Optional[Dict[str, Any]]
+
+
+def _subtree_bounds(root: Path) -> Tuple[str, str]:
+    """Return a half-open path range covering everything under ``root``.
+
+    Every path below ``root`` starts with ``root + sep``; bumping the separator
+    by one code point gives an upper bound, so the subtree is a primary-key
+    range scan.
+    """
+    prefix = str(root).rstrip(os.sep)
+    return f"{prefix}{os.sep}", f"{prefix}{chr(ord(os.sep) + 1)}"
+
+
+class SpatialIndexStore:
+    """SQLite-backed file/tag/location index."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def _ensure_schema(self) -> None:
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode = WAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, _SCHEMA_VERSION):
+                conn.executescript(
+                    """
+                    DROP TABLE IF EXISTS spatial_tags;
+                    DROP TABLE IF EXISTS spatial_locations;
+                    DROP TABLE IF EXISTS spatial_binders;
+                    DROP TABLE IF EXISTS spatial_files;
+                    """
+                )
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def signatures(self, root: Path) -> Dict[str, Tuple[int, int, str]]:
+        """Return ``path -> (mtime_ns, size, content_hash)`` under ``root``."""
+        low, high = _subtree_bounds(root)
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT path, mtime_ns, size, content_hash FROM spatial_files WHERE path >= ? AND path < ?",
+                (low, high),
+            ).fetchall()
+        return {row[0]: (row[1], row[2], row[3]) for row in rows}
+
+    def iter_files(self, root: Path) -> Iterator[IndexedFile]:
+        """Yield indexed files under ``root`` ordered by path."""
+        low, high = _subtree_bounds(root)
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT path, workspace, mtime_ns, size, content_hash, metadata_json "
+                "FROM spatial_files WHERE path >= ? AND path < ? ORDER BY path",
+                (low, high),
+            ).fetchall()
+        for row in rows:
+            yield IndexedFile(
+                path=row[0],
+                workspace=row[1],
+                mtime_ns=row[2],
+                size=row[3],
+                content_hash=row[4],
+                metadata=json.loads(row[5]) if row[5] else None,
+            )
+
+    def get(self, path: str) -> Optional[IndexedFile]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT path, workspace, mtime_ns, size, content_hash, metadata_json "
+                "FROM spatial_files WHERE path = ?",
+                (path,),
+            ).fetchone()
+        if row is None:
+            return None
+        return IndexedFile(
+            path=row[0],
+            workspace=row[1],
+            mtime_ns=row[2],
+            size=row[3],
+            content_hash=row[4],
+            metadata=json.loads(row[5]) if row[5] else None,
+        )
+
+    def postings(self) -> Dict[str, Dict[str, List[str]]]:
+        """Load all postings (used to warm the in-memory indexes)."""
+        result: Dict[str, Dict[str, List[str]]] = {"tags": {}, "locations": {}, "binders": {}}
+        with self._connect() as conn:
+            for kind, sql in (
+                ("tags", "SELECT tag, path FROM spatial_tags"),
+                ("locations", "SELECT location, path FROM spatial_locations"),
+                ("binders", "SELECT binder_id, path FROM spatial_binders ORDER BY path"),
+            ):
+                for key, path in conn.execute(sql):
+                    result[kind].setdefault(key, []).append(path)
+        return result
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def upsert_many(self, entries: Iterable[Tuple[IndexedFile, Iterable[str], Iterable[str]]]) -> int:
+        """Insert or replace files with their tag and location postings.
+
+        Each entry is ``(file, tags, locations)``; binder postings come from
+        ``file.metadata['binder_id']``.
+        """
+        count = 0
+        now = utc_now_iso()
+        with self._connect() as conn:
+            for indexed, tags, locations in entries:
+                metadata_json = (
+                    json.dumps(indexed.metadata, ensure_ascii=False, default=str)
+                    if indexed.metadata is not None
+                    else None
+                )
+                conn.execute(
+                    """
+                    INSERT INTO spatial_files (path, workspace, mtime_ns, size, content_hash, metadata_json, indexed_at)
+                    VALUES (?, ?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(path) DO UPDATE SET
+                        workspace = excluded.workspace,
+                        mtime_ns = excluded.mtime_ns,
+                        size = excluded.size,
+                        content_hash = excluded.content_hash,
+                        metadata_json = excluded.metadata_json,
+                        indexed_at = excluded.indexed_at
+                    """,
+                    (
+                        indexed.path,
+                        indexed.workspace,
+                        indexed.mtime_ns,
+                        indexed.size,
+                        indexed.content_hash,
+                        metadata_json,
+                        now,
+                    ),
+                )
+                for table in ("spatial_tags", "spatial_locations", "spatial_binders"):
+                    conn.execute(f"DELETE FROM {table} WHERE path = ?", (indexed.path,))
+                conn.executemany(
+                    "INSERT OR IGNORE INTO spatial_tags (tag, path) VALUES (?, ?)",
+                    [(tag, indexed.path) for tag in tags],
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO spatial_locations (location, path) VALUES (?, ?)",
+                    [(location, indexed.path) for location in locations],
+                )
+                binder_id = (indexed.metadata or {}).get("binder_id")
+                if binder_id:
+                    conn.execute(
+                        "INSERT OR IGNORE INTO spatial_binders (binder_id, path) VALUES (?, ?)",
+                        (str(binder_id), indexed.path),
+                    )
+                count += 1
+        return count
+
+    def touch_many(self, entries: Iterable[Tuple[str, int, int]]) -> None:
+        """Refresh stored ``(path, mtime_ns, size)`` when content hash is unchanged."""
+        with self._connect() as conn:
+            conn.executemany(
+                "UPDATE spatial_files SET mtime_ns = ?, size = ? WHERE path = ?",
+                [(mtime_ns, size, path) for path, mtime_ns, size in entries],
+            )
+
+    def delete_many(self, paths: Iterable[str]) -> int:
+        rows = [(path,) for path in paths]
+        if not rows:
+            return 0
+        with self._connect() as conn:
+            conn.executemany("DELETE FROM spatial_files WHERE path = ?", rows)
+        return len(rows)
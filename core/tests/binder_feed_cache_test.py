@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+from core.binder.feed import (
+    BinderFeed,
+    FeedFormat,
+    FrontmatterExtractor,
+    feed_cache_path,
+)
+
+
+def _write_doc(binder: Path, name: str, title: str, date: str) -> Path:
+    path = binder / name
+    path.write_text(f"---\ntitle: {title}\ndate: {date}\n---\n\nBody of {title}.\n", encoding="utf-8")
+    return path
+
+
+def _binder(tmp_path: Path) -> Path:
+    binder = tmp_path / "binder"
+    binder.mkdir()
+    for idx in range(5):
+        _write_doc(binder, f"doc-{idx}.md", f"Doc {idx}", f"2026-01-0{idx + 1}")
+    return binder
+
+
+def _feed(binder: Path, **kwargs) -> BinderFeed:
+    return BinderFeed(binder, cache_dir=binder.parent / "cache", **kwargs)
+
+
+def test_scan_files_reuses_cache_for_unchanged_files(tmp_path, monkeypatch):
+    binder = _binder(tmp_path)
+    first = _feed(binder).scan_files()
+    assert [item.title for item in first] == ["Doc 4", "Doc 3", "Doc 2", "Doc 1", "Doc 0"]
+    assert feed_cache_path(binder, tmp_path / "cache").exists()
+    assert sorted(path.name for path in binder.iterdir()) == [f"doc-{idx}.md" for idx in range(5)]
+
+    calls = []
+    original = FrontmatterExtractor.extract
+
+    def _counting(path):
+        calls.append(Path(path).name)
+        return original(path)
+
+    monkeypatch.setattr(FrontmatterExtractor, "extract", staticmethod(_counting))
+    doc = _write_doc(binder, "doc-2.md", "Doc 2 edited", "2026-01-03")
+    os.utime(doc, ns=(doc.stat().st_atime_ns, doc.stat().st_mtime_ns + 1_000_000))
+
+    second = _feed(binder).scan_files()
+    assert calls == ["doc-2.md"]
+    assert [item.to_dict() for item in second if item.title != "Doc 2 edited"] == [
+        item.to_dict() for item in first if item.title != "Doc 2"
+    ]
+
+
+def test_scan_files_drops_deleted_files_and_limits(tmp_path):
+    binder = _binder(tmp_path)
+    _feed(binder).scan_files()
+    (binder / "doc-4.md").unlink()
+
+    items = _feed(binder).scan_files(limit=2)
+    assert [item.title for item in items] == ["Doc 3", "Doc 2"]
+    cached = json.loads(feed_cache_path(binder, tmp_path / "cache").read_text(encoding="utf-8"))
+    assert "doc-4.md" not in cached["entries"]
+
+
+def test_guid_is_stable_and_base_url_not_cached(tmp_path):
+    binder = _binder(tmp_path)
+    plain = _feed(binder).scan_files()
+    hosted = _feed(binder, base_url="https://example.test").scan_files()
+    assert hosted[0].url == f"https://example.test/{plain[0].url}"
+    assert plain[0].guid == _feed(binder, use_cache=False).scan_files()[0].guid
+
+
+def test_render_returns_304_for_matching_validators(tmp_path):
+    binder = _binder(tmp_path)
+    feed = _feed(binder)
+    full = feed.render(format=FeedFormat.JSON_FEED, limit=3)
+    assert full.status == 200
+    assert len(json.loads(full.body)["items"]) == 3
+
+    etag = full.validators.etag
+    assert feed.render(format=FeedFormat.JSON_FEED, limit=3, if_none_match=etag).status == 304
+    assert feed.render(format=FeedFormat.RSS_2_0, limit=3, if_none_match=etag).status == 200
+    since = full.validators.last_modified
+    assert feed.render(format=FeedFormat.JSON_FEED, limit=3, if_modified_since=since).status == 304
+
+    doc = binder / "doc-0.md"
+    os.utime(doc, ns=(doc.stat().st_atime_ns, doc.stat().st_mtime_ns + 5_000_000_000))
+    assert feed.render(format=FeedFormat.JSON_FEED, limit=3, if_none_match=etag).status == 200
+
+
+def test_deleting_a_post_advances_last_modified(tmp_path):
+    binder = _binder(tmp_path)
+    old = 1_600_000_000
+    for path in [binder, *binder.iterdir()]:
+        os.utime(path, (old, old))
+    os.utime(binder / "doc-4.md", (old + 100, old + 100))  # newest post, deleted below
+    feed = _feed(binder)
+    since = feed.render(format=FeedFormat.JSON_FEED).validators.last_modified
+
+    (binder / "doc-4.md").unlink()
+    after = feed.render(format=FeedFormat.JSON_FEED, if_modified_since=since)
+    assert after.status == 200
+    assert [item["title"] for item in json.loads(after.body)["items"]][0] == "Doc 3"
@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import itertools
+import random
+import string
+
+from core.services.command_dispatch_service import (
+    _UCODE_MATCHER,
+    UCODE_COMMANDS,
+    _levenshtein_distance,
+    match_ucode_command,
+)
+from core.services.command_fuzzy_matcher import (
+    FuzzyCommandMatcher,
+    bounded_levenshtein,
+    get_command_matcher,
+)
+
+
+def _linear_closest(token: str, commands) -> tuple[str, int] | None:
+    candidates = [(cmd, _levenshtein_distance(token, cmd)) for cmd in commands]
+    candidates = [item for item in candidates if item[1] <= 2]
+    if not candidates:
+        return None
+    return min(candidates, key=lambda x: (x[1], x[0]))
+
+
+def test_bounded_levenshtein_matches_full_distance_within_budget():
+    words = ["PLAY", "PLAU", "PLAYA", "XYZ123", "", "STATUS", "STATS"]
+    for a, b in itertools.product(words, repeat=2):
+        full = _levenshtein_distance(a, b)
+        bounded = bounded_levenshtein(a, b, 2)
+        assert bounded == (full if full <= 2 else None)
+
+
+def test_matcher_agrees_with_linear_scan():
+    matcher = FuzzyCommandMatcher(UCODE_COMMANDS)
+    rng = random.Random(1234)
+    tokens = set()
+    for cmd in sorted(UCODE_COMMANDS):
+        for _ in range(6):
+            chars = list(cmd)
+            for _ in range(rng.randint(1, 3)):
+                op = rng.choice("ids")
+                pos = rng.randrange(len(chars) + (op == "i"))
+                if op == "i":
+                    chars.insert(pos, rng.choice(string.ascii_uppercase))
+                elif op == "d" and len(chars) > 1:
+                    del chars[pos % len(chars)]
+                else:
+                    chars[pos % len(chars)] = rng.choice(string.ascii_uppercase)
+            tokens.add("".join(chars))
+    for token in tokens:
+        assert matcher.closest(token) == _linear_closest(token, UCODE_COMMANDS), token
+
+
+def test_matcher_is_cached_per_command_set():
+    commands = frozenset(UCODE_COMMANDS)
+    assert get_command_matcher(commands) is get_command_matcher(commands)
+    assert get_command_matcher(frozenset({"ALPHA"})) is not get_command_matcher(commands)
+    assert _UCODE_MATCHER is get_command_matcher(commands)
+
+
+def test_match_ucode_command_contract_unchanged():
+    assert match_ucode_command("STATUS now") == ("STATUS", 1.0)
+    command, confidence = match_ucode_command("STATSU")
+    assert command == "STATUS"
+    assert confidence == 0.8
+    assert match_ucode_command("ls -la") == (None, 0.0)
+    assert match_ucode_command("QQQQQQQQ") == (None, 0.0)
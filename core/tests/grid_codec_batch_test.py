@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import math
+import random
+
+import pytest
+
+from core.services.grid_codec import (
+    NUMPY_AVAILABLE,
+    _index_to_col,
+    decode_many,
+    decode_to_latlon,
+    decode_to_latlon_bounds,
+    encode_from_latlon,
+    encode_many,
+)
+
+
+def _sample_codes(count: int) -> list[str]:
+    rng = random.Random(11)
+    cols = [_index_to_col(index) for index in range(80)]
+    codes = []
+    for _ in range(count):
+        cells = "-".join(f"{rng.choice(cols)}{rng.randint(10, 39)}" for _ in range(rng.randint(1, 5)))
+        codes.append(f"L{rng.randint(300, 899)}-{cells}")
+    return codes
+
+
+def _close(left: tuple[float, ...] | None, right: tuple[float, ...] | None) -> bool:
+    if left is None or right is None:
+        return left is right
+    return all(math.isclose(a, b, rel_tol=0.0, abs_tol=1e-9) for a, b in zip(left, right, strict=True))
+
+
+def test_decode_many_matches_scalar_bounds_and_centers() -> None:
+    codes = _sample_codes(2000) + ["L300-dc39-aA10", "L300-ZZ10"]
+
+    bounds = decode_many(codes)
+    centers = decode_many(codes, centers=True)
+
+    assert all(_close(batch, decode_to_latlon_bounds(code)) for code, batch in zip(codes, bounds, strict=True))
+    assert all(_close(batch, decode_to_latlon(code)) for code, batch in zip(codes, centers, strict=True))
+
+
+@pytest.mark.parametrize(
+    "code",
+    ["", "X300-AA10", "L300", "Labc-AA10", "L300-AA09", "L300-AA40", "L300-AA1", "L300-A110", None, 42],
+)
+def test_decode_many_returns_none_for_invalid_codes(code: object) -> None:
+    assert decode_many(["L300-AA10", code]) == [decode_to_latlon_bounds("L300-AA10"), None]
+
+
+def test_encode_many_matches_scalar_encode() -> None:
+    rng = random.Random(5)
+    lats = [rng.uniform(-95.0, 95.0) for _ in range(2000)] + [90.0, -90.0, 0.0]
+    lons = [rng.uniform(-185.0, 185.0) for _ in range(2000)] + [180.0, -180.0, 0.0]
+
+    assert encode_many(7, lats, lons) == [encode_from_latlon(7, lat, lon) for lat, lon in zip(lats, lons, strict=True)]
+
+
+def test_encode_many_rejects_mismatched_lengths() -> None:
+    with pytest.raises(ValueError):
+        encode_many(300, [0.0, 1.0], [0.0])
+
+
+@pytest.mark.skipif(not NUMPY_AVAILABLE, reason="numpy not installed")
+def test_decode_many_as_array_marks_invalid_rows_with_nan() -> None:
+    import numpy as np
+
+    array = decode_many(np.array(["L300-AA10", "bogus"]), as_array=True)
+
+    assert array.shape == (2, 4)
+    assert np.allclose(array[0], decode_to_latlon_bounds("L300-AA10"))
+    assert np.isnan(array[1]).all()
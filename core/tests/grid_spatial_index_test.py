@@ -0,0 +1,110 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from core.services.grid_codec import (
+    _index_to_col,
+    decode_to_latlon,
+    decode_to_latlon_bounds,
+)
+from core.services.grid_spatial_index import GridSpatialIndex, haversine_km
+
+
+def _random_entries(count: int, seed: int = 3) -> list[tuple[str, str]]:
+    rng = random.Random(seed)
+    cols = [_index_to_col(index) for index in range(80)]
+    entries = []
+    for index in range(count):
+        cells = "-".join(f"{rng.choice(cols)}{rng.randint(10, 39)}" for _ in range(rng.randint(1, 3)))
+        entries.append((f"item-{index}", f"L{rng.choice([300, 305])}-{cells}"))
+    return entries
+
+
+def test_contained_in_and_containing_follow_the_cell_path() -> None:
+    index = GridSpatialIndex(
+        [
+            ("city", "L300-BV34-AQ35"),
+            ("region", "L300-BV34"),
+            ("room", "L300-BV34-AQ35-AA10-Z2"),
+            ("cellar", "L300-BV34-AQ35-Z-2"),
+            ("elsewhere", "L300-BV35"),
+            ("other-layer", "L305-BV34-AQ35"),
+        ]
+    )
+
+    assert index.contained_in("L300-BV34") == ["cellar", "city", "region", "room"]
+    assert index.contained_in("L300-BV34-AQ35") == ["cellar", "city", "room"]
+    assert index.containing("L300-BV34-AQ35-AA10") == ["cellar", "city", "region", "room"]
+    assert index.within_cells("L300-BV34-AQ35-Z-2", radius=0) == ["cellar", "city", "other-layer", "room"]
+    assert index.contained_in("L301-BV34") == []
+
+
+def test_within_bounds_and_cells_match_brute_force() -> None:
+    entries = _random_entries(3000)
+    index = GridSpatialIndex(entries)
+    centers = {item: decode_to_latlon(code) for item, code in entries}
+
+    box = (-20.0, 35.0, -40.0, 60.0)
+    expected = sorted(
+        item for item, (lat, lon) in centers.items() if box[0] <= lat <= box[1] and box[2] <= lon <= box[3]
+    )
+    assert index.within_bounds(*box) == expected
+
+    lat_min, lat_max, lon_min, lon_max = decode_to_latlon_bounds("L300-BV34")
+    expected = sorted(
+        item
+        for item, (lat, lon) in centers.items()
+        if lat_min - 12.0 <= lat <= lat_max + 12.0 and lon_min - 9.0 <= lon <= lon_max + 9.0
+    )
+    assert expected
+    assert index.within_cells("L300-BV34", radius=2) == expected
+
+
+def test_nearest_matches_brute_force() -> None:
+    entries = _random_entries(3000, seed=9)
+    index = GridSpatialIndex(entries)
+    rng = random.Random(1)
+
+    for _ in range(20):
+        lat, lon = rng.uniform(-90.0, 90.0), rng.uniform(-180.0, 180.0)
+        brute = sorted(haversine_km(lat, lon, *decode_to_latlon(code)) for _, code in entries)[:5]
+
+        found = index.nearest(lat, lon, k=5)
+
+        assert [round(km, 6) for _, km in found] == [round(km, 6) for km in brute]
+
+
+def test_nearest_to_respects_max_distance() -> None:
+    index = GridSpatialIndex([("a", "L300-BV34-AQ35"), ("b", "L300-BV34-AR35"), ("far", "L300-AA10")])
+
+    found = index.nearest_to("L300-BV34-AQ35", k=3, max_km=500.0)
+
+    assert [item for item, _ in found] == ["a", "b"]
+    assert found[0][1] == pytest.approx(0.0, abs=1e-6)
+
+
+def test_remove_prunes_items_and_empty_cells() -> None:
+    index = GridSpatialIndex.from_location_index({"L300-BV34-AQ35": {"doc.md"}, "L300-AA10": {"doc.md", "map.md"}})
+
+    assert index.remove("doc.md", "L300-AA10")
+    assert index.codes("doc.md") == ["L300-BV34-AQ35"]
+    assert index.contained_in("L300-AA10") == ["map.md"]
+    assert index.remove("doc.md")
+    assert "doc.md" not in index
+    assert index.contained_in("L300-BV34") == []
+    assert not index.remove("doc.md")
+
+
+def test_feeds_skip_invalid_codes() -> None:
+    index = GridSpatialIndex.from_rows(
+        [{"place_id": "p1", "loc_id": "L305-DA11-Z2"}, {"place_id": "p2", "loc_id": "bogus"}, {"place_id": "p3"}]
+    )
+    locations = GridSpatialIndex.from_locations([{"id": "L300-BJ10"}, {"id": "not-a-code"}])
+
+    assert len(index) == 1
+    assert index.contained_in("L305-DA11") == ["p1"]
+    assert len(locations) == 1
+    with pytest.raises(ValueError):
+        index.within_cells("bogus")
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import json
+import threading
+
+from core.services.logging_api import AsyncLogWriter, FileSink, LogConfig, LogManager, Logger
+
+
+def _manager(tmp_path, **overrides) -> LogManager:
+    config = LogConfig(root=tmp_path, writer="async", **overrides)
+    return LogManager(config)
+
+
+def _lines(tmp_path, component: str) -> list[dict]:
+    records = []
+    for path in sorted((tmp_path / component).glob("*.jsonl")):
+        for line in path.read_text(encoding="utf-8").splitlines():
+            records.append(json.loads(line))
+    return records
+
+
+def test_async_writer_batches_lines_per_sink(tmp_path):
+    manager = _manager(tmp_path, flush_interval=60.0)
+    core_logger = Logger(manager, component="core", category="test", name="core")
+    wizard_logger = Logger(manager, component="wizard", category="test", name="wizard")
+    for idx in range(50):
+        core_logger.info(f"core-{idx}")
+        wizard_logger.info(f"wizard-{idx}")
+
+    assert manager.flush(timeout=5.0)
+
+    core_msgs = [r["msg"] for r in _lines(tmp_path, "core")]
+    wizard_msgs = [r["msg"] for r in _lines(tmp_path, "wizard")]
+    assert core_msgs == [f"core-{idx}" for idx in range(50)]
+    assert wizard_msgs == [f"wizard-{idx}" for idx in range(50)]
+
+    writer = manager.health()["writer"]
+    assert writer["mode"] == "async"
+    assert writer["written"] == 100
+    assert writer["batches"] < 100
+    assert writer["queue_depth"] == 0
+    manager.close()
+
+
+def test_sync_writer_reports_mode_in_health(tmp_path):
+    manager = LogManager(LogConfig(root=tmp_path))
+    assert manager.health()["writer"] == {"mode": "sync"}
+    assert manager.flush()
+
+
+def test_drop_oldest_counts_evictions(tmp_path):
+    writer = AsyncLogWriter(capacity=2, backpressure="drop-oldest", flush_interval=60.0)
+    sink = FileSink(tmp_path, "core", "drop")
+    gate = threading.Lock()
+    original = sink.write_many
+
+    def slow_write(lines):
+        with gate:
+            original(lines)
+
+    sink.write_many = slow_write
+    with gate:
+        for idx in range(20):
+            writer.submit(sink, {"level": "info", "msg": str(idx)})
+        stats = writer.stats()
+        assert stats["queue_depth"] <= 2
+    writer.drain(timeout=5.0)
+    stats = writer.stats()
+    assert stats["dropped"] == stats["dropped_oldest"]
+    assert stats["enqueued"] - stats["dropped_oldest"] == stats["written"]
+    writer.close()
+
+
+def _parked(writer: AsyncLogWriter, tmp_path):
+    """Park the drain thread inside a write so queued events stay put and
+    counts are exact; returns the sink and a function that releases it."""
+    sink = FileSink(tmp_path, "core", "sample")
+    writing = threading.Event()
+    release = threading.Event()
+    original = sink.write_many
+
+    def blocking_write(lines):
+        writing.set()
+        release.wait(timeout=5.0)
+        original(lines)
+
+    sink.write_many = blocking_write
+    writer.submit(sink, {"level": "info", "msg": "blocker"})
+    drainer = threading.Thread(target=writer.drain)
+    drainer.start()
+    assert writing.wait(timeout=5.0)
+
+    def finish() -> list[str]:
+        release.set()
+        drainer.join(timeout=5.0)
+        assert writer.drain(timeout=5.0)
+        writer.close()
+        return [r["level"] for r in _lines(tmp_path, "core")][1:]
+
+    return sink, finish
+
+
+def test_sample_policy_keeps_warn_and_samples_low_levels(tmp_path):
+    writer = AsyncLogWriter(capacity=1, backpressure="sample", sample_every=5, flush_interval=60.0)
+    sink, finish = _parked(writer, tmp_path)
+
+    writer.submit(sink, {"level": "info"})
+    for _ in range(10):
+        writer.submit(sink, {"level": "debug"})
+    writer.submit(sink, {"level": "error"})
+
+    stats = writer.stats()
+    assert stats["sampled_out"] == 8
+    assert stats["dropped_oldest"] == 3
+    assert finish() == ["error"]
+
+
+def test_sample_policy_never_evicts_warn_for_low_levels(tmp_path):
+    writer = AsyncLogWriter(capacity=2, backpressure="sample", sample_every=1, flush_interval=60.0)
+    sink, finish = _parked(writer, tmp_path)
+
+    writer.submit(sink, {"level": "error"})
+    writer.submit(sink, {"level": "info"})
+    assert writer.submit(sink, {"level": "debug"})  # evicts info, not the older error
+    assert writer.submit(sink, {"level": "warn"})  # evicts debug
+    assert not writer.submit(sink, {"level": "debug"})  # only warn+ queued
+
+    stats = writer.stats()
+    assert stats["dropped_oldest"] == 2
+    assert stats["sampled_out"] == 1
+    assert finish() == ["error", "warn"]
+
+
+def test_fatal_drains_queue_before_ring_dump(tmp_path):
+    manager = _manager(tmp_path, flush_interval=60.0)
+    logger = Logger(manager, component="core", category="test", name="core")
+    logger.info("before-crash")
+    logger.fatal("boom")
+
+    crash_files = list((tmp_path / "crash").glob("crash-*.jsonl"))
+    assert crash_files
+    records = _lines(tmp_path, "core")
+    msgs = [r["msg"] for r in records]
+    assert msgs[:2] == ["before-crash", "boom"]
+    assert records[-1]["event"] == "log.ring_dump"
+    manager.close()
@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+from core.services.logging_api import LogConfig, LogManager, Logger
+
+
+def _manager(tmp_path, ring_size: int = 1000) -> LogManager:
+    return LogManager(LogConfig(root=tmp_path, ring_size=ring_size, level="trace"))
+
+
+def test_ring_is_bounded_and_keeps_newest(tmp_path):
+    manager = _manager(tmp_path, ring_size=5)
+    logger = Logger(manager, component="core", category="test", name="core")
+    for idx in range(12):
+        logger.info(f"msg-{idx}")
+
+    assert [e["msg"] for e in manager.ring()] == [f"msg-{idx}" for idx in range(7, 12)]
+    assert manager.health()["ring_entries"] == 5
+    assert manager.clear_ring() == 5
+    assert manager.ring() == []
+
+
+def test_query_filters_and_limits_newest_first(tmp_path):
+    manager = _manager(tmp_path)
+    core = Logger(manager, component="core", category="command", name="core")
+    wizard = Logger(manager, component="wizard", category="http", name="wizard", corr_id="C-42")
+    core.info("a")
+    core.error("b")
+    wizard.warn("c")
+    core.debug("d")
+    wizard.error("e")
+
+    assert [e["msg"] for e in manager.query(level="error")] == ["b", "e"]
+    assert [e["msg"] for e in manager.query(min_level="warn")] == ["b", "c", "e"]
+    assert [e["msg"] for e in manager.query(component="wizard")] == ["c", "e"]
+    assert [e["msg"] for e in manager.query(category=["command"], limit=2)] == ["b", "d"]
+    assert [e["msg"] for e in manager.query(corr_id="C-42", level=["warn"])] == ["c"]
+    assert [e["msg"] for e in manager.query(level="", component=None, limit=1)] == ["e"]
+
+
+def test_query_time_range(tmp_path):
+    manager = _manager(tmp_path)
+    base = datetime(2026, 1, 1, 12, 0, tzinfo=timezone.utc)
+    for minute in range(5):
+        manager._push_ring(
+            {
+                "ts": (base + timedelta(minutes=minute)).isoformat(),
+                "level": "info",
+                "msg": str(minute),
+            }
+        )
+
+    since = base + timedelta(minutes=1)
+    until = "2026-01-01T12:03:00Z"
+    assert [e["msg"] for e in manager.query(since=since, until=until)] == ["1", "2", "3"]
+    assert [e["msg"] for e in manager.query(since="2026-01-01T12:04:00")] == ["4"]
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+from core.locations.types import Location, Tile, TileObject, TileSprite
+from core.services.map_renderer import MapRenderer
+
+
+def _location(location_id: str = "L300-AA10", walls: tuple[str, ...] = ("AA10",)) -> Location:
+    tiles = {}
+    for col in "AB":
+        for row in range(10, 13):
+            cell = f"{col}A{row}"
+            char = "#" if cell in walls else "."
+            tiles[cell] = Tile(objects=[TileObject(char=char, label="ground", z=0)])
+    return Location(
+        id=location_id,
+        name=f"Grid {location_id}",
+        region="test",
+        description="Test grid",
+        layer=300,
+        cell="AA10",
+        scale="terrestrial",
+        continent="test",
+        timezone="UTC+0",
+        type="test",
+        region_type="test",
+        tiles=tiles,
+    )
+
+
+def test_render_draws_tiles_at_their_cells() -> None:
+    lines = MapRenderer().render(_location()).splitlines()
+
+    assert lines[4] == "     0   1 "
+    assert lines[5] == "10 #   .   "
+    assert lines[6] == "11 .   .   "
+
+
+def test_diff_reports_only_changed_rows_and_cells() -> None:
+    renderer = MapRenderer()
+    location = _location()
+
+    first = renderer.diff(location)
+    assert first.full
+    assert "\n".join(first.lines[index] for index in range(first.line_count)) == renderer.render(location)
+
+    assert not renderer.diff(location).changed
+
+    location.tiles["BA11"].sprites.append(TileSprite(id="hero", char="@", label="hero", z=1))
+    diff = renderer.diff(location)
+
+    assert not diff.full
+    assert diff.lines == {6: "11 .   @   "}
+    assert diff.cells == [(11, 1, "@")]
+
+
+def test_diff_is_full_when_tile_layout_changes() -> None:
+    renderer = MapRenderer()
+    location = _location()
+    renderer.diff(location)
+
+    location.tiles["CA13"] = Tile(objects=[TileObject(char="~", label="water", z=0)])
+    diff = renderer.diff(location)
+
+    assert diff.full
+    assert "\n".join(diff.lines.values()) == renderer.render(location)
+
+
+def test_render_many_matches_individual_renders() -> None:
+    renderer = MapRenderer()
+    locations = [_location("L300-AA10"), _location("L300-AB10", walls=("BA12",))]
+
+    batch = renderer.render_many(locations)
+
+    assert list(batch) == ["L300-AA10", "L300-AB10"]
+    assert batch == {location.id: MapRenderer().render(location) for location in locations}
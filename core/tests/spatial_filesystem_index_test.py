@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from core.services.spatial_filesystem import SpatialFilesystem, UserRole, WorkspaceType
+
+
+NOTE = """---
+title: Forest Walk
+tags: [forest, adventure]
+grid_locations: [L300-AB15]
+binder_id: trail
+---
+Body with #inline tag.
+"""
+
+
+def _fs(tmp_path, **kwargs) -> SpatialFilesystem:
+    return SpatialFilesystem(root_dir=tmp_path, user_role=UserRole.USER, **kwargs)
+
+
+def test_index_persists_postings_across_instances(tmp_path):
+    vault = tmp_path / "memory" / "vault"
+    vault.mkdir(parents=True)
+    (vault / "walk.md").write_text(NOTE, encoding="utf-8")
+    (vault / "image.bin").write_bytes(b"\x00\x01")
+
+    first = _fs(tmp_path)
+    files = {f.relative_path: f for f in first.list_workspace("@vault")}
+    assert set(files) == {"walk.md", "image.bin"}
+    assert files["walk.md"].metadata.tags == ["forest", "adventure", "inline"]
+    assert files["image.bin"].metadata is None
+
+    second = _fs(tmp_path)
+    assert str(vault / "walk.md") in second.tag_index["forest"]
+    assert str(vault / "walk.md") in second.location_index["L300-AB15"]
+    assert second.binder_index["trail"] == [str(vault / "walk.md")]
+
+    stats = second.sync_workspace(WorkspaceType.VAULT)
+    assert stats["scanned"] == 2
+    assert stats["parsed"] == 0
+
+    located = second.find_by_location("L300-AB15")
+    assert [f.relative_path for f in located] == ["walk.md"]
+    assert located[0].metadata.title == "Forest Walk"
+
+
+def test_sync_reparses_only_changed_files_and_drops_deleted(tmp_path):
+    vault = tmp_path / "memory" / "vault"
+    vault.mkdir(parents=True)
+    (vault / "a.md").write_text("---\ntags: [alpha]\n---\n", encoding="utf-8")
+    (vault / "b.md").write_text("---\ntags: [beta]\n---\n", encoding="utf-8")
+
+    fs = _fs(tmp_path, index_max_age=0.0)
+    assert fs.sync_workspace(WorkspaceType.VAULT)["parsed"] == 2
+
+    (vault / "a.md").write_text("---\ntags: [gamma]\n---\n", encoding="utf-8")
+    (vault / "b.md").unlink()
+    stats = fs.sync_workspace(WorkspaceType.VAULT)
+    assert stats["parsed"] == 1
+    assert stats["removed"] == 1
+    assert [f.relative_path for f in fs.find_by_tags(["gamma"])] == ["a.md"]
+    assert fs.find_by_tags(["alpha"]) == []
+    assert fs.find_by_tags(["beta"]) == []
+
+
+def test_throttled_queries_see_own_writes_and_explicit_invalidation(tmp_path):
+    vault = tmp_path / "memory" / "vault"
+    vault.mkdir(parents=True)
+    (vault / "a.md").write_text("---\ntags: [alpha]\n---\n", encoding="utf-8")
+
+    fs = _fs(tmp_path)
+    eager = _fs(tmp_path, index_path=tmp_path / "eager.db", index_max_age=0.0)
+    assert len(fs.find_by_tags(["alpha"])) == 1
+    assert len(eager.find_by_tags(["alpha"])) == 1
+
+    fs.write_file("@vault/b.md", "---\ntags: [alpha]\n---\n")
+    assert [f.relative_path for f in fs.find_by_tags(["alpha"])] == ["a.md", "b.md"]
+
+    (vault / "a.md").unlink()
+    assert [f.relative_path for f in eager.find_by_tags(["alpha"])] == ["b.md"]
+    assert [f.relative_path for f in fs.find_by_tags(["alpha"])] == ["a.md", "b.md"]
+
+    fs.invalidate_index(WorkspaceType.VAULT)
+    assert [f.relative_path for f in fs.find_by_tags(["alpha"])] == ["b.md"]
+
+
+def test_sync_index_walks_nested_workspaces_once(tmp_path):
+    fs = _fs(tmp_path, index_max_age=0.0)
+    fs.write_file("@vault/note.md", NOTE)
+    fs.write_file("@binders/ch1.md", NOTE)
+
+    assert fs.sync_index()["scanned"] == 2
+
+
+def test_binders_nested_in_vault_resolve_to_binders_workspace(tmp_path):
+    fs = _fs(tmp_path)
+    fs.write_file("@binders/ch1.md", NOTE)
+
+    vault_listing = [f.relative_path for f in fs.list_workspace("@vault")]
+    assert vault_listing == ["@binders/ch1.md"]
+
+    restarted = _fs(tmp_path)
+    found = restarted.find_by_tags(["forest"])
+    assert [(f.workspace, f.relative_path) for f in found] == [(WorkspaceType.BINDERS, "ch1.md")]
+
+    restarted.delete_file("@binders/ch1.md")
+    assert restarted.find_by_tags(["forest"]) == []
+    assert _fs(tmp_path).tag_index.get("forest", set()) == set()
+
+
+def test_tag_queries_support_all_mode_and_pagination(tmp_path):
+    vault = tmp_path / "memory" / "vault"
+    vault.mkdir(parents=True)
+    for idx in range(6):
+        tags = ["common"] + (["even"] if idx % 2 == 0 else [])
+        (vault / f"note-{idx}.md").write_text(f"---\ntags: {tags}\n---\n", encoding="utf-8")
+
+    fs = _fs(tmp_path)
+    assert fs.count_by_tags(["common"]) == 6
+    assert [f.relative_path for f in fs.find_by_tags(["common", "even"], match="all")] == [
+        "note-0.md",
+        "note-2.md",
+        "note-4.md",
+    ]
+    page = fs.find_by_tags(["common"], offset=2, limit=2)
+    assert [f.relative_path for f in page] == ["note-2.md", "note-3.md"]
+
+    lazy = fs.iter_by_tags(["even", "missing"], match="any", limit=1)
+    assert [f.relative_path for f in lazy] == ["note-0.md"]
+    assert fs.find_by_tags(["even", "missing"], match="all") == []
+
+
+def test_tag_results_hide_workspaces_without_access(tmp_path):
+    admin = SpatialFilesystem(root_dir=tmp_path, user_role=UserRole.ADMIN)
+    admin.write_file("@wizard/secret.md", "---\ntags: [hidden]\n---\n")
+    assert [f.relative_path for f in admin.find_by_tags(["hidden"])] == ["secret.md"]
+
+    user = _fs(tmp_path)
+    assert user.count_by_tags(["hidden"]) == 0
+    assert user.find_by_tags(["hidden"]) == []
+
+
+def test_near_and_nearest_location_queries_use_grid_index(tmp_path):
+    vault = tmp_path / "memory" / "vault"
+    vault.mkdir(parents=True)
+    (vault / "here.md").write_text("---\ngrid_locations: [L300-AB15]\n---\n", encoding="utf-8")
+    (vault / "next.md").write_text("---\ngrid_locations: [L300-AC15]\n---\n", encoding="utf-8")
+    (vault / "far.md").write_text("---\ngrid_locations: [L300-CA30]\n---\n", encoding="utf-8")
+
+    fs = _fs(tmp_path, index_max_age=0.0)
+    near = fs.find_near_location("L300-AB15", radius=1)
+    assert [f.relative_path for f in near] == ["here.md", "next.md"]
+    assert near[1].grid_locations == ["L300-AC15"]
+
+    nearest = fs.find_nearest_location("L300-AB15", k=3)
+    assert [f.relative_path for f, _ in nearest] == ["here.md", "next.md", "far.md"]
+
+    (vault / "next.md").unlink()
+    fs.sync_workspace(WorkspaceType.VAULT)
+    assert [f.relative_path for f in fs.find_near_location("L300-AB15")] == ["here.md"]
+
+    (vault / "cellar.md").write_text("---\ngrid_locations: [L300-AB15-Z-2]\n---\n", encoding="utf-8")
+    fs.sync_workspace(WorkspaceType.VAULT)
+    assert [f.relative_path for f in fs.find_near_location("L300-AB15-Z-2", radius=0)] == ["cellar.md", "here.md"]
+
+
+def test_cached_metadata_follows_index_rows_synced_elsewhere(tmp_path):
+    fs = _fs(tmp_path, index_max_age=0.0)
+    fs.write_file("@vault/note.md", "---\ntitle: Before\ntags: [draft]\n---\n")
+    assert fs.find_by_tags(["draft"])[0].metadata.title == "Before"
+
+    note = tmp_path / "memory" / "vault" / "note.md"
+    note.write_text("---\ntitle: After edit\ntags: [draft]\n---\n", encoding="utf-8")
+    _fs(tmp_path).sync_index()  # another instance re-parses into the shared index
+
+    assert fs.find_by_tags(["draft"])[0].metadata.title == "After edit"
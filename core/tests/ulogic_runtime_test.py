@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import json
+import threading
 
 from core.ulogic import (
     ActionGraph,
@@ -113,3 +114,93 @@ def test_ulogic_runtime_blocks_missing_dependencies(tmp_path) -> None:
 
     assert result["ok"] is False
     assert "Missing dependencies" in result["results"][0]["errors"][0]
+
+
+def test_ulogic_runtime_runs_nodes_declared_before_their_dependencies(tmp_path) -> None:
+    runtime = ULogicRuntime(
+        project_root=tmp_path / "project",
+        vault_root=tmp_path / "vault",
+    )
+
+    result = runtime.run_graph(
+        "wf-003",
+        ActionGraph(
+            plan_id="plan-003",
+            actions=(
+                ActionNode(
+                    id="write-json",
+                    action_type="write_json",
+                    payload={"relpath": "data/state.json", "obj": {"ready": True}},
+                    depends_on=("write-note",),
+                ),
+                ActionNode(
+                    id="write-note",
+                    action_type="write_text",
+                    payload={"relpath": "notes/summary.md", "text": "# Summary"},
+                ),
+            ),
+        ),
+    )
+
+    assert result["ok"] is True
+    assert [entry["node_id"] for entry in result["results"]] == ["write-json", "write-note"]
+    assert all("duration_ms" in entry["meta"]["timing"] for entry in result["results"])
+
+
+def test_ulogic_runtime_runs_independent_nodes_concurrently(tmp_path) -> None:
+    # Both commands must be in flight at once for the barrier to release.
+    barrier = threading.Barrier(2, timeout=5)
+
+    def _dispatch(command_text: str) -> dict[str, str]:
+        barrier.wait()
+        return {"status": "success", "output": command_text}
+
+    runtime = ULogicRuntime(
+        project_root=tmp_path / "project",
+        vault_root=tmp_path / "vault",
+        command_dispatcher=_dispatch,
+        max_workers=2,
+    )
+    result = runtime.run_graph(
+        "wf-004",
+        ActionGraph(
+            plan_id="plan-004",
+            actions=(
+                ActionNode(id="a", action_type="ucode_command", payload={"command_text": "A"}),
+                ActionNode(id="b", action_type="ucode_command", payload={"command_text": "B"}),
+            ),
+        ),
+    )
+
+    assert result["ok"] is True
+    assert [entry["output"] for entry in result["results"]] == ["A", "B"]
+
+
+def test_ulogic_runtime_reports_dependency_cycles(tmp_path) -> None:
+    runtime = ULogicRuntime(
+        project_root=tmp_path / "project",
+        vault_root=tmp_path / "vault",
+    )
+
+    def _note(node_id: str, *depends_on: str) -> ActionNode:
+        return ActionNode(
+            id=node_id,
+            action_type="write_text",
+            payload={"relpath": f"{node_id}.md", "text": node_id},
+            depends_on=depends_on,
+        )
+
+    result = runtime.run_graph(
+        "wf-005",
+        ActionGraph(
+            plan_id="plan-005",
+            actions=(_note("a", "b"), _note("b", "a"), _note("c", "a"), _note("d")),
+        ),
+    )
+
+    by_id = {entry["node_id"]: entry for entry in result["results"]}
+    assert result["ok"] is False
+    assert by_id["a"]["errors"] == ("Dependency cycle: a, b",)
+    assert by_id["b"]["errors"] == ("Dependency cycle: a, b",)
+    assert by_id["c"]["errors"][0] == "Failed dependencies: a"
+    assert by_id["d"]["ok"] is True
@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import json
+import threading
+
+from core.ulogic import ULogicStateStore
+
+
+def _entry(workflow_id: str, plan_id: str = "plan-001") -> dict[str, str]:
+    return {"id": f"workflow:{workflow_id}", "type": "workflow", "plan_id": plan_id}
+
+
+def test_state_store_appends_to_journal_without_rewriting_snapshot(tmp_path) -> None:
+    store = ULogicStateStore(tmp_path)
+
+    store.append_completed(_entry("wf-001"))
+    store.append_completed(_entry("wf-002"))
+
+    assert not store.completed_json.exists()
+    assert len(store.completed_journal.read_text(encoding="utf-8").splitlines()) == 2
+    assert ULogicStateStore(tmp_path).load_completed() == {
+        "completed": [_entry("wf-001"), _entry("wf-002")]
+    }
+
+
+def test_state_store_compacts_journal_into_snapshot(tmp_path) -> None:
+    store = ULogicStateStore(tmp_path, compact_every=3)
+
+    for index in range(4):
+        store.append_completed(_entry(f"wf-{index}"))
+
+    snapshot = json.loads(store.completed_json.read_text(encoding="utf-8"))
+    assert [entry["id"] for entry in snapshot["completed"]] == ["workflow:wf-0", "workflow:wf-1", "workflow:wf-2"]
+    assert len(store.completed_journal.read_text(encoding="utf-8").splitlines()) == 1
+    assert [entry["id"] for entry in ULogicStateStore(tmp_path).load_completed()["completed"]] == [
+        "workflow:wf-0",
+        "workflow:wf-1",
+        "workflow:wf-2",
+        "workflow:wf-3",
+    ]
+
+
+def test_state_store_skips_journal_lines_already_in_snapshot(tmp_path) -> None:
+    store = ULogicStateStore(tmp_path)
+    store.append_completed(_entry("wf-001"))
+    store.append_completed(_entry("wf-002"))
+    # A compaction that wrote the snapshot but died before removing the journal.
+    store.completed_json.write_text(
+        json.dumps({"completed": [_entry("wf-001"), _entry("wf-002")], "journal_seq": 2}),
+        encoding="utf-8",
+    )
+
+    reopened = ULogicStateStore(tmp_path)
+    reopened.append_completed(_entry("wf-003"))
+
+    assert [entry["id"] for entry in reopened.load_completed()["completed"]] == [
+        "workflow:wf-001",
+        "workflow:wf-002",
+        "workflow:wf-003",
+    ]
+
+
+def test_state_store_recovers_from_torn_journal_line(tmp_path) -> None:
+    store = ULogicStateStore(tmp_path)
+    store.append_completed(_entry("wf-001"))
+    with store.completed_journal.open("a", encoding="utf-8") as f:
+        f.write('{"seq": 2, "entry": {"id": "workf')
+
+    reopened = ULogicStateStore(tmp_path)
+    reopened.append_completed(_entry("wf-002"))
+
+    assert ULogicStateStore(tmp_path).load_completed()["completed"] == [_entry("wf-001"), _entry("wf-002")]
+
+
+def test_state_store_finds_completed_by_workflow_and_plan(tmp_path) -> None:
+    store = ULogicStateStore(tmp_path, compact_every=2)
+    store.append_completed(_entry("wf-001", "plan-a"))
+    store.append_completed(_entry("wf-002", "plan-b"))
+    store.append_completed(_entry("wf-001", "plan-b"))
+
+    assert store.find_completed(workflow_id="wf-001") == [_entry("wf-001", "plan-a"), _entry("wf-001", "plan-b")]
+    assert store.find_completed(plan_id="plan-b") == [_entry("wf-002", "plan-b"), _entry("wf-001", "plan-b")]
+    assert store.find_completed(workflow_id="wf-001", plan_id="plan-b") == [_entry("wf-001", "plan-b")]
+    assert store.find_completed(workflow_id="wf-404") == []
+
+
+def test_state_store_compaction_keeps_lines_appended_by_other_writers(tmp_path) -> None:
+    def writer(name: str) -> None:
+        store = ULogicStateStore(tmp_path, compact_every=5)
+        for index in range(40):
+            store.append_completed(_entry(f"{name}-{index}"))
+
+    threads = [threading.Thread(target=writer, args=(f"w{n}",)) for n in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    completed = ULogicStateStore(tmp_path).load_completed()["completed"]
+    assert sorted(entry["id"] for entry in completed) == sorted(
+        f"workflow:w{n}-{index}" for n in range(4) for index in range(40)
+    )
+    assert not list(tmp_path.glob("*.tmp"))
@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from dataclasses import asdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import asdict, replace
 from pathlib import Path
+import time
 from typing import Any, Callable
 
-from .action_graph import ActionGraph, ExecutionResult
+from .action_graph import ActionGraph, ActionNode, ExecutionResult
 from .artifact_store import ArtifactStore
 from .script_sandbox import SandboxError, ScriptSandbox
 from .state_store import ULogicStateStore
@@ -15,6 +17,58 @@ from .state_store import ULogicStateStore
 CommandDispatcher = Callable[[str], dict[str, Any]]
 
 
+def _failed(node: ActionNode, error: str) -> ExecutionResult:
+    return ExecutionResult(
+        ok=False,
+        node_id=node.id,
+        action_type=node.action_type,
+        errors=(error,),
+    )
+
+
+def _cycle_members(
+    actions: tuple[ActionNode, ...],
+    index_by_id: dict[str, int],
+    results: list[ExecutionResult | None],
+) -> set[int]:
+    """Indices of unresolved nodes that lie on a dependency cycle."""
+    candidates = {index for index, result in enumerate(results) if result is None}
+    indegree = {
+        index: sum(1 for dependency in actions[index].depends_on if index_by_id[dependency] in candidates)
+        for index in candidates
+    }
+    dependents: dict[int, list[int]] = {index: [] for index in candidates}
+    for index in candidates:
+        for dependency in actions[index].depends_on:
+            if index_by_id[dependency] in candidates:
+                dependents[index_by_id[dependency]].append(index)
+
+    ready = [index for index, degree in indegree.items() if degree == 0]
+    while ready:
+        index = ready.pop()
+        for dependent in dependents[index]:
+            indegree[dependent] -= 1
+            if indegree[dependent] == 0:
+                ready.append(dependent)
+    unordered = {index for index, degree in indegree.items() if degree > 0}
+
+    # Nodes merely downstream of a cycle are left to fail on their dependencies.
+    def reaches_itself(start: int) -> bool:
+        stack = [index_by_id[dependency] for dependency in actions[start].depends_on]
+        seen: set[int] = set()
+        while stack:
+            index = stack.pop()
+            if index == start:
+                return True
+            if index in seen or index not in unordered:
+                continue
+            seen.add(index)
+            stack.extend(index_by_id[dependency] for dependency in actions[index].depends_on)
+        return False
+
+    return {index for index in unordered if reaches_itself(index)}
+
+
 class ULogicRuntime:
     """Execute a bounded deterministic action graph against local state."""
 
@@ -27,6 +81,7 @@ class ULogicRuntime:
         state_store: ULogicStateStore | None = None,
         artifact_store: ArtifactStore | None = None,
         sandbox: ScriptSandbox | None = None,
+        max_workers: int = 4,
     ) -> None:
         self.project_root = Path(project_root)
         self.vault_root = Path(vault_root)
@@ -34,30 +89,44 @@ class ULogicRuntime:
         self.state_store = state_store or ULogicStateStore(self.project_root)
         self.artifact_store = artifact_store or ArtifactStore(self.vault_root)
         self.sandbox = sandbox or ScriptSandbox(self.project_root)
+        self.max_workers = max(1, max_workers)
 
     def run_graph(self, workflow_id: str, graph: ActionGraph) -> dict[str, Any]:
-        completed: set[str] = set()
-        results: list[ExecutionResult] = []
+        """Run ``graph`` as a DAG, executing independent nodes concurrently.
 
-        for node in graph.actions:
-            missing = [dependency for dependency in node.depends_on if dependency not in completed]
-            if missing:
-                results.append(
-                    ExecutionResult(
-                        ok=False,
-                        node_id=node.id,
-                        action_type=node.action_type,
-                        errors=(f"Missing dependencies: {', '.join(missing)}",),
-                    )
-                )
+        Nodes become ready once every dependency has succeeded, regardless of
+        declaration order, and up to ``max_workers`` ready nodes run at once.
+        Nodes with unknown dependencies, on a dependency cycle or downstream
+        of a failure are reported as failed without running. Results always
+        follow declaration order.
+        """
+        actions = graph.actions
+        results: list[ExecutionResult | None] = [None] * len(actions)
+        index_by_id: dict[str, int] = {}
+        for index, node in enumerate(actions):
+            if node.id in index_by_id:
+                results[index] = _failed(node, f"Duplicate node id: {node.id}")
+            else:
+                index_by_id[node.id] = index
+
+        for index, node in enumerate(actions):
+            if results[index] is not None:
                 continue
+            missing = [dependency for dependency in node.depends_on if dependency not in index_by_id]
+            if missing:
+                results[index] = _failed(node, f"Missing dependencies: {', '.join(missing)}")
 
-            result = self._execute_node(workflow_id, node.id, node.action_type, node.payload)
-            results.append(result)
-            if result.ok:
-                completed.add(node.id)
+        cycle = _cycle_members(actions, index_by_id, results)
+        for index in cycle:
+            results[index] = _failed(
+                actions[index],
+                f"Dependency cycle: {', '.join(actions[i].id for i in sorted(cycle))}",
+            )
+
+        self._schedule(workflow_id, actions, index_by_id, results)
+        final = [result for result in results if result is not None]
 
-        overall_ok = all(result.ok for result in results)
+        overall_ok = all(result.ok for result in final)
         self.state_store.append_completed(
             {
                 "id": f"workflow:{workflow_id}",
@@ -65,16 +134,67 @@ class ULogicRuntime:
                 "timestamp": self.state_store.now_iso(),
                 "ok": overall_ok,
                 "plan_id": graph.plan_id,
-                "evidence": [result.output for result in results if result.output],
-                "results": [asdict(result) for result in results],
+                "evidence": [result.output for result in final if result.output],
+                "results": [asdict(result) for result in final],
             }
         )
         return {
             "ok": overall_ok,
             "workflow_id": workflow_id,
             "plan_id": graph.plan_id,
-            "results": [asdict(result) for result in results],
+            "results": [asdict(result) for result in final],
+        }
+
+    def _schedule(
+        self,
+        workflow_id: str,
+        actions: tuple[ActionNode, ...],
+        index_by_id: dict[str, int],
+        results: list[ExecutionResult | None],
+    ) -> None:
+        origin = time.perf_counter()
+        pending = [index for index, result in enumerate(results) if result is None]
+        running: dict[Future[ExecutionResult], int] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="ulogic") as pool:
+            while pending or running:
+                still_pending: list[int] = []
+                for index in pending:
+                    node = actions[index]
+                    dependencies = [results[index_by_id[dependency]] for dependency in node.depends_on]
+                    failed = [
+                        dependency
+                        for dependency, result in zip(node.depends_on, dependencies, strict=True)
+                        if result is not None and not result.ok
+                    ]
+                    if failed:
+                        results[index] = _failed(node, f"Failed dependencies: {', '.join(failed)}")
+                    elif all(result is not None for result in dependencies):
+                        future = pool.submit(self._execute_timed, workflow_id, node, origin)
+                        running[future] = index
+                    else:
+                        still_pending.append(index)
+
+                if not running and len(still_pending) == len(pending):
+                    for index in still_pending:
+                        results[index] = _failed(actions[index], "Unresolved dependencies")
+                    break
+                pending = still_pending
+
+                if running:
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        results[running.pop(future)] = future.result()
+
+    def _execute_timed(self, workflow_id: str, node: ActionNode, origin: float) -> ExecutionResult:
+        started = time.perf_counter()
+        result = self._execute_node(workflow_id, node.id, node.action_type, node.payload)
+        finished = time.perf_counter()
+        timing = {
+            "started_ms": round((started - origin) * 1000, 3),
+            "duration_ms": round((finished - started) * 1000, 3),
         }
+        return replace(result, meta={**result.meta, "timing": timing})
 
     def _execute_node(
         self,
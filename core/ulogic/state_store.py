@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import UTC, datetime
+import fcntl
 import json
+import os
 from pathlib import Path
+import tempfile
 from typing import Any
 
 
@@ -17,12 +22,53 @@ def _read_json(path: Path, default: dict[str, Any]) -> dict[str, Any]:
 
 def _write_json(path: Path, data: dict[str, Any]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(json.dumps(data, indent=2))
+        os.replace(tmp_name, path)
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+
+
+def _signature(path: Path) -> tuple[int, int] | None:
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
 
 
 @dataclass
 class ULogicStateStore:
+    """Project state files under ``root``.
+
+    Completion history is a ``completed.json`` snapshot plus an append-only
+    ``completed.jsonl`` journal. Appends cost one line write; every
+    ``compact_every`` entries the journal is folded into the snapshot.
+    Journal lines carry a sequence number and the snapshot records the last
+    one it contains, so an interrupted compaction never duplicates entries.
+    Appends and compactions hold an exclusive lock on ``completed.lock``, so
+    a compaction always folds in lines other processes appended.
+    """
+
     root: Path
+    compact_every: int = 256
+
+    def __post_init__(self) -> None:
+        self._loaded = False
+        self._entries: list[dict[str, Any]] = []
+        self._snapshot_extra: dict[str, Any] = {}
+        self._snapshot_sig: tuple[int, int] | None = None
+        self._folded_seq = 0
+        self._journal_seq = 0
+        self._journal_offset = 0
+        self._journal_lines = 0
+        self._journal_torn = False
+        self._by_id: dict[str, list[int]] = {}
+        self._by_plan: dict[str, list[int]] = {}
+        self._lock_depth = 0
 
     @property
     def project_json(self) -> Path:
@@ -36,6 +82,10 @@ class ULogicStateStore:
     def completed_json(self) -> Path:
         return self.root / "completed.json"
 
+    @property
+    def completed_journal(self) -> Path:
+        return self.root / "completed.jsonl"
+
     def load_project(self) -> dict[str, Any]:
         return _read_json(self.project_json, {"name": "", "constraints": {}})
 
@@ -43,15 +93,157 @@ class ULogicStateStore:
         return _read_json(self.tasks_json, {"tasks": []})
 
     def load_completed(self) -> dict[str, Any]:
-        return _read_json(self.completed_json, {"completed": []})
+        """Snapshot and journal merged into the classic ``completed.json`` shape.
+
+        The merged view is cached and only the journal bytes appended since
+        the previous call are read.
+        """
+        entries = self._refresh()
+        return {**self._snapshot_extra, "completed": list(entries)}
+
+    def find_completed(
+        self,
+        *,
+        workflow_id: str | None = None,
+        plan_id: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Completed entries for a workflow and/or plan, in completion order."""
+        entries = self._refresh()
+        indices: list[int] | None = None
+        if workflow_id is not None:
+            indices = self._by_id.get(f"workflow:{workflow_id}", [])
+        if plan_id is not None:
+            plan_indices = self._by_plan.get(plan_id, [])
+            if indices is None:
+                indices = plan_indices
+            else:
+                wanted = set(plan_indices)
+                indices = [index for index in indices if index in wanted]
+        if indices is None:
+            return list(entries)
+        return [entries[index] for index in indices]
 
     def save_completed(self, data: dict[str, Any]) -> None:
-        _write_json(self.completed_json, data)
+        """Replace the whole completion history with ``data``."""
+        with self._locked():
+            self._refresh()
+            self._write_snapshot({**data, "journal_seq": self._journal_seq})
+        self._loaded = False
 
     def append_completed(self, entry: dict[str, Any]) -> None:
-        data = self.load_completed()
-        data.setdefault("completed", []).append(entry)
-        self.save_completed(data)
+        with self._locked():
+            self._refresh()
+            line = json.dumps({"seq": self._journal_seq + 1, "entry": entry}) + "\n"
+            if self._journal_torn:
+                # Terminate a line left half-written by an interrupted append.
+                line = "\n" + line
+            with self.completed_journal.open("a", encoding="utf-8") as f:
+                f.write(line)
+            self._read_journal()
+
+            if self._journal_lines >= self.compact_every:
+                self.compact()
+
+    def compact(self) -> None:
+        """Fold the journal into the ``completed.json`` snapshot."""
+        with self._locked():
+            entries = self._refresh()
+            if not self._journal_lines and not self._journal_torn:
+                return
+            self._write_snapshot({**self._snapshot_extra, "completed": entries, "journal_seq": self._journal_seq})
+            self._folded_seq = self._journal_seq
+            self._snapshot_sig = _signature(self.completed_json)
 
     def now_iso(self) -> str:
         return datetime.now(UTC).replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        # flock is per open file, so nested calls reuse the outer lock.
+        if self._lock_depth:
+            self._lock_depth += 1
+            try:
+                yield
+            finally:
+                self._lock_depth -= 1
+            return
+        self.root.mkdir(parents=True, exist_ok=True)
+        with (self.root / "completed.lock").open("a") as fh:
+            fcntl.flock(fh, fcntl.LOCK_EX)
+            self._lock_depth = 1
+            try:
+                yield
+            finally:
+                self._lock_depth = 0
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def _write_snapshot(self, data: dict[str, Any]) -> None:
+        _write_json(self.completed_json, data)
+        self.completed_journal.unlink(missing_ok=True)
+        self._journal_offset = 0
+        self._journal_lines = 0
+        self._journal_torn = False
+
+    def _refresh(self) -> list[dict[str, Any]]:
+        sig = _signature(self.completed_json)
+        if not self._loaded or sig != self._snapshot_sig:
+            self._load_snapshot(sig)
+        self._read_journal()
+        return self._entries
+
+    def _load_snapshot(self, sig: tuple[int, int] | None) -> None:
+        data = dict(_read_json(self.completed_json, {"completed": []}))
+        self._folded_seq = int(data.pop("journal_seq", 0) or 0)
+        self._journal_seq = self._folded_seq
+        self._entries = []
+        self._by_id = {}
+        self._by_plan = {}
+        for entry in data.pop("completed", None) or []:
+            self._index(entry)
+        self._snapshot_extra = data
+        self._snapshot_sig = sig
+        self._loaded = True
+        self._journal_offset = 0
+        self._journal_lines = 0
+        self._journal_torn = False
+
+    def _read_journal(self) -> None:
+        try:
+            size = self.completed_journal.stat().st_size
+        except FileNotFoundError:
+            size = 0
+        if size < self._journal_offset:
+            # Compacted by another store instance since we last looked.
+            self._load_snapshot(_signature(self.completed_json))
+        if size <= self._journal_offset:
+            return
+
+        with self.completed_journal.open("rb") as f:
+            f.seek(self._journal_offset)
+            chunk = f.read(size - self._journal_offset)
+        complete = chunk[: chunk.rfind(b"\n") + 1]
+        self._journal_offset += len(complete)
+        self._journal_torn = len(complete) < len(chunk)
+
+        for raw in complete.splitlines():
+            try:
+                record = json.loads(raw)
+                seq = int(record["seq"])
+                entry = record["entry"]
+            except (ValueError, KeyError, TypeError):
+                continue
+            self._journal_lines += 1
+            if seq <= self._folded_seq:
+                continue
+            self._journal_seq = max(self._journal_seq, seq)
+            self._index(entry)
+
+    def _index(self, entry: dict[str, Any]) -> None:
+        position = len(self._entries)
+        self._entries.append(entry)
+        if not isinstance(entry, dict):
+            return
+        if isinstance(entry_id := entry.get("id"), str):
+            self._by_id.setdefault(entry_id, []).append(position)
+        if isinstance(plan_id := entry.get("plan_id"), str):
+            self._by_plan.setdefault(plan_id, []).append(position)
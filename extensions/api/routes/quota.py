@@ -171,7 +171,7 @@ def queue_request():
         {
             "queued": True,
             "request_id": request_id,
-            "queue_position": len([r for r in tracker._queue if r.status == "pending"]),
+            "queue_position": tracker.get_queue_status()["pending"],
         }
     )
 
@@ -212,10 +212,7 @@ def get_history():
     provider_filter = request.args.get("provider")
 
     tracker = get_quota_tracker()
-    history = tracker._history[-limit:]
-
-    if provider_filter:
-        history = [h for h in history if h["provider"] == provider_filter]
+    history = tracker.get_history(limit=limit, provider=provider_filter)
 
     return jsonify(
         {
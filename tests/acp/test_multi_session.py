@@ -12,6 +12,7 @@ from pytest import raises
 from tests.mock.utils import mock_llm_chunk
 from tests.stubs.fake_backend import FakeBackend
 from vibe.acp.acp_agent_loop import VibeAcpAgentLoop
+from vibe.core.llm.http_pool import http_client_pool
 from vibe.core.types import Role
 
 
@@ -35,6 +36,18 @@ class TestMultiSessionCore:
         assert session1.agent_loop is not session2.agent_loop
         assert id(session1.agent_loop) != id(session2.agent_loop)
 
+    @pytest.mark.asyncio
+    async def test_aclose_closes_pooled_http_clients(
+        self, acp_agent_loop: VibeAcpAgentLoop
+    ) -> None:
+        await acp_agent_loop.initialize(protocol_version=PROTOCOL_VERSION)
+        await acp_agent_loop.new_session(cwd=str(Path.cwd()), mcp_servers=[])
+        client = http_client_pool.get("https://api.example.com", timeout=5.0)
+
+        await acp_agent_loop.aclose()
+
+        assert client.is_closed
+
     @pytest.mark.asyncio
     async def test_error_on_nonexistent_session(
         self, acp_agent_loop: VibeAcpAgentLoop
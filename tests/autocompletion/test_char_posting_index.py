@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from vibe.core.autocompletion.file_indexer import FileIndexStats, FileIndexStore
+from vibe.core.autocompletion.file_indexer.ignore_rules import IgnoreRules
+from vibe.core.autocompletion.file_indexer.postings import CharPostingIndex
+from vibe.core.autocompletion.file_indexer.store import IndexEntry
+from vibe.core.autocompletion.file_indexer.watcher import Change
+
+
+def _entry(rel: str, is_dir: bool = False) -> IndexEntry:
+    return IndexEntry(
+        rel=rel,
+        rel_lower=rel.lower(),
+        name=rel.rpartition("/")[2],
+        path=Path(rel),
+        is_dir=is_dir,
+    )
+
+
+def _rels(entries) -> list[str]:
+    return [entry.rel for entry in entries]
+
+
+def test_query_requires_every_character_case_insensitively() -> None:
+    index = CharPostingIndex()
+    index.reset([_entry("src/Main.py"), _entry("docs/index.md"), _entry("README.md")])
+
+    assert _rels(index.query("mp")) == ["src/Main.py"]
+    assert _rels(index.query("MD")) == ["docs/index.md", "README.md"]
+    assert _rels(index.query("zz")) == []
+    assert _rels(index.query()) == ["src/Main.py", "docs/index.md", "README.md"]
+
+
+def test_query_excludes_characters() -> None:
+    index = CharPostingIndex()
+    index.reset([_entry("src", True), _entry("src/main.py"), _entry("README.md")])
+
+    assert _rels(index.query(excluded="/")) == ["src", "README.md"]
+
+
+def test_query_yields_substring_matches_first() -> None:
+    index = CharPostingIndex()
+    index.reset([_entry("m/a/i/n.py"), _entry("lib/main.py"), _entry("mxaxixn")])
+
+    assert _rels(index.query("main", contains="main")) == [
+        "lib/main.py",
+        "m/a/i/n.py",
+        "mxaxixn",
+    ]
+
+
+def test_add_and_discard_keep_postings_current() -> None:
+    index = CharPostingIndex()
+    index.reset([_entry("alpha.py"), _entry("beta.py")])
+
+    index.add(_entry("gamma.py"))
+    index.discard("alpha.py")
+
+    assert _rels(index.query("a")) == ["beta.py", "gamma.py"]
+    assert _rels(index.query("l")) == []
+    assert len(index) == 2
+
+
+def test_store_candidates_follow_incremental_changes(tmp_path: Path) -> None:
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / "main.py").write_text("", encoding="utf-8")
+    store = FileIndexStore(IgnoreRules(), FileIndexStats())
+    store.rebuild(tmp_path)
+    root = store.root
+    assert root is not None
+
+    assert _rels(store.candidates("mn")) == ["src/main.py"]
+
+    (root / "src" / "mine.py").write_text("", encoding="utf-8")
+    (root / "src" / "main.py").unlink()
+    store.apply_changes([
+        (Change.added, root / "src" / "mine.py"),
+        (Change.deleted, root / "src" / "main.py"),
+    ])
+
+    assert _rels(store.candidates("mn")) == ["src/mine.py"]
@@ -0,0 +1,230 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from vibe.core.autocompletion.file_indexer import (
+    FileIndexer,
+    FileIndexStats,
+    FileIndexStore,
+)
+from vibe.core.autocompletion.file_indexer.ignore_rules import IgnoreRules
+from vibe.core.autocompletion.file_indexer.watcher import Change
+
+_OLD_MTIME_NS = 1_600_000_000 * 1_000_000_000
+
+
+def _make_store(snapshot_dir: Path) -> tuple[FileIndexStore, FileIndexStats]:
+    stats = FileIndexStats()
+    return FileIndexStore(IgnoreRules(), stats, snapshot_dir=snapshot_dir), stats
+
+
+def _age_dirs(root: Path) -> None:
+    for directory in [root, *(p for p in root.rglob("*") if p.is_dir())]:
+        os.utime(directory, ns=(_OLD_MTIME_NS, _OLD_MTIME_NS))
+
+
+def _rels(store: FileIndexStore) -> set[str]:
+    return {entry.rel for entry in store.snapshot()}
+
+
+def _build_tree(root: Path) -> None:
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "docs").mkdir()
+    (root / "src" / "main.py").write_text("", encoding="utf-8")
+    (root / "src" / "pkg" / "mod.py").write_text("", encoding="utf-8")
+    (root / "docs" / "index.md").write_text("", encoding="utf-8")
+    (root / "node_modules").mkdir()
+    (root / "node_modules" / "dep.js").write_text("", encoding="utf-8")
+
+
+def test_warm_start_loads_snapshot_without_walking(tmp_path: Path) -> None:
+    root = tmp_path / "project"
+    root.mkdir()
+    _build_tree(root)
+    _age_dirs(root)
+    snapshot_dir = tmp_path / "cache"
+
+    cold, cold_stats = _make_store(snapshot_dir)
+    cold.rebuild(root)
+    assert cold_stats.snapshot_misses == 1
+    assert cold_stats.snapshot_hits == 0
+
+    warm, warm_stats = _make_store(snapshot_dir)
+    warm.rebuild(root)
+
+    assert warm_stats.snapshot_hits == 1
+    assert warm_stats.reconciled_dirs == 0
+    assert _rels(warm) == _rels(cold)
+    assert "node_modules" not in _rels(warm)
+    mod = next(entry for entry in warm.snapshot() if entry.rel == "src/pkg/mod.py")
+    assert mod.path == root.resolve() / "src" / "pkg" / "mod.py"
+    assert mod.name == "mod.py"
+    assert not mod.is_dir
+
+
+def test_warm_start_reconciles_only_changed_directories(tmp_path: Path) -> None:
+    root = tmp_path / "project"
+    root.mkdir()
+    _build_tree(root)
+    _age_dirs(root)
+    snapshot_dir = tmp_path / "cache"
+    _make_store(snapshot_dir)[0].rebuild(root)
+
+    (root / "src" / "new.py").write_text("", encoding="utf-8")
+    (root / "docs" / "index.md").unlink()
+    (root / "src" / "pkg" / "mod.py").unlink()
+    (root / "src" / "pkg").rmdir()
+    (root / "src" / "fresh").mkdir()
+    (root / "src" / "fresh" / "inner.py").write_text("", encoding="utf-8")
+
+    warm, stats = _make_store(snapshot_dir)
+    warm.rebuild(root)
+
+    assert stats.snapshot_hits == 1
+    assert stats.reconciled_dirs == 2  # src and docs
+    assert stats.last_reconcile_ms >= 0
+    assert _rels(warm) == {
+        "docs",
+        "src",
+        "src/main.py",
+        "src/new.py",
+        "src/fresh",
+        "src/fresh/inner.py",
+    }
+
+
+def test_snapshot_is_ignored_when_ignore_rules_change(tmp_path: Path) -> None:
+    root = tmp_path / "project"
+    root.mkdir()
+    _build_tree(root)
+    snapshot_dir = tmp_path / "cache"
+    _make_store(snapshot_dir)[0].rebuild(root)
+
+    (root / ".gitignore").write_text("docs/\n", encoding="utf-8")
+
+    store, stats = _make_store(snapshot_dir)
+    store.rebuild(root)
+
+    assert stats.snapshot_misses == 1
+    assert "docs" not in _rels(store)
+
+
+def test_snapshot_is_ignored_when_nested_gitignore_changes(tmp_path: Path) -> None:
+    root = tmp_path / "project"
+    root.mkdir()
+    _build_tree(root)
+    gitignore = root / "src" / ".gitignore"
+    gitignore.write_text("*.txt\n", encoding="utf-8")
+    _age_dirs(root)
+    snapshot_dir = tmp_path / "cache"
+    _make_store(snapshot_dir)[0].rebuild(root)
+
+    gitignore.write_text("pkg/\n", encoding="utf-8")
+    _age_dirs(root)
+
+    store, stats = _make_store(snapshot_dir)
+    store.rebuild(root)
+
+    assert stats.snapshot_misses == 1
+    assert "src/pkg" not in _rels(store)
+
+
+def test_new_nested_gitignore_forces_a_fresh_walk(tmp_path: Path) -> None:
+    root = tmp_path / "project"
+    root.mkdir()
+    _build_tree(root)
+    _age_dirs(root)
+    snapshot_dir = tmp_path / "cache"
+    _make_store(snapshot_dir)[0].rebuild(root)
+
+    (root / "src" / ".gitignore").write_text("pkg/\n", encoding="utf-8")
+
+    store, stats = _make_store(snapshot_dir)
+    store.rebuild(root)
+
+    assert stats.snapshot_hits == 0
+    assert "src/pkg/mod.py" not in _rels(store)
+    assert "src/main.py" in _rels(store)
+
+
+def test_gitignore_change_reindexes_its_directory(tmp_path: Path) -> None:
+    root = tmp_path / "project"
+    root.mkdir()
+    _build_tree(root)
+    gitignore = root / "src" / ".gitignore"
+    gitignore.write_text("pkg/\n", encoding="utf-8")
+    store, _ = _make_store(tmp_path / "cache")
+    store.rebuild(root)
+    assert "src/pkg" not in _rels(store)
+
+    gitignore.write_text("main.py\n", encoding="utf-8")
+    store.apply_changes([(Change.modified, gitignore.resolve())])
+
+    assert "src/pkg/mod.py" in _rels(store)
+    assert "src/main.py" not in _rels(store)
+
+
+def test_cancelled_walk_is_never_persisted(tmp_path: Path) -> None:
+    root = tmp_path / "project"
+    (root / "a" / "b").mkdir(parents=True)
+    (root / "a" / "b" / "deep.txt").write_text("", encoding="utf-8")
+    (root / "c").mkdir()
+    (root / "c" / "x.txt").write_text("", encoding="utf-8")
+    _age_dirs(root)
+    other = tmp_path / "other"
+    other.mkdir()
+    snapshot_dir = tmp_path / "cache"
+    _make_store(snapshot_dir)[0].rebuild(root)
+
+    store = FileIndexStore(
+        IgnoreRules(), FileIndexStats(), snapshot_dir=snapshot_dir, walk_workers=1
+    )
+    calls = 0
+
+    def should_cancel() -> bool:
+        nonlocal calls
+        calls += 1
+        return calls > 1
+
+    store.rebuild(root, should_cancel=should_cancel, use_snapshot=False)
+    assert "a/b/deep.txt" not in _rels(store)
+    store.rebuild(other)  # switching roots must not save the partial index
+
+    warm, stats = _make_store(snapshot_dir)
+    warm.rebuild(root)
+
+    assert stats.snapshot_hits == 0
+    assert {"a/b/deep.txt", "c/x.txt"} <= _rels(warm)
+
+
+def test_indexer_persists_snapshot_across_instances(tmp_path: Path) -> None:
+    root = tmp_path / "project"
+    root.mkdir()
+    _build_tree(root)
+    snapshot_dir = tmp_path / "cache"
+
+    first = FileIndexer(snapshot_dir=snapshot_dir)
+    expected = {entry.rel for entry in first.get_index(root)}
+    first.shutdown()
+
+    second = FileIndexer(snapshot_dir=snapshot_dir)
+    try:
+        assert {entry.rel for entry in second.get_index(root)} == expected
+        assert second.stats.snapshot_hits == 1
+    finally:
+        second.shutdown()
+
+
+def test_indexer_without_persistence_always_walks(tmp_path: Path) -> None:
+    root = tmp_path / "project"
+    root.mkdir()
+    _build_tree(root)
+
+    indexer = FileIndexer(persist_snapshot=False)
+    try:
+        indexer.get_index(root)
+        assert indexer.stats.snapshot_hits == 0
+        assert indexer.stats.snapshot_misses == 0
+    finally:
+        indexer.shutdown()
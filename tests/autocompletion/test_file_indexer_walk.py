@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from pathlib import Path
+from threading import RLock
+
+import pytest
+
+from vibe.core.autocompletion.file_indexer import FileIndexStats, FileIndexStore
+from vibe.core.autocompletion.file_indexer.ignore_rules import IgnoreRules
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    root = tmp_path / "project"
+    for pkg in range(6):
+        for sub in range(4):
+            directory = root / f"pkg{pkg}" / f"sub{sub}"
+            directory.mkdir(parents=True)
+            for i in range(5):
+                (directory / f"mod_{i}.py").write_text("", encoding="utf-8")
+    (root / "node_modules" / "dep" / "lib").mkdir(parents=True)
+    (root / "node_modules" / "dep" / "lib" / "index.js").write_text("")
+    return root
+
+
+def _rels(store: FileIndexStore) -> set[str]:
+    return {entry.rel for entry in store.snapshot()}
+
+
+def test_parallel_walk_matches_single_threaded_walk(tree: Path) -> None:
+    sequential = FileIndexStore(IgnoreRules(), FileIndexStats(), walk_workers=1)
+    parallel = FileIndexStore(IgnoreRules(), FileIndexStats(), walk_workers=6)
+
+    sequential.rebuild(tree)
+    parallel.rebuild(tree)
+
+    assert _rels(parallel) == _rels(sequential)
+    assert len(_rels(parallel)) == 6 + 6 * 4 + 6 * 4 * 5
+
+
+def test_walk_never_descends_into_ignored_directories(
+    tree: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    store = FileIndexStore(IgnoreRules(), FileIndexStats(), walk_workers=4)
+    scanned: list[str] = []
+    original = store._scan_directory
+
+    def spy(directory: Path, rel_prefix: str, dir_mtimes):
+        scanned.append(rel_prefix)
+        return original(directory, rel_prefix, dir_mtimes)
+
+    monkeypatch.setattr(store, "_scan_directory", spy)
+    store.rebuild(tree)
+
+    assert not any(rel.startswith("node_modules") for rel in scanned)
+    assert "node_modules" not in _rels(store)
+
+
+def test_walk_publishes_partial_results_under_lock(tree: Path) -> None:
+    store = FileIndexStore(IgnoreRules(), FileIndexStats(), walk_workers=3)
+    sizes: list[int] = []
+
+    class RecordingLock:
+        def __init__(self) -> None:
+            self._lock = RLock()
+
+        def __enter__(self) -> None:
+            self._lock.acquire()
+
+        def __exit__(self, *exc_info: object) -> None:
+            sizes.append(len(store.snapshot()))
+            self._lock.release()
+
+    store.rebuild(tree, publish_lock=RecordingLock())
+
+    growth = [size for size in sizes if 0 < size < len(_rels(store))]
+    assert len(growth) > 5
+    assert sizes[-1] == len(_rels(store))
+
+
+def test_cancelled_walk_stops_early(tree: Path) -> None:
+    store = FileIndexStore(IgnoreRules(), FileIndexStats(), walk_workers=2)
+    calls = 0
+
+    def should_cancel() -> bool:
+        nonlocal calls
+        calls += 1
+        return calls > 3
+
+    store.rebuild(tree, should_cancel=should_cancel)
+
+    assert len(_rels(store)) < 6 + 6 * 4 + 6 * 4 * 5
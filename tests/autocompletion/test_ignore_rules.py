@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from vibe.core.autocompletion.file_indexer.ignore_rules import IgnoreRules
+
+
+@pytest.fixture
+def rules(tmp_path: Path) -> IgnoreRules:
+    (tmp_path / ".gitignore").write_text(
+        "*.tmp\n!keep.tmp\n/rootonly\nsrc/gen/\nbuild*/\nfixtures/*.json\n",
+        encoding="utf-8",
+    )
+    (tmp_path / "src").mkdir()
+    (tmp_path / "src" / ".gitignore").write_text(
+        "local.txt\n!*.log\n", encoding="utf-8"
+    )
+    ignore_rules = IgnoreRules()
+    ignore_rules.ensure_for_root(tmp_path)
+    return ignore_rules
+
+
+@pytest.mark.parametrize(
+    ("rel", "is_dir", "expected"),
+    [
+        ("a.tmp", False, True),
+        ("x/keep.tmp", False, False),
+        ("rootonly", False, True),
+        ("x/rootonly", False, False),
+        ("src/gen", True, True),
+        ("src/gen", False, False),
+        ("build1", True, True),
+        ("build1", False, False),
+        ("fixtures/data.json", False, True),
+        ("other/fixtures/data.json", False, False),
+        ("node_modules", True, True),
+        ("pkg/mod.pyc", False, True),
+        ("lib.min.js", False, True),
+        ("README.md", False, False),
+    ],
+)
+def test_root_scope_keeps_last_match_wins_semantics(
+    rules: IgnoreRules, rel: str, is_dir: bool, expected: bool
+) -> None:
+    assert rules.should_ignore(rel, rel.rpartition("/")[2], is_dir) is expected
+
+
+def test_nested_gitignore_applies_only_below_its_directory(rules: IgnoreRules) -> None:
+    assert rules.should_ignore("src/local.txt", "local.txt", False)
+    assert rules.should_ignore("src/deep/local.txt", "local.txt", False)
+    assert not rules.should_ignore("local.txt", "local.txt", False)
+
+
+def test_nested_gitignore_overrides_parent_scopes(rules: IgnoreRules) -> None:
+    assert rules.should_ignore("debug.log", "debug.log", False)
+    assert not rules.should_ignore("src/debug.log", "debug.log", False)
+
+
+def test_nested_gitignore_is_loaded_lazily(tmp_path: Path) -> None:
+    ignore_rules = IgnoreRules()
+    ignore_rules.ensure_for_root(tmp_path)
+    (tmp_path / "pkg").mkdir()
+    (tmp_path / "pkg" / ".gitignore").write_text("*.txt\n", encoding="utf-8")
+
+    assert ignore_rules.should_ignore("pkg/notes.txt", "notes.txt", False)
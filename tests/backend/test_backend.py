@@ -38,6 +38,7 @@ from vibe.core.llm.backend.factory import BACKEND_FACTORY
 from vibe.core.llm.backend.generic import GenericBackend
 from vibe.core.llm.backend.mistral import MistralBackend
 from vibe.core.llm.exceptions import BackendError
+from vibe.core.llm.http_pool import http_client_pool
 from vibe.core.llm.types import BackendLike
 from vibe.core.types import LLMChunk, LLMMessage, Role, ToolCall
 from vibe.core.utils import get_user_agent
@@ -434,4 +435,7 @@ class TestMistralRetry:
                 server_url=backend._server_url,
                 timeout_ms=720000,
                 retry_config=backend._retry_config,
+                async_client=http_client_pool.get(
+                    backend._server_url, timeout=backend._timeout
+                ),
             )
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import threading
+
+import pytest
+
+from vibe.core.llm.http_pool import HTTPClientPool, origin_of
+
+
+class _KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        body = b"ok"
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        pass
+
+
+@pytest.fixture
+def server_url() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}"
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_origin_of_normalizes_default_ports() -> None:
+    assert origin_of("https://api.mistral.ai/v1/chat") == "https://api.mistral.ai:443"
+    assert origin_of("http://localhost:8080/v1") == "http://localhost:8080"
+
+
+@pytest.mark.asyncio
+async def test_same_origin_shares_a_client() -> None:
+    pool = HTTPClientPool(http2=False)
+
+    first = pool.get("https://api.example.com/v1/chat", timeout=30.0)
+    second = pool.get("https://api.example.com/v1/models", timeout=30.0)
+    other = pool.get("https://other.example.com/v1", timeout=30.0)
+
+    assert first is second
+    assert other is not first
+    await pool.aclose()
+    assert first.is_closed
+
+
+def test_each_event_loop_gets_its_own_client() -> None:
+    pool = HTTPClientPool(http2=False)
+
+    async def get_client():
+        return pool.get("https://api.example.com", timeout=30.0)
+
+    first = asyncio.run(get_client())
+    second = asyncio.run(get_client())
+
+    assert first is not second
+
+
+@pytest.mark.asyncio
+async def test_requests_reuse_kept_alive_connections(server_url: str) -> None:
+    pool = HTTPClientPool(http2=False)
+
+    for path in ("/a", "/b", "/c"):
+        response = await pool.get(server_url + path, timeout=5.0).get(server_url + path)
+        assert response.status_code == 200
+    await pool.aclose()
+
+    stats = pool.stats(server_url)
+    assert stats.requests == 3
+    assert stats.connections_opened == 1
+    assert stats.reused_requests == 2
+    assert pool.stats().requests == 3
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import sqlite3
+
+import pytest
+
+from vibe.core.config import SessionLoggingConfig
+from vibe.core.session.session_catalog import SESSION_CATALOG_FILENAME, SessionCatalog
+from vibe.core.session.session_loader import SessionLoader
+
+
+@pytest.fixture
+def save_dir(tmp_path: Path) -> Path:
+    directory = tmp_path / "sessions"
+    directory.mkdir()
+    return directory
+
+
+@pytest.fixture
+def config(save_dir: Path) -> SessionLoggingConfig:
+    return SessionLoggingConfig(
+        save_dir=str(save_dir), session_prefix="test", enabled=True
+    )
+
+
+def _write_session(
+    save_dir: Path, session_id: str, cwd: str = "/work", stamp: str = "000000"
+) -> Path:
+    session_dir = save_dir / f"test_20240101_{stamp}_{session_id[:8]}"
+    session_dir.mkdir()
+    (session_dir / "messages.jsonl").write_text(
+        json.dumps({"role": "user", "content": "hi"}) + "\n", encoding="utf-8"
+    )
+    (session_dir / "meta.json").write_text(
+        json.dumps({
+            "session_id": session_id,
+            "end_time": "2024-01-01T00:00:00+00:00",
+            "title": f"title {session_id}",
+            "total_messages": 1,
+            "environment": {"working_directory": cwd},
+        }),
+        encoding="utf-8",
+    )
+    return session_dir
+
+
+def _rows(save_dir: Path) -> set[str]:
+    with sqlite3.connect(save_dir / SESSION_CATALOG_FILENAME) as conn:
+        return {row[0] for row in conn.execute("SELECT dir_name FROM sessions")}
+
+
+def test_list_sessions_is_served_from_the_catalog(
+    save_dir: Path, config: SessionLoggingConfig
+) -> None:
+    _write_session(save_dir, "aaaaaaaa-1", cwd="/a")
+    _write_session(save_dir, "bbbbbbbb-2", cwd="/b")
+
+    sessions = SessionLoader.list_sessions(config, cwd="/a")
+
+    assert [s["session_id"] for s in sessions] == ["aaaaaaaa-1"]
+    assert len(_rows(save_dir)) == 2
+
+
+def test_sync_only_rereads_changed_sessions(
+    save_dir: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _write_session(save_dir, "aaaaaaaa-1")
+    changed = _write_session(save_dir, "bbbbbbbb-2", stamp="000001")
+    catalog = SessionCatalog(save_dir, "test")
+    catalog.sync(SessionLoader._is_valid_session)
+
+    validated: list[str] = []
+
+    def is_valid(session_dir: Path) -> bool:
+        validated.append(session_dir.name)
+        return SessionLoader._is_valid_session(session_dir)
+
+    with (changed / "messages.jsonl").open("a", encoding="utf-8") as f:
+        f.write(json.dumps({"role": "assistant", "content": "yo"}) + "\n")
+    catalog.sync(is_valid)
+
+    assert validated == [changed.name]
+
+
+def test_sync_drops_rows_for_deleted_sessions(save_dir: Path) -> None:
+    doomed = _write_session(save_dir, "aaaaaaaa-1")
+    catalog = SessionCatalog(save_dir, "test")
+    catalog.sync(SessionLoader._is_valid_session)
+
+    for child in doomed.iterdir():
+        child.unlink()
+    doomed.rmdir()
+    catalog.sync(SessionLoader._is_valid_session)
+
+    assert _rows(save_dir) == set()
+
+
+def test_find_session_by_id_skips_invalid_sessions(
+    save_dir: Path, config: SessionLoggingConfig
+) -> None:
+    good = _write_session(save_dir, "cccccccc-1", stamp="000000")
+    broken = _write_session(save_dir, "cccccccc-2", stamp="000001")
+    (broken / "messages.jsonl").write_text("not json\n", encoding="utf-8")
+
+    assert SessionLoader.find_session_by_id("cccccccc", config) == good
+    assert SessionLoader.does_session_exist("cccccccc", config) is not None
+    assert SessionLoader.find_session_by_id("dddddddd", config) is None
+
+
+def test_logger_records_sessions_in_catalog(save_dir: Path) -> None:
+    catalog = SessionCatalog(save_dir, "test")
+    session_dir = _write_session(save_dir, "eeeeeeee-1")
+
+    catalog.record(
+        session_dir,
+        {"session_id": "eeeeeeee-1", "environment": {"working_directory": "/x"}},
+    )
+
+    assert [row["session_id"] for row in catalog.sessions("/x")] == ["eeeeeeee-1"]
+
+
+def test_rebuild_catalog_repopulates_from_disk(
+    save_dir: Path, config: SessionLoggingConfig
+) -> None:
+    _write_session(save_dir, "aaaaaaaa-1")
+    (save_dir / SESSION_CATALOG_FILENAME).write_bytes(b"")
+    SessionLoader.list_sessions(config)
+    _write_session(save_dir, "bbbbbbbb-2", stamp="000001")
+
+    assert SessionLoader.rebuild_catalog(config) == 2
+
+
+def test_corrupt_catalog_falls_back_to_directory_scan(
+    save_dir: Path, config: SessionLoggingConfig
+) -> None:
+    _write_session(save_dir, "aaaaaaaa-1")
+    (save_dir / SESSION_CATALOG_FILENAME).write_bytes(b"definitely not sqlite" * 10)
+
+    sessions = SessionLoader.list_sessions(config)
+
+    assert [s["session_id"] for s in sessions] == ["aaaaaaaa-1"]
@@ -9,7 +9,7 @@ import pytest
 
 from vibe.core.config import SessionLoggingConfig
 from vibe.core.session.session_loader import SessionLoader
-from vibe.core.types import LLMMessage, Role, ToolCall
+from vibe.core.types import FunctionCall, LLMMessage, Role, ToolCall
 
 
 @pytest.fixture
@@ -637,6 +637,84 @@ class TestSessionLoaderEdgeCases:
         assert messages[1].content == "Hi there!"
 
 
+def _write_tool_session(session_folder: Path, turns: int) -> None:
+    session_folder.mkdir()
+    lines = [LLMMessage(role=Role.system, content="System prompt")]
+    for turn in range(turns):
+        lines += [
+            LLMMessage(role=Role.user, content=f"question {turn}"),
+            LLMMessage(
+                role=Role.assistant,
+                tool_calls=[
+                    ToolCall(
+                        id=f"call_{turn}",
+                        index=0,
+                        function=FunctionCall(name="grep", arguments="{}"),
+                    )
+                ],
+            ),
+            LLMMessage(role=Role.tool, tool_call_id=f"call_{turn}", content="x" * 1000),
+            LLMMessage(role=Role.assistant, content=f"answer {turn}"),
+        ]
+    with (session_folder / "messages.jsonl").open("w", encoding="utf-8") as f:
+        for message in lines:
+            f.write(json.dumps(message.model_dump(exclude_none=True)) + "\n")
+
+
+class TestSessionLoaderPartialLoad:
+    def test_load_session_max_messages_starts_on_user_turn(
+        self, session_config: SessionLoggingConfig
+    ) -> None:
+        session_folder = Path(session_config.save_dir) / "test_20230101_120000_tail0000"
+        _write_tool_session(session_folder, turns=5)
+
+        messages, _ = SessionLoader.load_session(session_folder, max_messages=3)
+
+        assert [m.role for m in messages] == [
+            Role.user,
+            Role.assistant,
+            Role.tool,
+            Role.assistant,
+        ]
+        assert messages[0].content == "question 4"
+        assert messages[2].tool_call_id == "call_4"
+
+    def test_load_session_max_messages_skips_parsing_older_lines(
+        self, session_config: SessionLoggingConfig
+    ) -> None:
+        session_folder = Path(session_config.save_dir) / "test_20230101_120000_tail0001"
+        _write_tool_session(session_folder, turns=2)
+        messages_file = session_folder / "messages.jsonl"
+        lines = messages_file.read_text().splitlines(keepends=True)
+        lines[3] = '{"role": "tool", "content": "trunc\n'
+        messages_file.write_text("".join(lines))
+
+        messages, _ = SessionLoader.load_session(session_folder, max_messages=4)
+        assert messages[0].content == "question 1"
+
+        with pytest.raises(ValueError, match="invalid JSON"):
+            SessionLoader.load_session(session_folder)
+
+    def test_index_messages_returns_lazy_refs(
+        self, session_config: SessionLoggingConfig
+    ) -> None:
+        session_folder = Path(session_config.save_dir) / "test_20230101_120000_refs0000"
+        _write_tool_session(session_folder, turns=3)
+
+        refs = SessionLoader.index_messages(session_folder)
+
+        assert len(refs) == 12
+        assert [ref.role for ref in refs[:4]] == [
+            "user",
+            "assistant",
+            "tool",
+            "assistant",
+        ]
+        tool_output = refs[2].load()
+        assert tool_output.role == Role.tool
+        assert tool_output.content == "x" * 1000
+
+
 @pytest.fixture
 def create_test_session_with_cwd():
     def _create_session(
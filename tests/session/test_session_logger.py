@@ -11,6 +11,7 @@ import pytest
 from tests.conftest import build_test_vibe_config
 from vibe.core.agents.models import AgentProfile, AgentSafety
 from vibe.core.config import SessionLoggingConfig, VibeConfig
+from vibe.core.session.session_loader import SessionLoader
 from vibe.core.session.session_logger import SessionLogger
 from vibe.core.tools.manager import ToolManager
 from vibe.core.types import AgentStats, LLMMessage, Role, SessionMetadata
@@ -57,6 +58,7 @@ def mock_tool_manager() -> ToolManager:
     """Create a mock tool manager for testing."""
     manager = MagicMock(spec=ToolManager)
     manager.available_tools = {}
+    manager.tool_specs = []
     return manager
 
 
@@ -234,17 +236,22 @@ class TestSessionLoggerSaveInteraction:
             assert metadata["stats"]["steps"] == stats.steps
             assert "title" in metadata
             assert metadata["title"] == "Hello"
-            assert "system_prompt" in metadata
+            assert "system_prompt" not in metadata
+
+        with open(logger.session_dir / "context.json") as f:
+            context = json.load(f)
+            assert "system_prompt" in context
+            assert context["agent_profile"]["name"] == mock_agent_profile.name
 
     @pytest.mark.asyncio
-    async def test_save_interaction_system_prompt_in_metadata(
+    async def test_save_interaction_system_prompt_in_context(
         self,
         session_config: SessionLoggingConfig,
         mock_vibe_config: VibeConfig,
         mock_tool_manager: ToolManager,
         mock_agent_profile: AgentProfile,
     ) -> None:
-        """Test that system prompt is saved in metadata and not in messages."""
+        """Test that system prompt is saved in the session context and not in messages."""
         session_id = "test-session-123"
         logger = SessionLogger(session_config, session_id)
 
@@ -267,13 +274,13 @@ class TestSessionLoggerSaveInteraction:
         )
 
         assert logger.session_dir is not None
-        metadata_file = logger.session_dir / "meta.json"
-        assert metadata_file.exists()
-        with open(metadata_file) as f:
-            metadata = json.load(f)
-            assert "system_prompt" in metadata
-            assert metadata["system_prompt"]["content"] == "System prompt"
-            assert metadata["system_prompt"]["role"] == "system"
+        context_file = logger.session_dir / "context.json"
+        assert context_file.exists()
+        with open(context_file) as f:
+            context = json.load(f)
+            assert "system_prompt" in context
+            assert context["system_prompt"]["content"] == "System prompt"
+            assert context["system_prompt"]["role"] == "system"
 
         messages_file = logger.session_dir / "messages.jsonl"
         assert messages_file.exists()
@@ -350,6 +357,121 @@ class TestSessionLoggerSaveInteraction:
             lines = f.readlines()
             assert len(lines) == 4
 
+    @pytest.mark.asyncio
+    async def test_save_interaction_appends_batch_with_single_fsync(
+        self,
+        session_config: SessionLoggingConfig,
+        mock_vibe_config: VibeConfig,
+        mock_tool_manager: ToolManager,
+        mock_agent_profile: AgentProfile,
+    ) -> None:
+        """Test that a turn's messages are written with one fsync, not one per line."""
+        logger = SessionLogger(session_config, "test-session-123")
+        messages = [LLMMessage(role=Role.system, content="System prompt")] + [
+            LLMMessage(role=Role.user, content=f"message {i}") for i in range(10)
+        ]
+        stats = AgentStats(steps=1)
+
+        with patch(
+            "vibe.core.session.session_logger.os.fsync", wraps=os.fsync
+        ) as fsync:
+            await logger.save_interaction(
+                messages=messages,
+                stats=stats,
+                base_config=mock_vibe_config,
+                tool_manager=mock_tool_manager,
+                agent_profile=mock_agent_profile,
+            )
+
+        # messages.jsonl, context.json and meta.json
+        assert fsync.call_count == 3
+        assert logger.session_dir is not None
+        with open(logger.session_dir / "messages.jsonl") as f:
+            assert len(f.readlines()) == 10
+
+    @pytest.mark.asyncio
+    async def test_save_interaction_keeps_count_and_context_in_memory(
+        self,
+        session_config: SessionLoggingConfig,
+        mock_vibe_config: VibeConfig,
+        mock_tool_manager: ToolManager,
+        mock_agent_profile: AgentProfile,
+    ) -> None:
+        """Test that later turns neither re-read meta.json nor rewrite an unchanged context."""
+        logger = SessionLogger(session_config, "test-session-123")
+        messages = [
+            LLMMessage(role=Role.system, content="System prompt"),
+            LLMMessage(role=Role.user, content="Hello"),
+        ]
+        stats = AgentStats(steps=1)
+
+        async def save() -> None:
+            await logger.save_interaction(
+                messages=messages,
+                stats=stats,
+                base_config=mock_vibe_config,
+                tool_manager=mock_tool_manager,
+                agent_profile=mock_agent_profile,
+            )
+
+        await save()
+        assert logger.session_dir is not None
+        context_file = logger.session_dir / "context.json"
+        context_inode = context_file.stat().st_ino
+
+        # A re-read would trust this and append the whole history again.
+        (logger.session_dir / "meta.json").write_text(
+            json.dumps({"total_messages": 0}), encoding="utf-8"
+        )
+        messages.append(LLMMessage(role=Role.assistant, content="Hi"))
+        await save()
+
+        assert context_file.stat().st_ino == context_inode
+        with open(logger.session_dir / "meta.json") as f:
+            assert json.load(f)["total_messages"] == 2
+        with open(logger.session_dir / "messages.jsonl") as f:
+            assert len(f.readlines()) == 2
+
+    @pytest.mark.asyncio
+    async def test_save_interaction_failure_sweeps_stale_tmp_files(
+        self,
+        session_config: SessionLoggingConfig,
+        mock_vibe_config: VibeConfig,
+        mock_tool_manager: ToolManager,
+        mock_agent_profile: AgentProfile,
+    ) -> None:
+        """Test that a failed save still cleans up stale tmp files after the first turn."""
+        logger = SessionLogger(session_config, "test-session-123")
+        messages = [
+            LLMMessage(role=Role.system, content="System prompt"),
+            LLMMessage(role=Role.user, content="Hello"),
+        ]
+        stats = AgentStats(steps=1)
+
+        async def save() -> None:
+            await logger.save_interaction(
+                messages=messages,
+                stats=stats,
+                base_config=mock_vibe_config,
+                tool_manager=mock_tool_manager,
+                agent_profile=mock_agent_profile,
+            )
+
+        await save()
+        assert logger.session_dir is not None
+        stale_tmp_file = create_temp_file_ago(logger.session_dir, "meta.json.tmp", 10)
+        messages.append(LLMMessage(role=Role.assistant, content="Hi"))
+
+        with (
+            patch.object(
+                SessionLogger, "persist_metadata", side_effect=RuntimeError("disk full")
+            ),
+            pytest.raises(RuntimeError, match="Failed to save session"),
+        ):
+            await save()
+
+        assert not stale_tmp_file.exists()
+
     @pytest.mark.asyncio
     async def test_save_interaction_no_new_messages_is_noop(
         self,
@@ -502,6 +624,45 @@ class TestSessionLoggerSaveInteraction:
         with open(messages_file) as f:
             assert len(f.readlines()) == 2
 
+    @pytest.mark.asyncio
+    async def test_save_after_windowed_resume_keeps_only_the_window(
+        self,
+        session_config: SessionLoggingConfig,
+        mock_vibe_config: VibeConfig,
+        mock_tool_manager: ToolManager,
+        mock_agent_profile: AgentProfile,
+    ) -> None:
+        """A resumed session saves the loaded window; the original keeps it all."""
+        stats = AgentStats(steps=1)
+        history = [LLMMessage(role=Role.system, content="System prompt")]
+        for turn in range(3):
+            history += [
+                LLMMessage(role=Role.user, content=f"question {turn}"),
+                LLMMessage(role=Role.assistant, content=f"answer {turn}"),
+            ]
+        original = SessionLogger(session_config, "original-session")
+        await original.save_interaction(
+            history, stats, mock_vibe_config, mock_tool_manager, mock_agent_profile
+        )
+        assert original.session_dir is not None
+
+        window, _ = SessionLoader.load_session(original.session_dir, max_messages=2)
+        resumed = SessionLogger(session_config, "resumed-session")
+        await resumed.save_interaction(
+            [history[0], *window, LLMMessage(role=Role.user, content="question 3")],
+            stats,
+            mock_vibe_config,
+            mock_tool_manager,
+            mock_agent_profile,
+        )
+        assert resumed.session_dir is not None
+
+        saved, metadata = SessionLoader.load_session(resumed.session_dir)
+        assert [m.content for m in saved] == ["question 2", "answer 2", "question 3"]
+        assert metadata["total_messages"] == 3
+        kept, _ = SessionLoader.load_session(original.session_dir)
+        assert len(kept) == 6
+
 
 class TestSessionLoggerResetSession:
     def test_reset_session(self, session_config: SessionLoggingConfig) -> None:
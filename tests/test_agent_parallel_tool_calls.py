@@ -0,0 +1,176 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncGenerator
+import json
+from typing import ClassVar
+
+from pydantic import BaseModel
+import pytest
+
+from tests.conftest import build_test_agent_loop, build_test_vibe_config
+from tests.mock.utils import mock_llm_chunk
+from tests.stubs.fake_backend import FakeBackend
+from vibe.core.agent_loop import AgentLoop
+from vibe.core.agents.models import BuiltinAgentName
+from vibe.core.tools.base import BaseTool, BaseToolConfig, BaseToolState, InvokeContext
+from vibe.core.types import (
+    FunctionCall,
+    Role,
+    ToolCall,
+    ToolCallEvent,
+    ToolResultEvent,
+    ToolStreamEvent,
+)
+
+timeline: list[str] = []
+
+
+class SleepArgs(BaseModel):
+    label: str
+    delay: float = 0.0
+
+
+class SleepResult(BaseModel):
+    label: str
+
+
+class SleepState(BaseToolState):
+    pass
+
+
+class SlowRead(BaseTool[SleepArgs, SleepResult, BaseToolConfig, SleepState]):
+    read_only: ClassVar[bool] = True
+
+    @classmethod
+    def get_name(cls) -> str:
+        return "slow_read"
+
+    async def run(
+        self, args: SleepArgs, ctx: InvokeContext | None = None
+    ) -> AsyncGenerator[ToolStreamEvent | SleepResult, None]:
+        timeline.append(f"start {args.label}")
+        await asyncio.sleep(args.delay)
+        timeline.append(f"end {args.label}")
+        yield SleepResult(label=args.label)
+
+
+class SlowWrite(SlowRead):
+    read_only: ClassVar[bool] = False
+
+    @classmethod
+    def get_name(cls) -> str:
+        return "slow_write"
+
+
+def _call(tool: str, label: str, delay: float = 0.0) -> ToolCall:
+    return ToolCall(
+        id=f"call_{label}",
+        index=0,
+        function=FunctionCall(
+            name=tool, arguments=json.dumps({"label": label, "delay": delay})
+        ),
+    )
+
+
+def _agent_loop(tool_calls: list[ToolCall], max_parallel: int = 4) -> AgentLoop:
+    timeline.clear()
+    config = build_test_vibe_config(
+        auto_compact_threshold=0,
+        enabled_tools=["slow_read", "slow_write"],
+        max_parallel_tool_calls=max_parallel,
+    )
+    agent_loop = build_test_agent_loop(
+        config=config,
+        agent_name=BuiltinAgentName.AUTO_APPROVE,
+        backend=FakeBackend([
+            [
+                mock_llm_chunk(
+                    content="Working.",
+                    tool_calls=[
+                        call.model_copy(update={"index": i})
+                        for i, call in enumerate(tool_calls)
+                    ],
+                )
+            ],
+            [mock_llm_chunk(content="Done.")],
+        ]),
+    )
+    agent_loop.tool_manager._available["slow_read"] = SlowRead
+    agent_loop.tool_manager._available["slow_write"] = SlowWrite
+    return agent_loop
+
+
+def _tool_message_ids(agent_loop: AgentLoop) -> list[str | None]:
+    return [m.tool_call_id for m in agent_loop.messages if m.role == Role.tool]
+
+
+@pytest.mark.asyncio
+async def test_read_only_calls_run_concurrently_in_request_order() -> None:
+    agent_loop = _agent_loop([
+        _call("slow_read", "a", 0.2),
+        _call("slow_read", "b", 0.0),
+        _call("slow_read", "c", 0.1),
+    ])
+
+    events = [ev async for ev in agent_loop.act("Read things")]
+
+    assert timeline[:3] == ["start a", "start b", "start c"]
+    assert timeline[3:] == ["end b", "end c", "end a"]
+    results = [ev.tool_call_id for ev in events if isinstance(ev, ToolResultEvent)]
+    assert results == ["call_a", "call_b", "call_c"]
+    assert _tool_message_ids(agent_loop) == ["call_a", "call_b", "call_c"]
+
+
+@pytest.mark.asyncio
+async def test_each_call_event_directly_precedes_its_result() -> None:
+    agent_loop = _agent_loop([
+        _call("slow_read", "a", 0.1),
+        _call("slow_read", "b", 0.0),
+        _call("slow_read", "c", 0.05),
+    ])
+
+    events = [ev async for ev in agent_loop.act("Read things")]
+
+    sequence = [
+        (type(ev).__name__, ev.tool_call_id)
+        for ev in events
+        if isinstance(ev, ToolCallEvent | ToolResultEvent)
+    ]
+    assert sequence == [
+        ("ToolCallEvent", "call_a"),
+        ("ToolResultEvent", "call_a"),
+        ("ToolCallEvent", "call_b"),
+        ("ToolResultEvent", "call_b"),
+        ("ToolCallEvent", "call_c"),
+        ("ToolResultEvent", "call_c"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_mutating_call_waits_for_preceding_reads() -> None:
+    agent_loop = _agent_loop([
+        _call("slow_read", "a", 0.05),
+        _call("slow_read", "b", 0.0),
+        _call("slow_write", "w", 0.0),
+        _call("slow_read", "c", 0.0),
+    ])
+
+    events = [ev async for ev in agent_loop.act("Read then write")]
+
+    assert timeline.index("start w") > timeline.index("end a")
+    assert timeline.index("start c") > timeline.index("end w")
+    call_events = [ev.tool_call_id for ev in events if isinstance(ev, ToolCallEvent)]
+    assert call_events == ["call_a", "call_b", "call_w", "call_c"]
+    assert _tool_message_ids(agent_loop) == ["call_a", "call_b", "call_w", "call_c"]
+
+
+@pytest.mark.asyncio
+async def test_parallelism_limit_of_one_runs_sequentially() -> None:
+    agent_loop = _agent_loop(
+        [_call("slow_read", "a", 0.02), _call("slow_read", "b", 0.0)], max_parallel=1
+    )
+
+    [ev async for ev in agent_loop.act("Read things")]
+
+    assert timeline == ["start a", "end a", "start b", "end b"]
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+import os
+from pathlib import Path
+import sys
+
+import pytest
+
+from tests.conftest import build_test_vibe_config
+from vibe.core.paths.global_paths import TOOL_MANIFEST_FILE
+from vibe.core.tools.manager import ToolManager, _compute_module_name
+
+TOOL_SOURCE = """
+from collections.abc import AsyncGenerator
+
+from pydantic import BaseModel
+
+from vibe.core.tools.base import BaseTool, BaseToolConfig, BaseToolState
+
+
+class EchoArgs(BaseModel):
+    text: str
+
+
+class EchoResult(BaseModel):
+    text: str
+
+
+class Echo(BaseTool[EchoArgs, EchoResult, BaseToolConfig, BaseToolState]):
+    description = "{description}"
+
+    async def run(
+        self, args: EchoArgs, ctx=None
+    ) -> AsyncGenerator[EchoResult, None]:
+        yield EchoResult(text=args.text)
+"""
+
+
+@pytest.fixture
+def tool_file(tmp_path: Path) -> Path:
+    path = tmp_path / "tools" / "echo.py"
+    path.parent.mkdir()
+    path.write_text(TOOL_SOURCE.format(description="Echo text."), encoding="utf-8")
+    return path
+
+
+def _manager(tool_file: Path) -> ToolManager:
+    sys.modules.pop(_compute_module_name(tool_file), None)
+    config = build_test_vibe_config(
+        system_prompt_id="tests",
+        include_project_context=False,
+        tool_paths=[tool_file.parent],
+    )
+    return ToolManager(lambda: config)
+
+
+def _spec(manager: ToolManager, name: str):
+    return next(spec for spec in manager.tool_specs if spec.name == name)
+
+
+def test_cached_tools_are_not_imported_until_used(tool_file: Path) -> None:
+    _manager(tool_file)
+    assert TOOL_MANIFEST_FILE.path.is_file()
+
+    manager = _manager(tool_file)
+
+    assert "echo" in manager.available_tools
+    assert _spec(manager, "echo").description == "Echo text."
+    assert _spec(manager, "echo").parameters["required"] == ["text"]
+    assert _compute_module_name(tool_file) not in sys.modules
+
+    assert manager.get("echo").get_name() == "echo"
+    assert _compute_module_name(tool_file) in sys.modules
+
+
+def test_edited_tool_file_is_reimported(tool_file: Path) -> None:
+    _manager(tool_file)
+    tool_file.write_text(
+        TOOL_SOURCE.format(description="Echo text back."), encoding="utf-8"
+    )
+
+    manager = _manager(tool_file)
+
+    assert _spec(manager, "echo").description == "Echo text back."
+
+
+def test_touched_but_unchanged_file_stays_cached(tool_file: Path) -> None:
+    _manager(tool_file)
+    stat = tool_file.stat()
+    os.utime(tool_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    manager = _manager(tool_file)
+
+    assert _spec(manager, "echo").description == "Echo text."
+    assert _compute_module_name(tool_file) not in sys.modules
+
+
+def test_corrupt_manifest_is_ignored(tool_file: Path) -> None:
+    TOOL_MANIFEST_FILE.path.parent.mkdir(parents=True, exist_ok=True)
+    TOOL_MANIFEST_FILE.path.write_text("{not json", encoding="utf-8")
+
+    manager = _manager(tool_file)
+
+    assert _spec(manager, "echo").description == "Echo text."
+    assert "bash" in manager.available_tools
+
+
+HELPER_TOOL_SOURCE = """
+from collections.abc import AsyncGenerator
+
+from echo_helpers import EchoArgs, EchoResult
+
+from vibe.core.tools.base import BaseTool, BaseToolConfig, BaseToolState
+
+
+class Echo(BaseTool[EchoArgs, EchoResult, BaseToolConfig, BaseToolState]):
+    description = "Echo text."
+
+    async def run(
+        self, args: EchoArgs, ctx=None
+    ) -> AsyncGenerator[EchoResult, None]:
+        yield EchoResult(text=args.text)
+"""
+
+HELPER_SOURCE = """
+from pydantic import BaseModel
+
+
+class EchoArgs(BaseModel):
+{fields}
+
+
+class EchoResult(BaseModel):
+    text: str
+"""
+
+
+@pytest.fixture
+def helper_tool_file(
+    tool_file: Path, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[Path]:
+    lib = tmp_path / "lib"
+    lib.mkdir()
+    (lib / "echo_helpers.py").write_text(
+        HELPER_SOURCE.format(fields="    text: str"), encoding="utf-8"
+    )
+    monkeypatch.syspath_prepend(str(lib))
+    tool_file.write_text(HELPER_TOOL_SOURCE, encoding="utf-8")
+    yield tool_file
+    sys.modules.pop("echo_helpers", None)
+
+
+def test_edited_helper_module_is_reimported(helper_tool_file: Path) -> None:
+    _manager(helper_tool_file)
+    helper = helper_tool_file.parent.parent / "lib" / "echo_helpers.py"
+    helper.write_text(
+        HELPER_SOURCE.format(fields="    text: str\n    times: int"), encoding="utf-8"
+    )
+    sys.modules.pop("echo_helpers", None)
+
+    manager = _manager(helper_tool_file)
+
+    assert _spec(manager, "echo").parameters["required"] == ["text", "times"]
+
+
+def test_manifest_can_be_bypassed(
+    tool_file: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    _manager(tool_file)
+    monkeypatch.setenv("VIBE_NO_TOOL_MANIFEST", "1")
+
+    _manager(tool_file)
+
+    assert _compute_module_name(tool_file) in sys.modules
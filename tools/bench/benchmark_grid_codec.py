@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: grid_codec scalar decode/encode vs decode_many/encode_many."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+REPO = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO))
+
+from core.services.grid_codec import (
+    NUMPY_AVAILABLE,
+    _index_to_col,
+    decode_many,
+    decode_to_latlon_bounds,
+    encode_from_latlon,
+    encode_many,
+)
+
+
+def _codes(count: int, rng: random.Random) -> List[str]:
+    cols = [_index_to_col(index) for index in range(80)]
+    codes: List[str] = []
+    for _ in range(count):
+        depth = rng.randint(1, 4)
+        cells = "-".join(f"{rng.choice(cols)}{rng.randint(10, 39)}" for _ in range(depth))
+        codes.append(f"L{rng.randint(300, 899)}-{cells}")
+    return codes
+
+
+def _points(count: int, rng: random.Random) -> Tuple[List[float], List[float]]:
+    lats = [rng.uniform(-90.0, 90.0) for _ in range(count)]
+    lons = [rng.uniform(-180.0, 180.0) for _ in range(count)]
+    return lats, lons
+
+
+def _timed(fn: Any) -> Tuple[Any, float]:
+    t0 = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - t0
+
+
+def run_benchmark(count: int = 1_000_000, seed: int = 7) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    codes = _codes(count, rng)
+    lats, lons = _points(count, rng)
+
+    scalar_bounds, scalar_decode_s = _timed(lambda: [decode_to_latlon_bounds(code) for code in codes])
+    batch_bounds, batch_decode_s = _timed(lambda: decode_many(codes))
+    max_abs_diff = max(
+        abs(a - b)
+        for scalar, batch in zip(scalar_bounds, batch_bounds)
+        for a, b in zip(scalar, batch)
+    )
+
+    scalar_codes, scalar_encode_s = _timed(lambda: [encode_from_latlon(321, lat, lon) for lat, lon in zip(lats, lons)])
+    batch_codes, batch_encode_s = _timed(lambda: encode_many(321, lats, lons))
+
+    report: Dict[str, Any] = {
+        "codes": count,
+        "decode": {
+            "scalar_s": round(scalar_decode_s, 3),
+            "batch_s": round(batch_decode_s, 3),
+            "speedup": round(scalar_decode_s / max(batch_decode_s, 1e-9), 2),
+            "max_abs_diff_deg": max_abs_diff,
+        },
+        "encode": {
+            "scalar_s": round(scalar_encode_s, 3),
+            "batch_s": round(batch_encode_s, 3),
+            "speedup": round(scalar_encode_s / max(batch_encode_s, 1e-9), 2),
+            "mismatches": sum(a != b for a, b in zip(scalar_codes, batch_codes)),
+        },
+    }
+    if NUMPY_AVAILABLE:
+        _, array_s = _timed(lambda: decode_many(codes, as_array=True))
+        report["decode"]["as_array_s"] = round(array_s, 3)
+    return report
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=1_000_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    print(json.dumps(run_benchmark(args.count, args.seed), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: stage-1 uCODE fuzzy match, linear scan vs precompiled matcher."""
+
+from __future__ import annotations
+
+import json
+import statistics
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import sys
+
+REPO = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO))
+
+from core.services.command_dispatch_service import (
+    UCODE_COMMANDS,
+    _levenshtein_distance,
+    match_ucode_command,
+)
+from core.services.command_fuzzy_matcher import FuzzyCommandMatcher
+
+
+def _linear_match(token: str) -> Optional[Tuple[str, int]]:
+    """Pre-index stage-1 behaviour: Levenshtein against every command."""
+    candidates = []
+    for cmd in UCODE_COMMANDS:
+        dist = _levenshtein_distance(token, cmd)
+        if dist <= 2:
+            candidates.append((cmd, dist))
+    if not candidates:
+        return None
+    return min(candidates, key=lambda x: (x[1], x[0]))
+
+
+def _sample_tokens() -> List[str]:
+    tokens: List[str] = []
+    for cmd in sorted(UCODE_COMMANDS):
+        if len(cmd) >= 4:
+            tokens.append(cmd[:-1] + "X")  # substitution
+            tokens.append(cmd[1:])  # deletion
+            tokens.append(cmd + "S")  # insertion
+    tokens.extend(["WHATEVER", "PYTHONIC", "GITSTATUS", "DOCKERFILE"])  # misses
+    return tokens
+
+
+def _per_call_us(fn: Callable[[str], Any], tokens: List[str], rounds: int) -> Dict[str, float]:
+    samples: List[float] = []
+    for _ in range(rounds):
+        for token in tokens:
+            t0 = time.perf_counter()
+            fn(token)
+            samples.append((time.perf_counter() - t0) * 1_000_000.0)
+    samples.sort()
+    return {
+        "median_us": round(statistics.median(samples), 3),
+        "p95_us": round(samples[min(len(samples) - 1, int(len(samples) * 0.95))], 3),
+    }
+
+
+def run_benchmark(rounds: int = 50) -> Dict[str, Any]:
+    tokens = _sample_tokens()
+    t0 = time.perf_counter()
+    matcher = FuzzyCommandMatcher(UCODE_COMMANDS)
+    build_ms = (time.perf_counter() - t0) * 1000.0
+
+    mismatches = [t for t in tokens if matcher.closest(t) != _linear_match(t)]
+    linear = _per_call_us(_linear_match, tokens, rounds)
+    indexed = _per_call_us(matcher.closest, tokens, rounds)
+    dispatch = _per_call_us(lambda t: match_ucode_command(f"{t} arg"), tokens, rounds)
+    return {
+        "commands": len(UCODE_COMMANDS),
+        "tokens": len(tokens),
+        "matcher_build_ms": round(build_ms, 3),
+        "linear_scan": linear,
+        "precompiled": indexed,
+        "match_ucode_command": dispatch,
+        "speedup_median": round(linear["median_us"] / max(indexed["median_us"], 1e-9), 2),
+        "mismatches": mismatches,
+    }
+
+
+def main() -> int:
+    print(json.dumps(run_benchmark(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
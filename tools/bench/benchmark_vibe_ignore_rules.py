@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""Micro-benchmark: vibe IgnoreRules, per-pattern fnmatch scan vs compiled matcher."""
+
+from __future__ import annotations
+
+import fnmatch
+import json
+import random
+import statistics
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Tuple
+
+REPO = Path(__file__).resolve().parents[2]
+sys.path.insert(0, str(REPO))
+
+from vibe.core.autocompletion.file_indexer.ignore_rules import (
+    CompiledPattern,
+    IgnoreRules,
+)
+
+Sample = Tuple[str, str, bool]
+
+
+def _linear_should_ignore(
+    patterns: List[CompiledPattern], rel_str: str, name: str, is_dir: bool
+) -> bool:
+    """Pre-compilation behaviour: fnmatch every pattern, last match wins."""
+    ignored = False
+    for pattern in patterns:
+        if pattern.name_only:
+            if pattern.anchor_root and "/" in rel_str:
+                continue
+            target = name
+        else:
+            target = rel_str
+        if fnmatch.fnmatch(target, pattern.stripped) and (
+            not pattern.dir_only or is_dir
+        ):
+            ignored = pattern.is_exclude
+    return ignored
+
+
+def _gitignore(rules: int, rng: random.Random) -> str:
+    lines = ["# generated"]
+    for i in range(rules):
+        kind = i % 6
+        if kind == 0:
+            lines.append(f"*.gen{i}")
+        elif kind == 1:
+            lines.append(f"cache_{i}/")
+        elif kind == 2:
+            lines.append(f"/out{i}")
+        elif kind == 3:
+            lines.append(f"pkg{i % 40}/build_{i}/*.o")
+        elif kind == 4:
+            lines.append(f"fixture_{i}.json")
+        else:
+            lines.append(f"!keep_{rng.randint(0, 50)}.gen{i - 5}")
+    return "\n".join(lines) + "\n"
+
+
+def _samples(count: int, rng: random.Random) -> List[Sample]:
+    names = ["main.py", "index.ts", "README.md", "data.json", "lib.o", "x.pyc"]
+    samples: List[Sample] = []
+    for _ in range(count):
+        depth = rng.randint(0, 4)
+        parts = [f"pkg{rng.randint(0, 60)}"] + [
+            rng.choice(["src", "build_9", "tests", f"cache_{rng.randint(0, 400)}"])
+            for _ in range(depth)
+        ]
+        is_dir = rng.random() < 0.2
+        name = parts.pop() if is_dir and parts else rng.choice(names)
+        if rng.random() < 0.1:
+            name = f"keep_{rng.randint(0, 50)}.gen{rng.randint(0, 400)}"
+        rel = "/".join([*parts, name])
+        samples.append((rel, name, is_dir))
+    return samples
+
+
+def _per_call_us(
+    fn: Callable[[str, str, bool], Any], samples: List[Sample]
+) -> Dict[str, float]:
+    timings: List[float] = []
+    for rel, name, is_dir in samples:
+        t0 = time.perf_counter()
+        fn(rel, name, is_dir)
+        timings.append((time.perf_counter() - t0) * 1_000_000.0)
+    timings.sort()
+    return {
+        "median_us": round(statistics.median(timings), 3),
+        "p95_us": round(timings[min(len(timings) - 1, int(len(timings) * 0.95))], 3),
+    }
+
+
+def run_benchmark(
+    rules: int = 300, paths: int = 20000, seed: int = 7
+) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / ".gitignore").write_text(_gitignore(rules, rng), encoding="utf-8")
+        ignore_rules = IgnoreRules()
+        t0 = time.perf_counter()
+        ignore_rules.ensure_for_root(root)
+        build_ms = (time.perf_counter() - t0) * 1000.0
+        patterns = ignore_rules._patterns or []
+
+        samples = _samples(paths, rng)
+        mismatches = [
+            rel
+            for rel, name, is_dir in samples
+            if ignore_rules.should_ignore(rel, name, is_dir)
+            != _linear_should_ignore(patterns, rel, name, is_dir)
+        ]
+        linear = _per_call_us(
+            lambda rel, name, is_dir: _linear_should_ignore(
+                patterns, rel, name, is_dir
+            ),
+            samples,
+        )
+        compiled = _per_call_us(ignore_rules.should_ignore, samples)
+
+    return {
+        "patterns": len(patterns),
+        "paths": len(samples),
+        "build_ms": round(build_ms, 3),
+        "linear_scan": linear,
+        "compiled": compiled,
+        "speedup_median": round(
+            linear["median_us"] / max(compiled["median_us"], 1e-9), 2
+        ),
+        "mismatches": mismatches[:20],
+    }
+
+
+def main() -> int:
+    print(json.dumps(run_benchmark(), indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
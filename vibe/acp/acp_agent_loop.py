@@ -84,6 +84,7 @@ from vibe.core.config import (
     VibeConfig,
     load_dotenv_values,
 )
+from vibe.core.llm.http_pool import http_client_pool
 from vibe.core.proxy_setup import (
     ProxySetupError,
     parse_proxy_command,
@@ -445,7 +446,10 @@ class VibeAcpAgentLoop(AcpAgent):
             })
 
         try:
-            loaded_messages, _ = SessionLoader.load_session(session_dir)
+            loaded_messages, _ = SessionLoader.load_session(
+                session_dir,
+                max_messages=config.session_logging.resume_max_messages or None,
+            )
         except ValueError as e:
             raise RequestError.invalid_params({
                 "session_id": f"Failed to load session: {e}"
@@ -863,10 +867,22 @@ class VibeAcpAgentLoop(AcpAgent):
     def on_connect(self, conn: Client) -> None:
         self.client = conn
 
+    async def aclose(self) -> None:
+        for session in self.sessions.values():
+            await session.agent_loop.telemetry_client.aclose()
+        await http_client_pool.aclose()
+
+
+async def _serve(agent: VibeAcpAgentLoop) -> None:
+    try:
+        await run_agent(agent=agent, use_unstable_protocol=True)
+    finally:
+        await agent.aclose()
+
 
 def run_acp_server() -> None:
     try:
-        asyncio.run(run_agent(agent=VibeAcpAgentLoop(), use_unstable_protocol=True))
+        asyncio.run(_serve(VibeAcpAgentLoop()))
     except KeyboardInterrupt:
         # This is expected when the server is terminated
         pass
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import sqlite3
 import sys
 
 from rich import print as rprint
@@ -106,13 +107,26 @@ def load_session(
             sys.exit(1)
 
     try:
-        loaded_messages, _ = SessionLoader.load_session(session_to_load)
+        loaded_messages, _ = SessionLoader.load_session(
+            session_to_load,
+            max_messages=config.session_logging.resume_max_messages or None,
+        )
         return loaded_messages
     except Exception as e:
         rprint(f"[red]Failed to load session: {e}[/]")
         sys.exit(1)
 
 
+def rebuild_session_index(config: VibeConfig) -> None:
+    try:
+        count = SessionLoader.rebuild_catalog(config.session_logging)
+    except (OSError, sqlite3.Error) as e:
+        rprint(f"[red]Failed to rebuild session index: {e}[/]")
+        sys.exit(1)
+    rprint(f"Indexed {count} session(s) in {config.session_logging.save_dir}")
+    sys.exit(0)
+
+
 def _load_messages_from_previous_session(
     agent_loop: AgentLoop, loaded_messages: list[LLMMessage]
 ) -> None:
@@ -136,6 +150,9 @@ def run_cli(args: argparse.Namespace) -> None:
         if args.enabled_tools:
             config.enabled_tools = args.enabled_tools
 
+        if getattr(args, "rebuild_session_index", False):
+            rebuild_session_index(config)
+
         loaded_messages = load_session(args, config)
 
         stdin_prompt = get_prompt_from_stdin()
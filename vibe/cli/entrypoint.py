@@ -77,6 +77,11 @@ def parse_arguments() -> argparse.Namespace:
         "or custom from ~/.vibe/agents/NAME.toml)",
     )
     parser.add_argument("--setup", action="store_true", help="Setup API key and exit")
+    parser.add_argument(
+        "--rebuild-session-index",
+        action="store_true",
+        help="Rebuild the saved-session index used by --continue/--resume and exit",
+    )
     parser.add_argument(
         "--workdir",
         type=Path,
@@ -12,6 +12,7 @@ from weakref import WeakKeyDictionary
 
 from pydantic import BaseModel
 from rich import print as rprint
+from textual import events, on
 from textual.app import WINDOWS, App, ComposeResult
 from textual.binding import Binding, BindingType
 from textual.containers import Horizontal, VerticalGroup, VerticalScroll
@@ -84,6 +85,7 @@ from vibe.core.agent_loop import AgentLoop, TeleportError
 from vibe.core.agents import AgentProfile
 from vibe.core.autocompletion.path_prompt_adapter import render_path_prompt
 from vibe.core.config import VibeConfig
+from vibe.core.llm.http_pool import http_client_pool
 from vibe.core.paths.config_paths import HISTORY_FILE
 from vibe.core.session.session_loader import SessionLoader
 from vibe.core.teleport.types import (
@@ -331,6 +333,11 @@ class VibeApp(App):  # noqa: PLR0904
     def _is_file_watcher_enabled(self) -> bool:
         return self.config.file_watcher_for_autocomplete
 
+    @on(events.Unmount)
+    async def _close_http_clients(self) -> None:
+        await self.agent_loop.telemetry_client.aclose()
+        await http_client_pool.aclose()
+
     async def on_chat_input_container_submitted(
         self, event: ChatInputContainer.Submitted
     ) -> None:
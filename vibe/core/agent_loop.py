@@ -622,16 +622,109 @@ class AgentLoop:
     ) -> AsyncGenerator[ToolCallEvent | ToolResultEvent | ToolStreamEvent]:
         async for event in self._emit_failed_tool_events(resolved.failed_calls):
             yield event
-        for tool_call in resolved.tool_calls:
-            yield ToolCallEvent(
-                tool_name=tool_call.tool_name,
-                tool_class=tool_call.tool_class,
-                args=tool_call.validated_args,
-                tool_call_id=tool_call.call_id,
-            )
+        for batch in self._schedule_tool_calls(resolved.tool_calls):
+            if len(batch) > 1:
+                async for event in self._process_tool_calls_concurrently(batch):
+                    yield event
+                continue
+            tool_call = batch[0]
+            yield self._tool_call_event(tool_call)
             async for event in self._process_one_tool_call(tool_call):
                 yield event
 
+    @staticmethod
+    def _tool_call_event(tool_call: ResolvedToolCall) -> ToolCallEvent:
+        return ToolCallEvent(
+            tool_name=tool_call.tool_name,
+            tool_class=tool_call.tool_class,
+            args=tool_call.validated_args,
+            tool_call_id=tool_call.call_id,
+        )
+
+    def _schedule_tool_calls(
+        self, tool_calls: list[ResolvedToolCall]
+    ) -> list[list[ResolvedToolCall]]:
+        """Split a turn's tool calls into batches run one after another.
+
+        Consecutive read-only calls that need no approval prompt share a batch
+        and run concurrently; every other call is a batch of its own, so
+        writes and approvals keep their original order.
+        """
+        batches: list[list[ResolvedToolCall]] = []
+        parallel = self.config.max_parallel_tool_calls > 1
+        previous_concurrent = False
+        for tool_call in tool_calls:
+            concurrent = parallel and self._can_run_concurrently(tool_call)
+            if concurrent and previous_concurrent:
+                batches[-1].append(tool_call)
+            else:
+                batches.append([tool_call])
+            previous_concurrent = concurrent
+        return batches
+
+    def _can_run_concurrently(self, tool_call: ResolvedToolCall) -> bool:
+        if not tool_call.tool_class.read_only:
+            return False
+        try:
+            tool_instance = self.tool_manager.get(tool_call.tool_name)
+        except Exception:
+            return False
+        decision = self._resolve_tool_permission(
+            tool_instance, tool_call.validated_args
+        )
+        return decision is not None
+
+    async def _process_tool_calls_concurrently(
+        self, batch: list[ResolvedToolCall]
+    ) -> AsyncGenerator[ToolCallEvent | ToolResultEvent | ToolStreamEvent]:
+        limit = asyncio.Semaphore(self.config.max_parallel_tool_calls)
+        queues: list[asyncio.Queue[ToolResultEvent | ToolStreamEvent | None]] = [
+            asyncio.Queue() for _ in batch
+        ]
+
+        async def run(
+            tool_call: ResolvedToolCall,
+            queue: asyncio.Queue[ToolResultEvent | ToolStreamEvent | None],
+        ) -> None:
+            try:
+                async with limit:
+                    async for event in self._process_one_tool_call(tool_call):
+                        queue.put_nowait(event)
+            finally:
+                queue.put_nowait(None)
+
+        first_response = len(self.messages)
+        tasks = [
+            asyncio.create_task(run(tool_call, queue))
+            for tool_call, queue in zip(batch, queues, strict=True)
+        ]
+        try:
+            # Replay each call's events in request order, whatever order the
+            # calls actually finish in. The UI pairs results with the most
+            # recent call event, so each call is announced just before them.
+            for tool_call, task, queue in zip(batch, tasks, queues, strict=True):
+                yield self._tool_call_event(tool_call)
+                while (event := await queue.get()) is not None:
+                    yield event
+                await task
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            self._order_tool_responses(first_response, batch)
+
+    def _order_tool_responses(self, start: int, batch: list[ResolvedToolCall]) -> None:
+        position = {tool_call.call_id: i for i, tool_call in enumerate(batch)}
+        responses = self.messages[start:]
+        responses.sort(
+            key=lambda msg: (
+                position.get(msg.tool_call_id, len(batch))
+                if msg.tool_call_id is not None
+                else len(batch)
+            )
+        )
+        self.messages[start:] = responses
+
     def _handle_tool_response(
         self,
         tool_call: ResolvedToolCall,
@@ -753,6 +846,14 @@ class AgentLoop:
     async def _should_execute_tool(
         self, tool: BaseTool, args: BaseModel, tool_call_id: str
     ) -> ToolDecision:
+        if (decision := self._resolve_tool_permission(tool, args)) is not None:
+            return decision
+        return await self._ask_approval(tool.get_name(), args, tool_call_id)
+
+    def _resolve_tool_permission(
+        self, tool: BaseTool, args: BaseModel
+    ) -> ToolDecision | None:
+        """Decide from config alone; None means the user must be asked."""
         if self.auto_approve:
             return ToolDecision(
                 verdict=ToolExecutionResponse.EXECUTE,
@@ -789,7 +890,7 @@ class AgentLoop:
                 feedback=f"Tool '{tool_name}' is permanently disabled",
             )
 
-        return await self._ask_approval(tool_name, args, tool_call_id)
+        return None
 
     async def _ask_approval(
         self, tool_name: str, args: BaseModel, tool_call_id: str
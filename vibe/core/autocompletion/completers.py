@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from pathlib import Path
 from typing import NamedTuple
 
 from vibe.core.autocompletion.file_indexer import FileIndexer, IndexEntry
 from vibe.core.autocompletion.fuzzy import fuzzy_match
 
-DEFAULT_MAX_ENTRIES_TO_PROCESS = 32000
 DEFAULT_TARGET_MATCHES = 100
+# How long a keystroke waits on a running index rebuild before completing
+# against the entries published so far.
+DEFAULT_INDEX_WAIT_SECONDS = 1.0
 
 
 class Completer:
@@ -69,13 +71,15 @@ class CommandCompleter(Completer):
 class PathCompleter(Completer):
     def __init__(
         self,
-        max_entries_to_process: int = DEFAULT_MAX_ENTRIES_TO_PROCESS,
+        max_entries_to_process: int | None = None,
         target_matches: int = DEFAULT_TARGET_MATCHES,
         watcher_enabled_getter: Callable[[], bool] | None = None,
+        index_wait_seconds: float | None = DEFAULT_INDEX_WAIT_SECONDS,
     ) -> None:
         self._indexer = FileIndexer(should_enable_watcher=watcher_enabled_getter)
         self._max_entries_to_process = max_entries_to_process
         self._target_matches = target_matches
+        self._index_wait_seconds = index_wait_seconds
 
     class _SearchContext(NamedTuple):
         suffix: str
@@ -150,6 +154,16 @@ class PathCompleter(Completer):
         # entry matches the prefix: let the fuzzy matcher decide if it's a good match
         return True
 
+    def _candidate_filter(self, context: _SearchContext) -> tuple[str, str, str]:
+        # (required, excluded, contains) for the index's posting filter: every
+        # entry _matches_prefix or fuzzy_match could accept passes it, and
+        # substring hits of the pattern (the best fuzzy scores) come first.
+        if context.search_pattern:
+            return context.search_pattern, "", context.search_pattern
+        if context.path_prefix:
+            return f"{context.path_prefix.rstrip('/')}/", "", ""
+        return "", "/", ""
+
     def _is_visible(self, entry: IndexEntry, context: _SearchContext) -> bool:
         return not (entry.name.startswith(".") and not context.suffix.startswith("."))
 
@@ -158,13 +172,16 @@ class PathCompleter(Completer):
         return f"@{entry.rel}{suffix}"
 
     def _score_matches(
-        self, entries: list[IndexEntry], context: _SearchContext
+        self, entries: Iterable[IndexEntry], context: _SearchContext
     ) -> list[tuple[str, float]]:
         scored_matches: list[tuple[str, float]] = []
         MAX_MATCHES = 50
 
         for i, entry in enumerate(entries):
-            if i >= self._max_entries_to_process:
+            if (
+                self._max_entries_to_process is not None
+                and i >= self._max_entries_to_process
+            ):
                 break
 
             if not self._matches_prefix(entry, context):
@@ -205,7 +222,11 @@ class PathCompleter(Completer):
 
         try:
             # TODO (Vince): doing the assumption that "." is the root directory... Reliable?
-            file_index = self._indexer.get_index(Path("."))
+            file_index = self._indexer.get_candidates(
+                Path("."),
+                *self._candidate_filter(context),
+                timeout=self._index_wait_seconds,
+            )
         except (OSError, RuntimeError):
             return []
 
@@ -2,7 +2,9 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import fnmatch
+import hashlib
 from pathlib import Path
+import re
 
 DEFAULT_IGNORE_PATTERNS: list[tuple[str, bool]] = [
     (".git/", True),
@@ -54,50 +56,215 @@ class CompiledPattern:
     anchor_root: bool
 
 
+def _compile_pattern(raw: str, is_exclude: bool) -> CompiledPattern:
+    anchor_root = raw.startswith("/")
+    if anchor_root:
+        raw = raw[1:]
+
+    stripped = raw.rstrip("/")
+    return CompiledPattern(
+        raw=raw,
+        stripped=stripped,
+        is_exclude=is_exclude,
+        dir_only=raw.endswith("/"),
+        name_only="/" not in stripped,
+        anchor_root=anchor_root,
+    )
+
+
+def _parse_gitignore(text: str) -> list[CompiledPattern]:
+    patterns: list[CompiledPattern] = []
+    for line in text.splitlines():
+        raw = line.strip()
+        if not raw or raw.startswith("#"):
+            continue
+
+        if "#" in raw:
+            raw = raw.split("#", 1)[0].rstrip()
+            if not raw:
+                continue
+
+        is_exclude = not raw.startswith("!")
+        if not is_exclude:
+            raw = raw[1:].lstrip()
+            if not raw:
+                continue
+
+        patterns.append(_compile_pattern(raw, is_exclude))
+    return patterns
+
+
+class _ScopeMatcher:
+    """The patterns of one ignore scope compiled for constant-cost lookups.
+
+    Literal patterns live in dicts keyed by name or relative path, ``*.ext``
+    patterns in a dict keyed by extension; the remaining glob patterns are
+    merged into one regex per (target, is_dir, top-level) variant
+    whose alternatives run from the last pattern to the first, so the first
+    alternative that matches is the one gitignore's "last match wins" picks.
+    """
+
+    def __init__(self, patterns: list[CompiledPattern]) -> None:
+        self.patterns = patterns
+        self._name_literals: dict[str, list[int]] = {}
+        self._path_literals: dict[str, list[int]] = {}
+        self._name_suffixes: dict[str, list[int]] = {}
+        self._name_globs: list[int] = []
+        self._path_globs: list[int] = []
+        for index, pattern in enumerate(patterns):
+            is_glob = any(char in pattern.stripped for char in "*?[")
+            if pattern.name_only:
+                suffix = pattern.stripped[1:]
+                if pattern.stripped.startswith("*.") and not any(
+                    char in suffix for char in "*?["
+                ):
+                    self._name_suffixes.setdefault(suffix, []).append(index)
+                elif is_glob:
+                    self._name_globs.append(index)
+                else:
+                    self._name_literals.setdefault(pattern.stripped, []).append(index)
+            elif is_glob:
+                self._path_globs.append(index)
+            else:
+                self._path_literals.setdefault(pattern.stripped, []).append(index)
+        self._regexes: dict[
+            tuple[bool, bool, bool], tuple[re.Pattern[str], list[int]] | None
+        ] = {}
+
+    def match(self, rel_str: str, name: str, is_dir: bool) -> CompiledPattern | None:
+        top_level = "/" not in rel_str
+        best = -1
+        for index in self._name_literals.get(name, ()):
+            if self._applies(self.patterns[index], is_dir, top_level):
+                best = max(best, index)
+        dot = name.find(".")
+        while dot != -1:
+            for index in self._name_suffixes.get(name[dot:], ()):
+                if self._applies(self.patterns[index], is_dir, top_level):
+                    best = max(best, index)
+            dot = name.find(".", dot + 1)
+        for index in self._path_literals.get(rel_str, ()):
+            if is_dir or not self.patterns[index].dir_only:
+                best = max(best, index)
+        for by_name, target in ((True, name), (False, rel_str)):
+            compiled = self._regex(by_name, is_dir, top_level)
+            if compiled is None:
+                continue
+            regex, order = compiled
+            hit = regex.match(target)
+            if hit is not None and hit.lastindex is not None:
+                best = max(best, order[hit.lastindex - 1])
+        return self.patterns[best] if best >= 0 else None
+
+    @staticmethod
+    def _applies(pattern: CompiledPattern, is_dir: bool, top_level: bool) -> bool:
+        if pattern.dir_only and not is_dir:
+            return False
+        return not (pattern.name_only and pattern.anchor_root and not top_level)
+
+    def _regex(
+        self, by_name: bool, is_dir: bool, top_level: bool
+    ) -> tuple[re.Pattern[str], list[int]] | None:
+        key = (by_name, is_dir, top_level if by_name else True)
+        if key in self._regexes:
+            return self._regexes[key]
+
+        candidates = self._name_globs if by_name else self._path_globs
+        order = [
+            index
+            for index in reversed(candidates)
+            if self._applies(self.patterns[index], is_dir, key[2])
+        ]
+        compiled = None
+        if order:
+            regex = re.compile(
+                "|".join(
+                    f"({fnmatch.translate(self.patterns[index].stripped)})"
+                    for index in order
+                )
+            )
+            compiled = (regex, order)
+        self._regexes[key] = compiled
+        return compiled
+
+
 class IgnoreRules:
+    """Default ignore patterns plus the root ``.gitignore`` and any nested
+    ``.gitignore`` files, which are loaded the first time a path below their
+    directory is checked. Deeper scopes take precedence, as in git.
+    """
+
     def __init__(self, defaults: list[tuple[str, bool]] | None = None) -> None:
         self._defaults = defaults or DEFAULT_IGNORE_PATTERNS
         self._patterns: list[CompiledPattern] | None = None
+        self._scopes: dict[str, _ScopeMatcher | None] = {}
         self._root: Path | None = None
 
     def ensure_for_root(self, root: Path) -> None:
         resolved_root = root.resolve()
         if self._patterns is None or self._root != resolved_root:
             self._patterns = self._build_patterns(resolved_root)
+            self._scopes = {"": _ScopeMatcher(self._patterns)}
             self._root = resolved_root
 
     def should_ignore(self, rel_str: str, name: str, is_dir: bool) -> bool:
         if not self._patterns:
             return False
 
-        ignored = False
-        for pattern in self._patterns:
-            if self._matches(rel_str, name, is_dir, pattern):
-                ignored = pattern.is_exclude
-        return ignored
+        scope_rel = rel_str.rpartition("/")[0]
+        while True:
+            scope = self._scope(scope_rel)
+            if scope is not None:
+                scoped = rel_str[len(scope_rel) + 1 :] if scope_rel else rel_str
+                pattern = scope.match(scoped, name, is_dir)
+                if pattern is not None:
+                    return pattern.is_exclude
+            if not scope_rel:
+                return False
+            scope_rel = scope_rel.rpartition("/")[0]
+
+    def fingerprint(self) -> str:
+        digest = hashlib.sha256()
+        for pattern in self._patterns or []:
+            digest.update(
+                f"{pattern.raw}\0{pattern.is_exclude}\0{pattern.anchor_root}\n".encode()
+            )
+        return digest.hexdigest()[:16]
 
     def reset(self) -> None:
         self._patterns = None
+        self._scopes = {}
         self._root = None
 
-    def _build_patterns(self, root: Path) -> list[CompiledPattern]:
-        patterns: list[CompiledPattern] = []
-        for raw, is_exclude in self._defaults:
-            anchor_root = raw.startswith("/")
-            if anchor_root:
-                raw = raw[1:]
-
-            stripped = raw.rstrip("/")
-            patterns.append(
-                CompiledPattern(
-                    raw=raw,
-                    stripped=stripped,
-                    is_exclude=is_exclude,
-                    dir_only=raw.endswith("/"),
-                    name_only="/" not in stripped,
-                    anchor_root=anchor_root,
+    def invalidate_scope(self, scope_rel: str) -> None:
+        """Forget the nested ``.gitignore`` of ``scope_rel`` so it is re-read."""
+        if scope_rel:
+            self._scopes.pop(scope_rel, None)
+
+    def _scope(self, scope_rel: str) -> _ScopeMatcher | None:
+        try:
+            return self._scopes[scope_rel]
+        except KeyError:
+            pass
+
+        scope = None
+        if self._root is not None:
+            try:
+                text = (self._root / scope_rel / ".gitignore").read_text(
+                    encoding="utf-8"
                 )
-            )
+            except (OSError, UnicodeDecodeError):
+                text = ""
+            patterns = _parse_gitignore(text)
+            if patterns:
+                scope = _ScopeMatcher(patterns)
+        self._scopes[scope_rel] = scope
+        return scope
+
+    def _build_patterns(self, root: Path) -> list[CompiledPattern]:
+        patterns = [
+            _compile_pattern(raw, is_exclude) for raw, is_exclude in self._defaults
+        ]
 
         gitignore_path = root / ".gitignore"
         if gitignore_path.exists():
@@ -106,51 +273,6 @@ class IgnoreRules:
             except Exception:
                 return patterns
 
-            for line in text.splitlines():
-                raw = line.strip()
-                if not raw or raw.startswith("#"):
-                    continue
-
-                if "#" in raw:
-                    raw = raw.split("#", 1)[0].rstrip()
-                    if not raw:
-                        continue
-
-                is_exclude = not raw.startswith("!")
-                if not is_exclude:
-                    raw = raw[1:].lstrip()
-                    if not raw:
-                        continue
-
-                anchor_root = raw.startswith("/")
-                if anchor_root:
-                    raw = raw[1:]
-
-                stripped = raw.rstrip("/")
-                patterns.append(
-                    CompiledPattern(
-                        raw=raw,
-                        stripped=stripped,
-                        is_exclude=is_exclude,
-                        dir_only=raw.endswith("/"),
-                        name_only="/" not in stripped,
-                        anchor_root=anchor_root,
-                    )
-                )
+            patterns.extend(_parse_gitignore(text))
 
         return patterns
-
-    def _matches(
-        self, rel_str: str, name: str, is_dir: bool, pattern: CompiledPattern
-    ) -> bool:
-        if pattern.name_only:
-            if pattern.anchor_root and "/" in rel_str:
-                return False
-            target = name
-        else:
-            target = rel_str
-
-        if not fnmatch.fnmatch(target, pattern.stripped):
-            return False
-
-        return not pattern.dir_only or is_dir
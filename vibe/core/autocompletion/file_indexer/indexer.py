@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import atexit
-from collections.abc import Callable, Iterable
+from collections.abc import Callable, Iterable, Iterator
 from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from pathlib import Path
@@ -14,6 +14,7 @@ from vibe.core.autocompletion.file_indexer.store import (
     IndexEntry,
 )
 from vibe.core.autocompletion.file_indexer.watcher import Change, WatchController
+from vibe.core.paths.global_paths import FILE_INDEX_CACHE_DIR
 
 
 @dataclass(slots=True)
@@ -27,12 +28,19 @@ class FileIndexer:
         self,
         mass_change_threshold: int = 200,
         should_enable_watcher: Callable[[], bool] | None = None,
+        snapshot_dir: Path | None = None,
+        persist_snapshot: bool = True,
     ) -> None:
         self._lock = RLock()  # guards _store snapshot access and watcher callbacks.
         self._stats = FileIndexStats()
         self._ignore_rules = IgnoreRules()
+        if persist_snapshot and snapshot_dir is None:
+            snapshot_dir = FILE_INDEX_CACHE_DIR.path
         self._store = FileIndexStore(
-            self._ignore_rules, self._stats, mass_change_threshold=mass_change_threshold
+            self._ignore_rules,
+            self._stats,
+            mass_change_threshold=mass_change_threshold,
+            snapshot_dir=snapshot_dir if persist_snapshot else None,
         )
         self._watcher = WatchController(self._handle_watch_changes)
         self._rebuild_executor = ThreadPoolExecutor(
@@ -52,7 +60,31 @@ class FileIndexer:
     def stats(self) -> FileIndexStats:
         return self._stats
 
-    def get_index(self, root: Path) -> list[IndexEntry]:
+    def get_index(self, root: Path, timeout: float | None = None) -> list[IndexEntry]:
+        """Entries under ``root``. Waits for a running rebuild for at most
+        ``timeout`` seconds (forever when ``None``); on expiry the entries
+        published so far are returned.
+        """
+        self._ensure_index(root, timeout)
+        with self._lock:  # ensure root reference is fresh before snapshotting
+            return self._store.snapshot()
+
+    def get_candidates(
+        self,
+        root: Path,
+        required: str = "",
+        excluded: str = "",
+        contains: str = "",
+        timeout: float | None = None,
+    ) -> Iterator[IndexEntry]:
+        """Like ``get_index`` but narrowed through the character posting index;
+        see ``FileIndexStore.candidates``.
+        """
+        self._ensure_index(root, timeout)
+        with self._lock:
+            return self._store.candidates(required, excluded, contains)
+
+    def _ensure_index(self, root: Path, timeout: float | None = None) -> Path:
         resolved_root = root.resolve()
 
         with self._lock:  # read current root without blocking rebuild bookkeeping
@@ -77,15 +109,17 @@ class FileIndexer:
             with self._rebuild_lock:
                 self._target_root = resolved_root
             self._start_background_rebuild(resolved_root)
-            self._wait_for_rebuild(resolved_root)
 
-        if self._should_enable_watcher():
-            self._watcher.start(resolved_root)
-        else:
+        # The walk publishes as it goes, so a rebuild started by an earlier
+        # call may still be running even though the store already has the root.
+        rebuilt = self._wait_for_rebuild(resolved_root, timeout)
+
+        if not self._should_enable_watcher():
             self._watcher.stop()
+        elif rebuilt:
+            self._watcher.start(resolved_root)
 
-        with self._lock:  # ensure root reference is fresh before snapshotting
-            return self._store.snapshot()
+        return resolved_root
 
     def refresh(self) -> None:
         self._watcher.stop()
@@ -103,6 +137,12 @@ class FileIndexer:
         if self._shutdown:
             return
         self._shutdown = True
+        self._watcher.stop()
+        with self._rebuild_lock:
+            rebuilding = bool(self._active_rebuilds)
+        if not rebuilding:  # a running walk has only part of the tree
+            with self._lock:  # keep watcher updates for the next warm start
+                self._store.save_snapshot()
         self.refresh()
         self._rebuild_executor.shutdown(wait=True)
 
@@ -145,15 +185,18 @@ class FileIndexer:
                     self._active_rebuilds.pop(root, None)
                     return
 
-            with self._lock:  # exclusive access while rebuilding the store
-                if task.cancel_event.is_set():
-                    with self._rebuild_lock:
-                        self._active_rebuilds.pop(root, None)
-                    return
+            if task.cancel_event.is_set():
+                with self._rebuild_lock:
+                    self._active_rebuilds.pop(root, None)
+                return
 
-                self._store.rebuild(
-                    root, should_cancel=lambda: task.cancel_event.is_set()
-                )
+            # The store takes _lock itself for each published batch, so
+            # readers can query partial results during the walk.
+            self._store.rebuild(
+                root,
+                should_cancel=lambda: task.cancel_event.is_set(),
+                publish_lock=self._lock,
+            )
 
             with self._rebuild_lock:
                 self._active_rebuilds.pop(root, None)
@@ -163,11 +206,12 @@ class FileIndexer:
         finally:
             task.done_event.set()
 
-    def _wait_for_rebuild(self, root: Path) -> None:
+    def _wait_for_rebuild(self, root: Path, timeout: float | None = None) -> bool:
         with self._rebuild_lock:
             task = self._active_rebuilds.get(root)
         if task:
-            task.done_event.wait()
+            return task.done_event.wait(timeout)
+        return True
 
     def _handle_watch_changes(
         self, root: Path, raw_changes: Iterable[tuple[Change, str]]
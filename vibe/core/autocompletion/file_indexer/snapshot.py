@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+import json
+import os
+from pathlib import Path
+
+SNAPSHOT_VERSION = 2
+
+
+@dataclass(slots=True)
+class IndexSnapshot:
+    """Compact on-disk form of a root's index.
+
+    ``files`` holds the sorted relative paths of non-directory entries and
+    ``dirs`` maps every indexed directory (``""`` for the root) to its
+    ``st_mtime_ns`` at scan time. A directory whose mtime differs on load has
+    gained, lost or renamed a direct child and is the only thing rescanned.
+    ``gitignores`` records ``[st_mtime_ns, st_size]`` of every nested
+    ``.gitignore``; editing one leaves its directory's mtime alone, so any
+    difference makes the whole snapshot stale.
+    """
+
+    root: str
+    ignore_fingerprint: str
+    files: list[str] = field(default_factory=list)
+    dirs: dict[str, int] = field(default_factory=dict)
+    gitignores: dict[str, list[int]] = field(default_factory=dict)
+
+
+def snapshot_path(snapshot_dir: Path, root: Path) -> Path:
+    digest = hashlib.sha256(str(root).encode("utf-8")).hexdigest()[:16]
+    return snapshot_dir / f"{digest}.json"
+
+
+def file_signature(path: Path) -> list[int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def load_snapshot(
+    snapshot_dir: Path, root: Path, ignore_fingerprint: str
+) -> IndexSnapshot | None:
+    try:
+        data = json.loads(snapshot_path(snapshot_dir, root).read_text("utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    if (
+        not isinstance(data, dict)
+        or not _is_current(data, root, ignore_fingerprint)
+        or not _gitignores_unchanged(root, data["gitignores"])
+    ):
+        return None
+
+    return IndexSnapshot(
+        root=data["root"],
+        ignore_fingerprint=data["ignore"],
+        files=data["files"],
+        dirs=data["dirs"],
+        gitignores=data["gitignores"],
+    )
+
+
+def _is_current(data: dict, root: Path, ignore_fingerprint: str) -> bool:
+    return (
+        data.get("version") == SNAPSHOT_VERSION
+        and data.get("root") == str(root)
+        and data.get("ignore") == ignore_fingerprint
+        and isinstance(data.get("files"), list)
+        and isinstance(data.get("dirs"), dict)
+        and isinstance(data.get("gitignores"), dict)
+    )
+
+
+def _gitignores_unchanged(root: Path, gitignores: dict) -> bool:
+    return all(
+        file_signature(root / rel) == signature for rel, signature in gitignores.items()
+    )
+
+
+def delete_snapshot(snapshot_dir: Path, root: Path) -> None:
+    try:
+        snapshot_path(snapshot_dir, root).unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+def save_snapshot(snapshot_dir: Path, snapshot: IndexSnapshot) -> None:
+    target = snapshot_path(snapshot_dir, Path(snapshot.root))
+    payload = {
+        "version": SNAPSHOT_VERSION,
+        "root": snapshot.root,
+        "ignore": snapshot.ignore_fingerprint,
+        "files": snapshot.files,
+        "dirs": snapshot.dirs,
+        "gitignores": snapshot.gitignores,
+    }
+    try:
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp = target.with_suffix(f".{os.getpid()}.tmp")
+        tmp.write_text(json.dumps(payload, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, target)
+    except OSError:
+        pass
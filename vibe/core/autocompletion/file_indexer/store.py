@@ -1,18 +1,55 @@
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections import deque
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager
 from dataclasses import dataclass
 import os
 from pathlib import Path
+from threading import Condition, RLock, Thread
+import time
 
 from vibe.core.autocompletion.file_indexer.ignore_rules import IgnoreRules
+from vibe.core.autocompletion.file_indexer.postings import CharPostingIndex
+from vibe.core.autocompletion.file_indexer.snapshot import (
+    IndexSnapshot,
+    delete_snapshot,
+    file_signature,
+    load_snapshot,
+    save_snapshot,
+)
 from vibe.core.autocompletion.file_indexer.watcher import Change
 
+# Directory mtimes this close to the save time may still change within the
+# filesystem's timestamp granularity, so they are persisted as "unknown".
+_RACY_MTIME_NS = 2_000_000_000
+
+_GITIGNORE = ".gitignore"
+
+# scandir blocks in the kernel with the GIL released, so a few threads overlap
+# directory reads well beyond the core count (notably on network filesystems).
+DEFAULT_WALK_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+
+def _record_mtime(
+    dir_mtimes: dict[str, int] | None, rel_str: str, entry: os.DirEntry
+) -> None:
+    if dir_mtimes is None:
+        return
+    try:
+        dir_mtimes[rel_str] = entry.stat(follow_symlinks=False).st_mtime_ns
+    except OSError:
+        pass
+
 
 @dataclass(slots=True)
 class FileIndexStats:
     rebuilds: int = 0
     incremental_updates: int = 0
+    snapshot_hits: int = 0
+    snapshot_misses: int = 0
+    reconciled_dirs: int = 0
+    last_reconcile_ms: float = 0.0
 
 
 @dataclass(slots=True)
@@ -30,13 +67,23 @@ class FileIndexStore:
         ignore_rules: IgnoreRules,
         stats: FileIndexStats,
         mass_change_threshold: int = 200,
+        snapshot_dir: Path | None = None,
+        walk_workers: int = DEFAULT_WALK_WORKERS,
     ) -> None:
         self._ignore_rules = ignore_rules
         self._stats = stats
         self._mass_change_threshold = mass_change_threshold
+        self._snapshot_dir = snapshot_dir
+        self._walk_workers = max(1, walk_workers)
         self._entries_by_rel: dict[str, IndexEntry] = {}
         self._ordered_entries: list[IndexEntry] | None = None
+        self._postings: CharPostingIndex | None = None
+        self._dir_mtimes: dict[str, int] = {}
         self._root: Path | None = None
+        self._dirty = False
+        # Only an index whose walk or reconcile ran to the end is persisted;
+        # a partial one would record mtimes for directories never scanned.
+        self._complete = False
 
     @property
     def root(self) -> Path | None:
@@ -45,18 +92,119 @@ class FileIndexStore:
     def clear(self) -> None:
         self._entries_by_rel.clear()
         self._ordered_entries = None
+        self._postings = None
+        self._dir_mtimes.clear()
         self._root = None
+        self._dirty = False
+        self._complete = False
 
     def rebuild(
-        self, root: Path, should_cancel: Callable[[], bool] | None = None
+        self,
+        root: Path,
+        should_cancel: Callable[[], bool] | None = None,
+        use_snapshot: bool = True,
+        publish_lock: AbstractContextManager | None = None,
     ) -> None:
-        resolved_root = root.resolve()
-        self._ignore_rules.ensure_for_root(resolved_root)
-        entries = self._walk_directory(resolved_root, cancel_check=should_cancel)
-        self._entries_by_rel = {entry.rel: entry for entry in entries}
-        self._ordered_entries = entries
-        self._root = resolved_root
-        self._stats.rebuilds += 1
+        """Re-index ``root`` from its snapshot or a parallel directory walk.
+
+        A cold walk publishes each scanned directory into the store under
+        ``publish_lock``, so readers holding that lock see partial results
+        while the rebuild runs; without one the walk uses a private lock.
+        """
+        lock = publish_lock if publish_lock is not None else RLock()
+        with lock:
+            resolved_root = root.resolve()
+            if self._root is not None and self._root != resolved_root:
+                self.save_snapshot()
+
+            self._ignore_rules.ensure_for_root(resolved_root)
+            self._root = resolved_root
+            self._postings = None
+            self._complete = False
+
+            snapshot = None
+            if use_snapshot and self._snapshot_dir is not None:
+                snapshot = load_snapshot(
+                    self._snapshot_dir, resolved_root, self._ignore_rules.fingerprint()
+                )
+                if snapshot is None:
+                    self._stats.snapshot_misses += 1
+
+            warm = snapshot is not None and self._warm_start(snapshot, should_cancel)
+            if warm:
+                self._stats.snapshot_hits += 1
+            else:
+                if snapshot is not None:
+                    self._stats.snapshot_misses += 1
+                self._entries_by_rel = {}
+                self._ordered_entries = None
+                self._dir_mtimes = {}
+                try:
+                    self._dir_mtimes[""] = resolved_root.stat().st_mtime_ns
+                except OSError:
+                    pass
+
+        if not warm:
+            self._walk_parallel(resolved_root, lock, should_cancel)
+
+        with lock:
+            cancelled = bool(should_cancel and should_cancel())
+            if cancelled and not warm and self._snapshot_dir is not None:
+                delete_snapshot(self._snapshot_dir, resolved_root)
+            if self._root != resolved_root:
+                return  # another rebuild took over the store meanwhile
+            self._stats.rebuilds += 1
+            if cancelled:
+                self._dirty = False
+                return
+            self._complete = True
+            if not warm:
+                self._dirty = True
+            self.save_snapshot()
+
+    def save_snapshot(self) -> None:
+        if (
+            self._snapshot_dir is None
+            or self._root is None
+            or not self._dirty
+            or not self._complete
+        ):
+            return
+
+        racy_after = time.time_ns() - _RACY_MTIME_NS
+        files: list[str] = []
+        dirs: dict[str, int] = {"": 0}
+        for rel, entry in self._entries_by_rel.items():
+            if entry.is_dir:
+                dirs[rel] = 0
+            else:
+                files.append(rel)
+        for rel in dirs:
+            mtime = self._dir_mtimes.get(rel, 0)
+            dirs[rel] = mtime if mtime < racy_after else 0
+        files.sort()
+        gitignores: dict[str, list[int]] = {}
+        for rel in files:
+            if rel.endswith(f"/{_GITIGNORE}"):
+                signature = file_signature(self._root / rel)
+                if signature is not None:
+                    # A racy mtime never matches on load, forcing a fresh walk.
+                    gitignores[rel] = [
+                        signature[0] if signature[0] < racy_after else 0,
+                        signature[1],
+                    ]
+
+        save_snapshot(
+            self._snapshot_dir,
+            IndexSnapshot(
+                root=str(self._root),
+                ignore_fingerprint=self._ignore_rules.fingerprint(),
+                files=files,
+                dirs=dirs,
+                gitignores=gitignores,
+            ),
+        )
+        self._dirty = False
 
     def snapshot(self) -> list[IndexEntry]:
         if not self._entries_by_rel:
@@ -69,15 +217,31 @@ class FileIndexStore:
 
         return list(self._ordered_entries)
 
+    def candidates(
+        self, required: str = "", excluded: str = "", contains: str = ""
+    ) -> Iterator[IndexEntry]:
+        """Entries containing every character of ``required`` and none of
+        ``excluded`` (case-insensitive), in snapshot order with substring
+        matches of ``contains`` first.
+
+        The posting index is built on first use and then kept current by
+        ``apply_changes``.
+        """
+        if self._postings is None:
+            self._postings = CharPostingIndex()
+            self._postings.reset(self.snapshot())
+        return self._postings.query(required, excluded, contains)
+
     def apply_changes(self, changes: list[tuple[Change, Path]]) -> None:
         if self._root is None:
             return
 
         if len(changes) > self._mass_change_threshold:
-            self.rebuild(self._root)
+            self.rebuild(self._root, use_snapshot=False)
             return
 
         modified = False
+        ignore_scopes: set[str] = set()
         for change, path in changes:
             try:
                 rel_str = path.relative_to(self._root).as_posix()
@@ -87,6 +251,9 @@ class FileIndexStore:
             if not rel_str:
                 continue
 
+            if path.name == _GITIGNORE:
+                ignore_scopes.add(rel_str.rpartition("/")[0])
+
             if change is Change.deleted:
                 if self._remove_entry(rel_str):
                     modified = True
@@ -96,23 +263,158 @@ class FileIndexStore:
                 continue
 
             if path.is_dir():
-                dir_entry = self._create_entry(rel_str, path.name, path, True)
-                if dir_entry:
-                    self._entries_by_rel[rel_str] = dir_entry
-                    modified = True
-                for entry in self._walk_directory(path, rel_str):
-                    self._entries_by_rel[entry.rel] = entry
+                if self._index_directory(rel_str, path):
                     modified = True
             else:
                 file_entry = self._create_entry(rel_str, path.name, path, False)
                 if file_entry:
-                    self._entries_by_rel[file_entry.rel] = file_entry
+                    self._put_entry(file_entry)
                     modified = True
 
+        if ignore_scopes and self._reload_ignore_scopes(ignore_scopes):
+            modified = True
+
         if modified:
             self._ordered_entries = None
+            self._dirty = True
             self._stats.incremental_updates += 1
 
+    def _reload_ignore_scopes(self, scopes: set[str]) -> bool:
+        """Re-index everything below directories whose ``.gitignore`` changed."""
+        assert self._root is not None
+        if "" in scopes:
+            self._ignore_rules.reset()
+            self.rebuild(self._root, use_snapshot=False)
+            return False
+        for scope in scopes:
+            self._ignore_rules.invalidate_scope(scope)
+        modified = False
+        for scope in sorted(scopes):
+            if self._remove_entry(scope):
+                self._index_directory(scope, self._root / scope)
+                modified = True
+        return modified
+
+    def _index_directory(self, rel_str: str, path: Path) -> bool:
+        modified = False
+        dir_entry = self._create_entry(rel_str, path.name, path, True)
+        if dir_entry:
+            self._put_entry(dir_entry)
+            modified = True
+        for entry in self._walk_directory(path, rel_str):
+            self._put_entry(entry)
+            modified = True
+        return modified
+
+    def _warm_start(
+        self, snapshot: IndexSnapshot, should_cancel: Callable[[], bool] | None
+    ) -> bool:
+        """Load ``snapshot`` and rescan only directories whose mtime changed."""
+        assert self._root is not None
+        started = time.perf_counter()
+        root = self._root
+        try:
+            entries = {rel: self._entry_for(root, rel, False) for rel in snapshot.files}
+            entries.update(
+                (rel, self._entry_for(root, rel, True)) for rel in snapshot.dirs if rel
+            )
+            dir_mtimes = {rel: int(mtime) for rel, mtime in snapshot.dirs.items()}
+        except (TypeError, ValueError, AttributeError):
+            return False
+
+        self._entries_by_rel = entries
+        self._ordered_entries = None
+        self._dir_mtimes = dir_mtimes
+        self._dirty = False
+
+        children: dict[str, list[str]] = {}
+        for rel in entries:
+            children.setdefault(rel.rpartition("/")[0], []).append(rel)
+
+        # Parents first, so a removed directory's subtree is never rescanned.
+        for rel in sorted(dir_mtimes, key=lambda rel: rel.count("/") if rel else -1):
+            if should_cancel and should_cancel():
+                break
+            if rel and rel not in self._entries_by_rel:
+                continue
+            directory = root / rel if rel else root
+            try:
+                mtime = directory.stat().st_mtime_ns
+            except OSError:
+                if rel:
+                    self._remove_entry(rel)
+                else:
+                    self._entries_by_rel.clear()
+                self._dirty = True
+                continue
+            if mtime == self._dir_mtimes.get(rel):
+                continue
+            if (
+                rel
+                and f"{rel}/{_GITIGNORE}" not in snapshot.gitignores
+                and (directory / _GITIGNORE).is_file()
+            ):
+                # A new nested .gitignore can hide entries the snapshot kept.
+                return False
+            self._rescan_directory(directory, rel, children.get(rel, []))
+            self._dir_mtimes[rel] = mtime
+            self._stats.reconciled_dirs += 1
+            self._dirty = True
+
+        self._stats.last_reconcile_ms = (time.perf_counter() - started) * 1000
+        return True
+
+    def _rescan_directory(
+        self, directory: Path, rel_prefix: str, known_children: list[str]
+    ) -> None:
+        seen: dict[str, tuple[str, Path, bool]] = {}
+        try:
+            with os.scandir(directory) as iterator:
+                for entry in iterator:
+                    rel_str = f"{rel_prefix}/{entry.name}" if rel_prefix else entry.name
+                    seen[rel_str] = (
+                        entry.name,
+                        Path(entry.path),
+                        entry.is_dir(follow_symlinks=False),
+                    )
+        except OSError:
+            return
+
+        for rel_str in known_children:
+            if rel_str not in seen:
+                self._remove_entry(rel_str)
+
+        for rel_str, (name, path, is_dir) in seen.items():
+            current = self._entries_by_rel.get(rel_str)
+            if current is not None:
+                if current.is_dir == is_dir:
+                    continue
+                self._remove_entry(rel_str)
+
+            index_entry = self._create_entry(rel_str, name, path, is_dir)
+            if not index_entry:
+                continue
+            self._entries_by_rel[rel_str] = index_entry
+            if is_dir:
+                try:
+                    self._dir_mtimes[rel_str] = path.stat().st_mtime_ns
+                except OSError:
+                    pass
+                for child in self._walk_directory(
+                    path, rel_str, dir_mtimes=self._dir_mtimes
+                ):
+                    self._entries_by_rel[child.rel] = child
+
+    @staticmethod
+    def _entry_for(root: Path, rel_str: str, is_dir: bool) -> IndexEntry:
+        return IndexEntry(
+            rel=rel_str,
+            rel_lower=rel_str.lower(),
+            name=rel_str.rpartition("/")[2],
+            path=root / rel_str,
+            is_dir=is_dir,
+        )
+
     def _create_entry(
         self, rel_str: str, name: str, path: Path, is_dir: bool
     ) -> IndexEntry | None:
@@ -127,14 +429,26 @@ class FileIndexStore:
         directory: Path,
         rel_prefix: str = "",
         cancel_check: Callable[[], bool] | None = None,
-    ) -> list[IndexEntry]:
-        results: list[IndexEntry] = []
+        dir_mtimes: dict[str, int] | None = None,
+    ) -> Iterator[IndexEntry]:
+        pending = [(directory, rel_prefix)]
+        while pending:
+            current, prefix = pending.pop()
+            if cancel_check and cancel_check():
+                return
+            entries, subdirs = self._scan_directory(current, prefix, dir_mtimes)
+            yield from entries
+            pending.extend(subdirs)
+
+    def _scan_directory(
+        self, directory: Path, rel_prefix: str, dir_mtimes: dict[str, int] | None
+    ) -> tuple[list[IndexEntry], list[tuple[Path, str]]]:
+        """Index one directory level; ignored subdirectories are never queued."""
+        entries: list[IndexEntry] = []
+        subdirs: list[tuple[Path, str]] = []
         try:
             with os.scandir(directory) as iterator:
                 for entry in iterator:
-                    if cancel_check and cancel_check():
-                        break
-
                     is_dir = entry.is_dir(follow_symlinks=False)
                     name = entry.name
                     rel_str = f"{rel_prefix}/{name}" if rel_prefix else name
@@ -144,26 +458,109 @@ class FileIndexStore:
                     if not index_entry:
                         continue
 
-                    results.append(index_entry)
+                    entries.append(index_entry)
 
                     if is_dir:
-                        results.extend(
-                            self._walk_directory(path, rel_str, cancel_check)
-                        )
+                        _record_mtime(dir_mtimes, rel_str, entry)
+                        subdirs.append((path, rel_str))
         except (PermissionError, OSError):
             pass
 
-        return results
+        return entries, subdirs
+
+    def _publish(
+        self,
+        entries: list[IndexEntry],
+        dir_mtimes: dict[str, int],
+        publish_lock: AbstractContextManager,
+        cancelled: Callable[[], bool],
+    ) -> bool:
+        with publish_lock:
+            if cancelled():
+                return False
+            for entry in entries:
+                self._put_entry(entry)
+            self._dir_mtimes.update(dir_mtimes)
+            if entries:
+                self._ordered_entries = None
+            return True
+
+    def _walk_parallel(
+        self,
+        root: Path,
+        publish_lock: AbstractContextManager,
+        cancel_check: Callable[[], bool] | None,
+    ) -> None:
+        """Walk ``root`` on ``walk_workers`` threads sharing one LIFO queue.
+
+        Idle workers take whatever directory was queued last, so the work
+        spreads across threads however unbalanced the tree is. Each scanned
+        level is merged into the store under ``publish_lock``.
+        """
+        pending: deque[tuple[Path, str]] = deque([(root, "")])
+        condition = Condition()
+        active = 0
+
+        def cancelled() -> bool:
+            return bool(cancel_check and cancel_check())
+
+        def work() -> None:
+            nonlocal active
+            while True:
+                with condition:
+                    while not pending and active:
+                        condition.wait()
+                    if not pending or cancelled():
+                        pending.clear()
+                        condition.notify_all()
+                        return
+                    directory, rel_prefix = pending.pop()
+                    active += 1
+
+                subdirs: list[tuple[Path, str]] = []
+                try:
+                    dir_mtimes: dict[str, int] = {}
+                    entries, subdirs = self._scan_directory(
+                        directory, rel_prefix, dir_mtimes
+                    )
+                    if not self._publish(entries, dir_mtimes, publish_lock, cancelled):
+                        subdirs = []
+                finally:
+                    with condition:
+                        active -= 1
+                        pending.extend(subdirs)
+                        condition.notify_all()
+
+        threads = [
+            Thread(target=work, name=f"file-indexer-walk-{i}", daemon=True)
+            for i in range(self._walk_workers - 1)
+        ]
+        for thread in threads:
+            thread.start()
+        work()
+        for thread in threads:
+            thread.join()
+
+    def _put_entry(self, entry: IndexEntry) -> None:
+        self._entries_by_rel[entry.rel] = entry
+        if self._postings is not None:
+            self._postings.add(entry)
 
     def _remove_entry(self, rel_str: str) -> bool:
         entry = self._entries_by_rel.pop(rel_str, None)
         if not entry:
             return False
+        if self._postings is not None:
+            self._postings.discard(rel_str)
 
         if entry.is_dir:
+            self._dir_mtimes.pop(rel_str, None)
             prefix = f"{rel_str}/"
             to_remove = [key for key in self._entries_by_rel if key.startswith(prefix)]
             for key in to_remove:
                 self._entries_by_rel.pop(key, None)
+                self._dir_mtimes.pop(key, None)
+                if self._postings is not None:
+                    self._postings.discard(key)
 
         return True
@@ -129,6 +129,11 @@ class SessionLoggingConfig(BaseSettings):
     save_dir: str = ""
     session_prefix: str = "session"
     enabled: bool = True
+    # Resume only the most recent turns (at least this many messages) of a
+    # saved session; 0 restores the whole history. The resumed conversation is
+    # saved as a new session holding just those turns, while the original
+    # session directory keeps the full history.
+    resume_max_messages: int = Field(default=0, ge=0)
 
     @field_validator("save_dir", mode="before")
     @classmethod
@@ -332,6 +337,7 @@ class VibeConfig(BaseSettings):
     enable_update_checks: bool = True
     enable_auto_update: bool = True
     api_timeout: float = 720.0
+    max_parallel_tool_calls: int = Field(default=4, ge=1)
 
     # TODO(vibe-nuage): remove exclude=True once the feature is publicly available
     nuage_enabled: bool = Field(default=False, exclude=True)
@@ -12,6 +12,7 @@ from vibe.core.llm.backend.anthropic import AnthropicAdapter
 from vibe.core.llm.backend.base import APIAdapter, PreparedRequest
 from vibe.core.llm.backend.vertex import VertexAnthropicAdapter
 from vibe.core.llm.exceptions import BackendErrorBuilder
+from vibe.core.llm.http_pool import http_client_pool
 from vibe.core.llm.message_utils import merge_consecutive_user_messages
 from vibe.core.types import (
     AvailableTool,
@@ -180,19 +181,14 @@ class GenericBackend:
         """Initialize the backend.
 
         Args:
-            client: Optional httpx client to use. If not provided, one will be created.
+            client: Optional httpx client to use. If not provided, the shared
+                client for the provider's origin is taken from the HTTP pool.
         """
         self._client = client
-        self._owns_client = client is None
         self._provider = provider
         self._timeout = timeout
 
     async def __aenter__(self) -> GenericBackend:
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(self._timeout),
-                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            )
         return self
 
     async def __aexit__(
@@ -201,18 +197,12 @@ class GenericBackend:
         exc_val: BaseException | None,
         exc_tb: types.TracebackType | None,
     ) -> None:
-        if self._owns_client and self._client:
-            await self._client.aclose()
-            self._client = None
-
-    def _get_client(self) -> httpx.AsyncClient:
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(self._timeout),
-                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            )
-            self._owns_client = True
-        return self._client
+        await self.close()
+
+    def _get_client(self, url: str) -> httpx.AsyncClient:
+        if self._client is not None:
+            return self._client
+        return http_client_pool.get(url, timeout=self._timeout)
 
     async def complete(
         self,
@@ -358,7 +348,7 @@ class GenericBackend:
     async def _make_request(
         self, url: str, data: bytes, headers: dict[str, str]
     ) -> HTTPResponse:
-        client = self._get_client()
+        client = self._get_client(url)
         response = await client.post(url, content=data, headers=headers)
         response.raise_for_status()
 
@@ -370,7 +360,7 @@ class GenericBackend:
     async def _make_streaming_request(
         self, url: str, data: bytes, headers: dict[str, str]
     ) -> AsyncGenerator[dict[str, Any]]:
-        client = self._get_client()
+        client = self._get_client(url)
         async with client.stream(
             method="POST", url=url, content=data, headers=headers
         ) as response:
@@ -427,6 +417,6 @@ class GenericBackend:
         return result.usage.prompt_tokens
 
     async def close(self) -> None:
-        if self._owns_client and self._client:
-            await self._client.aclose()
-            self._client = None
+        """No-op: injected clients belong to the caller and pooled ones are
+        shared, so they are closed with ``http_client_pool.aclose()`` on shutdown.
+        """
@@ -12,6 +12,7 @@ import mistralai
 from mistralai.utils.retries import BackoffStrategy, RetryConfig
 
 from vibe.core.llm.exceptions import BackendErrorBuilder
+from vibe.core.llm.http_pool import http_client_pool
 from vibe.core.llm.message_utils import merge_consecutive_user_messages
 from vibe.core.types import (
     AvailableTool,
@@ -161,6 +162,7 @@ class MistralMapper:
 class MistralBackend:
     def __init__(self, provider: ProviderConfig, timeout: float = 720.0) -> None:
         self._client: mistralai.Mistral | None = None
+        self._async_client: httpx.AsyncClient | None = None
         self._provider = provider
         self._mapper = MistralMapper()
         self._api_key = (
@@ -217,15 +219,24 @@ class MistralBackend:
             )
 
     def _create_mistral_client(self) -> mistralai.Mistral:
+        # The SDK leaves a supplied async client open on exit, so the pooled
+        # connections outlive this backend instance.
+        self._async_client = self._pooled_client()
         return mistralai.Mistral(
             api_key=self._api_key,
             server_url=self._server_url,
             timeout_ms=int(self._timeout * 1000),
             retry_config=self._retry_config,
+            async_client=self._async_client,
         )
 
+    def _pooled_client(self) -> httpx.AsyncClient:
+        return http_client_pool.get(self._server_url, timeout=self._timeout)
+
     def _get_client(self) -> mistralai.Mistral:
-        if self._client is None:
+        # Rebuild when the pool hands out a different client, e.g. on a new
+        # event loop, since httpx clients cannot cross loops.
+        if self._client is None or self._async_client is not self._pooled_client():
             self._client = self._create_mistral_client()
         return self._client
 
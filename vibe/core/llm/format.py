@@ -64,12 +64,12 @@ class APIToolFormatHandler:
         return [
             AvailableTool(
                 function=AvailableFunction(
-                    name=tool_class.get_name(),
-                    description=tool_class.description,
-                    parameters=tool_class.get_parameters(),
+                    name=spec.name,
+                    description=spec.description,
+                    parameters=spec.parameters,
                 )
             )
-            for tool_class in tool_manager.available_tools.values()
+            for spec in tool_manager.tool_specs
         ]
 
     def get_tool_choice(self) -> StrToolChoice | AvailableTool:
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass
+from importlib.util import find_spec
+from typing import Any
+import weakref
+
+import httpx
+
+# HTTP/2 needs the optional ``h2`` package; without it clients speak HTTP/1.1.
+HTTP2_AVAILABLE = find_spec("h2") is not None
+
+
+@dataclass(slots=True)
+class ConnectionStats:
+    """Connection-level counters for one origin (or all of them).
+
+    ``connections_opened`` counts TCP connects and ``tls_handshakes`` TLS
+    handshakes; every request beyond the opened connections rode on a
+    kept-alive one.
+    """
+
+    requests: int = 0
+    connections_opened: int = 0
+    tls_handshakes: int = 0
+
+    @property
+    def reused_requests(self) -> int:
+        return max(0, self.requests - self.connections_opened)
+
+    @property
+    def reuse_ratio(self) -> float:
+        return self.reused_requests / self.requests if self.requests else 0.0
+
+    def merge(self, other: ConnectionStats) -> None:
+        self.requests += other.requests
+        self.connections_opened += other.connections_opened
+        self.tls_handshakes += other.tls_handshakes
+
+
+def origin_of(url: str) -> str:
+    parsed = httpx.URL(url)
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    return f"{parsed.scheme}://{parsed.host}:{port}"
+
+
+class HTTPClientPool:
+    """Process-wide ``httpx.AsyncClient`` instances keyed by origin.
+
+    Backends, subagents and telemetry talking to the same host share one
+    client and therefore its keep-alive connections, instead of each paying
+    for its own TCP and TLS handshakes. An ``AsyncClient`` is bound to the
+    event loop it first runs on, so clients are kept per running loop and are
+    dropped with it.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 60.0,
+        http2: bool = HTTP2_AVAILABLE,
+    ) -> None:
+        self._limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._http2 = http2
+        self._clients: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[tuple[str, float], httpx.AsyncClient]
+        ] = weakref.WeakKeyDictionary()
+        self._stats: defaultdict[str, ConnectionStats] = defaultdict(ConnectionStats)
+
+    def get(self, url: str, *, timeout: float) -> httpx.AsyncClient:
+        """Shared client for ``url``'s origin on the running event loop."""
+        origin = origin_of(url)
+        clients = self._clients.setdefault(asyncio.get_running_loop(), {})
+        client = clients.get((origin, timeout))
+        if client is None or client.is_closed:
+            client = self._create_client(origin, timeout)
+            clients[origin, timeout] = client
+        return client
+
+    def stats(self, url: str | None = None) -> ConnectionStats:
+        """Counters for ``url``'s origin, or summed over every origin."""
+        if url is not None:
+            stats = self._stats.get(origin_of(url))
+            return (
+                ConnectionStats()
+                if stats is None
+                else ConnectionStats(
+                    stats.requests, stats.connections_opened, stats.tls_handshakes
+                )
+            )
+        total = ConnectionStats()
+        for stats in self._stats.values():
+            total.merge(stats)
+        return total
+
+    async def aclose(self) -> None:
+        """Close the clients created on the running event loop."""
+        clients = self._clients.pop(asyncio.get_running_loop(), {})
+        await asyncio.gather(
+            *(client.aclose() for client in clients.values()), return_exceptions=True
+        )
+
+    def _create_client(self, origin: str, timeout: float) -> httpx.AsyncClient:
+        stats = self._stats[origin]
+
+        async def trace(event_name: str, info: dict[str, Any]) -> None:
+            if event_name == "connection.connect_tcp.complete":
+                stats.connections_opened += 1
+            elif event_name == "connection.start_tls.complete":
+                stats.tls_handshakes += 1
+
+        async def on_request(request: httpx.Request) -> None:
+            stats.requests += 1
+            request.extensions["trace"] = trace
+
+        return httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout),
+            limits=self._limits,
+            http2=self._http2,
+            event_hooks={"request": [on_request]},
+        )
+
+
+http_client_pool = HTTPClientPool()
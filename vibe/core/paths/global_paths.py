@@ -41,6 +41,8 @@ GLOBAL_AGENTS_DIR = GlobalPath(lambda: VIBE_HOME.path / "agents")
 GLOBAL_PROMPTS_DIR = GlobalPath(lambda: VIBE_HOME.path / "prompts")
 SESSION_LOG_DIR = GlobalPath(lambda: VIBE_HOME.path / "logs" / "session")
 TRUSTED_FOLDERS_FILE = GlobalPath(lambda: VIBE_HOME.path / "trusted_folders.toml")
+FILE_INDEX_CACHE_DIR = GlobalPath(lambda: VIBE_HOME.path / "cache" / "file_index")
+TOOL_MANIFEST_FILE = GlobalPath(lambda: VIBE_HOME.path / "cache" / "tool_manifest.json")
 LOG_DIR = GlobalPath(lambda: VIBE_HOME.path / "logs")
 LOG_FILE = GlobalPath(lambda: VIBE_HOME.path / "logs" / "vibe.log")
 
@@ -5,6 +5,7 @@ import asyncio
 from vibe.core.agent_loop import AgentLoop
 from vibe.core.agents.models import BuiltinAgentName
 from vibe.core.config import VibeConfig
+from vibe.core.llm.http_pool import http_client_pool
 from vibe.core.output_formatters import create_formatter
 from vibe.core.types import AssistantEvent, LLMMessage, OutputFormat, Role
 from vibe.core.utils import ConversationLimitException, logger
@@ -52,5 +53,6 @@ def run_programmatic(
             return formatter.finalize()
         finally:
             await agent_loop.telemetry_client.aclose()
+            await http_client_pool.aclose()
 
     return asyncio.run(_async_run())
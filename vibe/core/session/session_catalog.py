@@ -0,0 +1,249 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from contextlib import closing
+import json
+import os
+from pathlib import Path
+import sqlite3
+from typing import Any
+
+SESSION_CATALOG_FILENAME = "session_index.db"
+
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    dir_name TEXT PRIMARY KEY,
+    session_id TEXT,
+    cwd TEXT NOT NULL DEFAULT '',
+    title TEXT,
+    end_time TEXT,
+    total_messages INTEGER NOT NULL DEFAULT 0,
+    meta_sig TEXT,
+    messages_sig TEXT,
+    messages_mtime_ns INTEGER,
+    valid INTEGER NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_cwd ON sessions(cwd, end_time);
+CREATE INDEX IF NOT EXISTS idx_sessions_recent ON sessions(valid, messages_mtime_ns);
+"""
+
+_UPSERT = """
+INSERT INTO sessions (
+    dir_name, session_id, cwd, title, end_time, total_messages,
+    meta_sig, messages_sig, messages_mtime_ns, valid
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT(dir_name) DO UPDATE SET
+    session_id = excluded.session_id,
+    cwd = excluded.cwd,
+    title = excluded.title,
+    end_time = excluded.end_time,
+    total_messages = excluded.total_messages,
+    meta_sig = excluded.meta_sig,
+    messages_sig = excluded.messages_sig,
+    messages_mtime_ns = excluded.messages_mtime_ns,
+    valid = excluded.valid
+"""
+
+
+def _file_sig(path: Path) -> tuple[str | None, int | None]:
+    """A change signature (mtime, ctime, size) plus the mtime, or Nones if the
+    path is not a regular file.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        return None, None
+    if not path.is_file():
+        return None, None
+    return f"{st.st_mtime_ns}:{st.st_ctime_ns}:{st.st_size}", st.st_mtime_ns
+
+
+class SessionCatalog:
+    """SQLite summary of the session directories under one save dir.
+
+    Rows are written by ``SessionLogger`` after each saved turn and refreshed
+    by ``sync`` for directories whose ``meta.json`` or ``messages.jsonl``
+    changed behind its back (older sessions, copies, manual edits), so listing
+    and resuming read one small table instead of every metadata file.
+    """
+
+    def __init__(self, save_dir: Path, session_prefix: str) -> None:
+        self.save_dir = Path(save_dir)
+        self.session_prefix = session_prefix
+        self.db_path = self.save_dir / SESSION_CATALOG_FILENAME
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=5.0)
+        if not self._schema_ready:
+            self._ensure_schema(conn)
+            self._schema_ready = True
+        return conn
+
+    @staticmethod
+    def _ensure_schema(conn: sqlite3.Connection) -> None:
+        with conn:
+            conn.execute("PRAGMA journal_mode = WAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version not in {0, _SCHEMA_VERSION}:
+                conn.execute("DROP TABLE IF EXISTS sessions")
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def record(self, session_dir: Path, metadata: dict[str, Any]) -> None:
+        """Upsert the row for a session its logger has just written."""
+        from vibe.core.session.session_logger import (
+            MESSAGES_FILENAME,
+            METADATA_FILENAME,
+        )
+
+        meta_sig, _ = _file_sig(session_dir / METADATA_FILENAME)
+        messages_sig, messages_mtime = _file_sig(session_dir / MESSAGES_FILENAME)
+        row = self._row(
+            session_dir.name,
+            metadata,
+            meta_sig,
+            messages_sig,
+            messages_mtime,
+            valid=meta_sig is not None and messages_sig is not None,
+        )
+        with closing(self._connect()) as conn, conn:
+            conn.execute(_UPSERT, row)
+
+    def sync(self, is_valid: Callable[[Path], bool]) -> None:
+        """Bring the catalog in line with the session directories on disk.
+
+        Unchanged directories cost two ``stat`` calls; only new or modified
+        ones are re-validated with ``is_valid`` and have their metadata read.
+        """
+        from vibe.core.session.session_logger import (
+            MESSAGES_FILENAME,
+            METADATA_FILENAME,
+        )
+
+        on_disk: dict[str, Path] = {}
+        prefix = f"{self.session_prefix}_"
+        try:
+            with os.scandir(self.save_dir) as entries:
+                for entry in entries:
+                    if entry.name.startswith(prefix) and entry.is_dir():
+                        on_disk[entry.name] = Path(entry.path)
+        except OSError:
+            return
+
+        with closing(self._connect()) as conn, conn:
+            known = {
+                dir_name: (meta_sig, messages_sig)
+                for dir_name, meta_sig, messages_sig in conn.execute(
+                    "SELECT dir_name, meta_sig, messages_sig FROM sessions"
+                )
+            }
+            stale = [name for name in known if name not in on_disk]
+            conn.executemany(
+                "DELETE FROM sessions WHERE dir_name = ?", [(name,) for name in stale]
+            )
+
+            rows = []
+            for dir_name, session_dir in on_disk.items():
+                meta_sig, _ = _file_sig(session_dir / METADATA_FILENAME)
+                messages_sig, messages_mtime = _file_sig(
+                    session_dir / MESSAGES_FILENAME
+                )
+                if known.get(dir_name) == (meta_sig, messages_sig):
+                    continue
+                valid = is_valid(session_dir)
+                metadata = self._read_metadata(session_dir) if valid else {}
+                rows.append(
+                    self._row(
+                        dir_name,
+                        metadata,
+                        meta_sig,
+                        messages_sig,
+                        messages_mtime,
+                        valid=valid,
+                    )
+                )
+            conn.executemany(_UPSERT, rows)
+
+    def rebuild(self, is_valid: Callable[[Path], bool]) -> int:
+        """Drop every row and repopulate from the session directories."""
+        with closing(self._connect()) as conn, conn:
+            conn.execute("DELETE FROM sessions")
+        self.sync(is_valid)
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
+
+    def sessions(self, cwd: str | None = None) -> list[sqlite3.Row]:
+        sql = (
+            "SELECT session_id, cwd, title, end_time FROM sessions "
+            "WHERE valid = 1 AND session_id IS NOT NULL AND session_id != ''"
+        )
+        params: list[Any] = []
+        if cwd is not None:
+            sql += " AND cwd = ?"
+            params.append(cwd)
+        sql += " ORDER BY end_time DESC"
+        with closing(self._connect()) as conn:
+            conn.row_factory = sqlite3.Row
+            return conn.execute(sql, params).fetchall()
+
+    def latest(
+        self, short_id: str | None = None, valid_only: bool = True
+    ) -> Path | None:
+        """Most recently written session dir, optionally limited to one short id."""
+        for dir_name in self._recent(short_id, valid_only):
+            return self.save_dir / dir_name
+        return None
+
+    def _recent(self, short_id: str | None, valid_only: bool) -> list[str]:
+        sql = "SELECT dir_name FROM sessions WHERE messages_sig IS NOT NULL"
+        params: list[Any] = []
+        if valid_only:
+            sql += " AND valid = 1"
+        suffix = f"_{short_id}" if short_id is not None else ""
+        if suffix:
+            sql += " AND substr(dir_name, -?) = ?"
+            params.extend([len(suffix), suffix])
+        sql += " ORDER BY messages_mtime_ns DESC"
+        with closing(self._connect()) as conn:
+            names = [row[0] for row in conn.execute(sql, params)]
+        # Mirror the "<prefix>_*_<short_id>" directory glob exactly.
+        min_length = len(self.session_prefix) + 1 + len(suffix)
+        return [name for name in names if len(name) >= min_length]
+
+    @staticmethod
+    def _read_metadata(session_dir: Path) -> dict[str, Any]:
+        from vibe.core.session.session_logger import METADATA_FILENAME
+
+        try:
+            with (session_dir / METADATA_FILENAME).open("r", encoding="utf-8") as f:
+                metadata = json.load(f)
+        except (OSError, UnicodeDecodeError, json.JSONDecodeError):
+            return {}
+        return metadata if isinstance(metadata, dict) else {}
+
+    @staticmethod
+    def _row(
+        dir_name: str,
+        metadata: dict[str, Any],
+        meta_sig: str | None,
+        messages_sig: str | None,
+        messages_mtime: int | None,
+        *,
+        valid: bool,
+    ) -> tuple[Any, ...]:
+        environment = metadata.get("environment") or {}
+        return (
+            dir_name,
+            metadata.get("session_id"),
+            environment.get("working_directory", "") or "",
+            metadata.get("title"),
+            metadata.get("end_time"),
+            int(metadata.get("total_messages") or 0),
+            meta_sig,
+            messages_sig,
+            messages_mtime,
+            int(valid),
+        )
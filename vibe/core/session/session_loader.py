@@ -1,12 +1,22 @@
 from __future__ import annotations
 
+from collections.abc import Iterator
+from dataclasses import dataclass
 from datetime import UTC, datetime
 import json
 from pathlib import Path
+import re
+import sqlite3
 from typing import TYPE_CHECKING, Any, TypedDict
 
-from vibe.core.session.session_logger import MESSAGES_FILENAME, METADATA_FILENAME
+from vibe.core.session.session_catalog import SessionCatalog
+from vibe.core.session.session_logger import (
+    CONTEXT_FILENAME,
+    MESSAGES_FILENAME,
+    METADATA_FILENAME,
+)
 from vibe.core.types import LLMMessage
+from vibe.core.utils import logger
 
 if TYPE_CHECKING:
     from vibe.core.config import SessionLoggingConfig
@@ -19,6 +29,40 @@ class SessionInfo(TypedDict):
     end_time: str | None
 
 
+# SessionLogger dumps "role" first, so it can be read without parsing the line.
+_ROLE_RE = re.compile(rb'^\{\s*"role"\s*:\s*"([a-z]+)"')
+
+
+@dataclass(frozen=True, slots=True)
+class SessionMessageRef:
+    """Location of one message line in a session's messages.jsonl.
+
+    Lets callers page through long histories (and their large tool outputs)
+    without holding every message in memory; ``load`` materialises it.
+    """
+
+    path: Path
+    offset: int
+    length: int
+    role: str
+
+    def load(self) -> LLMMessage:
+        with self.path.open("rb") as f:
+            f.seek(self.offset)
+            return LLMMessage.model_validate(_decode_line(f.read(self.length)))
+
+
+def _decode_line(line: bytes) -> Any:
+    return json.loads(line.decode("utf-8", errors="ignore"))
+
+
+def _sniff_role(line: bytes) -> str:
+    if match := _ROLE_RE.match(line):
+        return match.group(1).decode("ascii")
+    data = _decode_line(line)
+    return str(data.get("role", "")) if isinstance(data, dict) else ""
+
+
 class SessionLoader:
     @staticmethod
     def _is_valid_session(session_dir: Path) -> bool:
@@ -79,6 +123,13 @@ class SessionLoader:
         if not save_dir.exists():
             return None
 
+        catalog = SessionLoader._synced_catalog(config)
+        if catalog is not None:
+            try:
+                return catalog.latest()
+            except sqlite3.Error as e:
+                logger.warning("Session catalog query failed: %s", e)
+
         pattern = f"{config.session_prefix}_*"
         session_dirs = list(save_dir.glob(pattern))
 
@@ -88,6 +139,16 @@ class SessionLoader:
     def find_session_by_id(
         session_id: str, config: SessionLoggingConfig
     ) -> Path | None:
+        if not Path(config.save_dir).exists():
+            return None
+
+        catalog = SessionLoader._synced_catalog(config)
+        if catalog is not None:
+            try:
+                return catalog.latest(session_id[:8])
+            except sqlite3.Error as e:
+                logger.warning("Session catalog query failed: %s", e)
+
         matches = SessionLoader._find_session_dirs_by_short_id(session_id, config)
 
         return SessionLoader.latest_session(matches)
@@ -96,6 +157,16 @@ class SessionLoader:
     def does_session_exist(
         session_id: str, config: SessionLoggingConfig
     ) -> Path | None:
+        if not Path(config.save_dir).exists():
+            return None
+
+        catalog = SessionLoader._synced_catalog(config)
+        if catalog is not None:
+            try:
+                return catalog.latest(session_id[:8], valid_only=False)
+            except sqlite3.Error as e:
+                logger.warning("Session catalog query failed: %s", e)
+
         for session_dir in SessionLoader._find_session_dirs_by_short_id(
             session_id, config
         ):
@@ -122,6 +193,39 @@ class SessionLoader:
         utc_dt = dt.astimezone(UTC)
         return utc_dt.isoformat()
 
+    @staticmethod
+    def _normalize_end_time(end_time: str | None) -> str | None:
+        if not end_time:
+            return end_time
+        try:
+            return SessionLoader._convert_to_utc_iso(end_time)
+        except (ValueError, OSError):
+            return None
+
+    @staticmethod
+    def _synced_catalog(config: SessionLoggingConfig) -> SessionCatalog | None:
+        """Return the save dir's session catalog, refreshed against the disk.
+
+        ``None`` means the catalog is unusable (read-only dir, locked or
+        corrupt database) and callers fall back to scanning the directories.
+        """
+        catalog = SessionCatalog(Path(config.save_dir), config.session_prefix)
+        try:
+            catalog.sync(SessionLoader._is_valid_session)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Session catalog unavailable, scanning sessions: %s", e)
+            return None
+        return catalog
+
+    @staticmethod
+    def rebuild_catalog(config: SessionLoggingConfig) -> int:
+        """Repopulate the session catalog from scratch; returns the row count."""
+        save_dir = Path(config.save_dir)
+        if not save_dir.exists():
+            return 0
+        catalog = SessionCatalog(save_dir, config.session_prefix)
+        return catalog.rebuild(SessionLoader._is_valid_session)
+
     @staticmethod
     def list_sessions(
         config: SessionLoggingConfig, cwd: str | None = None
@@ -130,6 +234,23 @@ class SessionLoader:
         if not save_dir.exists():
             return []
 
+        catalog = SessionLoader._synced_catalog(config)
+        if catalog is not None:
+            try:
+                rows = catalog.sessions(cwd)
+            except sqlite3.Error as e:
+                logger.warning("Session catalog query failed: %s", e)
+            else:
+                return [
+                    {
+                        "session_id": row["session_id"],
+                        "cwd": row["cwd"],
+                        "title": row["title"],
+                        "end_time": SessionLoader._normalize_end_time(row["end_time"]),
+                    }
+                    for row in rows
+                ]
+
         pattern = f"{config.session_prefix}_*"
         session_dirs = list(save_dir.glob(pattern))
 
@@ -155,68 +276,144 @@ class SessionLoader:
             if cwd is not None and session_cwd != cwd:
                 continue
 
-            end_time = metadata.get("end_time")
-            if end_time:
-                try:
-                    end_time = SessionLoader._convert_to_utc_iso(end_time)
-                except (ValueError, OSError):
-                    end_time = None
-
             sessions.append({
                 "session_id": session_id,
                 "cwd": session_cwd,
                 "title": metadata.get("title"),
-                "end_time": end_time,
+                "end_time": SessionLoader._normalize_end_time(metadata.get("end_time")),
             })
 
         return sessions
 
     @staticmethod
-    def load_session(filepath: Path) -> tuple[list[LLMMessage], dict[str, Any]]:
-        # Load session messages from MESSAGES_FILENAME
-        messages_filepath = filepath / MESSAGES_FILENAME
+    def index_messages(filepath: Path) -> list[SessionMessageRef]:
+        """Byte offsets and roles of the non-system messages in a session.
 
+        Only the role of each line is inspected, so indexing a session with
+        huge tool outputs costs one sequential read and no JSON parsing.
+        """
+        messages_filepath = filepath / MESSAGES_FILENAME
+        refs: list[SessionMessageRef] = []
+        offset = 0
         try:
-            with messages_filepath.open("r", encoding="utf-8", errors="ignore") as f:
-                content = f.readlines()
-        except Exception as e:
+            with messages_filepath.open("rb") as f:
+                for line in f:
+                    role = _sniff_role(line)
+                    if role != "system":
+                        refs.append(
+                            SessionMessageRef(
+                                messages_filepath, offset, len(line), role
+                            )
+                        )
+                    offset += len(line)
+        except OSError as e:
             raise ValueError(
                 f"Error reading session messages at {filepath}: {e}"
             ) from e
-
-        if not content:
+        except ValueError as e:
+            raise ValueError(
+                f"Session messages contain invalid JSON (may have been corrupted): "
+                f"{filepath}\nDetails: {e}"
+            ) from e
+        if offset == 0:
             raise ValueError(
                 f"Session messages file is empty (may have been corrupted by interruption): "
                 f"{filepath}"
             )
+        return refs
 
+    @staticmethod
+    def _iter_messages(filepath: Path) -> Iterator[LLMMessage]:
+        messages_filepath = filepath / MESSAGES_FILENAME
         try:
-            data = [json.loads(line) for line in content]
-        except json.JSONDecodeError as e:
+            f = messages_filepath.open("rb")
+        except OSError as e:
             raise ValueError(
-                f"Session messages contain invalid JSON (may have been corrupted): "
-                f"{filepath}\nDetails: {e}"
+                f"Error reading session messages at {filepath}: {e}"
             ) from e
 
-        messages = [
-            LLMMessage.model_validate(msg) for msg in data if msg["role"] != "system"
-        ]
+        with f:
+            empty = True
+            for line in f:
+                empty = False
+                try:
+                    data = _decode_line(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(
+                        f"Session messages contain invalid JSON (may have been corrupted): "
+                        f"{filepath}\nDetails: {e}"
+                    ) from e
+                if data["role"] != "system":
+                    yield LLMMessage.model_validate(data)
+            if empty:
+                raise ValueError(
+                    f"Session messages file is empty (may have been corrupted by interruption): "
+                    f"{filepath}"
+                )
 
-        # Load session metadata from METADATA_FILENAME
-        metadata_filepath = filepath / METADATA_FILENAME
+    @staticmethod
+    def _window_start(refs: list[SessionMessageRef], max_messages: int) -> int:
+        # Widen the tail back to the user turn that opened it so tool results
+        # never lose the assistant call they answer.
+        start = max(0, len(refs) - max_messages)
+        while start > 0 and refs[start].role != "user":
+            start -= 1
+        return start
 
-        if metadata_filepath.exists():
+    @staticmethod
+    def load_session(
+        filepath: Path, max_messages: int | None = None
+    ) -> tuple[list[LLMMessage], dict[str, Any]]:
+        """Load a session's messages and merged metadata.
+
+        Messages are parsed and validated one line at a time. With
+        ``max_messages`` only the most recent turns (at least that many
+        messages, starting on a user message) are materialised. Older turns
+        are not returned at all, so a conversation resumed from the window
+        and saved again only contains the window; the full history stays in
+        ``filepath``, which resuming never rewrites.
+        """
+        if max_messages is None:
+            messages = list(SessionLoader._iter_messages(filepath))
+        else:
+            refs = SessionLoader.index_messages(filepath)
+            window = refs[SessionLoader._window_start(refs, max_messages) :]
+            try:
+                with (filepath / MESSAGES_FILENAME).open("rb") as f:
+                    messages = []
+                    for ref in window:
+                        f.seek(ref.offset)
+                        data = _decode_line(f.read(ref.length))
+                        messages.append(LLMMessage.model_validate(data))
+            except OSError as e:
+                raise ValueError(
+                    f"Error reading session messages at {filepath}: {e}"
+                ) from e
+            except json.JSONDecodeError as e:
+                raise ValueError(
+                    f"Session messages contain invalid JSON (may have been corrupted): "
+                    f"{filepath}\nDetails: {e}"
+                ) from e
+
+        # Load session metadata: the per-turn METADATA_FILENAME layered over
+        # the static CONTEXT_FILENAME (absent for sessions saved before the
+        # split, whose meta.json holds everything).
+        metadata: dict[str, Any] = {}
+        for metadata_filepath in (
+            filepath / CONTEXT_FILENAME,
+            filepath / METADATA_FILENAME,
+        ):
+            if not metadata_filepath.exists():
+                continue
             try:
                 with metadata_filepath.open(
                     "r", encoding="utf-8", errors="ignore"
                 ) as f:
-                    metadata = json.load(f)
+                    metadata.update(json.load(f))
             except json.JSONDecodeError as e:
                 raise ValueError(
                     f"Session metadata contains invalid JSON (may have been corrupted): "
                     f"{filepath}\nDetails: {e}"
                 ) from e
-        else:
-            metadata = {}
 
         return messages, metadata
@@ -5,13 +5,15 @@ import getpass
 import json
 import os
 from pathlib import Path
+import sqlite3
 import subprocess
 from typing import TYPE_CHECKING, Any
 
 from anyio import NamedTemporaryFile, Path as AsyncPath
 
+from vibe.core.session.session_catalog import SessionCatalog
 from vibe.core.types import AgentStats, LLMMessage, Role, SessionMetadata
-from vibe.core.utils import is_windows, utc_now
+from vibe.core.utils import is_windows, logger, utc_now
 
 if TYPE_CHECKING:
     from vibe.core.agents.models import AgentProfile
@@ -21,6 +23,9 @@ if TYPE_CHECKING:
 
 METADATA_FILENAME = "meta.json"
 MESSAGES_FILENAME = "messages.jsonl"
+# Config dump, tool schemas, agent profile and system prompt: rewritten only
+# when they change, so meta.json stays small and cheap to persist every turn.
+CONTEXT_FILENAME = "context.json"
 
 
 class SessionLogger:
@@ -35,6 +40,9 @@ class SessionLogger:
             self.session_start_time: str = "N/A"
             self.session_dir: Path | None = None
             self.session_metadata: SessionMetadata | None = None
+            self.catalog: SessionCatalog | None = None
+            self._persisted_messages: int | None = None
+            self._persisted_context: str | None = None
             return
 
         self.save_dir = Path(session_config.save_dir)
@@ -45,6 +53,9 @@ class SessionLogger:
         self.save_dir.mkdir(parents=True, exist_ok=True)
         self.session_dir = self.save_folder
         self.session_metadata = self._initialize_session_metadata()
+        self.catalog = SessionCatalog(self.save_dir, self.session_prefix)
+        self._persisted_messages = None
+        self._persisted_context = None
 
     @property
     def save_folder(self) -> Path:
@@ -146,9 +157,11 @@ class SessionLogger:
         return title
 
     @staticmethod
-    async def persist_metadata(metadata: Any, session_dir: Path) -> None:
+    async def persist_metadata(
+        metadata: Any, session_dir: Path, filename: str = METADATA_FILENAME
+    ) -> None:
         temp_metadata_filepath = None
-        metadata_filepath = session_dir / METADATA_FILENAME
+        metadata_filepath = session_dir / filename
         try:
             async with NamedTemporaryFile(
                 mode="w",
@@ -177,18 +190,19 @@ class SessionLogger:
 
     @staticmethod
     async def persist_messages(messages: list[dict], session_dir: Path) -> None:
-        messages_filepath = session_dir / "messages.jsonl"
+        messages_filepath = session_dir / MESSAGES_FILENAME
+        # One buffered append and one fsync for the whole batch: a crash can
+        # only tear the last line, which SessionLoader already reports.
+        payload = "".join(
+            json.dumps(message, ensure_ascii=False) + "\n" for message in messages
+        )
         try:
-            if not messages_filepath.exists():
-                messages_filepath.touch()
-
             async with await AsyncPath(messages_filepath).open(
                 "a", encoding="utf-8"
             ) as f:
-                for message in messages:
-                    await f.write(json.dumps(message, ensure_ascii=False) + "\n")
-                    await f.flush()
-                    os.fsync(f.wrapped.fileno())
+                await f.write(payload)
+                await f.flush()
+                os.fsync(f.wrapped.fileno())
         except Exception as e:
             raise RuntimeError(
                 f"Failed to persist session messages to {messages_filepath}: {e}"
@@ -216,20 +230,7 @@ class SessionLogger:
                 f"Failed to create session directory at {self.session_dir}: {type(e).__name__}: {e}"
             ) from e
 
-        # Read old metadata and get total_messages
-        try:
-            if self.metadata_filepath.exists():
-                async with await AsyncPath(self.metadata_filepath).open(
-                    encoding="utf-8", errors="ignore"
-                ) as f:
-                    old_metadata = json.loads(await f.read())
-                    old_total_messages = old_metadata["total_messages"]
-            else:
-                old_total_messages = 0
-        except Exception as e:
-            raise RuntimeError(
-                f"Failed to read session metadata at {self.metadata_filepath}: {e}"
-            ) from e
+        old_total_messages = await self._get_persisted_messages()
 
         try:
             non_system_messages = [m for m in messages if m.role != Role.system]
@@ -241,50 +242,109 @@ class SessionLogger:
 
             messages_data = [m.model_dump(exclude_none=True) for m in new_messages]
             await SessionLogger.persist_messages(messages_data, self.session_dir)
+            self._persisted_messages = len(non_system_messages)
 
             # If message update succeeded, write metadata
-            tools_available = [
-                {
-                    "type": "function",
-                    "function": {
-                        "name": tool_class.get_name(),
-                        "description": tool_class.description,
-                        "parameters": tool_class.get_parameters(),
-                    },
-                }
-                for tool_class in tool_manager.available_tools.values()
-            ]
-
-            title = self._get_title(messages)
-            system_prompt = (
-                messages[0].model_dump()
-                if len(messages) > 0 and messages[0].role == Role.system
-                else None
+            await self._persist_context(
+                messages, base_config, tool_manager, agent_profile
             )
-            total_messages = len(non_system_messages)
 
             metadata_dump = {
                 **self.session_metadata.model_dump(),
                 "end_time": utc_now().isoformat(),
                 "stats": stats.model_dump(),
-                "title": title,
-                "total_messages": total_messages,
-                "tools_available": tools_available,
-                "config": base_config.model_dump(mode="json"),
-                "agent_profile": {
-                    "name": agent_profile.name,
-                    "overrides": agent_profile.overrides,
-                },
-                "system_prompt": system_prompt,
+                "title": self._get_title(messages),
+                "total_messages": self._persisted_messages,
             }
 
             await SessionLogger.persist_metadata(metadata_dump, self.session_dir)
+            self._record_in_catalog(metadata_dump)
         except Exception as e:
+            # A failed write may leave a tmp file behind: sweep stale ones now.
+            self.cleanup_tmp_files()
             raise RuntimeError(
                 f"Failed to save session to {self.session_dir}: {e}"
             ) from e
-        finally:
-            self.cleanup_tmp_files()
+
+    async def _get_persisted_messages(self) -> int:
+        """Number of non-system messages already in messages.jsonl.
+
+        Tracked in memory once known; meta.json is only read on the first save
+        into a session directory, which is also when stale tmp files are swept
+        (failed saves sweep them again).
+        """
+        if self._persisted_messages is not None:
+            return self._persisted_messages
+
+        self.cleanup_tmp_files()
+        try:
+            if self.metadata_filepath.exists():
+                async with await AsyncPath(self.metadata_filepath).open(
+                    encoding="utf-8", errors="ignore"
+                ) as f:
+                    old_metadata = json.loads(await f.read())
+                    self._persisted_messages = int(old_metadata["total_messages"])
+            else:
+                self._persisted_messages = 0
+        except Exception as e:
+            raise RuntimeError(
+                f"Failed to read session metadata at {self.metadata_filepath}: {e}"
+            ) from e
+        return self._persisted_messages
+
+    async def _persist_context(
+        self,
+        messages: list[LLMMessage],
+        base_config: VibeConfig,
+        tool_manager: ToolManager,
+        agent_profile: AgentProfile,
+    ) -> None:
+        if self.session_dir is None:
+            return
+
+        tools_available = [
+            {
+                "type": "function",
+                "function": {
+                    "name": spec.name,
+                    "description": spec.description,
+                    "parameters": spec.parameters,
+                },
+            }
+            for spec in tool_manager.tool_specs
+        ]
+        system_prompt = (
+            messages[0].model_dump()
+            if len(messages) > 0 and messages[0].role == Role.system
+            else None
+        )
+        context = {
+            "tools_available": tools_available,
+            "config": base_config.model_dump(mode="json"),
+            "agent_profile": {
+                "name": agent_profile.name,
+                "overrides": agent_profile.overrides,
+            },
+            "system_prompt": system_prompt,
+        }
+
+        serialized = json.dumps(context, sort_keys=True, ensure_ascii=False)
+        if serialized == self._persisted_context:
+            return
+        await SessionLogger.persist_metadata(
+            context, self.session_dir, filename=CONTEXT_FILENAME
+        )
+        self._persisted_context = serialized
+
+    def _record_in_catalog(self, metadata: dict[str, Any]) -> None:
+        # The catalog is an index over the session files, never the source of
+        # truth: a failed update is repaired by the next SessionLoader sync.
+        if self.catalog is None or self.session_dir is None:
+            return
+        try:
+            self.catalog.record(self.session_dir, metadata)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Failed to update session catalog: %s", e)
 
     def reset_session(self, session_id: str) -> None:
         """Clear existing session info and setup a new session"""
@@ -295,6 +355,8 @@ class SessionLogger:
         self.session_start_time = utc_now().isoformat()
         self.session_dir = self.save_folder
         self.session_metadata = self._initialize_session_metadata()
+        self._persisted_messages = None
+        self._persisted_context = None
 
     def cleanup_tmp_files(self) -> None:
         """Delete temporary files created more than 5 minutes ago"""
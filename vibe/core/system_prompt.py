@@ -429,9 +429,9 @@ def get_universal_system_prompt(
     if config.include_prompt_detail:
         sections.append(_get_os_system_prompt())
         tool_prompts = []
-        for tool_class in tool_manager.available_tools.values():
-            if prompt := tool_class.get_tool_prompt():
-                tool_prompts.append(prompt)
+        for spec in tool_manager.tool_specs:
+            if spec.prompt:
+                tool_prompts.append(spec.prompt)
         if tool_prompts:
             sections.append("\n---\n".join(tool_prompts))
 
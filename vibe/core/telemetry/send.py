@@ -10,6 +10,7 @@ import httpx
 from vibe import __version__
 from vibe.core.config import Backend, VibeConfig
 from vibe.core.llm.format import ResolvedToolCall
+from vibe.core.llm.http_pool import http_client_pool
 from vibe.core.utils import get_user_agent
 
 try:
@@ -70,12 +71,9 @@ class TelemetryClient:
 
     @property
     def client(self) -> httpx.AsyncClient:
-        if self._client is None:
-            self._client = httpx.AsyncClient(
-                timeout=httpx.Timeout(5.0),
-                limits=httpx.Limits(max_keepalive_connections=5, max_connections=10),
-            )
-        return self._client
+        if self._client is not None:
+            return self._client
+        return http_client_pool.get(DATALAKE_EVENTS_URL, timeout=5.0)
 
     def send_telemetry_event(self, event_name: str, properties: dict[str, Any]) -> None:
         mistral_api_key = self._get_mistral_api_key()
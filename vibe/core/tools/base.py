@@ -115,6 +115,10 @@ class BaseTool[
 
     prompt_path: ClassVar[Path] | None = None
 
+    # Tools that never write files or run arbitrary commands. AgentLoop may run
+    # several of them concurrently when a turn requests more than one.
+    read_only: ClassVar[bool] = False
+
     def __init__(self, config: ToolConfig, state: ToolState) -> None:
         self.config = config
         self.state = state
@@ -136,17 +140,22 @@ class BaseTool[
         the tool's source file, with the same name but a .md extension
         (e.g., bash.py -> prompts/bash.md).
         """
+        if (prompt_path := cls._get_tool_prompt_path()) is None:
+            return None
         try:
-            class_file = inspect.getfile(cls)
-            class_path = Path(class_file)
-            prompt_dir = class_path.parent / "prompts"
-            prompt_path = cls.prompt_path or prompt_dir / f"{class_path.stem}.md"
-
             return prompt_path.read_text("utf-8")
-        except (FileNotFoundError, TypeError, OSError):
-            pass
+        except OSError:
+            return None
 
-        return None
+    @classmethod
+    def _get_tool_prompt_path(cls) -> Path | None:
+        if cls.prompt_path is not None:
+            return cls.prompt_path
+        try:
+            class_path = Path(inspect.getfile(cls))
+        except TypeError:
+            return None
+        return class_path.parent / "prompts" / f"{class_path.stem}.md"
 
     async def invoke(
         self, ctx: InvokeContext | None = None, **raw: Any
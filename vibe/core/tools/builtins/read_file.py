@@ -71,6 +71,7 @@ class ReadFile(
         "Read a UTF-8 file, returning content from a specific line range. "
         "Reading is capped by a byte limit for safety."
     )
+    read_only: ClassVar[bool] = True
 
     @final
     async def run(
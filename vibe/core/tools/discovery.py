@@ -0,0 +1,339 @@
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Iterator, Mapping, MutableMapping
+from dataclasses import dataclass
+import hashlib
+import json
+from logging import getLogger
+import os
+from pathlib import Path
+import sys
+import sysconfig
+import tempfile
+from types import ModuleType
+from typing import TYPE_CHECKING, Any
+
+from vibe import __version__
+
+if TYPE_CHECKING:
+    from vibe.core.tools.base import BaseTool
+
+logger = getLogger("vibe")
+
+# Schemas are produced by this version's BaseTool, so entries written by
+# another release are discarded wholesale.
+_MANIFEST_VERSION = f"1:{__version__}"
+
+
+@dataclass(frozen=True, slots=True)
+class ToolSpec:
+    """What the model and the system prompt see of a tool."""
+
+    name: str
+    description: str
+    parameters: dict[str, Any]
+    prompt: str | None = None
+
+    @classmethod
+    def from_class(cls, tool_class: type[BaseTool]) -> ToolSpec:
+        return cls(
+            name=tool_class.get_name(),
+            description=tool_class.description,
+            parameters=tool_class.get_parameters(),
+            prompt=tool_class.get_tool_prompt(),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class ToolManifestEntry:
+    """A tool class recorded in the manifest, importable from ``path``."""
+
+    path: str
+    attr: str
+    name: str
+    description: str
+    parameters: dict[str, Any]
+    prompt_path: str | None = None
+
+    @classmethod
+    def from_class(
+        cls, path: Path, attr: str, tool_class: type[BaseTool]
+    ) -> ToolManifestEntry:
+        prompt_path = tool_class._get_tool_prompt_path()
+        return cls(
+            path=str(path),
+            attr=attr,
+            name=tool_class.get_name(),
+            description=tool_class.description,
+            parameters=tool_class.get_parameters(),
+            prompt_path=None if prompt_path is None else str(prompt_path),
+        )
+
+    def to_record(self) -> dict[str, Any]:
+        return {
+            "attr": self.attr,
+            "name": self.name,
+            "description": self.description,
+            "parameters": self.parameters,
+            "prompt_path": self.prompt_path,
+        }
+
+    def to_spec(self) -> ToolSpec:
+        prompt = None
+        if self.prompt_path is not None:
+            try:
+                prompt = Path(self.prompt_path).read_text("utf-8")
+            except OSError:
+                pass
+        return ToolSpec(
+            name=self.name,
+            description=self.description,
+            parameters=self.parameters,
+            prompt=prompt,
+        )
+
+
+def _file_digest(path: Path) -> str | None:
+    try:
+        return hashlib.sha256(path.read_bytes()).hexdigest()
+    except OSError:
+        return None
+
+
+# Installed code only changes with a reinstall, and the manifest version
+# already tracks the vibe release, so imports from here are not dependencies.
+_INSTALLED_PREFIXES = tuple({
+    os.path.join(path, "")
+    for key in ("stdlib", "platstdlib", "purelib", "platlib")
+    if (path := sysconfig.get_paths().get(key))
+})
+
+
+def _module_dependencies(module: ModuleType) -> list[str]:
+    """Source files of the non-installed modules ``module`` imports directly.
+
+    Both ``import helpers`` and ``from helpers import Args`` are found, the
+    latter through the object's ``__module__``. Modules those files import in
+    turn are not followed.
+    """
+    own_file = getattr(module, "__file__", None)
+    files: set[str] = set()
+    for value in vars(module).values():
+        if isinstance(value, ModuleType):
+            dependency = value
+        elif (
+            dependency := sys.modules.get(getattr(value, "__module__", None) or "")
+        ) is None:
+            continue
+        source = getattr(dependency, "__file__", None)
+        if not source or source == own_file or source.startswith(_INSTALLED_PREFIXES):
+            continue
+        files.add(source)
+    return sorted(files)
+
+
+def _signature(path: str) -> list[int] | None:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+class ToolManifest:
+    """On-disk record of the tool classes each discovered file exports.
+
+    Records are keyed on the file path and trusted while its mtime and size
+    are unchanged. When they differ the content hash decides, so touching a
+    file without editing it does not force an import.
+
+    A record also keeps the mtime and size of the local modules the file
+    imported, and any change there forces an import too. Only direct imports
+    are tracked; set ``VIBE_NO_TOOL_MANIFEST=1`` to bypass the manifest while
+    editing helpers deeper down.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._files = self._read()
+        self._dirty = False
+
+    def _read(self) -> dict[str, dict[str, Any]]:
+        try:
+            data = json.loads(self._path.read_text("utf-8"))
+        except (OSError, ValueError):
+            return {}
+        if not isinstance(data, dict) or data.get("version") != _MANIFEST_VERSION:
+            return {}
+        files = data.get("files")
+        return files if isinstance(files, dict) else {}
+
+    def lookup(self, file_path: Path) -> list[ToolManifestEntry] | None:
+        """Cached entries for ``file_path``, or None if it must be imported."""
+        key = str(file_path)
+        if (
+            os.getenv("VIBE_NO_TOOL_MANIFEST")
+            or (record := self._files.get(key)) is None
+        ):
+            return None
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+
+        if (stat.st_mtime_ns, stat.st_size) != (
+            record.get("mtime_ns"),
+            record.get("size"),
+        ):
+            digest = _file_digest(file_path)
+            if digest is None or digest != record.get("sha256"):
+                return None
+            record["mtime_ns"] = stat.st_mtime_ns
+            record["size"] = stat.st_size
+            self._dirty = True
+
+        dependencies = record.get("dependencies", {})
+        if not isinstance(dependencies, dict) or any(
+            _signature(dependency) != signature
+            for dependency, signature in dependencies.items()
+        ):
+            return None
+
+        try:
+            return [ToolManifestEntry(path=key, **tool) for tool in record["tools"]]
+        except (KeyError, TypeError):
+            return None
+
+    def store(
+        self,
+        file_path: Path,
+        entries: list[ToolManifestEntry],
+        module: ModuleType | None = None,
+    ) -> None:
+        dependencies: dict[str, list[int]] = {}
+        for dependency in [] if module is None else _module_dependencies(module):
+            if (signature := _signature(dependency)) is None:
+                return
+            dependencies[dependency] = signature
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return
+        if (digest := _file_digest(file_path)) is None:
+            return
+        self._files[str(file_path)] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": digest,
+            "dependencies": dependencies,
+            "tools": [entry.to_record() for entry in entries],
+        }
+        self._dirty = True
+
+    def save(self) -> None:
+        """Write the manifest back if anything changed, pruning deleted files."""
+        stale = [key for key in self._files if not os.path.exists(key)]
+        for key in stale:
+            del self._files[key]
+        if not (self._dirty or stale):
+            return
+
+        payload = json.dumps({"version": _MANIFEST_VERSION, "files": self._files})
+        try:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_name = tempfile.mkstemp(
+                dir=self._path.parent, prefix=f".{self._path.name}.", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(payload)
+                os.replace(tmp_name, self._path)
+            except BaseException:
+                Path(tmp_name).unlink(missing_ok=True)
+                raise
+        except OSError as e:
+            logger.debug("Could not write tool manifest %s: %s", self._path, e)
+            return
+        self._dirty = False
+
+
+class ToolRegistry(MutableMapping[str, "type[BaseTool]"]):
+    """Tool classes by name, importing manifest entries on first lookup.
+
+    Membership, iteration and :meth:`spec` never import anything; indexing a
+    tool that came from the manifest imports its module once and keeps the
+    class.
+    """
+
+    def __init__(self, load: Callable[[Path, str], type[BaseTool] | None]) -> None:
+        self._load = load
+        self._entries: dict[str, type[BaseTool] | ToolManifestEntry] = {}
+        self._specs: dict[str, ToolSpec] = {}
+
+    def add_cached(self, entry: ToolManifestEntry) -> None:
+        self._entries[entry.name] = entry
+        self._specs.pop(entry.name, None)
+
+    def is_loaded(self, name: str) -> bool:
+        return not isinstance(self._entries.get(name), ToolManifestEntry)
+
+    def spec(self, name: str) -> ToolSpec:
+        if (spec := self._specs.get(name)) is None:
+            entry = self._entries[name]
+            spec = (
+                entry.to_spec()
+                if isinstance(entry, ToolManifestEntry)
+                else ToolSpec.from_class(entry)
+            )
+            self._specs[name] = spec
+        return spec
+
+    def subset(self, names: Iterable[str]) -> Mapping[str, type[BaseTool]]:
+        return _ToolRegistryView(self, [name for name in names if name in self])
+
+    def __getitem__(self, name: str) -> type[BaseTool]:
+        entry = self._entries[name]
+        if not isinstance(entry, ToolManifestEntry):
+            return entry
+        if (tool_class := self._load(Path(entry.path), entry.attr)) is None:
+            logger.warning("Failed to load tool '%s' from %s", name, entry.path)
+            raise KeyError(name)
+        self._entries[name] = tool_class
+        return tool_class
+
+    def __setitem__(self, name: str, tool_class: type[BaseTool]) -> None:
+        self._entries[name] = tool_class
+        self._specs.pop(name, None)
+
+    def __delitem__(self, name: str) -> None:
+        del self._entries[name]
+        self._specs.pop(name, None)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._entries)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class _ToolRegistryView(Mapping[str, "type[BaseTool]"]):
+    def __init__(self, registry: ToolRegistry, names: list[str]) -> None:
+        self._registry = registry
+        self._names = dict.fromkeys(names)
+
+    def __getitem__(self, name: str) -> type[BaseTool]:
+        if name not in self._names:
+            raise KeyError(name)
+        return self._registry[name]
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._names
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
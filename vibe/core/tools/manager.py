@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from collections.abc import Callable, Iterator
+from collections.abc import Callable, Iterator, Mapping
 import hashlib
 import importlib.util
 import inspect
@@ -8,11 +8,22 @@ from logging import getLogger
 from pathlib import Path
 import re
 import sys
+from types import ModuleType
 from typing import TYPE_CHECKING, Any
 
 from vibe.core.paths.config_paths import resolve_local_tools_dir
-from vibe.core.paths.global_paths import DEFAULT_TOOL_DIR, GLOBAL_TOOLS_DIR
+from vibe.core.paths.global_paths import (
+    DEFAULT_TOOL_DIR,
+    GLOBAL_TOOLS_DIR,
+    TOOL_MANIFEST_FILE,
+)
 from vibe.core.tools.base import BaseTool, BaseToolConfig
+from vibe.core.tools.discovery import (
+    ToolManifest,
+    ToolManifestEntry,
+    ToolRegistry,
+    ToolSpec,
+)
 from vibe.core.tools.mcp import (
     RemoteTool,
     create_mcp_http_proxy_tool_class,
@@ -70,7 +81,8 @@ class ToolManager:
     """Manages tool discovery and instantiation for an Agent.
 
     Discovers available tools from the provided search paths. Each Agent
-    should have its own ToolManager instance.
+    should have its own ToolManager instance. Files already recorded in the
+    tool manifest are not imported until one of their tools is looked up.
     """
 
     def __init__(self, config_getter: Callable[[], VibeConfig]) -> None:
@@ -78,9 +90,7 @@ class ToolManager:
         self._instances: dict[str, BaseTool] = {}
         self._search_paths: list[Path] = self._compute_search_paths(self._config)
 
-        self._available: dict[str, type[BaseTool]] = {
-            cls.get_name(): cls for cls in self._iter_tool_classes(self._search_paths)
-        }
+        self._available: ToolRegistry = self._discover_tools(self._search_paths)
         self._integrate_mcp()
 
     @property
@@ -108,21 +118,61 @@ class ToolManager:
         return unique
 
     @staticmethod
-    def _iter_tool_classes(search_paths: list[Path]) -> Iterator[type[BaseTool]]:
-        """Iterate over all search_paths to find tool classes.
+    def _iter_tool_files(search_paths: list[Path]) -> Iterator[Path]:
+        """Iterate over all search_paths to find candidate tool files.
 
         Note: if a search path is not a directory, it is treated as a single tool file.
         """
         for base in search_paths:
             if not base.is_dir() and base.name.endswith(".py"):
-                if tools := ToolManager._load_tools_from_file(base):
-                    for tool in tools:
-                        yield tool
+                yield base
 
-            for path in base.rglob("*.py"):
-                if tools := ToolManager._load_tools_from_file(path):
-                    for tool in tools:
-                        yield tool
+            yield from base.rglob("*.py")
+
+    @staticmethod
+    def _iter_tool_classes(search_paths: list[Path]) -> Iterator[type[BaseTool]]:
+        """Iterate over all search_paths to find tool classes."""
+        for path in ToolManager._iter_tool_files(search_paths):
+            if tools := ToolManager._load_tools_from_file(path):
+                yield from tools
+
+    @staticmethod
+    def _discover_tools(search_paths: list[Path]) -> ToolRegistry:
+        """Collect tools from search_paths, reusing the manifest where it is valid.
+
+        Only files that are new or changed since they were last recorded get
+        imported here; everything else is imported on first lookup.
+        """
+        registry = ToolRegistry(ToolManager._load_tool_class)
+        manifest = ToolManifest(TOOL_MANIFEST_FILE.path)
+        for path in ToolManager._iter_tool_files(search_paths):
+            if not path.is_file() or path.name.startswith("_"):
+                continue
+
+            if (entries := manifest.lookup(path)) is not None:
+                for entry in entries:
+                    registry.add_cached(entry)
+                continue
+
+            if (module := ToolManager._load_module(path)) is None:
+                continue
+            tools = ToolManager._tool_classes_in(module)
+            for tool in tools.values():
+                registry[tool.get_name()] = tool
+            try:
+                manifest.store(
+                    path,
+                    [
+                        ToolManifestEntry.from_class(path, attr, tool)
+                        for attr, tool in tools.items()
+                    ],
+                    module,
+                )
+            except Exception as e:
+                logger.debug("Not caching tools from %s: %s", path, e)
+
+        manifest.save()
+        return registry
 
     @staticmethod
     def _load_tools_from_file(file_path: Path) -> list[type[BaseTool]] | None:
@@ -132,30 +182,45 @@ class ToolManager:
         if name.startswith("_"):
             return
 
+        if (module := ToolManager._load_module(file_path)) is None:
+            return
+        return list(ToolManager._tool_classes_in(module).values())
+
+    @staticmethod
+    def _load_tool_class(file_path: Path, attr: str) -> type[BaseTool] | None:
+        if (module := ToolManager._load_module(file_path)) is None:
+            return None
+        return ToolManager._tool_classes_in(module).get(attr)
+
+    @staticmethod
+    def _load_module(file_path: Path) -> ModuleType | None:
         module_name = _compute_module_name(file_path)
 
         if module_name in sys.modules:
-            module = sys.modules[module_name]
-        else:
-            spec = importlib.util.spec_from_file_location(module_name, file_path)
-            if spec is None or spec.loader is None:
-                return
-            module = importlib.util.module_from_spec(spec)
-            sys.modules[module_name] = module
-            try:
-                spec.loader.exec_module(module)
-            except Exception:
-                return
+            return sys.modules[module_name]
 
-        tools = []
-        for tool_obj in vars(module).values():
+        spec = importlib.util.spec_from_file_location(module_name, file_path)
+        if spec is None or spec.loader is None:
+            return None
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        try:
+            spec.loader.exec_module(module)
+        except Exception:
+            return None
+        return module
+
+    @staticmethod
+    def _tool_classes_in(module: ModuleType) -> dict[str, type[BaseTool]]:
+        tools: dict[str, type[BaseTool]] = {}
+        for attr, tool_obj in vars(module).items():
             if not inspect.isclass(tool_obj):
                 continue
             if not issubclass(tool_obj, BaseTool) or tool_obj is BaseTool:
                 continue
             if inspect.isabstract(tool_obj):
                 continue
-            tools.append(tool_obj)
+            tools[attr] = tool_obj
         return tools
 
     @staticmethod
@@ -179,20 +244,29 @@ class ToolManager:
         return defaults
 
     @property
-    def available_tools(self) -> dict[str, type[BaseTool]]:
+    def available_tools(self) -> Mapping[str, type[BaseTool]]:
+        """Enabled tool classes by name; a class is imported when first accessed."""
         if self._config.enabled_tools:
-            return {
-                name: cls
-                for name, cls in self._available.items()
+            return self._available.subset(
+                name
+                for name in self._available
                 if name_matches(name, self._config.enabled_tools)
-            }
+            )
         if self._config.disabled_tools:
-            return {
-                name: cls
-                for name, cls in self._available.items()
+            return self._available.subset(
+                name
+                for name in self._available
                 if not name_matches(name, self._config.disabled_tools)
-            }
-        return dict(self._available)
+            )
+        return self._available.subset(self._available)
+
+    @property
+    def tool_specs(self) -> list[ToolSpec]:
+        """Name, description, schema and prompt of each enabled tool.
+
+        Served from the manifest for tools that have not been imported yet.
+        """
+        return [self._available.spec(name) for name in self.available_tools]
 
     def _integrate_mcp(self) -> None:
         if not self._config.mcp_servers:
@@ -324,12 +398,11 @@ class ToolManager:
         if tool_name in self._instances:
             return self._instances[tool_name]
 
-        if tool_name not in self._available:
+        if (tool_class := self._available.get(tool_name)) is None:
             raise NoSuchToolError(
                 f"Unknown tool: {tool_name}. Available: {list(self._available.keys())}"
             )
 
-        tool_class = self._available[tool_name]
         tool_config = self.get_tool_config(tool_name)
         self._instances[tool_name] = tool_class.from_config(tool_config)
         return self._instances[tool_name]
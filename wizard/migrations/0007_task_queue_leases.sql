@@ -0,0 +1,7 @@
+ALTER TABLE task_queue
+ADD COLUMN IF NOT EXISTS lease_owner TEXT;
+
+ALTER TABLE task_queue
+ADD COLUMN IF NOT EXISTS lease_expires_at TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_task_queue_claim ON task_queue(state, scheduled_for);
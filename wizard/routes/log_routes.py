@@ -18,7 +18,14 @@ from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 
 from core.services.time_utils import utc_day_string
-from wizard.services.logging_api import get_logger, get_log_stats, get_logging_health, get_logs_root
+from wizard.services.log_index import tail_lines
+from wizard.services.logging_api import (
+    get_log_manager,
+    get_logger,
+    get_log_stats,
+    get_logging_health,
+    get_logs_root,
+)
 
 
 class ToastLogPayload(BaseModel):
@@ -47,13 +54,7 @@ def create_log_routes(auth_guard=None):
         return candidates[-1] if candidates else None
 
     def _read_tail(path: Path, limit: int) -> List[str]:
-        try:
-            lines = path.read_text(encoding="utf-8", errors="ignore").splitlines()
-        except FileNotFoundError:
-            return []
-        if limit <= 0:
-            return []
-        return lines[-limit:]
+        return tail_lines(path, limit)
 
     async def _stream_file(path: Path, limit: int) -> Generator[bytes, None, None]:
         for line in _read_tail(path, limit):
@@ -92,6 +93,33 @@ def create_log_routes(auth_guard=None):
             "stats": get_log_stats(),
         }
 
+    @router.get("/recent")
+    async def recent_logs(
+        level: Optional[str] = Query(None, pattern="^(trace|debug|info|warn|error|fatal)$"),
+        min_level: Optional[str] = Query(None, pattern="^(trace|debug|info|warn|error|fatal)$"),
+        category: Optional[str] = None,
+        component: Optional[str] = None,
+        corr_id: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: int = Query(200, ge=1, le=2000),
+    ) -> Dict[str, Any]:
+        """Recent events from the in-process ring buffer (no disk reads)."""
+        try:
+            entries = get_log_manager().query(
+                level=level,
+                min_level=min_level,
+                category=category,
+                component=component,
+                corr_id=corr_id,
+                since=since,
+                until=until,
+                limit=limit,
+            )
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=f"Invalid time bound: {exc}")
+        return {"count": len(entries), "entries": entries}
+
     @router.get("/stream")
     async def stream_logs(
         component: str = Query("wizard", pattern="^(core|wizard|script|extension|dev)$"),
@@ -4,9 +4,10 @@ from __future__ import annotations
 
 from typing import Any, Callable, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, Header, HTTPException, Query, Response
 from pydantic import BaseModel, Field
 
+from core.binder.feed import FEED_CACHE_DIR, BinderFeed, FeedFormat
 from wizard.services.publish_service import get_publish_service, PublishService
 
 AuthGuard = Optional[Callable]
@@ -115,6 +116,36 @@ def create_publish_routes(
             raise HTTPException(status_code=404, detail="Publish manifest not found")
         return {"success": True, "manifest": manifest}
 
+    @router.get("/feeds/{binder_id}")
+    async def get_binder_feed(
+        binder_id: str,
+        format: str = Query(default="rss", pattern="^(rss|json)$"),
+        limit: Optional[int] = Query(default=None, ge=1, le=1000),
+        if_none_match: Optional[str] = Header(default=None),
+        if_modified_since: Optional[str] = Header(default=None),
+    ):
+        if not binder_id or binder_id.startswith(".") or "/" in binder_id or "\\" in binder_id:
+            raise HTTPException(status_code=400, detail="Invalid binder id")
+        binder_path = service.repo_root / "memory" / "vault" / "@binders" / binder_id
+        try:
+            feed = BinderFeed(binder_path, cache_dir=service.repo_root / FEED_CACHE_DIR)
+        except ValueError:
+            raise HTTPException(status_code=404, detail="Binder not found")
+        rendered = feed.render(
+            format=FeedFormat.RSS_2_0 if format == "rss" else FeedFormat.JSON_FEED,
+            limit=limit,
+            if_none_match=if_none_match,
+            if_modified_since=if_modified_since,
+        )
+        headers = {
+            "ETag": rendered.validators.etag,
+            "Last-Modified": rendered.validators.last_modified,
+            "Cache-Control": "no-cache",
+        }
+        if rendered.status == 304:
+            return Response(status_code=304, headers=headers)
+        return Response(content=rendered.body, media_type=rendered.media_type, headers=headers)
+
     @router.post("/providers/{provider}/sync")
     async def sync_publish_provider(provider: str):
         try:
@@ -0,0 +1,219 @@
+"""SQLite usage ledger for CostTracker.
+
+Raw entries go to ``usage_entries``; ``usage_rollup`` keeps per-day,
+per-resource, per-provider totals updated in the same transaction, so daily,
+monthly and report queries read O(days) small rows instead of re-parsing every
+entry. Legacy ``usage-YYYY-MM-DD.json`` files are imported once.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS usage_entries (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    day TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    resource TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    amount REAL NOT NULL,
+    cost_usd REAL NOT NULL,
+    metadata_json TEXT NOT NULL DEFAULT '{}'
+);
+CREATE INDEX IF NOT EXISTS idx_usage_entries_day ON usage_entries(day, id);
+CREATE TABLE IF NOT EXISTS usage_rollup (
+    day TEXT NOT NULL,
+    resource TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    amount REAL NOT NULL DEFAULT 0,
+    cost_usd REAL NOT NULL DEFAULT 0,
+    entries INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, resource, provider)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS imported_files (
+    name TEXT PRIMARY KEY
+);
+"""
+
+_ROLLUP_UPSERT = """
+INSERT INTO usage_rollup (day, resource, provider, amount, cost_usd, entries)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT(day, resource, provider) DO UPDATE SET
+    amount = amount + excluded.amount,
+    cost_usd = cost_usd + excluded.cost_usd,
+    entries = entries + excluded.entries
+"""
+
+
+class CostLedger:
+    """Raw usage entries plus incrementally maintained daily rollups."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.db_path, timeout=5.0)
+
+    def _ensure_schema(self) -> None:
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode = WAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, _SCHEMA_VERSION):
+                conn.executescript(
+                    """
+                    DROP TABLE IF EXISTS usage_entries;
+                    DROP TABLE IF EXISTS usage_rollup;
+                    DROP TABLE IF EXISTS imported_files;
+                    """
+                )
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    def append(self, entries: List[Dict[str, Any]]) -> None:
+        """Insert entries (UsageEntry dicts) and fold them into the rollup."""
+        if not entries:
+            return
+        with self._connect() as conn:
+            self._append(conn, entries)
+
+    def _append(self, conn: sqlite3.Connection, entries: List[Dict[str, Any]]) -> None:
+        rows = []
+        rollup: Dict[Tuple[str, str, str], List[float]] = {}
+        for entry in entries:
+            day = str(entry["timestamp"])[:10]
+            rows.append(
+                (
+                    day,
+                    entry["timestamp"],
+                    entry["resource"],
+                    entry["provider"],
+                    float(entry["amount"]),
+                    float(entry["cost_usd"]),
+                    json.dumps(entry.get("metadata") or {}, default=str),
+                )
+            )
+            totals = rollup.setdefault((day, entry["resource"], entry["provider"]), [0.0, 0.0, 0])
+            totals[0] += float(entry["amount"])
+            totals[1] += float(entry["cost_usd"])
+            totals[2] += 1
+        conn.executemany(
+            """
+            INSERT INTO usage_entries (day, timestamp, resource, provider, amount, cost_usd, metadata_json)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+            """,
+            rows,
+        )
+        conn.executemany(
+            _ROLLUP_UPSERT,
+            [(*key, amount, cost, count) for key, (amount, cost, count) in rollup.items()],
+        )
+
+    def import_json_files(self, data_path: Path) -> int:
+        """Import legacy ``usage-*.json`` day files not imported before."""
+        imported = 0
+        with self._connect() as conn:
+            done = {row[0] for row in conn.execute("SELECT name FROM imported_files")}
+            for usage_file in sorted(data_path.glob("usage-*.json")):
+                if usage_file.name in done:
+                    continue
+                try:
+                    entries = json.loads(usage_file.read_text())
+                except (OSError, ValueError):
+                    continue
+                if isinstance(entries, list):
+                    valid = [
+                        entry
+                        for entry in entries
+                        if isinstance(entry, dict)
+                        and {"timestamp", "resource", "provider", "amount", "cost_usd"} <= entry.keys()
+                    ]
+                    self._append(conn, valid)
+                    imported += len(valid)
+                conn.execute("INSERT INTO imported_files (name) VALUES (?)", (usage_file.name,))
+        return imported
+
+    # ------------------------------------------------------------------
+    # Rollup reads
+    # ------------------------------------------------------------------
+
+    def amount(self, resource: str, start_day: str, end_day: str) -> float:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT COALESCE(SUM(amount), 0) FROM usage_rollup WHERE day BETWEEN ? AND ? AND resource = ?",
+                (start_day, end_day, resource),
+            ).fetchone()
+        return float(row[0])
+
+    def cost(self, start_day: str, end_day: str) -> float:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT COALESCE(SUM(cost_usd), 0) FROM usage_rollup WHERE day BETWEEN ? AND ?",
+                (start_day, end_day),
+            ).fetchone()
+        return float(row[0])
+
+    def amounts_by_resource(self, start_day: str, end_day: str) -> Dict[str, float]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT resource, SUM(amount) FROM usage_rollup WHERE day BETWEEN ? AND ? GROUP BY resource",
+                (start_day, end_day),
+            ).fetchall()
+        return {resource: float(amount) for resource, amount in rows}
+
+    def summary(self, start_day: str, end_day: str) -> Dict[str, Any]:
+        """Cost by provider, amount by resource, total cost and entry count."""
+        by_provider: Dict[str, float] = {}
+        by_resource: Dict[str, float] = {}
+        total_cost = 0.0
+        total_entries = 0
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT resource, provider, SUM(amount), SUM(cost_usd), SUM(entries)
+                FROM usage_rollup WHERE day BETWEEN ? AND ?
+                GROUP BY resource, provider
+                """,
+                (start_day, end_day),
+            ).fetchall()
+        for resource, provider, amount, cost, entries in rows:
+            by_provider[provider] = by_provider.get(provider, 0.0) + float(cost)
+            by_resource[resource] = by_resource.get(resource, 0.0) + float(amount)
+            total_cost += float(cost)
+            total_entries += int(entries)
+        return {
+            "by_provider": by_provider,
+            "by_resource": by_resource,
+            "total_cost": total_cost,
+            "entries": total_entries,
+        }
+
+    # ------------------------------------------------------------------
+    # Raw entries
+    # ------------------------------------------------------------------
+
+    def iter_entries(
+        self, start_day: str, end_day: str, resource: Optional[str] = None
+    ) -> Iterator[Tuple[str, str, str, float, float]]:
+        """Yield ``(timestamp, resource, provider, amount, cost_usd)`` in day order."""
+        sql = (
+            "SELECT timestamp, resource, provider, amount, cost_usd FROM usage_entries "
+            "WHERE day BETWEEN ? AND ?"
+        )
+        params: List[Any] = [start_day, end_day]
+        if resource:
+            sql += " AND resource = ?"
+            params.append(resource)
+        sql += " ORDER BY day, id"
+        conn = self._connect()
+        try:
+            yield from conn.execute(sql, params)
+        finally:
+            conn.close()
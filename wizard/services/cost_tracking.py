@@ -20,14 +20,16 @@ Features:
 Note: WIZARD-ONLY functionality.
 """
 
+import calendar
 import json
-from datetime import datetime, date
+from datetime import datetime, date, timedelta
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 from collections import defaultdict
 
+from wizard.services.cost_ledger import CostLedger
 from wizard.services.logging_api import get_logger
 
 logger = get_logger("cost-tracking")
@@ -145,19 +147,23 @@ class CostTracker:
         Path(__file__).parent.parent.parent / "memory" / "wizard" / "cost_tracking"
     )
 
-    def __init__(self):
+    def __init__(self, data_path: Optional[Path] = None):
         """Initialize cost tracker."""
-        self.DATA_PATH.mkdir(parents=True, exist_ok=True)
+        self.data_path = Path(data_path) if data_path else self.DATA_PATH
+        self.data_path.mkdir(parents=True, exist_ok=True)
         self.budgets = self._load_budgets()
         self._alerts_sent: Dict[str, List[float]] = defaultdict(list)
 
-    def _get_usage_file(self, date_obj: date) -> Path:
-        """Get usage file for a specific date."""
-        return self.DATA_PATH / f"usage-{date_obj.isoformat()}.json"
+        # Entries + per-day rollups; legacy day files are imported once.
+        self.ledger = CostLedger(self.data_path / "usage.db")
+        try:
+            self.ledger.import_json_files(self.data_path)
+        except Exception as e:
+            logger.error(f"[LOCAL] Failed to import usage files: {e}")
 
     def _load_budgets(self) -> Dict[str, Budget]:
         """Load budget configurations."""
-        budget_file = self.DATA_PATH / "budgets.json"
+        budget_file = self.data_path / "budgets.json"
 
         if budget_file.exists():
             try:
@@ -170,7 +176,7 @@ class CostTracker:
 
     def save_budgets(self):
         """Save budget configurations."""
-        budget_file = self.DATA_PATH / "budgets.json"
+        budget_file = self.data_path / "budgets.json"
         data = {k: asdict(v) for k, v in self.budgets.items()}
         budget_file.write_text(json.dumps(data, indent=2))
 
@@ -217,18 +223,7 @@ class CostTracker:
             metadata=metadata or {},
         )
 
-        # Load and append to today's file
-        usage_file = self._get_usage_file(now.date())
-        entries = []
-
-        if usage_file.exists():
-            try:
-                entries = json.loads(usage_file.read_text())
-            except Exception:
-                entries = []
-
-        entries.append(asdict(entry))
-        usage_file.write_text(json.dumps(entries, indent=2))
+        self.ledger.append([asdict(entry)])
 
         # Check budget alerts
         return self._check_alerts(resource.value, now.date())
@@ -286,79 +281,39 @@ class CostTracker:
 
     def get_daily_usage(self, resource: str, date_obj: Optional[date] = None) -> float:
         """Get total usage for a resource on a specific day."""
-        date_obj = date_obj or datetime.now().date()
-        usage_file = self._get_usage_file(date_obj)
-
-        if not usage_file.exists():
-            return 0.0
-
-        try:
-            entries = json.loads(usage_file.read_text())
-            return sum(e["amount"] for e in entries if e["resource"] == resource)
-        except Exception:
-            return 0.0
+        day = (date_obj or datetime.now().date()).isoformat()
+        return self.ledger.amount(resource, day, day)
 
     def get_monthly_usage(self, resource: str, year: int, month: int) -> float:
         """Get total usage for a resource in a specific month."""
-        total = 0.0
-
-        # Iterate through all days in the month
-        for day in range(1, 32):
-            try:
-                date_obj = date(year, month, day)
-                total += self.get_daily_usage(resource, date_obj)
-            except ValueError:
-                break  # Invalid date (month ended)
-
-        return total
+        last_day = calendar.monthrange(year, month)[1]
+        return self.ledger.amount(
+            resource,
+            date(year, month, 1).isoformat(),
+            date(year, month, last_day).isoformat(),
+        )
 
     def get_daily_cost(self, date_obj: Optional[date] = None) -> float:
         """Get total cost for a day."""
-        date_obj = date_obj or datetime.now().date()
-        usage_file = self._get_usage_file(date_obj)
-
-        if not usage_file.exists():
-            return 0.0
-
-        try:
-            entries = json.loads(usage_file.read_text())
-            return sum(e["cost_usd"] for e in entries)
-        except Exception:
-            return 0.0
+        day = (date_obj or datetime.now().date()).isoformat()
+        return self.ledger.cost(day, day)
 
     def generate_report(self, days: int = 30) -> UsageReport:
         """Generate a usage report for the past N days."""
         end_date = datetime.now().date()
-        start_date = date(
-            end_date.year,
-            end_date.month - (1 if days > 28 else 0),
-            1 if days > 28 else end_date.day - days,
-        )
-
-        by_provider: Dict[str, float] = defaultdict(float)
-        by_resource: Dict[str, float] = defaultdict(float)
-        total_cost = 0.0
-        total_entries = 0
+        if days > 28:
+            # Month-scale reports start at the first of the previous month.
+            first = end_date.replace(day=1)
+            start_date = (first - timedelta(days=1)).replace(day=1)
+        else:
+            start_date = end_date - timedelta(days=days)
 
         # Aggregate data
-        current = start_date
-        while current <= end_date:
-            usage_file = self._get_usage_file(current)
-            if usage_file.exists():
-                try:
-                    entries = json.loads(usage_file.read_text())
-                    for entry in entries:
-                        by_provider[entry["provider"]] += entry["cost_usd"]
-                        by_resource[entry["resource"]] += entry["amount"]
-                        total_cost += entry["cost_usd"]
-                        total_entries += 1
-                except Exception:
-                    pass
-
-            # Move to next day
-            from datetime import timedelta
-
-            current = current + timedelta(days=1)
+        summary = self.ledger.summary(start_date.isoformat(), end_date.isoformat())
+        by_provider: Dict[str, float] = summary["by_provider"]
+        by_resource: Dict[str, float] = summary["by_resource"]
+        total_cost = summary["total_cost"]
+        total_entries = summary["entries"]
 
         # Calculate budget status
         # Use OK-model tokens as the primary budget indicator
@@ -401,8 +356,9 @@ class CostTracker:
         }
 
         # Get usage per resource
+        daily_usage = self.ledger.amounts_by_resource(today.isoformat(), today.isoformat())
         for resource in ResourceType:
-            daily = self.get_daily_usage(resource.value, today)
+            daily = daily_usage.get(resource.value, 0.0)
             budget = self.budgets.get(resource.value)
 
             data["today"]["by_resource"][resource.value] = {
@@ -426,20 +382,12 @@ class CostTracker:
     def export_csv(self, start_date: date, end_date: date, output_path: str) -> bool:
         """Export usage data to CSV."""
         try:
-            from datetime import timedelta
-
             lines = ["timestamp,resource,provider,amount,cost_usd"]
 
-            current = start_date
-            while current <= end_date:
-                usage_file = self._get_usage_file(current)
-                if usage_file.exists():
-                    entries = json.loads(usage_file.read_text())
-                    for e in entries:
-                        lines.append(
-                            f"{e['timestamp']},{e['resource']},{e['provider']},{e['amount']},{e['cost_usd']}"
-                        )
-                current = current + timedelta(days=1)
+            for timestamp, resource, provider, amount, cost_usd in self.ledger.iter_entries(
+                start_date.isoformat(), end_date.isoformat()
+            ):
+                lines.append(f"{timestamp},{resource},{provider},{amount},{cost_usd}")
 
             Path(output_path).write_text("\n".join(lines))
             return True
@@ -0,0 +1,348 @@
+"""Sidecar SQLite index for v1.5 JSONL logs.
+
+Tracks, per log file, how far it has been indexed plus one row per line with
+its byte offset, timestamp, level and category. Each refresh only reads bytes
+appended since the last refresh, so dashboard queries seek straight to the
+matching lines instead of re-reading every file.
+
+Directories are only re-listed when their mtime changes, refreshes closer
+together than ``min_interval`` are skipped, and the oldest entries are
+pruned once the index holds more than ``max_entries`` lines.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+INDEX_DIRNAME = ".index"
+INDEX_FILENAME = "log-index.sqlite3"
+_SCHEMA_VERSION = 2
+DEFAULT_MAX_ENTRIES = 200_000
+# A directory modified this recently may still gain entries within the same
+# mtime tick, so it is listed again on the next refresh.
+_DIR_SETTLE_NS = 1_000_000_000
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS log_files (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    path TEXT NOT NULL UNIQUE,
+    component TEXT NOT NULL,
+    prefix TEXT NOT NULL,
+    inode INTEGER NOT NULL DEFAULT 0,
+    size INTEGER NOT NULL DEFAULT 0,
+    mtime REAL NOT NULL DEFAULT 0,
+    indexed_offset INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS log_dirs (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS log_entries (
+    file_id INTEGER NOT NULL REFERENCES log_files(id) ON DELETE CASCADE,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    ts TEXT NOT NULL DEFAULT '',
+    level TEXT NOT NULL DEFAULT '',
+    category TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (file_id, offset)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS idx_log_entries_ts ON log_entries(ts);
+CREATE INDEX IF NOT EXISTS idx_log_entries_level_ts ON log_entries(level, ts);
+CREATE INDEX IF NOT EXISTS idx_log_entries_file_ts ON log_entries(file_id, ts);
+"""
+
+
+def _sort_ts(raw: Any) -> str:
+    """Return a lexically sortable UTC timestamp ('' when unparseable)."""
+    if not isinstance(raw, str) or not raw:
+        return ""
+    try:
+        parsed = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+    except ValueError:
+        return ""
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed.isoformat(timespec="microseconds")
+
+
+def tail_lines(path: Path, max_lines: int, block_size: int = 64 * 1024) -> List[str]:
+    """Return the last ``max_lines`` lines of ``path`` by reading back from EOF."""
+    if max_lines <= 0:
+        return []
+    try:
+        handle = path.open("rb")
+    except OSError:
+        return []
+    with handle:
+        handle.seek(0, os.SEEK_END)
+        position = handle.tell()
+        chunks: List[bytes] = []
+        newlines = 0
+        while position > 0 and newlines <= max_lines:
+            step = min(block_size, position)
+            position -= step
+            handle.seek(position)
+            chunk = handle.read(step)
+            chunks.append(chunk)
+            newlines += chunk.count(b"\n")
+    data = b"".join(reversed(chunks))
+    lines = data.decode("utf-8", errors="ignore").splitlines()
+    return lines[-max_lines:]
+
+
+class LogIndex:
+    """Incremental offset index over ``<root>/**/*.jsonl``.
+
+    Refreshes within ``min_interval`` seconds of the previous one return
+    without touching the disk; pass ``min_interval=0`` to always refresh.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        db_path: Optional[Path] = None,
+        min_interval: float = 1.0,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.root = Path(root)
+        self.db_path = Path(db_path) if db_path else self.root / INDEX_DIRNAME / INDEX_FILENAME
+        self.min_interval = min_interval
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._initialized = False
+        self._refreshed_at: Optional[float] = None
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=5.0)
+        conn.execute("PRAGMA foreign_keys = ON")
+        return conn
+
+    def _init_db(self) -> None:
+        if self._initialized:
+            return
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode = WAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version != _SCHEMA_VERSION:
+                conn.executescript(
+                    "DROP TABLE IF EXISTS log_entries; DROP TABLE IF EXISTS log_files; "
+                    "DROP TABLE IF EXISTS log_dirs;"
+                )
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._initialized = True
+
+    def refresh(self) -> Dict[str, int]:
+        """Bring the index up to date with files on disk."""
+        with self._lock:
+            stats = {"files": 0, "reindexed": 0, "new_entries": 0, "removed": 0, "pruned": 0}
+            now = time.monotonic()
+            if self._refreshed_at is not None and now - self._refreshed_at < self.min_interval:
+                return stats
+            self._init_db()
+            with self._connect() as conn:
+                known = {
+                    row[1]: row
+                    for row in conn.execute(
+                        "SELECT id, path, inode, size, mtime, indexed_offset FROM log_files"
+                    )
+                }
+                known_dirs = dict(conn.execute("SELECT path, mtime_ns FROM log_dirs"))
+                paths, dirs = self._walk(known, known_dirs)
+                seen = set()
+                for key in paths:
+                    path = Path(key)
+                    try:
+                        st = path.stat()
+                    except OSError:
+                        continue
+                    seen.add(key)
+                    stats["files"] += 1
+                    row = known.get(key)
+                    if row is None:
+                        cursor = conn.execute(
+                            "INSERT INTO log_files (path, component, prefix) VALUES (?, ?, ?)",
+                            (key, path.parent.name, path.stem.split("-")[0]),
+                        )
+                        file_id, offset = cursor.lastrowid, 0
+                    else:
+                        file_id, _, inode, size, mtime, offset = row
+                        if st.st_size == size and st.st_mtime == mtime and st.st_ino == inode:
+                            continue
+                        if st.st_ino != inode or st.st_size < offset:
+                            # Rotated or truncated: start over for this file.
+                            conn.execute("DELETE FROM log_entries WHERE file_id = ?", (file_id,))
+                            offset = 0
+                            stats["reindexed"] += 1
+                    new_offset, rows = self._scan(path, file_id, offset)
+                    if rows:
+                        conn.executemany(
+                            "INSERT OR REPLACE INTO log_entries "
+                            "(file_id, offset, length, ts, level, category) VALUES (?, ?, ?, ?, ?, ?)",
+                            rows,
+                        )
+                        stats["new_entries"] += len(rows)
+                    conn.execute(
+                        "UPDATE log_files SET inode = ?, size = ?, mtime = ?, indexed_offset = ? WHERE id = ?",
+                        (st.st_ino, st.st_size, st.st_mtime, new_offset, file_id),
+                    )
+                for key, row in known.items():
+                    if key not in seen:
+                        conn.execute("DELETE FROM log_files WHERE id = ?", (row[0],))
+                        stats["removed"] += 1
+                conn.execute("DELETE FROM log_dirs")
+                conn.executemany("INSERT INTO log_dirs (path, mtime_ns) VALUES (?, ?)", dirs.items())
+                if stats["new_entries"]:
+                    stats["pruned"] = self._prune(conn)
+            self._refreshed_at = now
+            return stats
+
+    def _walk(
+        self, known: Dict[str, tuple], known_dirs: Dict[str, int]
+    ) -> Tuple[List[str], Dict[str, int]]:
+        """Candidate ``*.jsonl`` paths, listing only directories that changed.
+
+        A directory whose mtime matches the stored one has gained or lost no
+        entries, so its known files and subdirectories are reused as-is.
+        """
+        files_in: Dict[str, List[str]] = defaultdict(list)
+        for key in known:
+            files_in[os.path.dirname(key)].append(key)
+        subdirs_in: Dict[str, List[str]] = defaultdict(list)
+        for key in known_dirs:
+            subdirs_in[os.path.dirname(key)].append(key)
+
+        paths: List[str] = []
+        dirs: Dict[str, int] = {}
+        settled_before = time.time_ns() - _DIR_SETTLE_NS
+        pending = [str(self.root)]
+        while pending:
+            directory = pending.pop()
+            try:
+                mtime_ns = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+            if known_dirs.get(directory) == mtime_ns:
+                paths.extend(files_in[directory])
+                pending.extend(subdirs_in[directory])
+            else:
+                try:
+                    with os.scandir(directory) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                if entry.name != INDEX_DIRNAME:
+                                    pending.append(entry.path)
+                            elif entry.name.endswith(".jsonl") and entry.is_file():
+                                paths.append(entry.path)
+                except OSError:
+                    continue
+            dirs[directory] = mtime_ns if mtime_ns < settled_before else -1
+        return paths, dirs
+
+    def _prune(self, conn: sqlite3.Connection) -> int:
+        """Drop the oldest entries beyond ``max_entries``."""
+        excess = conn.execute("SELECT COUNT(*) FROM log_entries").fetchone()[0] - self.max_entries
+        if excess <= 0:
+            return 0
+        conn.execute(
+            "DELETE FROM log_entries WHERE (file_id, offset) IN ("
+            "SELECT file_id, offset FROM log_entries ORDER BY ts, file_id, offset LIMIT ?)",
+            (excess,),
+        )
+        return excess
+
+    def _scan(self, path: Path, file_id: int, offset: int) -> Tuple[int, List[tuple]]:
+        rows: List[tuple] = []
+        try:
+            with path.open("rb") as handle:
+                handle.seek(offset)
+                for raw in handle:
+                    if not raw.endswith(b"\n"):
+                        # Partial line still being written; pick it up next time.
+                        break
+                    line_offset = offset
+                    offset += len(raw)
+                    try:
+                        payload = json.loads(raw)
+                    except ValueError:
+                        continue
+                    if not isinstance(payload, dict):
+                        continue
+                    rows.append(
+                        (
+                            file_id,
+                            line_offset,
+                            len(raw),
+                            _sort_ts(payload.get("ts") or payload.get("timestamp")),
+                            str(payload.get("level", "")).lower(),
+                            str(payload.get("category", "")),
+                        )
+                    )
+        except OSError:
+            pass
+        return offset, rows
+
+    def categories(self) -> List[str]:
+        self._init_db()
+        with self._connect() as conn:
+            return [row[0] for row in conn.execute("SELECT DISTINCT component FROM log_files ORDER BY component")]
+
+    def query(
+        self,
+        category: str = "all",
+        level: Optional[str] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: int = 200,
+    ) -> List[Tuple[str, int, int]]:
+        """Return ``(path, offset, length)`` for matching lines, newest first."""
+        self._init_db()
+        clauses: List[str] = []
+        params: List[Any] = []
+        if category not in ("all", ""):
+            clauses.append("(f.component = ? OR f.prefix = ?)")
+            params.extend([category, category])
+        if level:
+            clauses.append("e.level = ?")
+            params.append(level.lower())
+        if since:
+            clauses.append("e.ts >= ?")
+            params.append(_sort_ts(since))
+        if until:
+            clauses.append("e.ts <= ?")
+            params.append(_sort_ts(until))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        sql = (
+            "SELECT f.path, e.offset, e.length FROM log_entries e "
+            f"JOIN log_files f ON f.id = e.file_id {where} "
+            "ORDER BY e.ts DESC, e.file_id DESC, e.offset DESC LIMIT ?"
+        )
+        params.append(max(0, limit))
+        with self._connect() as conn:
+            return [(row[0], row[1], row[2]) for row in conn.execute(sql, params)]
+
+    def read_lines(self, refs: List[Tuple[str, int, int]]) -> Iterator[Tuple[str, str]]:
+        """Yield ``(path, line)`` for each reference, opening each file once."""
+        handles: Dict[str, Any] = {}
+        try:
+            for path, offset, length in refs:
+                handle = handles.get(path)
+                if handle is None:
+                    try:
+                        handle = handles[path] = open(path, "rb")
+                    except OSError:
+                        continue
+                handle.seek(offset)
+                yield path, handle.read(length).decode("utf-8", errors="ignore").rstrip("\n")
+        finally:
+            for handle in handles.values():
+                handle.close()
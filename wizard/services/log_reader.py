@@ -3,17 +3,27 @@
 from __future__ import annotations
 
 import json
-from collections import deque
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from wizard.services.log_index import LogIndex, tail_lines
 from wizard.services.logging_api import get_log_stats, get_logs_root
 
 
 class LogReader:
     """Read and parse Wizard JSONL logs for UI consumption."""
 
+    def __init__(self) -> None:
+        self._indexes: Dict[Path, LogIndex] = {}
+
+    def _index_for(self, log_dir: Path) -> LogIndex:
+        index = self._indexes.get(log_dir)
+        if index is None:
+            index = self._indexes[log_dir] = LogIndex(log_dir)
+        return index
+
     def read_logs(
         self, category: str = "all", limit: int = 200, level: Optional[str] = None
     ) -> Dict[str, Any]:
@@ -27,12 +37,44 @@ class LogReader:
                 "stats": {},
             }
 
+        selected = (category or "all").lower()
+        try:
+            index = self._index_for(log_dir)
+            index.refresh()
+            categories = index.categories()
+            trimmed = self._read_indexed(index, selected, limit, level)
+        except (sqlite3.Error, OSError):
+            categories, trimmed = self._read_scan(log_dir, selected, limit, level)
+
+        return {
+            "logs": trimmed,
+            "category": selected,
+            "limit": limit,
+            "categories": categories,
+            "stats": get_log_stats(),
+        }
+
+    def _read_indexed(
+        self, index: LogIndex, selected: str, limit: int, level: Optional[str]
+    ) -> List[Dict[str, Any]]:
+        refs = index.query(category=selected, level=level, limit=limit)
+        entries: List[Dict[str, Any]] = []
+        for path, line in index.read_lines(refs):
+            parsed = self._parse_log_json(line, Path(path).name)
+            if not parsed:
+                continue
+            parsed.pop("timestamp_sort", None)
+            entries.append(parsed)
+        return entries
+
+    def _read_scan(
+        self, log_dir: Path, selected: str, limit: int, level: Optional[str]
+    ) -> tuple[List[str], List[Dict[str, Any]]]:
+        """Fallback when the sidecar index is unavailable."""
         files = sorted(
             log_dir.rglob("*.jsonl"), key=lambda p: p.stat().st_mtime, reverse=True
         )
         categories = sorted({p.parent.name for p in files})
-
-        selected = (category or "all").lower()
         entries: List[Dict[str, Any]] = []
 
         for log_file in files:
@@ -55,24 +97,10 @@ class LogReader:
         trimmed = entries[:limit]
         for entry in trimmed:
             entry.pop("timestamp_sort", None)
-
-        return {
-            "logs": trimmed,
-            "category": selected,
-            "limit": limit,
-            "categories": categories,
-            "stats": get_log_stats(),
-        }
+        return categories, trimmed
 
     def _tail_file(self, path: Path, max_lines: int) -> List[str]:
-        buf: deque = deque(maxlen=max_lines)
-        try:
-            with path.open("r", encoding="utf-8", errors="ignore") as handle:
-                for line in handle:
-                    buf.append(line.rstrip("\n"))
-        except OSError:
-            return []
-        return list(buf)
+        return tail_lines(path, max_lines)
 
     def _parse_log_json(self, line: str, filename: str) -> Optional[Dict[str, Any]]:
         try:
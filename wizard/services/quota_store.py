@@ -0,0 +1,417 @@
+"""SQLite persistence for QuotaTracker.
+
+Per-provider rolling counters live in ``quota_providers`` and are advanced in
+SQL (day/month rollover and the per-minute window included), so concurrent
+processes never overwrite each other's usage. Every request is appended to
+``quota_usage``; queued requests live in ``quota_queue`` indexed by
+status/priority/created_at. Both tables are pruned to a row cap: the usage
+log by id, and completed/failed queue rows by age.
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS quota_providers (
+    provider TEXT PRIMARY KEY,
+    limits_json TEXT NOT NULL DEFAULT '{}',
+    requests_today INTEGER NOT NULL DEFAULT 0,
+    requests_this_month INTEGER NOT NULL DEFAULT 0,
+    tokens_today INTEGER NOT NULL DEFAULT 0,
+    tokens_this_month INTEGER NOT NULL DEFAULT 0,
+    cost_today REAL NOT NULL DEFAULT 0,
+    cost_this_month REAL NOT NULL DEFAULT 0,
+    last_daily_reset TEXT NOT NULL DEFAULT '',
+    last_monthly_reset TEXT NOT NULL DEFAULT '',
+    total_requests INTEGER NOT NULL DEFAULT 0,
+    total_cost REAL NOT NULL DEFAULT 0,
+    requests_this_minute INTEGER NOT NULL DEFAULT 0,
+    minute_window_start REAL NOT NULL DEFAULT 0,
+    last_request_time REAL NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS quota_usage (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    ts TEXT NOT NULL,
+    provider TEXT NOT NULL,
+    tokens_input INTEGER NOT NULL DEFAULT 0,
+    tokens_output INTEGER NOT NULL DEFAULT 0,
+    cost REAL NOT NULL DEFAULT 0,
+    success INTEGER NOT NULL DEFAULT 1,
+    workflow_id TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_quota_usage_provider ON quota_usage(provider, id);
+CREATE TABLE IF NOT EXISTS quota_queue (
+    id TEXT PRIMARY KEY,
+    provider TEXT NOT NULL,
+    priority INTEGER NOT NULL,
+    endpoint TEXT NOT NULL DEFAULT '',
+    method TEXT NOT NULL DEFAULT 'POST',
+    payload_json TEXT NOT NULL DEFAULT '{}',
+    estimated_tokens INTEGER NOT NULL DEFAULT 0,
+    estimated_cost REAL NOT NULL DEFAULT 0,
+    workflow_id TEXT,
+    objective_id TEXT,
+    created_at REAL NOT NULL,
+    scheduled_for REAL,
+    retry_count INTEGER NOT NULL DEFAULT 0,
+    max_retries INTEGER NOT NULL DEFAULT 3,
+    status TEXT NOT NULL DEFAULT 'pending',
+    result_json TEXT,
+    error TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_quota_queue_pending ON quota_queue(status, priority, created_at);
+"""
+
+_TERMINAL_STATUSES = ("completed", "failed")
+
+COUNTER_COLUMNS = (
+    "requests_today",
+    "requests_this_month",
+    "tokens_today",
+    "tokens_this_month",
+    "cost_today",
+    "cost_this_month",
+    "last_daily_reset",
+    "last_monthly_reset",
+    "total_requests",
+    "total_cost",
+    "requests_this_minute",
+    "minute_window_start",
+    "last_request_time",
+)
+
+# Effective counters as of (:today, :month, :now); stale windows read as zero.
+_EFFECTIVE_SELECT = """
+SELECT provider, limits_json,
+    CASE WHEN last_daily_reset = :today THEN requests_today ELSE 0 END AS requests_today,
+    CASE WHEN last_monthly_reset = :month THEN requests_this_month ELSE 0 END AS requests_this_month,
+    CASE WHEN last_daily_reset = :today THEN tokens_today ELSE 0 END AS tokens_today,
+    CASE WHEN last_monthly_reset = :month THEN tokens_this_month ELSE 0 END AS tokens_this_month,
+    CASE WHEN last_daily_reset = :today THEN cost_today ELSE 0 END AS cost_today,
+    CASE WHEN last_monthly_reset = :month THEN cost_this_month ELSE 0 END AS cost_this_month,
+    :today AS last_daily_reset,
+    :month AS last_monthly_reset,
+    total_requests,
+    total_cost,
+    CASE WHEN :now - minute_window_start > 60 THEN 0 ELSE requests_this_minute END AS requests_this_minute,
+    minute_window_start,
+    last_request_time
+FROM quota_providers
+"""
+
+QUEUE_COLUMNS = (
+    "id",
+    "provider",
+    "priority",
+    "endpoint",
+    "method",
+    "payload_json",
+    "estimated_tokens",
+    "estimated_cost",
+    "workflow_id",
+    "objective_id",
+    "created_at",
+    "scheduled_for",
+    "retry_count",
+    "max_retries",
+    "status",
+)
+
+
+class QuotaStore:
+    """SQLite-backed quota counters, usage log and request queue."""
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._ensure_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=5.0)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def _ensure_schema(self) -> None:
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode = WAL")
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version not in (0, _SCHEMA_VERSION):
+                conn.executescript(
+                    """
+                    DROP TABLE IF EXISTS quota_providers;
+                    DROP TABLE IF EXISTS quota_usage;
+                    DROP TABLE IF EXISTS quota_queue;
+                    """
+                )
+            conn.executescript(_SCHEMA)
+            conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+    # ------------------------------------------------------------------
+    # Providers
+    # ------------------------------------------------------------------
+
+    def is_empty(self) -> bool:
+        with self._connect() as conn:
+            return conn.execute("SELECT 1 FROM quota_providers LIMIT 1").fetchone() is None
+
+    def seed_provider(self, provider: str, limits: Dict[str, Any], counters: Optional[Dict[str, Any]] = None) -> None:
+        """Insert a provider row unless it already exists."""
+        counters = {key: value for key, value in (counters or {}).items() if key in COUNTER_COLUMNS}
+        columns = ["provider", "limits_json", *counters.keys()]
+        placeholders = ", ".join("?" for _ in columns)
+        with self._connect() as conn:
+            conn.execute(
+                f"INSERT INTO quota_providers ({', '.join(columns)}) VALUES ({placeholders}) "
+                "ON CONFLICT(provider) DO NOTHING",
+                (provider, json.dumps(limits), *counters.values()),
+            )
+
+    def set_limits(self, provider: str, limits: Dict[str, Any]) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE quota_providers SET limits_json = ? WHERE provider = ?",
+                (json.dumps(limits), provider),
+            )
+
+    def providers(self, today: str, month: str, now: float) -> List[Dict[str, Any]]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                _EFFECTIVE_SELECT + " ORDER BY provider",
+                {"today": today, "month": month, "now": now},
+            ).fetchall()
+        return [self._provider_row(row) for row in rows]
+
+    def provider(self, provider: str, today: str, month: str, now: float) -> Optional[Dict[str, Any]]:
+        with self._connect() as conn:
+            row = conn.execute(
+                _EFFECTIVE_SELECT + " WHERE provider = :provider",
+                {"today": today, "month": month, "now": now, "provider": provider},
+            ).fetchone()
+        return self._provider_row(row) if row else None
+
+    def record_usage(
+        self,
+        provider: str,
+        *,
+        limits: Dict[str, Any],
+        ts: str,
+        today: str,
+        month: str,
+        now: float,
+        tokens_input: int,
+        tokens_output: int,
+        cost: float,
+        success: bool,
+        workflow_id: Optional[str],
+    ) -> Dict[str, Any]:
+        """Append a usage row and advance the provider's counters atomically."""
+        tokens = tokens_input + tokens_output
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO quota_providers (provider, limits_json) VALUES (?, ?) "
+                "ON CONFLICT(provider) DO NOTHING",
+                (provider, json.dumps(limits)),
+            )
+            conn.execute(
+                """
+                INSERT INTO quota_usage (ts, provider, tokens_input, tokens_output, cost, success, workflow_id)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (ts, provider, tokens_input, tokens_output, cost, 1 if success else 0, workflow_id),
+            )
+            row = conn.execute(
+                """
+                UPDATE quota_providers SET
+                    requests_today = CASE WHEN last_daily_reset = :today THEN requests_today ELSE 0 END + 1,
+                    tokens_today = CASE WHEN last_daily_reset = :today THEN tokens_today ELSE 0 END + :tokens,
+                    cost_today = CASE WHEN last_daily_reset = :today THEN cost_today ELSE 0 END + :cost,
+                    requests_this_month = CASE WHEN last_monthly_reset = :month THEN requests_this_month ELSE 0 END + 1,
+                    tokens_this_month = CASE WHEN last_monthly_reset = :month THEN tokens_this_month ELSE 0 END + :tokens,
+                    cost_this_month = CASE WHEN last_monthly_reset = :month THEN cost_this_month ELSE 0 END + :cost,
+                    last_daily_reset = :today,
+                    last_monthly_reset = :month,
+                    requests_this_minute = CASE WHEN :now - minute_window_start > 60 THEN 1 ELSE requests_this_minute + 1 END,
+                    minute_window_start = CASE WHEN :now - minute_window_start > 60 THEN :now ELSE minute_window_start END,
+                    last_request_time = :now,
+                    total_requests = total_requests + 1,
+                    total_cost = total_cost + :cost
+                WHERE provider = :provider
+                RETURNING *
+                """,
+                {
+                    "provider": provider,
+                    "today": today,
+                    "month": month,
+                    "now": now,
+                    "tokens": tokens,
+                    "cost": cost,
+                },
+            ).fetchone()
+        return self._provider_row(row)
+
+    def _provider_row(self, row: sqlite3.Row) -> Dict[str, Any]:
+        data = json.loads(row["limits_json"] or "{}")
+        data.update({key: row[key] for key in COUNTER_COLUMNS})
+        data["provider"] = row["provider"]
+        return data
+
+    # ------------------------------------------------------------------
+    # Usage log
+    # ------------------------------------------------------------------
+
+    def history(self, limit: int = 50, provider: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Most recent usage rows, oldest first."""
+        sql = "SELECT ts, provider, tokens_input, tokens_output, cost, success, workflow_id FROM quota_usage"
+        params: List[Any] = []
+        if provider:
+            sql += " WHERE provider = ?"
+            params.append(provider)
+        sql += " ORDER BY id DESC LIMIT ?"
+        params.append(max(0, limit))
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [
+            {
+                "timestamp": row["ts"],
+                "provider": row["provider"],
+                "tokens_input": row["tokens_input"],
+                "tokens_output": row["tokens_output"],
+                "cost": row["cost"],
+                "success": bool(row["success"]),
+                "workflow_id": row["workflow_id"],
+            }
+            for row in reversed(rows)
+        ]
+
+    def prune_usage(self, keep: int) -> int:
+        with self._connect() as conn:
+            result = conn.execute(
+                "DELETE FROM quota_usage WHERE id <= (SELECT MAX(id) FROM quota_usage) - ?",
+                (keep,),
+            )
+        return result.rowcount
+
+    # ------------------------------------------------------------------
+    # Queue
+    # ------------------------------------------------------------------
+
+    def enqueue(self, rows: Iterable[Dict[str, Any]]) -> None:
+        placeholders = ", ".join("?" for _ in QUEUE_COLUMNS)
+        with self._connect() as conn:
+            conn.executemany(
+                f"INSERT OR IGNORE INTO quota_queue ({', '.join(QUEUE_COLUMNS)}) VALUES ({placeholders})",
+                [tuple(row.get(column) for column in QUEUE_COLUMNS) for row in rows],
+            )
+
+    def pending(
+        self, now: float, limit: int = 50, after: Optional[Tuple[int, float, str]] = None
+    ) -> List[Dict[str, Any]]:
+        """Pending rows that are due, in (priority, created_at, id) order.
+
+        ``after`` is the key of the last row of the previous page. Keyset
+        paging stays correct while other processes claim rows, where an
+        OFFSET would shift and skip due requests.
+        """
+        sql = """
+            SELECT * FROM quota_queue
+            WHERE status = 'pending' AND (scheduled_for IS NULL OR scheduled_for <= ?)
+        """
+        params: List[Any] = [now]
+        if after is not None:
+            sql += " AND (priority, created_at, id) > (?, ?, ?)"
+            params.extend(after)
+        sql += " ORDER BY priority ASC, created_at ASC, id ASC LIMIT ?"
+        params.append(limit)
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def claim(self, request_id: str) -> bool:
+        """Move a pending row to processing; False if another worker got it first."""
+        with self._connect() as conn:
+            result = conn.execute(
+                "UPDATE quota_queue SET status = 'processing' WHERE id = ? AND status = 'pending'",
+                (request_id,),
+            )
+        return result.rowcount == 1
+
+    def finish(self, request_id: str, *, success: bool, result: Any, error: Optional[str], now: float) -> bool:
+        """Complete a request, re-queueing failures with linear backoff until max_retries."""
+        with self._connect() as conn:
+            updated = conn.execute(
+                """
+                UPDATE quota_queue SET
+                    result_json = ?,
+                    error = ?,
+                    status = CASE
+                        WHEN ? THEN 'completed'
+                        WHEN retry_count < max_retries THEN 'pending'
+                        ELSE 'failed'
+                    END,
+                    scheduled_for = CASE
+                        WHEN NOT ? AND retry_count < max_retries THEN ? + 60 * (retry_count + 1)
+                        ELSE scheduled_for
+                    END,
+                    retry_count = CASE
+                        WHEN NOT ? AND retry_count < max_retries THEN retry_count + 1
+                        ELSE retry_count
+                    END
+                WHERE id = ?
+                """,
+                (
+                    json.dumps(result, default=str) if result is not None else None,
+                    error,
+                    success,
+                    success,
+                    now,
+                    success,
+                    request_id,
+                ),
+            )
+        return updated.rowcount == 1
+
+    def prune_queue(self, keep: int) -> int:
+        """Delete completed/failed rows beyond the ``keep`` most recent."""
+        with self._connect() as conn:
+            result = conn.execute(
+                """
+                DELETE FROM quota_queue
+                WHERE status IN (?, ?) AND id NOT IN (
+                    SELECT id FROM quota_queue WHERE status IN (?, ?)
+                    ORDER BY created_at DESC LIMIT ?
+                )
+                """,
+                (*_TERMINAL_STATUSES, *_TERMINAL_STATUSES, max(0, keep)),
+            )
+        return result.rowcount
+
+    def queue_counts(self) -> Tuple[Dict[str, int], Dict[Tuple[int, str], Tuple[int, float]]]:
+        """Return ``({status: count}, {(priority, provider): (count, est_cost)})`` for pending."""
+        with self._connect() as conn:
+            by_status = {
+                row["status"]: row["n"]
+                for row in conn.execute("SELECT status, COUNT(*) AS n FROM quota_queue GROUP BY status")
+            }
+            pending = {
+                (row["priority"], row["provider"]): (row["n"], row["cost"])
+                for row in conn.execute(
+                    """
+                    SELECT priority, provider, COUNT(*) AS n, COALESCE(SUM(estimated_cost), 0) AS cost
+                    FROM quota_queue WHERE status = 'pending'
+                    GROUP BY priority, provider
+                    """
+                )
+            }
+        return by_status, pending
+
+    def pending_count(self) -> int:
+        with self._connect() as conn:
+            return conn.execute(
+                "SELECT COUNT(*) FROM quota_queue WHERE status = 'pending'"
+            ).fetchone()[0]
@@ -18,6 +18,7 @@ Alpha: v1.0.2.1+
 """
 
 import json
+import sqlite3
 import time
 from pathlib import Path
 from datetime import timedelta
@@ -29,6 +30,7 @@ from collections import defaultdict
 from core.services.time_utils import utc_day_string, utc_now, utc_now_iso_z
 from wizard.services.logging_api import get_logger
 from wizard.services.provider_load_logger import log_provider_event
+from wizard.services.quota_store import QuotaStore
 
 logger = get_logger("quota-tracker")
 
@@ -301,144 +303,187 @@ DEFAULT_QUOTAS = {
 }
 
 
+LIMIT_FIELDS = (
+    "requests_per_minute",
+    "requests_per_day",
+    "requests_per_month",
+    "tokens_per_minute",
+    "tokens_per_day",
+    "tokens_per_month",
+    "daily_budget",
+    "monthly_budget",
+    "cost_per_1k_tokens_input",
+    "cost_per_1k_tokens_output",
+    "cost_per_request",
+)
+
+# Usage rows kept in the append-only log (older rows pruned at startup).
+USAGE_LOG_KEEP = 100_000
+# Completed/failed queue rows kept for inspection (older rows pruned at startup).
+QUEUE_HISTORY_KEEP = 10_000
+
+
+def _quota_limits(quota: ProviderQuota) -> Dict[str, Any]:
+    return {key: getattr(quota, key) for key in LIMIT_FIELDS}
+
+
+def _quota_from_row(row: Dict[str, Any]) -> ProviderQuota:
+    quota = ProviderQuota.from_dict(row)
+    quota.requests_this_minute = int(row.get("requests_this_minute", 0) or 0)
+    quota.minute_window_start = float(row.get("minute_window_start", 0.0) or 0.0)
+    quota.last_request_time = float(row.get("last_request_time", 0.0) or 0.0)
+    return quota
+
+
+def _request_from_row(row: Dict[str, Any]) -> QueuedRequest:
+    return QueuedRequest(
+        id=row["id"],
+        provider=APIProvider(row["provider"]),
+        priority=RequestPriority(row["priority"]),
+        endpoint=row.get("endpoint") or "",
+        method=row.get("method") or "POST",
+        payload=json.loads(row.get("payload_json") or "{}"),
+        estimated_tokens=row.get("estimated_tokens") or 0,
+        estimated_cost=row.get("estimated_cost") or 0.0,
+        workflow_id=row.get("workflow_id"),
+        objective_id=row.get("objective_id"),
+        created_at=row.get("created_at") or time.time(),
+        scheduled_for=row.get("scheduled_for"),
+        retry_count=row.get("retry_count") or 0,
+        max_retries=row.get("max_retries", 3),
+        status=row.get("status") or "pending",
+    )
+
+
+def _request_to_row(request: QueuedRequest) -> Dict[str, Any]:
+    return {
+        "id": request.id,
+        "provider": request.provider.value,
+        "priority": request.priority.value,
+        "endpoint": request.endpoint,
+        "method": request.method,
+        "payload_json": json.dumps(request.payload or {}),
+        "estimated_tokens": request.estimated_tokens,
+        "estimated_cost": request.estimated_cost,
+        "workflow_id": request.workflow_id,
+        "objective_id": request.objective_id,
+        "created_at": request.created_at,
+        "scheduled_for": request.scheduled_for,
+        "retry_count": request.retry_count,
+        "max_retries": request.max_retries,
+        "status": request.status,
+    }
+
+
 class QuotaTracker:
     """
     Tracks API quotas and manages request prioritization.
+
+    State lives in ``quotas.db`` (see ``QuotaStore``): counters are advanced
+    in SQL so several processes can record usage without lost updates.
+    Legacy ``quotas.json``/``queue.json`` are imported once into a new store.
     """
 
     CONFIG_DIR = Path(__file__).parent.parent / "config"
     DATA_DIR = Path(__file__).parent.parent.parent / "memory" / "logs" / "quotas"
 
-    def __init__(self):
+    def __init__(self, data_dir: Optional[Path] = None):
         """Initialize quota tracker."""
-        self.CONFIG_DIR.mkdir(parents=True, exist_ok=True)
-        self.DATA_DIR.mkdir(parents=True, exist_ok=True)
+        self.data_dir = Path(data_dir) if data_dir else self.DATA_DIR
+        self.data_dir.mkdir(parents=True, exist_ok=True)
+        self._store = QuotaStore(self.data_dir / "quotas.db")
 
-        # Provider quotas
+        # Provider quotas (limits + last-read counters; the store is authoritative)
         self._quotas: Dict[APIProvider, ProviderQuota] = {}
 
-        # Request queue
-        self._queue: List[QueuedRequest] = []
-
-        # Request history (for analytics)
-        self._history: List[Dict[str, Any]] = []
-
         # Load data
         self._load_quotas()
-        self._load_queue()
+        try:
+            self._store.prune_usage(USAGE_LOG_KEEP)
+            self._store.prune_queue(QUEUE_HISTORY_KEEP)
+        except sqlite3.Error as e:
+            logger.warning(f"[WIZ] Quota log prune failed: {e}")
 
         logger.info(f"[WIZ] QuotaTracker: {len(self._quotas)} providers configured")
 
+    @staticmethod
+    def _periods() -> tuple[str, str, float]:
+        return utc_day_string(), utc_now().strftime("%Y-%m"), time.time()
+
     def _load_quotas(self):
-        """Load quota configurations and usage."""
-        quota_file = self.DATA_DIR / "quotas.json"
+        """Seed provider rows (importing legacy JSON once) and load them."""
+        if self._store.is_empty():
+            self._import_legacy_json()
 
+        # Initialize missing providers with defaults
+        for provider, defaults in DEFAULT_QUOTAS.items():
+            quota = ProviderQuota(provider=provider, **defaults)
+            self._store.seed_provider(provider.value, _quota_limits(quota))
+
+        self._refresh_all()
+
+    def _import_legacy_json(self):
+        """Import pre-SQLite quotas.json/queue.json into the store."""
+        quota_file = self.data_dir / "quotas.json"
         if quota_file.exists():
             try:
                 data = json.loads(quota_file.read_text())
                 for provider_str, quota_data in data.get("quotas", {}).items():
-                    provider = APIProvider(provider_str)
-                    self._quotas[provider] = ProviderQuota.from_dict(quota_data)
+                    quota = ProviderQuota.from_dict({**quota_data, "provider": provider_str})
+                    self._store.seed_provider(
+                        quota.provider.value,
+                        _quota_limits(quota),
+                        {key: value for key, value in quota.to_dict().items() if key not in LIMIT_FIELDS},
+                    )
             except Exception as e:
                 logger.error(f"[ERROR] Failed to load quotas: {e}")
 
-        # Initialize missing providers with defaults
-        for provider, defaults in DEFAULT_QUOTAS.items():
-            if provider not in self._quotas:
-                self._quotas[provider] = ProviderQuota(provider=provider, **defaults)
-
-        # Check for date rollovers
-        self._check_rollovers()
-
-    def _save_quotas(self):
-        """Save quota data."""
-        data = {
-            "version": "1.0.0",
-            "updated_at": utc_now_iso_z(),
-            "quotas": {
-                provider.value: quota.to_dict()
-                for provider, quota in self._quotas.items()
-            },
-        }
-
-        quota_file = self.DATA_DIR / "quotas.json"
-        quota_file.write_text(json.dumps(data, indent=2))
-
-    def _load_queue(self):
-        """Load queued requests."""
-        queue_file = self.DATA_DIR / "queue.json"
-
+        queue_file = self.data_dir / "queue.json"
         if queue_file.exists():
             try:
                 data = json.loads(queue_file.read_text())
+                rows = []
                 for req_data in data.get("queue", []):
-                    req = QueuedRequest(
-                        id=req_data["id"],
-                        provider=APIProvider(req_data["provider"]),
-                        priority=RequestPriority(req_data["priority"]),
-                        endpoint=req_data.get("endpoint", ""),
-                        method=req_data.get("method", "POST"),
-                        payload=req_data.get("payload", {}),
-                        estimated_tokens=req_data.get("estimated_tokens", 0),
-                        estimated_cost=req_data.get("estimated_cost", 0.0),
-                        workflow_id=req_data.get("workflow_id"),
-                        objective_id=req_data.get("objective_id"),
-                        created_at=req_data.get("created_at", time.time()),
-                        status=req_data.get("status", "pending"),
+                    rows.append(
+                        _request_to_row(
+                            QueuedRequest(
+                                id=req_data["id"],
+                                provider=APIProvider(req_data["provider"]),
+                                priority=RequestPriority(req_data["priority"]),
+                                endpoint=req_data.get("endpoint", ""),
+                                method=req_data.get("method", "POST"),
+                                payload=req_data.get("payload", {}),
+                                estimated_tokens=req_data.get("estimated_tokens", 0),
+                                estimated_cost=req_data.get("estimated_cost", 0.0),
+                                workflow_id=req_data.get("workflow_id"),
+                                objective_id=req_data.get("objective_id"),
+                                created_at=req_data.get("created_at", time.time()),
+                                status=req_data.get("status", "pending"),
+                            )
+                        )
                     )
-                    self._queue.append(req)
+                self._store.enqueue(rows)
             except Exception as e:
                 logger.error(f"[ERROR] Failed to load queue: {e}")
 
-    def _save_queue(self):
-        """Save queued requests."""
-        data = {
-            "version": "1.0.0",
-            "updated_at": utc_now_iso_z(),
-            "queue": [
-                {
-                    "id": req.id,
-                    "provider": req.provider.value,
-                    "priority": req.priority.value,
-                    "endpoint": req.endpoint,
-                    "method": req.method,
-                    "payload": req.payload,
-                    "estimated_tokens": req.estimated_tokens,
-                    "estimated_cost": req.estimated_cost,
-                    "workflow_id": req.workflow_id,
-                    "objective_id": req.objective_id,
-                    "created_at": req.created_at,
-                    "status": req.status,
-                }
-                for req in self._queue
-                if req.status == "pending"
-            ],
-        }
-
-        queue_file = self.DATA_DIR / "queue.json"
-        queue_file.write_text(json.dumps(data, indent=2))
-
-    def _check_rollovers(self):
-        """Check and apply date rollovers."""
-        today = utc_day_string()
-        this_month = utc_now().strftime("%Y-%m")
-
-        for quota in self._quotas.values():
-            # Daily rollover
-            if quota.last_daily_reset != today:
-                quota.requests_today = 0
-                quota.tokens_today = 0
-                quota.cost_today = 0.0
-                quota.last_daily_reset = today
-
-            # Monthly rollover
-            if quota.last_monthly_reset != this_month:
-                quota.requests_this_month = 0
-                quota.tokens_this_month = 0
-                quota.cost_this_month = 0.0
-                quota.last_monthly_reset = this_month
-
-        self._save_quotas()
+    def _refresh_all(self) -> Dict[APIProvider, ProviderQuota]:
+        """Reload every provider's effective counters in one query."""
+        for row in self._store.providers(*self._periods()):
+            try:
+                provider = APIProvider(row["provider"])
+            except ValueError:
+                continue
+            self._quotas[provider] = _quota_from_row(row)
+        return self._quotas
+
+    def _refresh(self, provider: APIProvider) -> Optional[ProviderQuota]:
+        """Reload one provider's effective counters."""
+        row = self._store.provider(provider.value, *self._periods())
+        if row is None:
+            return self._quotas.get(provider)
+        quota = _quota_from_row(row)
+        self._quotas[provider] = quota
+        return quota
 
     # === Public API ===
 
@@ -453,15 +498,9 @@ class QuotaTracker:
         Returns:
             True if request is allowed
         """
-        quota = self._quotas.get(provider)
-        if not quota:
+        if provider not in self._quotas:
             return True  # Unknown provider, allow
-
-        # Check rate limit
-        now = time.time()
-        if now - quota.minute_window_start > 60:
-            quota.requests_this_minute = 0
-            quota.minute_window_start = now
+        quota = self._refresh(provider)
 
         if quota.requests_this_minute >= quota.requests_per_minute:
             log_provider_event(
@@ -545,59 +584,42 @@ class QuotaTracker:
 
         total_tokens = tokens_input + tokens_output
 
-        # Update rate limiting
-        now = time.time()
-        if now - quota.minute_window_start > 60:
-            quota.requests_this_minute = 0
-            quota.minute_window_start = now
-        quota.requests_this_minute += 1
-        quota.last_request_time = now
-
-        # Update counts
-        quota.requests_today += 1
-        quota.requests_this_month += 1
-        quota.total_requests += 1
-        quota.tokens_today += total_tokens
-        quota.tokens_this_month += total_tokens
-
         # Calculate cost
         if cost is None:
             cost = self._calculate_cost(provider, tokens_input, tokens_output)
 
-        quota.cost_today += cost
-        quota.cost_this_month += cost
-        quota.total_cost += cost
-
-        # Record in history
-        self._history.append(
-            {
-                "timestamp": utc_now_iso_z(),
-                "provider": provider.value,
-                "tokens_input": tokens_input,
-                "tokens_output": tokens_output,
-                "cost": cost,
-                "success": success,
-                "workflow_id": workflow_id,
-            }
+        today, month, now = self._periods()
+        row = self._store.record_usage(
+            provider.value,
+            limits=_quota_limits(quota),
+            ts=utc_now_iso_z(),
+            today=today,
+            month=month,
+            now=now,
+            tokens_input=tokens_input,
+            tokens_output=tokens_output,
+            cost=cost,
+            success=success,
+            workflow_id=workflow_id,
         )
-
-        # Keep history manageable
-        if len(self._history) > 1000:
-            self._history = self._history[-500:]
-
-        self._save_quotas()
+        self._quotas[provider] = _quota_from_row(row)
 
         logger.info(
             f"[WIZ] API request: {provider.value} "
             f"tokens={total_tokens} cost=${cost:.4f}"
         )
 
+    def get_history(self, limit: int = 50, provider: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Recent usage records (oldest first), optionally for one provider."""
+        return self._store.history(limit=limit, provider=provider)
+
     def get_quota_status(self, provider: APIProvider) -> Dict[str, Any]:
         """Get detailed quota status for a provider."""
-        quota = self._quotas.get(provider)
-        if not quota:
+        if provider not in self._quotas:
             return {"provider": provider.value, "configured": False}
+        return self._status_for(provider, self._refresh(provider))
 
+    def _status_for(self, provider: APIProvider, quota: ProviderQuota) -> Dict[str, Any]:
         return {
             "provider": provider.value,
             "configured": True,
@@ -643,9 +665,11 @@ class QuotaTracker:
             },
         }
 
+        quotas = self._refresh_all()
         for provider in APIProvider:
-            status = self.get_quota_status(provider)
-            if status.get("configured"):
+            quota = quotas.get(provider)
+            if quota is not None:
+                status = self._status_for(provider, quota)
                 result["providers"][provider.value] = status
                 result["totals"]["cost_today"] += status["daily"]["cost"]
                 result["totals"]["cost_this_month"] += status["monthly"]["cost"]
@@ -681,7 +705,7 @@ class QuotaTracker:
             "requests_today": all_quotas["totals"]["requests_today"],
             "active_providers": len(all_quotas["providers"]),
             "warnings": warnings,
-            "queue_size": len([r for r in self._queue if r.status == "pending"]),
+            "queue_size": self._store.pending_count(),
         }
 
     # === Queue Management ===
@@ -727,63 +751,59 @@ class QuotaTracker:
             objective_id=objective_id,
         )
 
-        self._queue.append(request)
-        self._queue.sort(key=lambda r: (r.priority.value, r.created_at))
-
-        self._save_queue()
+        self._store.enqueue([_request_to_row(request)])
 
         logger.info(f"[WIZ] Queued request {request_id} for {provider.value}")
 
         return request_id
 
     def get_next_request(self) -> Optional[QueuedRequest]:
-        """Get next request from queue that can be executed."""
-        for request in self._queue:
-            if request.status != "pending":
-                continue
-
-            if self.can_request(request.provider, request.estimated_tokens):
-                request.status = "processing"
-                return request
-
-        return None
+        """Claim the next due request (priority, then age) whose provider has quota."""
+        allowed: Dict[tuple, bool] = {}
+        after = None
+        page = 50
+        while True:
+            rows = self._store.pending(time.time(), limit=page, after=after)
+            if not rows:
+                return None
+            for row in rows:
+                request = _request_from_row(row)
+                key = (request.provider, request.estimated_tokens)
+                if key not in allowed:
+                    allowed[key] = self.can_request(request.provider, request.estimated_tokens)
+                if not allowed[key]:
+                    continue
+                if self._store.claim(request.id):
+                    request.status = "processing"
+                    return request
+            last = rows[-1]
+            after = (last["priority"], last["created_at"], last["id"])
 
     def complete_request(
         self, request_id: str, success: bool, result: Any = None, error: str = None
     ):
         """Mark a queued request as complete."""
-        for request in self._queue:
-            if request.id == request_id:
-                request.status = "completed" if success else "failed"
-                request.result = result
-                request.error = error
-
-                if not success and request.retry_count < request.max_retries:
-                    request.retry_count += 1
-                    request.status = "pending"
-                    request.scheduled_for = time.time() + (60 * request.retry_count)
-
-                self._save_queue()
-                return
+        self._store.finish(request_id, success=success, result=result, error=error, now=time.time())
 
     def get_queue_status(self) -> Dict[str, Any]:
         """Get queue status."""
-        pending = [r for r in self._queue if r.status == "pending"]
-        processing = [r for r in self._queue if r.status == "processing"]
+        by_status, pending = self._store.queue_counts()
 
         by_priority = defaultdict(int)
         by_provider = defaultdict(int)
+        estimated_cost = 0.0
 
-        for req in pending:
-            by_priority[req.priority.name] += 1
-            by_provider[req.provider.value] += 1
+        for (priority, provider), (count, cost) in pending.items():
+            by_priority[RequestPriority(priority).name] += count
+            by_provider[provider] += count
+            estimated_cost += cost
 
         return {
-            "pending": len(pending),
-            "processing": len(processing),
+            "pending": by_status.get("pending", 0),
+            "processing": by_status.get("processing", 0),
             "by_priority": dict(by_priority),
             "by_provider": dict(by_provider),
-            "estimated_cost": sum(r.estimated_cost for r in pending),
+            "estimated_cost": estimated_cost,
         }
 
     # === Helper Methods ===
@@ -835,7 +855,7 @@ class QuotaTracker:
         if requests_per_day is not None:
             quota.requests_per_day = requests_per_day
 
-        self._save_quotas()
+        self._store.set_limits(provider.value, _quota_limits(quota))
 
 
 # Singleton
@@ -44,6 +44,8 @@ CREATE TABLE IF NOT EXISTS task_queue (
     defer_count INTEGER DEFAULT 0,
     backoff_seconds INTEGER DEFAULT 0,
     last_deferred_at TEXT,
+    lease_owner TEXT,
+    lease_expires_at TEXT,
     FOREIGN KEY(task_id) REFERENCES tasks(id) ON DELETE CASCADE
 );
 
@@ -57,3 +59,4 @@ CREATE INDEX IF NOT EXISTS idx_task_runs_task_id ON task_runs(task_id);
 CREATE INDEX IF NOT EXISTS idx_task_runs_state ON task_runs(state);
 CREATE INDEX IF NOT EXISTS idx_task_queue_state ON task_queue(state);
 CREATE INDEX IF NOT EXISTS idx_task_queue_task_id ON task_queue(task_id);
+CREATE INDEX IF NOT EXISTS idx_task_queue_claim ON task_queue(state, scheduled_for);
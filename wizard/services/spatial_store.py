@@ -2,6 +2,7 @@ import sqlite3
 from pathlib import Path
 from typing import Any, Dict, List, Optional
 
+from core.services.grid_spatial_index import GridSpatialIndex
 from wizard.services.path_utils import get_repo_root, get_vault_dir
 
 SCHEMA_PATH = get_repo_root() / "v1-3" / "core" / "src" / "spatial" / "schema.sql"
@@ -49,3 +50,13 @@ def fetch_spatial_rows(db_path: Path, query: str, params: Optional[tuple] = None
         return [dict(row) for row in rows]
     finally:
         conn.close()
+
+
+def load_place_index(db_path: Path, anchor_id: Optional[str] = None) -> GridSpatialIndex:
+    """Build a spatial index of place_id by loc_id, optionally for one anchor."""
+    query = "SELECT place_id, loc_id FROM places"
+    params: tuple = ()
+    if anchor_id:
+        query += " WHERE anchor_id = ?"
+        params = (anchor_id,)
+    return GridSpatialIndex.from_rows(fetch_spatial_rows(db_path, query, params))
@@ -43,7 +43,17 @@ class WizardStore(ABC):
         raise NotImplementedError
 
     @abstractmethod
-    def claim_due_queue_items(self, *, limit: int = 10) -> list[dict[str, Any]]:
+    def claim_due_queue_items(
+        self,
+        *,
+        limit: int = 10,
+        owner: str | None = None,
+        lease_seconds: int | None = None,
+    ) -> list[dict[str, Any]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def extend_queue_leases(self, queue_ids: list[int], *, owner: str, lease_seconds: int) -> int:
         raise NotImplementedError
 
     @abstractmethod
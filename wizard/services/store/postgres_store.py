@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
 from wizard.services.deploy_mode import require_managed_env
@@ -20,6 +20,11 @@ def _utc_now() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+def _utc_after(seconds: int) -> str:
+    moment = datetime.now(timezone.utc) + timedelta(seconds=seconds)
+    return moment.isoformat().replace("+00:00", "Z")
+
+
 class PostgresWizardStore(WizardStore):
     def __init__(self, dsn: str | None = None):
         if psycopg is None:
@@ -176,31 +181,56 @@ class PostgresWizardStore(WizardStore):
     def get_scheduled_queue(self, *, limit: int = 50) -> list[dict[str, Any]]:
         return self._queue_rows(limit=limit)
 
-    def claim_due_queue_items(self, *, limit: int = 10) -> list[dict[str, Any]]:
+    def claim_due_queue_items(
+        self,
+        *,
+        limit: int = 10,
+        owner: str | None = None,
+        lease_seconds: int | None = None,
+    ) -> list[dict[str, Any]]:
+        now = _utc_now()
+        lease_expires_at = _utc_after(lease_seconds) if lease_seconds else None
         with self._connect() as conn, conn.cursor() as cur:
             cur.execute(
                 """
                 WITH claimed AS (
                     SELECT id
                     FROM task_queue
-                    WHERE state = 'pending' AND scheduled_for <= %s
+                    WHERE (state = 'pending' AND scheduled_for <= %s)
+                       OR (state = 'processing' AND lease_expires_at IS NOT NULL AND lease_expires_at <= %s)
                     ORDER BY scheduled_for ASC
                     LIMIT %s
                     FOR UPDATE SKIP LOCKED
                 )
                 UPDATE task_queue q
-                SET state = 'processing', processed_at = %s
+                SET state = 'processing', processed_at = %s, lease_owner = %s, lease_expires_at = %s
                 FROM claimed
                 WHERE q.id = claimed.id
                 RETURNING q.id
                 """,
-                (_utc_now(), limit, _utc_now()),
+                (now, now, limit, now, owner, lease_expires_at),
             )
             rows = cur.fetchall()
-        claimed = []
-        for row in rows:
-            claimed.extend(self._queue_rows("WHERE q.id = %s", (row["id"],), limit=1))
-        return claimed
+        if not rows:
+            return []
+        return self._queue_rows(
+            "WHERE q.id = ANY(%s)",
+            ([row["id"] for row in rows],),
+            limit=len(rows),
+        )
+
+    def extend_queue_leases(self, queue_ids: list[int], *, owner: str, lease_seconds: int) -> int:
+        if not queue_ids:
+            return 0
+        with self._connect() as conn, conn.cursor() as cur:
+            cur.execute(
+                """
+                UPDATE task_queue SET lease_expires_at = %s
+                WHERE id = ANY(%s) AND state = 'processing' AND lease_owner = %s
+                """,
+                (_utc_after(lease_seconds), list(queue_ids), owner),
+            )
+            return cur.rowcount
 
     def complete_task_run(self, run_id: str, *, result: str, output: str) -> bool:
         now = _utc_now()
@@ -211,7 +241,14 @@ class PostgresWizardStore(WizardStore):
             )
             cur.execute("SELECT task_id FROM task_runs WHERE id = %s", (run_id,))
             row = cur.fetchone()
-            cur.execute("UPDATE task_queue SET state = 'completed', processed_at = %s WHERE run_id = %s", (now, run_id))
+            cur.execute(
+                """
+                UPDATE task_queue
+                SET state = 'completed', processed_at = %s, lease_owner = NULL, lease_expires_at = NULL
+                WHERE run_id = %s
+                """,
+                (now, run_id),
+            )
             if row:
                 cur.execute("UPDATE tasks SET state = 'harvest', updated_at = %s WHERE id = %s", (now, row["task_id"]))
         return True
@@ -235,7 +272,9 @@ class PostgresWizardStore(WizardStore):
                     defer_reason = COALESCE(%s, defer_reason),
                     defer_count = defer_count + 1,
                     backoff_seconds = COALESCE(%s, backoff_seconds),
-                    last_deferred_at = %s
+                    last_deferred_at = %s,
+                    lease_owner = NULL,
+                    lease_expires_at = NULL
                 WHERE id = %s
                 """,
                 (scheduled_iso, reason, backoff_seconds, _utc_now(), queue_id),
@@ -254,7 +293,9 @@ class PostgresWizardStore(WizardStore):
                     defer_reason = NULL,
                     defer_count = 0,
                     backoff_seconds = 0,
-                    last_deferred_at = NULL
+                    last_deferred_at = NULL,
+                    lease_owner = NULL,
+                    lease_expires_at = NULL
                 WHERE id = %s
                 RETURNING id
                 """,
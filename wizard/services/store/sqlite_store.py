@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import json
+import os
 import sqlite3
+import threading
 import uuid
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any
 
@@ -18,17 +20,43 @@ def _utc_now() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+def _utc_after(seconds: int) -> str:
+    moment = datetime.now(timezone.utc) + timedelta(seconds=seconds)
+    return moment.isoformat().replace("+00:00", "Z")
+
+
 class SQLiteWizardStore(WizardStore):
     def __init__(self, db_path: Path):
         self.db_path = Path(db_path)
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
         self._init_db()
 
     def _connect(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
+        """Return this thread's long-lived connection (WAL, busy timeout).
+
+        ``with conn:`` blocks still commit or roll back per operation; the
+        connection itself stays open so workers do not reconnect per call.
+        A forked child opens its own connection instead of reusing the parent's.
+        """
+        conn = getattr(self._local, "conn", None)
+        if conn is not None and self._local.pid == os.getpid():
+            return conn
+        conn = sqlite3.connect(self.db_path, timeout=5.0)
         conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("PRAGMA busy_timeout = 5000")
+        self._local.conn = conn
+        self._local.pid = os.getpid()
         return conn
 
+    def close(self) -> None:
+        """Close the calling thread's pooled connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
     def _init_db(self) -> None:
         if not _TASK_SCHEMA_PATH.exists():
             raise FileNotFoundError(f"Task schema file missing: {_TASK_SCHEMA_PATH}")
@@ -122,6 +150,13 @@ class SQLiteWizardStore(WizardStore):
                 conn.execute("ALTER TABLE task_queue ADD COLUMN backoff_seconds INTEGER DEFAULT 0")
             if "last_deferred_at" not in queue_columns:
                 conn.execute("ALTER TABLE task_queue ADD COLUMN last_deferred_at TEXT")
+            if "lease_owner" not in queue_columns:
+                conn.execute("ALTER TABLE task_queue ADD COLUMN lease_owner TEXT")
+            if "lease_expires_at" not in queue_columns:
+                conn.execute("ALTER TABLE task_queue ADD COLUMN lease_expires_at TEXT")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_task_queue_claim ON task_queue(state, scheduled_for)"
+            )
 
     def _json_dump(self, value: Any) -> str:
         return json.dumps(value or {})
@@ -304,27 +339,55 @@ class SQLiteWizardStore(WizardStore):
     def get_scheduled_queue(self, *, limit: int = 50) -> list[dict[str, Any]]:
         return self._queue_rows(limit=limit)
 
-    def claim_due_queue_items(self, *, limit: int = 10) -> list[dict[str, Any]]:
-        claimed: list[dict[str, Any]] = []
+    def claim_due_queue_items(
+        self,
+        *,
+        limit: int = 10,
+        owner: str | None = None,
+        lease_seconds: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Atomically claim up to ``limit`` due items in one UPDATE ... RETURNING.
+
+        Items whose lease has expired (their worker died mid-run) are claimable
+        again, so several runners can share one queue without double execution.
+        """
+        now = _utc_now()
+        lease_expires_at = _utc_after(lease_seconds) if lease_seconds else None
         with self._connect() as conn:
             rows = conn.execute(
                 """
-                SELECT q.id
-                FROM task_queue q
-                WHERE q.state = 'pending' AND q.scheduled_for <= ?
-                ORDER BY q.scheduled_for ASC
-                LIMIT ?
+                UPDATE task_queue
+                SET state = 'processing', processed_at = ?, lease_owner = ?, lease_expires_at = ?
+                WHERE id IN (
+                    SELECT id FROM task_queue
+                    WHERE (state = 'pending' AND scheduled_for <= ?)
+                       OR (state = 'processing' AND lease_expires_at IS NOT NULL AND lease_expires_at <= ?)
+                    ORDER BY scheduled_for ASC
+                    LIMIT ?
+                )
+                RETURNING id
                 """,
-                (_utc_now(), limit),
+                (now, owner, lease_expires_at, now, now, limit),
             ).fetchall()
-            for row in rows:
-                updated = conn.execute(
-                    "UPDATE task_queue SET state = 'processing', processed_at = ? WHERE id = ? AND state = 'pending'",
-                    (_utc_now(), row["id"]),
-                )
-                if updated.rowcount:
-                    claimed.append(self._queue_rows("WHERE q.id = ?", (row["id"],), limit=1)[0])
-        return claimed
+        ids = [row["id"] for row in rows]
+        if not ids:
+            return []
+        placeholders = ", ".join("?" for _ in ids)
+        return self._queue_rows(f"WHERE q.id IN ({placeholders})", tuple(ids), limit=len(ids))
+
+    def extend_queue_leases(self, queue_ids: list[int], *, owner: str, lease_seconds: int) -> int:
+        if not queue_ids:
+            return 0
+        placeholders = ", ".join("?" for _ in queue_ids)
+        with self._connect() as conn:
+            result = conn.execute(
+                f"""
+                UPDATE task_queue SET lease_expires_at = ?
+                WHERE id IN ({placeholders}) AND state = 'processing' AND lease_owner = ?
+                """,
+                (_utc_after(lease_seconds), *queue_ids, owner),
+            )
+        return result.rowcount
 
     def complete_task_run(self, run_id: str, *, result: str, output: str) -> bool:
         now = _utc_now()
@@ -335,7 +398,11 @@ class SQLiteWizardStore(WizardStore):
             )
             row = conn.execute("SELECT task_id FROM task_runs WHERE id = ?", (run_id,)).fetchone()
             conn.execute(
-                "UPDATE task_queue SET state = 'completed', processed_at = ? WHERE run_id = ?",
+                """
+                UPDATE task_queue
+                SET state = 'completed', processed_at = ?, lease_owner = NULL, lease_expires_at = NULL
+                WHERE run_id = ?
+                """,
                 (now, run_id),
             )
             if row:
@@ -364,7 +431,9 @@ class SQLiteWizardStore(WizardStore):
                     defer_reason = COALESCE(?, defer_reason),
                     defer_count = defer_count + 1,
                     backoff_seconds = COALESCE(?, backoff_seconds),
-                    last_deferred_at = ?
+                    last_deferred_at = ?,
+                    lease_owner = NULL,
+                    lease_expires_at = NULL
                 WHERE id = ?
                 """,
                 (scheduled_iso, reason, backoff_seconds, _utc_now(), queue_id),
@@ -383,7 +452,9 @@ class SQLiteWizardStore(WizardStore):
                     defer_reason = NULL,
                     defer_count = 0,
                     backoff_seconds = 0,
-                    last_deferred_at = NULL
+                    last_deferred_at = NULL,
+                    lease_owner = NULL,
+                    lease_expires_at = NULL
                 WHERE id = ?
                 """,
                 (now, queue_id),
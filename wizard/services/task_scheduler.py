@@ -6,6 +6,7 @@ import json
 import socket
 import logging
 import sqlite3
+import threading
 import uuid
 import hashlib
 from datetime import UTC, datetime, timedelta, time
@@ -42,6 +43,10 @@ DEFAULT_SETTINGS = {
     "auto_retry_deferred_reasons": ["network_unavailable"],
     "auto_retry_deferred_limit": 10,
     "maintenance_retry_dry_run": False,
+    "runner_mode": "tick",
+    "batch_size": 8,
+    "batch_workers": 4,
+    "lease_seconds": 300,
     "auto_retry_deferred_policy": {
         "network_unavailable": {"enabled": True, "limit": 10, "dry_run": False, "window": ""},
     },
@@ -85,6 +90,7 @@ class TaskScheduler:
             None if self._managed else self.db_path
         )
         self.workflow_scheduler = WorkflowScheduler(Path(repo_root))
+        self._budget_lock = threading.Lock()
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         if not self._managed:
             self._init_db()
@@ -131,6 +137,8 @@ class TaskScheduler:
         self._add_column(conn, "task_queue", queue_columns, "defer_count", "INTEGER DEFAULT 0")
         self._add_column(conn, "task_queue", queue_columns, "backoff_seconds", "INTEGER DEFAULT 0")
         self._add_column(conn, "task_queue", queue_columns, "last_deferred_at", "TEXT")
+        self._add_column(conn, "task_queue", queue_columns, "lease_owner", "TEXT")
+        self._add_column(conn, "task_queue", queue_columns, "lease_expires_at", "TEXT")
 
     def get_settings(self) -> Dict[str, Any]:
         if self._managed:
@@ -204,6 +212,11 @@ class TaskScheduler:
         ]
         merged["auto_retry_deferred_limit"] = int(merged.get("auto_retry_deferred_limit", 10) or 0)
         merged["maintenance_retry_dry_run"] = bool(merged.get("maintenance_retry_dry_run", False))
+        runner_mode = str(merged.get("runner_mode") or "tick").strip().lower()
+        merged["runner_mode"] = runner_mode if runner_mode in {"tick", "batch"} else "tick"
+        merged["batch_size"] = max(1, int(merged.get("batch_size", 8) or 8))
+        merged["batch_workers"] = max(1, int(merged.get("batch_workers", 4) or 4))
+        merged["lease_seconds"] = max(30, int(merged.get("lease_seconds", 300) or 300))
         merged["auto_retry_deferred_policy"] = self._normalize_auto_retry_policy(
             merged.get("auto_retry_deferred_policy")
         )
@@ -540,7 +553,8 @@ class TaskScheduler:
                 row = cursor.fetchone()
                 task_id = row[0] if row else None
                 conn.execute(
-                    "UPDATE task_queue SET state='completed', processed_at=CURRENT_TIMESTAMP WHERE run_id=?",
+                    "UPDATE task_queue SET state='completed', processed_at=CURRENT_TIMESTAMP, "
+                    "lease_owner=NULL, lease_expires_at=NULL WHERE run_id=?",
                     (run_id,),
                 )
                 if task_id:
@@ -579,7 +593,9 @@ class TaskScheduler:
                         defer_reason = COALESCE(?, defer_reason),
                         defer_count = COALESCE(defer_count, 0) + 1,
                         backoff_seconds = COALESCE(?, backoff_seconds),
-                        last_deferred_at = ?
+                        last_deferred_at = ?,
+                        lease_owner = NULL,
+                        lease_expires_at = NULL
                     WHERE id = ?
                     """,
                     (
@@ -1001,12 +1017,16 @@ class TaskScheduler:
         except OSError:
             return False
 
+    def network_available(self, settings: Optional[Dict[str, Any]] = None) -> bool:
+        """Whether tasks may use the network: allowed by settings and reachable."""
+        settings = settings if settings is not None else self.get_settings()
+        return bool(settings.get("allow_network", True)) and self._network_available()
+
     def run_pending(self, max_tasks: Optional[int] = None) -> Dict[str, Any]:
         """Schedule due tasks and execute a paced batch."""
         settings = self.get_settings()
         if max_tasks is None:
             max_tasks = int(settings.get("max_tasks_per_tick", 2))
-        allow_network = bool(settings.get("allow_network", True))
         scheduled = self.schedule_due_tasks()
         pending = (
             self.store.claim_due_queue_items(limit=20)
@@ -1018,77 +1038,132 @@ class TaskScheduler:
 
         pending.sort(key=self._score_task, reverse=True)
         executed = 0
-        network_ok = self._network_available() if allow_network else False
+        network_ok = self.network_available(settings)
         deferred = 0
         now = utc_now()
         for item in pending:
             if executed >= max_tasks:
                 break
-            if not self._within_window(item, now, settings):
-                self._defer_queue_item(
-                    item,
-                    reason="waiting_for_window",
-                    now=now,
-                    settings=settings,
-                    preferred_time=self._next_window_start(item, now, settings),
-                )
-                deferred += 1
-                continue
-            if not self._resources_ok(item):
-                self._defer_queue_item(
-                    item,
-                    reason="resource_pressure",
-                    now=now,
-                    settings=settings,
-                )
-                deferred += 1
-                continue
-            if item.get("requires_network") and not network_ok:
-                self._defer_queue_item(
-                    item,
-                    reason="network_unavailable",
-                    now=now,
-                    settings=settings,
-                )
-                deferred += 1
-                continue
-            if not self._budget_allows(item, settings, now):
-                self._defer_queue_item(
-                    item,
-                    reason="api_budget_exhausted",
-                    now=now,
-                    settings=settings,
-                    preferred_time=self._next_window_start(item, now + timedelta(days=1), settings),
-                )
-                deferred += 1
-                continue
-            if (not self._managed) and (not self.mark_processing(item["id"])):
-                continue
-            execution = self._execute_task_item(item)
-            if execution.get("defer_reason"):
-                defer_until = execution.get("defer_until")
-                scheduled_for = None
-                if isinstance(defer_until, datetime):
-                    scheduled_for = defer_until
-                elif isinstance(defer_until, str):
-                    try:
-                        scheduled_for = parse_utc_datetime(defer_until)
-                    except ValueError:
-                        scheduled_for = now + timedelta(hours=1)
-                self._defer_queue_item(
-                    item,
-                    reason=str(execution["defer_reason"]),
-                    now=now,
-                    settings=settings,
-                    preferred_time=scheduled_for,
-                )
+            outcome, settings = self._process_item(
+                item,
+                settings=settings,
+                now=now,
+                network_ok=network_ok,
+                claimed=self._managed,
+            )
+            if outcome == "executed":
+                executed += 1
+            elif outcome == "deferred":
                 deferred += 1
-                continue
-            self.complete_task(item["run_id"], result=str(execution["result"]), output=str(execution["output"]))
-            settings = self._record_budget_use(item, settings, now)
-            executed += 1
         return {"scheduled": scheduled, "executed": executed, "deferred": deferred}
 
+    def claim_batch(self, limit: int, *, owner: str, lease_seconds: int) -> List[Dict[str, Any]]:
+        """Schedule due tasks, then atomically lease up to ``limit`` queue items."""
+        self.schedule_due_tasks()
+        claimed = self.store.claim_due_queue_items(limit=limit, owner=owner, lease_seconds=lease_seconds)
+        claimed.sort(key=self._score_task, reverse=True)
+        return claimed
+
+    def renew_leases(self, queue_ids: List[int], *, owner: str, lease_seconds: int) -> int:
+        """Extend leases held by ``owner`` (worker heartbeat)."""
+        return self.store.extend_queue_leases(queue_ids, owner=owner, lease_seconds=lease_seconds)
+
+    def run_claimed_item(self, item: Dict[str, Any], *, network_ok: Optional[bool] = None) -> str:
+        """Gate and execute one leased item; safe to call from worker threads."""
+        settings = self.get_settings()
+        if network_ok is None:
+            network_ok = self.network_available(settings)
+        outcome, _ = self._process_item(
+            item,
+            settings=settings,
+            now=utc_now(),
+            network_ok=network_ok,
+            claimed=True,
+        )
+        return outcome
+
+    def _process_item(
+        self,
+        item: Dict[str, Any],
+        *,
+        settings: Dict[str, Any],
+        now: datetime,
+        network_ok: bool,
+        claimed: bool,
+    ) -> tuple[str, Dict[str, Any]]:
+        """Run one queue item through window/resource/network/budget gates.
+
+        Returns ``(outcome, settings)`` where outcome is ``executed``,
+        ``deferred`` or ``skipped``. Claimed items are already leased and
+        re-read budget settings under a lock so concurrent workers share one
+        daily budget.
+        """
+        if not self._within_window(item, now, settings):
+            self._defer_queue_item(
+                item,
+                reason="waiting_for_window",
+                now=now,
+                settings=settings,
+                preferred_time=self._next_window_start(item, now, settings),
+            )
+            return "deferred", settings
+        if not self._resources_ok(item):
+            self._defer_queue_item(
+                item,
+                reason="resource_pressure",
+                now=now,
+                settings=settings,
+            )
+            return "deferred", settings
+        if item.get("requires_network") and not network_ok:
+            self._defer_queue_item(
+                item,
+                reason="network_unavailable",
+                now=now,
+                settings=settings,
+            )
+            return "deferred", settings
+        with self._budget_lock:
+            if claimed:
+                settings = self.get_settings()
+            budget_ok = self._budget_allows(item, settings, now)
+        if not budget_ok:
+            self._defer_queue_item(
+                item,
+                reason="api_budget_exhausted",
+                now=now,
+                settings=settings,
+                preferred_time=self._next_window_start(item, now + timedelta(days=1), settings),
+            )
+            return "deferred", settings
+        if (not claimed) and (not self.mark_processing(item["id"])):
+            return "skipped", settings
+        execution = self._execute_task_item(item)
+        if execution.get("defer_reason"):
+            defer_until = execution.get("defer_until")
+            scheduled_for = None
+            if isinstance(defer_until, datetime):
+                scheduled_for = defer_until
+            elif isinstance(defer_until, str):
+                try:
+                    scheduled_for = parse_utc_datetime(defer_until)
+                except ValueError:
+                    scheduled_for = now + timedelta(hours=1)
+            self._defer_queue_item(
+                item,
+                reason=str(execution["defer_reason"]),
+                now=now,
+                settings=settings,
+                preferred_time=scheduled_for,
+            )
+            return "deferred", settings
+        self.complete_task(item["run_id"], result=str(execution["result"]), output=str(execution["output"]))
+        with self._budget_lock:
+            if claimed:
+                settings = self.get_settings()
+            settings = self._record_budget_use(item, settings, now)
+        return "executed", settings
+
     def _ensure_workflow_from_source(self, payload: Dict[str, Any]) -> str:
         workflow_id = str(payload.get("workflow_id") or Path(str(payload.get("source_path", "workflow"))).stem)
         try:
@@ -1,16 +1,33 @@
-"""Background runner for TaskScheduler."""
+"""Background runner for TaskScheduler.
+
+Two modes, picked from the scheduler's ``runner_mode`` setting:
+
+- ``tick`` (default): call ``run_pending`` once per tick.
+- ``batch``: lease a batch of due items with an atomic claim, run them on a
+  bounded worker pool and heartbeat the leases while they run. Several runner
+  processes can share one queue; an item whose runner dies is reclaimed once
+  its lease expires.
+"""
 
 from __future__ import annotations
 
+import os
+import socket
 import threading
 import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import Any
+from typing import Any, Dict, List
 
 from wizard.services.logging_api import get_logger
 from wizard.services.task_scheduler import TaskScheduler
 
 
+def _default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
 @dataclass
 class TaskSchedulerRunner:
     """Run TaskScheduler in a background thread."""
@@ -21,6 +38,7 @@ class TaskSchedulerRunner:
             "wizard", category="scheduler", name="wizard-scheduler"
         )
     )
+    worker_id: str = field(default_factory=_default_worker_id)
     _stop: threading.Event = field(default_factory=threading.Event, init=False)
     _thread: threading.Thread = field(default=None, init=False)
 
@@ -45,7 +63,13 @@ class TaskSchedulerRunner:
                     if tick_seconds < 5:
                         tick_seconds = 5
                     wait_seconds = tick_seconds
-                    result = self.scheduler.run_pending(max_tasks=max_tasks)
+                    if settings.get("runner_mode") == "batch":
+                        result = self.run_batch(settings)
+                        if result["claimed"] >= result["batch_size"]:
+                            # Queue still has work: go again without waiting a tick.
+                            wait_seconds = 0
+                    else:
+                        result = self.scheduler.run_pending(max_tasks=max_tasks)
                     if result.get("executed", 0):
                         self.logger.info(
                             f"[WIZ] Scheduler executed {result.get('executed')} task(s)"
@@ -64,5 +88,57 @@ class TaskSchedulerRunner:
         self._thread = threading.Thread(target=loop, daemon=True)
         self._thread.start()
 
+    def run_batch(self, settings: Dict[str, Any] | None = None) -> Dict[str, int]:
+        """Claim one batch, execute it on the worker pool and wait for it."""
+        settings = settings or self.scheduler.get_settings()
+        batch_size = int(settings.get("batch_size", 8))
+        workers = int(settings.get("batch_workers", 4))
+        lease_seconds = int(settings.get("lease_seconds", 300))
+        counts = {"batch_size": batch_size, "claimed": 0, "executed": 0, "deferred": 0, "failed": 0}
+
+        items = self.scheduler.claim_batch(batch_size, owner=self.worker_id, lease_seconds=lease_seconds)
+        counts["claimed"] = len(items)
+        if not items:
+            return counts
+
+        network_ok = self.scheduler.network_available(settings)
+        running: List[int] = [int(item["id"]) for item in items]
+        running_lock = threading.Lock()
+        done = threading.Event()
+
+        def heartbeat() -> None:
+            interval = max(1.0, lease_seconds / 3)
+            while not done.wait(interval):
+                with running_lock:
+                    ids = list(running)
+                if ids:
+                    try:
+                        self.scheduler.renew_leases(ids, owner=self.worker_id, lease_seconds=lease_seconds)
+                    except Exception as exc:
+                        self.logger.warn("[WIZ] Scheduler lease heartbeat error: %s", exc)
+
+        def work(item: Dict[str, Any]) -> str:
+            try:
+                return self.scheduler.run_claimed_item(item, network_ok=network_ok)
+            except Exception as exc:
+                self.logger.warn("[WIZ] Scheduler task %s failed: %s", item.get("task_id"), exc)
+                self.scheduler.complete_task(item["run_id"], result="error", output=str(exc))
+                return "failed"
+            finally:
+                with running_lock:
+                    running.remove(int(item["id"]))
+
+        beat = threading.Thread(target=heartbeat, daemon=True)
+        beat.start()
+        try:
+            with ThreadPoolExecutor(max_workers=min(workers, len(items))) as pool:
+                for outcome in pool.map(work, items):
+                    if outcome in counts:
+                        counts[outcome] += 1
+        finally:
+            done.set()
+            beat.join()
+        return counts
+
     def stop(self) -> None:
         self._stop.set()
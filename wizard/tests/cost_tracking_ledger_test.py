@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+
+from wizard.services.cost_tracking import CostTracker, Provider, ResourceType
+
+
+def test_rollups_answer_daily_monthly_and_report_queries(tmp_path):
+    tracker = CostTracker(data_path=tmp_path)
+    tracker.record_usage(ResourceType.AI_TOKENS, Provider.OPENAI, 2000, {"type": "input"})
+    tracker.record_usage(ResourceType.AI_TOKENS, Provider.ANTHROPIC, 1000)
+    tracker.record_usage(ResourceType.WEB_REQUESTS, Provider.WEB, 3)
+
+    today = datetime.now().date()
+    assert tracker.get_daily_usage(ResourceType.AI_TOKENS.value, today) == 3000
+    assert tracker.get_monthly_usage(ResourceType.AI_TOKENS.value, today.year, today.month) == 3000
+    assert round(tracker.get_daily_cost(today), 6) == round(0.02 + 0.075, 6)
+
+    report = tracker.generate_report(days=7)
+    assert report.entries_count == 3
+    assert report.by_resource == {"ai_tokens": 3000.0, "web_requests": 3.0}
+    assert round(report.by_provider["anthropic"], 6) == 0.075
+
+    dashboard = tracker.get_dashboard_data()
+    assert dashboard["today"]["by_resource"]["web_requests"]["usage"] == 3
+    assert dashboard["today"]["by_resource"]["storage_mb"]["usage"] == 0
+
+    out = tmp_path / "usage.csv"
+    assert tracker.export_csv(today, today, str(out))
+    lines = out.read_text().splitlines()
+    assert lines[0] == "timestamp,resource,provider,amount,cost_usd"
+    assert [line.split(",")[2] for line in lines[1:]] == ["openai", "anthropic", "web"]
+
+
+def test_legacy_day_files_are_imported_once(tmp_path):
+    entries = [
+        {
+            "timestamp": "2026-01-05T10:00:00",
+            "resource": "ai_requests",
+            "provider": "openai",
+            "amount": 4,
+            "cost_usd": 0.5,
+            "metadata": {},
+        }
+    ]
+    (tmp_path / "usage-2026-01-05.json").write_text(json.dumps(entries))
+
+    CostTracker(data_path=tmp_path)
+    tracker = CostTracker(data_path=tmp_path)
+    assert tracker.get_monthly_usage("ai_requests", 2026, 1) == 4
+    assert tracker.get_monthly_usage("ai_requests", 2026, 2) == 0
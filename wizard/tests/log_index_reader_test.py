@@ -0,0 +1,114 @@
+import json
+import os
+
+import wizard.services.log_index as log_index_module
+import wizard.services.log_reader as log_reader_module
+from wizard.services.log_index import LogIndex, tail_lines
+from wizard.services.log_reader import LogReader
+
+
+def _write(path, records, mode="a"):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with path.open(mode, encoding="utf-8") as handle:
+        for record in records:
+            handle.write(json.dumps(record) + "\n")
+
+
+def _record(ts, level="info", msg="", category="general"):
+    return {"ts": ts, "level": level, "msg": msg, "category": category, "component": "wizard"}
+
+
+def test_tail_lines_reads_backwards_across_blocks(tmp_path):
+    path = tmp_path / "big.jsonl"
+    path.write_text("".join(f"line-{idx}\n" for idx in range(1000)), encoding="utf-8")
+    assert tail_lines(path, 3, block_size=16) == ["line-997", "line-998", "line-999"]
+    assert tail_lines(path, 0) == []
+    assert tail_lines(tmp_path / "missing.jsonl", 5) == []
+
+
+def test_log_index_refresh_is_incremental(tmp_path):
+    log_file = tmp_path / "wizard" / "wizard-server-2026-01-01.jsonl"
+    _write(log_file, [_record(f"2026-01-01T00:00:0{idx}+00:00", msg=str(idx)) for idx in range(3)])
+    index = LogIndex(tmp_path, min_interval=0)
+
+    assert index.refresh()["new_entries"] == 3
+    assert index.refresh()["new_entries"] == 0
+
+    with log_file.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(_record("2026-01-01T00:00:05+00:00", level="error", msg="3")) + "\n")
+        handle.write('{"ts": "partial')
+    assert index.refresh()["new_entries"] == 1
+
+    refs = index.query(level="ERROR")
+    assert [json.loads(line)["msg"] for _, line in index.read_lines(refs)] == ["3"]
+
+    log_file.write_text(json.dumps(_record("2026-01-02T00:00:00+00:00", msg="fresh")) + "\n", encoding="utf-8")
+    stats = index.refresh()
+    assert stats["reindexed"] == 1
+    assert [json.loads(line)["msg"] for _, line in index.read_lines(index.query())] == ["fresh"]
+
+
+def test_log_index_lists_only_changed_directories(tmp_path, monkeypatch):
+    old = tmp_path / "wizard" / "wizard-server-2026-01-01.jsonl"
+    live = tmp_path / "core" / "core-2026-01-02.jsonl"
+    _write(old, [_record("2026-01-01T00:00:00Z", msg="old")])
+    _write(live, [_record("2026-01-02T00:00:00Z", msg="live")])
+    index = LogIndex(tmp_path, min_interval=0)
+    assert index.refresh()["new_entries"] == 2
+    for directory in (tmp_path, old.parent, live.parent):
+        os.utime(directory, (1_700_000_000, 1_700_000_000))
+    index.refresh()
+
+    listed = []
+    real_scandir = os.scandir
+
+    def scandir(path):
+        listed.append(path)
+        return real_scandir(path)
+
+    monkeypatch.setattr(log_index_module.os, "scandir", scandir)
+    _write(live, [_record("2026-01-02T00:00:01Z", msg="appended")])
+    assert index.refresh()["new_entries"] == 1
+    assert listed == []
+
+    old.unlink()
+    stats = index.refresh()
+    assert listed == [str(old.parent)]
+    assert stats["removed"] == 1
+    assert [json.loads(line)["msg"] for _, line in index.read_lines(index.query())] == ["appended", "live"]
+
+
+def test_log_index_throttles_refresh_and_caps_entries(tmp_path):
+    log_file = tmp_path / "wizard" / "wizard-server-2026-01-01.jsonl"
+    _write(log_file, [_record(f"2026-01-01T00:00:0{idx}Z", msg=str(idx)) for idx in range(5)])
+    index = LogIndex(tmp_path, min_interval=60, max_entries=3)
+
+    assert index.refresh() == {"files": 1, "reindexed": 0, "new_entries": 5, "removed": 0, "pruned": 2}
+    _write(log_file, [_record("2026-01-01T00:00:09Z", msg="9")])
+    assert index.refresh()["new_entries"] == 0
+    assert [json.loads(line)["msg"] for _, line in index.read_lines(index.query())] == ["4", "3", "2"]
+
+
+def test_read_logs_uses_index_sorted_and_filtered(tmp_path, monkeypatch):
+    monkeypatch.setattr(log_reader_module, "get_logs_root", lambda: tmp_path)
+    monkeypatch.setattr(log_reader_module, "get_log_stats", lambda: {})
+    _write(
+        tmp_path / "wizard" / "wizard-server-2026-01-01.jsonl",
+        [
+            _record("2026-01-01T10:00:00Z", msg="old"),
+            _record("2026-01-01T12:00:00Z", level="error", msg="boom"),
+        ],
+    )
+    _write(
+        tmp_path / "core" / "core-2026-01-01.jsonl",
+        [_record("2026-01-01T11:00:00+00:00", msg="core-mid")],
+    )
+
+    reader = LogReader()
+    result = reader.read_logs("all", limit=2)
+    assert [entry["message"] for entry in result["logs"]] == ["boom", "core-mid"]
+    assert result["categories"] == ["core", "wizard"]
+
+    wizard_only = reader.read_logs("wizard", limit=10, level="info")
+    assert [entry["message"] for entry in wizard_only["logs"]] == ["old"]
+    assert "timestamp_sort" not in wizard_only["logs"][0]
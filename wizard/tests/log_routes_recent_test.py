@@ -0,0 +1,35 @@
+import importlib
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+
+def _client(tmp_path, monkeypatch):
+    monkeypatch.setenv("UDOS_LOG_ROOT", str(tmp_path))
+    core_logging = importlib.import_module("core.services.logging_api")
+    core_logging._LOG_MANAGER = None
+
+    from wizard.routes.log_routes import create_log_routes
+
+    app = FastAPI()
+    app.include_router(create_log_routes(auth_guard=None))
+    return TestClient(app), core_logging
+
+
+def test_recent_logs_reads_ring_without_disk(tmp_path, monkeypatch):
+    client, core_logging = _client(tmp_path, monkeypatch)
+    logger = core_logging.get_logger("wizard", category="recent-test", name="wizard-recent")
+    logger.info("first")
+    logger.error("second")
+
+    response = client.get("/api/logs/recent", params={"category": "recent-test", "level": "error"})
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["count"] == 1
+    assert payload["entries"][0]["msg"] == "second"
+
+
+def test_recent_logs_rejects_bad_time_bound(tmp_path, monkeypatch):
+    client, _ = _client(tmp_path, monkeypatch)
+    response = client.get("/api/logs/recent", params={"since": "not-a-date"})
+    assert response.status_code == 400
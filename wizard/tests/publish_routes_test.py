@@ -170,3 +170,30 @@ def test_oc_app_render_rejects_invalid_session_boundary():
     )
     assert forbidden_secret.status_code == 400
     assert "forbidden secret keys" in forbidden_secret.json()["detail"]
+
+
+def test_publish_binder_feed_conditional_get(tmp_path):
+    binder = tmp_path / "memory" / "vault" / "@binders" / "notes"
+    binder.mkdir(parents=True)
+    (binder / "one.md").write_text("---\ntitle: One\ndate: 2026-02-01\n---\n\nHello.\n", encoding="utf-8")
+    app = FastAPI()
+    app.include_router(create_publish_routes(publish_service=PublishService(repo_root=tmp_path)))
+    client = TestClient(app)
+
+    res = client.get("/api/publish/feeds/notes", params={"format": "json"})
+    assert res.status_code == 200
+    assert res.json()["items"][0]["title"] == "One"
+    etag = res.headers["etag"]
+    assert res.headers["last-modified"]
+    assert list((tmp_path / "memory" / "bank" / "binder" / "feed-cache").glob("*.json"))
+
+    cached = client.get("/api/publish/feeds/notes", params={"format": "json"}, headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.headers["etag"] == etag
+
+    rss = client.get("/api/publish/feeds/notes", headers={"If-None-Match": etag})
+    assert rss.status_code == 200
+    assert rss.headers["content-type"].startswith("application/rss+xml")
+
+    assert client.get("/api/publish/feeds/missing").status_code == 404
+    assert client.get("/api/publish/feeds/.hidden").status_code == 400
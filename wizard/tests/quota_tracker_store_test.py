@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import json
+import threading
+
+from wizard.services.quota_store import QuotaStore
+from wizard.services.quota_tracker import APIProvider, QuotaTracker, RequestPriority
+
+
+def test_record_request_accumulates_across_tracker_instances(tmp_path):
+    trackers = [QuotaTracker(data_dir=tmp_path) for _ in range(3)]
+
+    def worker(tracker: QuotaTracker) -> None:
+        for _ in range(20):
+            tracker.record_request(APIProvider.MISTRAL, tokens_input=10, tokens_output=5, cost=0.01)
+
+    threads = [threading.Thread(target=worker, args=(tracker,)) for tracker in trackers]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    status = QuotaTracker(data_dir=tmp_path).get_quota_status(APIProvider.MISTRAL)
+    assert status["daily"]["requests"] == 60
+    assert status["daily"]["tokens"] == 900
+    assert status["totals"]["cost"] == 0.6
+    history = trackers[0].get_history(limit=5, provider="mistral")
+    assert len(history) == 5
+    assert history[-1]["tokens_output"] == 5
+
+
+def test_counters_roll_over_by_day(tmp_path, monkeypatch):
+    tracker = QuotaTracker(data_dir=tmp_path)
+    tracker.record_request(APIProvider.OPENAI, tokens_input=100, cost=0.5)
+    monkeypatch.setattr(QuotaTracker, "_periods", staticmethod(lambda: ("2999-01-01", "2999-01", 0.0)))
+
+    status = tracker.get_quota_status(APIProvider.OPENAI)
+    assert status["daily"]["requests"] == 0
+    assert status["monthly"]["cost"] == 0
+    assert status["totals"]["requests"] == 1
+
+    tracker.record_request(APIProvider.OPENAI, tokens_input=10, cost=0.1)
+    assert tracker.get_quota_status(APIProvider.OPENAI)["daily"]["requests"] == 1
+
+
+def test_queue_pops_by_priority_and_retries_failures(tmp_path):
+    tracker = QuotaTracker(data_dir=tmp_path)
+    low = tracker.queue_request(APIProvider.GITHUB, "/low", {}, priority=RequestPriority.LOW)
+    high = tracker.queue_request(APIProvider.GITHUB, "/high", {"a": 1}, priority=RequestPriority.HIGH)
+
+    status = tracker.get_queue_status()
+    assert status["pending"] == 2
+    assert status["by_priority"] == {"LOW": 1, "HIGH": 1}
+
+    first = tracker.get_next_request()
+    assert first.id == high
+    assert first.payload == {"a": 1}
+    assert QuotaTracker(data_dir=tmp_path).get_next_request().id == low
+    assert tracker.get_next_request() is None
+
+    tracker.complete_request(high, success=False, error="boom")
+    tracker.complete_request(low, success=True)
+    status = tracker.get_queue_status()
+    assert status["pending"] == 1
+    assert status["processing"] == 0
+    # Retried request is backed off, so it is not due yet.
+    assert tracker.get_next_request() is None
+    assert tracker.get_dashboard_summary()["queue_size"] == 1
+
+
+def test_legacy_json_is_imported_once(tmp_path):
+    (tmp_path / "quotas.json").write_text(
+        json.dumps(
+            {
+                "quotas": {
+                    "gemini": {
+                        "provider": "gemini",
+                        "daily_budget": 7.5,
+                        "total_requests": 42,
+                    }
+                }
+            }
+        )
+    )
+    (tmp_path / "queue.json").write_text(
+        json.dumps({"queue": [{"id": "legacy1", "provider": "github", "priority": 3}]})
+    )
+
+    tracker = QuotaTracker(data_dir=tmp_path)
+    status = tracker.get_quota_status(APIProvider.GEMINI)
+    assert status["daily"]["budget"] == 7.5
+    assert status["totals"]["requests"] == 42
+    assert tracker.get_queue_status()["pending"] == 1
+
+    tracker.update_provider_limits(APIProvider.GEMINI, daily_budget=9.0)
+    again = QuotaTracker(data_dir=tmp_path)
+    assert again.get_quota_status(APIProvider.GEMINI)["daily"]["budget"] == 9.0
+    assert again.get_queue_status()["pending"] == 1
+
+
+def test_next_request_is_not_skipped_while_other_workers_claim(tmp_path, monkeypatch):
+    tracker = QuotaTracker(data_dir=tmp_path)
+    other = QuotaTracker(data_dir=tmp_path)
+    for idx in range(70):
+        tracker.queue_request(APIProvider.GITHUB, f"/busy/{idx}", {})
+    due = tracker.queue_request(APIProvider.OPENAI, "/due", {})
+    for idx in range(50):
+        tracker.queue_request(APIProvider.GITHUB, f"/late/{idx}", {})
+
+    claimed_elsewhere = []
+
+    def can_request(provider, estimated_tokens=0):
+        # While this worker scans its first page, another one claims it.
+        if not claimed_elsewhere:
+            claimed_elsewhere.extend(other.get_next_request() for _ in range(50))
+        return provider is APIProvider.OPENAI
+
+    monkeypatch.setattr(tracker, "can_request", can_request)
+    assert tracker.get_next_request().id == due
+
+
+def test_startup_prunes_old_completed_queue_rows(tmp_path, monkeypatch):
+    monkeypatch.setattr("wizard.services.quota_tracker.QUEUE_HISTORY_KEEP", 2)
+    tracker = QuotaTracker(data_dir=tmp_path)
+    done = [tracker.queue_request(APIProvider.GITHUB, f"/{idx}", {}) for idx in range(5)]
+    waiting = tracker.queue_request(APIProvider.GITHUB, "/waiting", {})
+    for request_id in done:
+        assert tracker.get_next_request().id == request_id
+        tracker.complete_request(request_id, success=True)
+
+    again = QuotaTracker(data_dir=tmp_path)
+    assert again.get_queue_status()["pending"] == 1
+    assert QuotaStore(tmp_path / "quotas.db").queue_counts()[0] == {"completed": 2, "pending": 1}
+    assert again.get_next_request().id == waiting
@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import sqlite3
+
+from wizard.services.spatial_store import load_place_index
+
+
+def test_load_place_index_reads_places_by_anchor(tmp_path):
+    db_path = tmp_path / "state.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE places (place_id TEXT, anchor_id TEXT, loc_id TEXT)")
+    conn.executemany(
+        "INSERT INTO places VALUES (?, ?, ?)",
+        [
+            ("harbour", "EARTH", "L305-DA11-Z2"),
+            ("market", "EARTH", "L305-DA11-AB12"),
+            ("crater", "MARS", "L305-DA11"),
+        ],
+    )
+    conn.commit()
+    conn.close()
+
+    index = load_place_index(db_path, anchor_id="EARTH")
+
+    assert index.contained_in("L305-DA11") == ["harbour", "market"]
+    assert [place for place, _ in index.nearest_to("L305-DA11-AB12", k=1)] == ["market"]
+    assert len(load_place_index(db_path)) == 3
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import threading
+from datetime import timedelta
+
+from core.services.time_utils import utc_now
+from wizard.services.store.sqlite_store import SQLiteWizardStore
+from wizard.services.task_scheduler import TaskScheduler
+from wizard.services.task_scheduler_runner import TaskSchedulerRunner
+
+
+def _queue_tasks(store: SQLiteWizardStore, count: int) -> None:
+    due = utc_now() - timedelta(minutes=1)
+    for idx in range(count):
+        task = store.create_task({"name": f"task-{idx}", "kind": "noop"})
+        store.schedule_task(task["id"], due)
+
+
+def test_claim_is_atomic_across_store_instances(tmp_path):
+    db_path = tmp_path / "ops.db"
+    _queue_tasks(SQLiteWizardStore(db_path), 40)
+    stores = [SQLiteWizardStore(db_path) for _ in range(4)]
+    claimed: list[list[int]] = [[] for _ in stores]
+
+    def worker(idx: int) -> None:
+        while True:
+            batch = stores[idx].claim_due_queue_items(limit=3, owner=f"w{idx}", lease_seconds=60)
+            if not batch:
+                return
+            claimed[idx].extend(item["id"] for item in batch)
+
+    threads = [threading.Thread(target=worker, args=(idx,)) for idx in range(len(stores))]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    all_ids = [queue_id for ids in claimed for queue_id in ids]
+    assert len(all_ids) == 40
+    assert len(set(all_ids)) == 40
+
+
+def test_expired_lease_is_reclaimed_and_heartbeat_is_owner_scoped(tmp_path):
+    store = SQLiteWizardStore(tmp_path / "ops.db")
+    _queue_tasks(store, 1)
+
+    first = store.claim_due_queue_items(limit=5, owner="a", lease_seconds=60)
+    assert [item["lease_owner"] for item in first] == ["a"]
+    assert store.claim_due_queue_items(limit=5, owner="b", lease_seconds=60) == []
+    assert store.extend_queue_leases([first[0]["id"]], owner="b", lease_seconds=60) == 0
+    assert store.extend_queue_leases([first[0]["id"]], owner="a", lease_seconds=60) == 1
+
+    with store._connect() as conn:
+        conn.execute("UPDATE task_queue SET lease_expires_at = '2000-01-01T00:00:00Z'")
+    reclaimed = store.claim_due_queue_items(limit=5, owner="b", lease_seconds=60)
+    assert [(item["id"], item["lease_owner"]) for item in reclaimed] == [(first[0]["id"], "b")]
+
+    store.complete_task_run(reclaimed[0]["run_id"], result="success", output="")
+    row = store.get_scheduled_queue(limit=1)[0]
+    assert row["state"] == "completed"
+    assert row["lease_owner"] is None
+
+
+def test_runner_batch_mode_executes_claimed_items(tmp_path):
+    scheduler = TaskScheduler(db_path=tmp_path / "tasks.db")
+    scheduler.update_settings({"runner_mode": "batch", "batch_size": 10, "batch_workers": 3})
+    for idx in range(5):
+        task = scheduler.create_task(name=f"batch-{idx}", schedule="daily")
+        scheduler.schedule_task(task["id"], utc_now() - timedelta(minutes=1))
+    scheduler._resources_ok = lambda _item: True  # type: ignore[method-assign]
+    seen: list[str] = []
+    lock = threading.Lock()
+
+    def _execute(item):
+        with lock:
+            seen.append(item["task_id"])
+        return {"result": "success", "output": "ok"}
+
+    scheduler._execute_task_item = _execute  # type: ignore[method-assign]
+    scheduler._network_available = lambda: False  # type: ignore[method-assign]
+
+    runner = TaskSchedulerRunner(scheduler=scheduler, worker_id="runner-test")
+    result = runner.run_batch()
+
+    assert result["claimed"] == 5
+    assert result["executed"] == 5
+    assert len(set(seen)) == 5
+    states = {row["state"] for row in scheduler.get_scheduled_queue(limit=10)}
+    assert states == {"completed"}
+    assert runner.run_batch()["claimed"] == 0
+
+
+def test_network_available_respects_allow_network_setting(tmp_path):
+    scheduler = TaskScheduler(db_path=tmp_path / "tasks.db")
+    probes: list[bool] = []
+
+    def _probe() -> bool:
+        probes.append(True)
+        return True
+
+    scheduler._network_available = _probe  # type: ignore[method-assign]
+
+    assert scheduler.network_available({"allow_network": False}) is False
+    assert probes == []
+    scheduler.update_settings({"allow_network": True})
+    assert scheduler.network_available() is True
+    assert probes == [True]